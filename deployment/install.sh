@@ -49,7 +49,7 @@ echo "Diretório: $SCRIPT_DIR"
 echo "----------------------------------------"
 
 # Executa o script dentro do container
-docker exec oncabito-bot python3 scripts/daily_checkup.py
+docker exec oncabito-bot python3 scripts/daily_cpf_checkup.py
 
 echo "----------------------------------------"
 echo "✅ Checkup concluído em $(date)"
@@ -58,18 +58,10 @@ EOF
 chmod +x "$INSTALL_DIR/deployment/run_checkup.sh"
 echo "✅ run_checkup.sh atualizado com path dinâmico"
 
-# Configura cron job com path dinâmico
-echo "⏰ Configurando cron job..."
-CRON_ENTRY="0 6 * * * $INSTALL_DIR/deployment/run_checkup.sh >> $INSTALL_DIR/logs/checkup.log 2>&1"
-
-# Remove cron job antigo se existir
+# O checkup diário roda dentro do bot (agendador interno, 6:00); remove o cron antigo
+echo "⏰ Removendo cron job do checkup (agora executado pelo próprio bot)..."
 crontab -l 2>/dev/null | grep -v "OnCabito\|Sentinela\|checkup" | crontab -
-
-# Adiciona novo cron job
-(crontab -l 2>/dev/null; echo "# OnCabito Bot - Checkup diário às 6:00"; echo "$CRON_ENTRY") | crontab -
-
-echo "✅ Cron job configurado:"
-echo "   $CRON_ENTRY"
+echo "✅ Cron job removido. Checkup manual: $INSTALL_DIR/deployment/run_checkup.sh"
 
 # Cria script de deploy
 cat > "$INSTALL_DIR/deploy.sh" << 'EOF'
@@ -124,7 +116,7 @@ echo "🎉 INSTALAÇÃO CONCLUÍDA!"
 echo "========================"
 echo ""
 echo "📁 Diretório do projeto: $INSTALL_DIR"
-echo "⏰ Cron job: Diário às 6:00"
+echo "⏰ Checkup diário: 6:00, agendado pelo próprio bot"
 echo "📋 Logs: $INSTALL_DIR/logs/"
 echo ""
 echo "🚀 PRÓXIMOS PASSOS:"
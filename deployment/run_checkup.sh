@@ -1,6 +1,7 @@
 #!/bin/bash
 #
 # Script para executar o checkup diário dentro do container Docker
+# (execução manual; o bot já roda o checkup às 6:00 pelo agendador interno)
 #
 
 echo "🚀 Executando checkup diário..."
@@ -8,7 +9,7 @@ echo "Data/Hora: $(date)"
 echo "----------------------------------------"
 
 # Executa o script dentro do container
-docker exec oncabo-gaming-bot python3 scripts/daily_checkup.py
+docker exec oncabo-gaming-bot python3 scripts/daily_cpf_checkup.py
 
 echo "----------------------------------------"
 echo "✅ Checkup concluído em $(date)"
\ No newline at end of file
@@ -2,9 +2,32 @@ import logging
 import os
 import asyncio
 
+from telegram import Update
+
 from src.sentinela.core.logging_config import setup_logging
-from src.sentinela.infrastructure.config.dependency_injection import configure_dependencies
+from src.sentinela.infrastructure.config.dependency_injection import configure_dependencies, get_container
 from src.sentinela.presentation.telegram_bot_new import application, register_handlers
+from src.sentinela.presentation.webhook_server import serve_webhook
+from src.sentinela.application.use_cases.scheduled_tasks_use_case import ScheduledTasksUseCase
+from src.sentinela.core import config
+from src.sentinela.core.access_control import PermissionManager
+from src.sentinela.infrastructure.events.audit_log import AuditLogWriter
+from src.sentinela.infrastructure.events.event_bus import EventBus
+from src.sentinela.infrastructure.events.outbox import OutboxRelay
+from src.sentinela.infrastructure.events.transport import EventTransportConsumer
+from src.sentinela.infrastructure.external_services.attachment_pipeline import AttachmentUploadPipeline
+from src.sentinela.infrastructure.external_services.group_client import GroupClient
+from src.sentinela.infrastructure.external_services.invite_link_pool import InviteLinkPool
+from src.sentinela.infrastructure.external_services.join_aggregator import JoinBurstAggregator
+from src.sentinela.infrastructure.external_services.membership_executor import MembershipActionExecutor
+from src.sentinela.infrastructure.external_services.message_scheduler import OutboundMessageScheduler
+from src.sentinela.infrastructure.repositories.authorization_snapshot import AuthorizationSnapshot
+from src.sentinela.infrastructure.repositories.membership_index import MembershipIndex
+from src.sentinela.infrastructure.repositories.sqlite_conversation_state_store import SQLiteConversationStateStore
+from src.sentinela.infrastructure.scheduling.contract_reverifier import ContractReverifier
+from src.sentinela.infrastructure.scheduling.deadline_scheduler import DeadlineScheduler
+from src.sentinela.infrastructure.scheduling.jobs import build_task_handlers
+from src.sentinela.infrastructure.scheduling.membership_index_sync import MembershipIndexSync
 
 def run_migrations():
     """Executa migrations se disponíveis."""
@@ -54,17 +77,78 @@ def main() -> None:
         # 5. (Opcional) Inicia serviços de background
         # Esta parte pode ser migrada para dentro da nova arquitetura depois
         async def startup_services(app):
+            # Todos os envios do bot passam pela fila com rate limit
+            get_container().get(OutboundMessageScheduler).bind(app.bot)
+            get_container().get(AttachmentUploadPipeline).bind(app.bot)
+            get_container().get(MembershipActionExecutor).bind(app.bot)
+            # Quem está no grupo: índice local mantido pelos updates chat_member
+            get_container().get(MembershipIndex).load()
+            get_container().get(GroupClient).bind(app.bot)
+            get_container().get(MembershipIndexSync).bind(app.bot)
+            # Verificados / já interagiram, consultados em todo /start, /status e /suporte
+            get_container().get(AuthorizationSnapshot).load()
+            # Conversas de /suporte em andamento antes do restart
+            await get_container().get(SQLiteConversationStateStore).load()
+            # Administradores em cache para os decorators de permissão
+            await PermissionManager.refresh_admins()
+            # Reenvia eventos do outbox que ficaram pendentes
+            await get_container().get(OutboxRelay).start()
+            # Eventos publicados pelos scripts de cron
+            await get_container().get(EventTransportConsumer).start()
+            # Tarefas periódicas (checkup diário de CPF, prazos) no próprio processo
+            if config.SCHEDULER_ENABLED:
+                await get_container().get(ScheduledTasksUseCase).register_default_tasks(
+                    build_task_handlers(get_container(), app.bot)
+                )
+                await get_container().get(DeadlineScheduler).start()
+            # Contratos consultados no HubSoft ao longo do dia (o checkup só aplica o resultado)
+            if config.CONTRACT_REVERIFY_ENABLED and config.HUBSOFT_ENABLED:
+                await get_container().get(ContractReverifier).start()
+            # Links de convite prontos para entregar após a verificação de CPF
+            get_container().get(InviteLinkPool).bind(app.bot)
+            if config.INVITE_POOL_ENABLED:
+                await get_container().get(InviteLinkPool).start()
             logger.info("Serviços de background (startup) iniciados.")
 
         async def shutdown_services(app):
+            await get_container().get(DeadlineScheduler).stop()
+            await get_container().get(ContractReverifier).stop()
+            await get_container().get(InviteLinkPool).stop()
+            await get_container().get(EventTransportConsumer).stop()
+            await get_container().get(OutboxRelay).stop()
+            # Boas-vindas de entradas ainda na janela de agrupamento
+            await get_container().get(JoinBurstAggregator).shutdown()
+            # Anexos de chamados ainda sendo enviados ao HubSoft
+            await get_container().get(AttachmentUploadPipeline).shutdown()
+            # Drena eventos adiados (publish_nowait) antes de encerrar
+            await get_container().get(EventBus).shutdown()
+            await get_container().get(AuditLogWriter).shutdown()
+            await get_container().get(OutboundMessageScheduler).shutdown()
+            await get_container().get(SQLiteConversationStateStore).shutdown()
+            # Linhas do índice de membros ainda não gravadas
+            await get_container().get(MembershipIndex).shutdown()
             logger.info("Serviços de background (shutdown) finalizados.")
 
         application.post_init = startup_services
         application.post_shutdown = shutdown_services
 
         # 6. Inicia o bot
-        logger.info("--- Iniciando o bot Sentinela com a NOVA ARQUITETURA ---")
-        application.run_polling()
+        logger.info(f"--- Iniciando o bot Sentinela com a NOVA ARQUITETURA (modo {config.BOT_MODE}) ---")
+        # chat_member não é entregue pelo Telegram sem ser pedido explicitamente
+        if config.BOT_MODE == "webhook":
+            asyncio.run(serve_webhook(
+                application,
+                secret_token=config.WEBHOOK_SECRET_TOKEN,
+                webhook_url=config.WEBHOOK_URL,
+                path=config.WEBHOOK_PATH,
+                listen=config.WEBHOOK_LISTEN,
+                port=config.WEBHOOK_PORT,
+                register=config.WEBHOOK_REGISTER,
+                max_connections=config.WEBHOOK_MAX_CONNECTIONS,
+                allowed_updates=Update.ALL_TYPES
+            ))
+        else:
+            application.run_polling(allowed_updates=Update.ALL_TYPES)
         logger.info("--- Bot Sentinela foi encerrado ---")
 
     except Exception as e:
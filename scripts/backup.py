@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Backups dos bancos SQLite - execução manual.
+
+O bot faz um backup por dia às 3h (tarefa agendada `backup_databases`).
+Este script cria, lista, confere e restaura conjuntos de backup em
+BACKUP_DIR/sets/. A cópia usa a API de backup do SQLite em lotes de
+páginas e pode rodar com o bot no ar; a restauração não: pare o bot antes.
+
+Uso:
+    python3 scripts/backup.py create [--label manual] [--no-export]
+    python3 scripts/backup.py list
+    python3 scripts/backup.py verify [CONJUNTO]
+    python3 scripts/backup.py restore CONJUNTO [--database main] [--target ARQUIVO] --yes
+"""
+
+import sys
+import argparse
+import logging
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+sys.path.insert(0, str(root_dir / "src"))
+
+from sentinela.infrastructure.backup.sqlite_backup import BackupManager
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def build_manager() -> BackupManager:
+    """Gerenciador com os mesmos bancos e diretório do bot."""
+    from dotenv import load_dotenv
+    load_dotenv()
+    from sentinela.core.config import (
+        AUDIT_DATABASE_FILE, BACKUP_DIR, BACKUP_KEEP_SETS, BACKUP_PAGES_PER_STEP, DATABASE_FILE
+    )
+    return BackupManager(
+        {"main": DATABASE_FILE, "audit": AUDIT_DATABASE_FILE},
+        backup_dir=BACKUP_DIR,
+        keep_sets=BACKUP_KEEP_SETS,
+        pages_per_step=BACKUP_PAGES_PER_STEP
+    )
+
+
+def resolve_set(manager: BackupManager, name: str = None) -> Path:
+    """Conjunto pelo nome ou caminho; sem nome, o completo mais recente."""
+    if name:
+        path = Path(name)
+        return path if path.is_dir() else manager.sets_dir / name
+    complete = [s for s in manager.list_sets() if s['complete']]
+    if not complete:
+        raise FileNotFoundError(f"Nenhum backup completo em {manager.sets_dir}")
+    return complete[-1]['path']
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description="Backups online dos bancos SQLite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    create = commands.add_parser("create", help="Cria um conjunto de backup")
+    create.add_argument("--label", default="manual", help="Rótulo do conjunto (padrão: manual)")
+    create.add_argument("--no-export", action="store_true", help="Só as cópias .db, sem exports JSONL")
+    create.add_argument(
+        "--keep", type=int, default=None,
+        help="Conjuntos com o mesmo rótulo mantidos após criar (padrão: não rotaciona)"
+    )
+
+    commands.add_parser("list", help="Lista os conjuntos")
+
+    verify = commands.add_parser("verify", help="Confere um conjunto contra o manifest")
+    verify.add_argument("set", nargs="?", help="Conjunto (padrão: o mais recente)")
+
+    restore = commands.add_parser("restore", help="Restaura um banco de um conjunto")
+    restore.add_argument("set", help="Conjunto (nome em BACKUP_DIR/sets ou caminho)")
+    restore.add_argument("--database", default="main", help="Banco do conjunto: main ou audit (padrão: main)")
+    restore.add_argument("--target", default=None, help="Arquivo a substituir (padrão: o banco configurado)")
+    restore.add_argument("--yes", action="store_true", help="Confirma a substituição do arquivo")
+
+    args = parser.parse_args()
+    manager = build_manager()
+
+    try:
+        if args.command == "create":
+            set_dir = manager.create_set(args.label, export=not args.no_export)
+            problems = manager.verify_set(set_dir)
+            if problems:
+                for problem in problems:
+                    logger.error(f"❌ {problem}")
+                sys.exit(1)
+            if args.keep is not None:
+                manager.rotate(keep=args.keep, label=args.label)
+            print(f"✅ Backup criado e conferido: {set_dir}")
+
+        elif args.command == "list":
+            sets = manager.list_sets()
+            if not sets:
+                print(f"Nenhum backup em {manager.sets_dir}")
+            for entry in sets:
+                if entry['complete']:
+                    print(f"✅ {entry['path'].name}  {entry['size']:>14,} bytes  ({entry['label']})")
+                else:
+                    print(f"⚠️ {entry['path'].name}  incompleto")
+
+        elif args.command == "verify":
+            set_dir = resolve_set(manager, args.set)
+            problems = manager.verify_set(set_dir)
+            for problem in problems:
+                print(f"❌ {problem}")
+            if problems:
+                sys.exit(1)
+            print(f"✅ {set_dir.name}: todos os arquivos e tabelas conferem")
+
+        elif args.command == "restore":
+            set_dir = resolve_set(manager, args.set)
+            target = args.target or manager.databases.get(args.database)
+            if not target:
+                raise ValueError(f"Banco desconhecido: {args.database}")
+            if not args.yes:
+                print(f"Isto substitui {target} pelo banco '{args.database}' de {set_dir.name}.")
+                print("Pare o bot e repita com --yes para confirmar.")
+                sys.exit(1)
+            manager.restore(set_dir, args.database, target)
+            print(f"✅ {target} restaurado de {set_dir.name} e conferido")
+
+    except (FileNotFoundError, ValueError) as e:
+        logger.error(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Benchmark do Event Bus.
+
+Mede o custo do próprio bus ao publicar TicketCreated no fluxo de
+confirmação do /suporte. Os handlers registrados hoje (auditoria,
+analytics, notificações) são stubs com `asyncio.sleep(0.1)`; medir com
+eles mede o sleep, não o bus. Por isso o benchmark usa handlers sintéticos
+na mesma quantidade dos registrados para TicketCreated, com latência
+configurável (--handler-ms, padrão 0 = só o custo do despacho):
+
+- publish: aguarda todos os handlers
+- publish_nowait: entrega aos workers em background e retorna
+
+O overhead do bus é a latência de publish menos a do handler (os
+handlers de um evento rodam concorrentemente).
+
+Com --throughput, mede também a vazão do despacho (eventos/s) com
+handlers no-op inscritos em vários níveis da hierarquia de eventos,
+comparando a tabela de despacho em cache com a resolução a cada evento.
+
+Uso:
+    python scripts/benchmark_event_bus.py [--iterations 500] [--handler-ms 0] [--throughput 20000]
+"""
+
+import sys
+import os
+import time
+import asyncio
+import logging
+import argparse
+import statistics
+
+# Adiciona o diretório raiz ao path
+root_dir = os.path.join(os.path.dirname(__file__), '..')
+sys.path.append(root_dir)
+
+from src.sentinela.infrastructure.events.event_bus import InMemoryEventBus, EventHandler
+from src.sentinela.domain.entities.base import DomainEvent
+from src.sentinela.infrastructure.events.event_handler_registry import EventHandlerRegistry
+from src.sentinela.domain.events.ticket_events import TicketCreated
+from src.sentinela.domain.value_objects.identifiers import TicketId, Protocol
+
+logging.basicConfig(level=logging.WARNING)
+
+
+def make_ticket_created(i: int) -> TicketCreated:
+    """Cria um TicketCreated sintético."""
+    return TicketCreated(
+        ticket_id=TicketId(i + 1),
+        user_id=100000 + i,
+        username=f"@gamer{i}",
+        category="connectivity",
+        affected_game="Valorant",
+        problem_timing="Agora/Hoje",
+        description="Ping alto e perda de pacotes desde hoje cedo",
+        protocol=Protocol.hubsoft(f"2025{i:06d}")
+    )
+
+
+def summarize(label: str, samples_ms: list) -> None:
+    """Imprime estatísticas de latência."""
+    ordered = sorted(samples_ms)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{label:<16} média={statistics.mean(ordered):8.3f}ms  "
+        f"p50={statistics.median(ordered):8.3f}ms  p99={p99:8.3f}ms"
+    )
+
+
+def registered_handler_count() -> int:
+    """Quantidade de handlers registrados que recebem TicketCreated."""
+    bus = InMemoryEventBus()
+    EventHandlerRegistry(bus).register_all_handlers()
+    return len(bus._resolve_handlers(TicketCreated))
+
+
+async def measure(iterations: int, handler_ms: float) -> None:
+    """Executa as medições."""
+    handler_count = registered_handler_count()
+    bus = InMemoryEventBus(max_concurrent_handlers=max(10, handler_count))
+    for _ in range(handler_count):
+        bus.subscribe(TicketCreated, NoOpHandler(TicketCreated, handler_ms / 1000))
+
+    blocking = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        await bus.publish(make_ticket_created(i))
+        blocking.append((time.perf_counter() - start) * 1000)
+
+    deferred = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        await bus.publish_nowait(make_ticket_created(i))
+        deferred.append((time.perf_counter() - start) * 1000)
+
+    drain_start = time.perf_counter()
+    await bus.shutdown()
+    drain_ms = (time.perf_counter() - drain_start) * 1000
+
+    print(
+        f"Latência do handler de confirmação do /suporte ({iterations} tickets, "
+        f"{handler_count} handlers de {handler_ms:g}ms)"
+    )
+    summarize("publish", blocking)
+    summarize("publish_nowait", deferred)
+    print(f"Overhead do bus (publish - handler): {statistics.mean(blocking) - handler_ms:.3f}ms por evento")
+    print(f"Redução média: {statistics.mean(blocking) - statistics.mean(deferred):.3f}ms por confirmação")
+    print(f"Drain no shutdown: {drain_ms:.1f}ms")
+
+
+class NoOpHandler(EventHandler):
+    """Handler sem trabalho (ou com latência fixa), para isolar o custo do despacho."""
+
+    def __init__(self, event_type, delay_seconds: float = 0.0):
+        self._event_type = event_type
+        self._delay_seconds = delay_seconds
+
+    @property
+    def event_type(self):
+        return self._event_type
+
+    async def handle(self, event: DomainEvent) -> None:
+        if self._delay_seconds:
+            await asyncio.sleep(self._delay_seconds)
+
+
+def build_throughput_bus() -> InMemoryEventBus:
+    """Cria bus com handlers no tipo concreto, na base e globais."""
+    bus = InMemoryEventBus(max_concurrent_handlers=100)
+    for _ in range(3):
+        bus.subscribe(TicketCreated, NoOpHandler(TicketCreated))
+    for _ in range(2):
+        bus.subscribe(DomainEvent, NoOpHandler(DomainEvent))
+    for _ in range(3):
+        bus.subscribe_to_all(NoOpHandler(DomainEvent))
+    return bus
+
+
+async def measure_throughput(events: int) -> None:
+    """Mede eventos despachados por segundo."""
+    sample = make_ticket_created(0)
+    results = {}
+
+    for label, cached in (("tabela em cache", True), ("resolução por evento", False)):
+        bus = build_throughput_bus()
+        if not cached:
+            # Simula o custo antigo: recalcula a lista de handlers a cada publish
+            bus._dispatch_table = _NoCache()
+
+        start = time.perf_counter()
+        for _ in range(events):
+            await bus.publish(sample)
+        elapsed = time.perf_counter() - start
+        results[label] = events / elapsed
+
+        handlers = bus.get_stats()['stats']['handlers_executed'] // events
+        print(f"{label:<22} {results[label]:10.0f} eventos/s  ({handlers} handlers por evento)")
+
+    lookups = 200000
+    bus = build_throughput_bus()
+    bus._resolve_handlers(TicketCreated)
+    start = time.perf_counter()
+    for _ in range(lookups):
+        bus._dispatch_table.get(TicketCreated)
+    cached_ns = (time.perf_counter() - start) / lookups * 1e9
+    start = time.perf_counter()
+    for _ in range(lookups):
+        bus._resolve_handlers(TicketCreated)
+    resolve_ns = (time.perf_counter() - start) / lookups * 1e9
+    print(f"Lookup de handlers: cache={cached_ns:.0f}ns  resolução={resolve_ns:.0f}ns")
+
+
+class _NoCache(dict):
+    """Tabela de despacho que nunca guarda entradas."""
+
+    def __setitem__(self, key, value):
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark do Event Bus")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument(
+        "--handler-ms", type=float, default=0.0,
+        help="Latência simulada de cada handler (0 = mede só o despacho)"
+    )
+    parser.add_argument("--throughput", type=int, default=0, help="Eventos para o teste de vazão (0 = não executa)")
+    args = parser.parse_args()
+    asyncio.run(measure(args.iterations, args.handler_ms))
+    if args.throughput:
+        print()
+        print(f"Vazão do despacho ({args.throughput} eventos, handlers no-op)")
+        asyncio.run(measure_throughput(args.throughput))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark de processamento concorrente de updates.
+
+Alimenta uma Application real do PTB (API do Telegram falsa, sem rede)
+com uma carga mista de usuários sintéticos e mede a latência por
+comando, da chegada do update ao fim do handler:
+
+- /status: resposta rápida
+- texto (CPF): validação curta
+- /suporte: consulta lenta ao HubSoft simulada
+
+Compara o processamento sequencial (padrão do PTB) com o
+PerUserUpdateProcessor e confere que nenhum usuário teve mensagens
+processadas fora de ordem ou em paralelo.
+
+Uso:
+    python scripts/benchmark_update_concurrency.py [--users 200] [--per-user 5] [--concurrency 1 64]
+"""
+
+import sys
+import os
+import time
+import random
+import asyncio
+import logging
+import argparse
+from collections import defaultdict
+from typing import Dict, List
+
+# Adiciona o diretório raiz ao path
+root_dir = os.path.join(os.path.dirname(__file__), '..')
+sys.path.append(root_dir)
+
+from telegram import Update
+from telegram.ext import Application, TypeHandler
+
+from scripts.fake_bot_api import FakeBotAPI, FAKE_TOKEN
+from src.sentinela.presentation.update_processor import PerUserUpdateProcessor
+
+logging.basicConfig(level=logging.WARNING)
+
+# comando -> (peso na carga, tempo de processamento em segundos)
+WORKLOAD = {
+    "/status": (0.7, 0.002),
+    "cpf": (0.2, 0.010),
+    "/suporte": (0.1, 0.300),
+}
+
+
+def make_update(update_id: int, user_id: int, command: str) -> dict:
+    """Cria um update sintético de mensagem privada."""
+    text = "12345678909" if command == "cpf" else command
+    message = {
+        "message_id": update_id,
+        "date": int(time.time()),
+        "chat": {"id": user_id, "type": "private"},
+        "from": {"id": user_id, "is_bot": False, "first_name": f"Gamer{user_id}"},
+        "text": text,
+    }
+    if text.startswith("/"):
+        message["entities"] = [{"type": "bot_command", "offset": 0, "length": len(text)}]
+    return {"update_id": update_id, "message": message}
+
+
+def build_load(users: int, per_user: int, seed: int) -> List[dict]:
+    """Intercala as mensagens dos usuários em ordem aleatória (mantendo a ordem de cada um)."""
+    rng = random.Random(seed)
+    commands = list(WORKLOAD)
+    weights = [WORKLOAD[c][0] for c in commands]
+
+    queues = {100000 + u: rng.choices(commands, weights, k=per_user) for u in range(users)}
+    load = []
+    update_id = 0
+    while queues:
+        user_id = rng.choice(list(queues))
+        update_id += 1
+        load.append(make_update(update_id, user_id, queues[user_id].pop(0)))
+        if not queues[user_id]:
+            del queues[user_id]
+    return load
+
+
+class Probe:
+    """Handler que simula o trabalho e registra latência e ordem por usuário."""
+
+    def __init__(self, expected: int):
+        self.expected = expected
+        self.arrived_at: Dict[int, float] = {}
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.last_seen: Dict[int, int] = {}
+        self.active_users: set = set()
+        self.order_violations = 0
+        self.overlap_violations = 0
+        self.done = asyncio.Event()
+        self.handled = 0
+
+    async def handle(self, update: Update, context) -> None:
+        user_id = update.effective_user.id
+        text = update.message.text
+        command = "cpf" if text.isdigit() else text
+
+        if user_id in self.active_users:
+            self.overlap_violations += 1
+        if self.last_seen.get(user_id, 0) > update.update_id:
+            self.order_violations += 1
+        self.last_seen[user_id] = update.update_id
+        self.active_users.add(user_id)
+
+        try:
+            await asyncio.sleep(WORKLOAD[command][1])
+        finally:
+            self.active_users.discard(user_id)
+
+        self.latencies[command].append((time.perf_counter() - self.arrived_at[update.update_id]) * 1000)
+        self.handled += 1
+        if self.handled >= self.expected:
+            self.done.set()
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def run_once(load: List[dict], concurrency: int, rate: float) -> None:
+    probe = Probe(len(load))
+    builder = Application.builder().token(FAKE_TOKEN).request(FakeBotAPI())
+    if concurrency > 1:
+        builder = builder.concurrent_updates(PerUserUpdateProcessor(concurrency))
+    application = builder.build()
+    application.add_handler(TypeHandler(Update, probe.handle))
+
+    await application.initialize()
+    await application.start()
+
+    started = time.perf_counter()
+    interval = 1 / rate if rate else 0
+    for i, data in enumerate(load):
+        if interval:
+            delay = started + i * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        update = Update.de_json(data, application.bot)
+        probe.arrived_at[update.update_id] = time.perf_counter()
+        await application.update_queue.put(update)
+
+    await probe.done.wait()
+    elapsed = time.perf_counter() - started
+
+    await application.stop()
+    await application.shutdown()
+
+    label = "sequencial" if concurrency <= 1 else f"concorrência={concurrency}"
+    print(f"\n{label}: {len(load)} updates em {elapsed:.2f}s ({len(load) / elapsed:.1f} updates/s)")
+    for command, samples in probe.latencies.items():
+        ordered = sorted(samples)
+        print(
+            f"  {command:<10} n={len(ordered):5d}  p50={percentile(ordered, 0.5):9.1f}ms  "
+            f"p95={percentile(ordered, 0.95):9.1f}ms  p99={percentile(ordered, 0.99):9.1f}ms"
+        )
+    print(f"  fora de ordem: {probe.order_violations}  paralelos no mesmo usuário: {probe.overlap_violations}")
+    if concurrency > 1:
+        print(f"  processor: {application.update_processor.get_stats()}")
+
+
+async def run(args) -> None:
+    load = build_load(args.users, args.per_user, args.seed)
+    print(f"Carga: {args.users} usuários x {args.per_user} mensagens, taxa={'rajada' if not args.rate else f'{args.rate}/s'}")
+    for concurrency in args.concurrency:
+        await run_once(load, concurrency, args.rate)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de processamento concorrente de updates")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--per-user", type=int, default=5)
+    parser.add_argument("--rate", type=float, default=200, help="Updates por segundo (0 = rajada)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 64])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark de recebimento de updates: polling x webhook.
+
+Publica updates sintéticos numa Application real do PTB usando uma API
+do Telegram falsa (sem rede) e mede a latência do momento em que o
+update "existe" no Telegram até o handler começar a processá-lo:
+
+- polling: getUpdates falso com long polling, atraso de rede simulado
+  na ida e na volta de cada chamada
+- webhook: POSTs no WebhookServer local, com o mesmo atraso simulado
+  e até --max-connections requisições simultâneas (como o Telegram)
+
+Uso:
+    python scripts/benchmark_update_ingestion.py [--updates 2000] [--rate 0] [--latency-ms 40]
+"""
+
+import sys
+import os
+import time
+import asyncio
+import logging
+import argparse
+import statistics
+from typing import Dict, List, Optional
+
+# Adiciona o diretório raiz ao path
+root_dir = os.path.join(os.path.dirname(__file__), '..')
+sys.path.append(root_dir)
+
+import aiohttp
+from telegram import Update
+from telegram.ext import Application, TypeHandler
+
+from scripts.fake_bot_api import FakeBotAPI, FAKE_TOKEN
+from src.sentinela.presentation.webhook_server import WebhookServer, SECRET_HEADER
+
+logging.basicConfig(level=logging.WARNING)
+
+SECRET = "benchmark-secret"
+
+
+def make_update(update_id: int) -> dict:
+    """Cria um /status sintético de um usuário distinto."""
+    user = {"id": 100000 + update_id, "is_bot": False, "first_name": f"Gamer{update_id}"}
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": user["id"], "type": "private"},
+            "from": user,
+            "text": "/status",
+            "entities": [{"type": "bot_command", "offset": 0, "length": 7}]
+        }
+    }
+
+
+class LatencyRecorder:
+    """Registra o instante de publicação e de chegada ao handler."""
+
+    def __init__(self, expected: int):
+        self.expected = expected
+        self.sent_at: Dict[int, float] = {}
+        self.latencies_ms: List[float] = []
+        self.first_sent: Optional[float] = None
+        self.last_handled: float = 0.0
+        self.done = asyncio.Event()
+
+    def mark_sent(self, update_id: int) -> None:
+        now = time.perf_counter()
+        self.sent_at[update_id] = now
+        if self.first_sent is None:
+            self.first_sent = now
+
+    async def handle(self, update: Update, context) -> None:
+        now = time.perf_counter()
+        self.latencies_ms.append((now - self.sent_at[update.update_id]) * 1000)
+        self.last_handled = now
+        if len(self.latencies_ms) >= self.expected:
+            self.done.set()
+
+
+def build_application(api: FakeBotAPI, recorder: LatencyRecorder) -> Application:
+    application = (
+        Application.builder()
+        .token(FAKE_TOKEN)
+        .request(api)
+        .get_updates_request(api)
+        .build()
+    )
+    application.add_handler(TypeHandler(Update, recorder.handle))
+    return application
+
+
+async def produce(count: int, rate: float, publish) -> None:
+    """Publica `count` updates na taxa pedida (0 = rajada)."""
+    interval = 1 / rate if rate else 0
+    start = time.perf_counter()
+    for i in range(1, count + 1):
+        if interval:
+            delay = start + (i - 1) * interval - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        await publish(i)
+
+
+async def run_polling(count: int, rate: float, one_way_delay: float) -> LatencyRecorder:
+    api = FakeBotAPI(one_way_delay)
+    recorder = LatencyRecorder(count)
+    application = build_application(api, recorder)
+
+    await application.initialize()
+    await application.start()
+    await application.updater.start_polling(poll_interval=0, timeout=10)
+
+    async def publish(i: int) -> None:
+        update = make_update(i)
+        recorder.mark_sent(i)
+        api.push(update)
+
+    await produce(count, rate, publish)
+    await asyncio.wait_for(recorder.done.wait(), timeout=120)
+
+    await application.updater.stop()
+    await application.stop()
+    await application.shutdown()
+    return recorder
+
+
+async def run_webhook(count: int, rate: float, one_way_delay: float, port: int, max_connections: int) -> LatencyRecorder:
+    api = FakeBotAPI(one_way_delay)
+    recorder = LatencyRecorder(count)
+    application = build_application(api, recorder)
+
+    await application.initialize()
+    await application.start()
+    server = WebhookServer(application, SECRET, path="/webhook", listen="127.0.0.1", port=port)
+    await server.start()
+
+    url = f"http://127.0.0.1:{port}/webhook"
+    connections = asyncio.Semaphore(max_connections)
+    posts = []
+
+    async with aiohttp.ClientSession(headers={SECRET_HEADER: SECRET}) as session:
+        async def deliver(i: int, body: dict) -> None:
+            async with connections:
+                await asyncio.sleep(one_way_delay)
+                async with session.post(url, json=body) as response:
+                    response.raise_for_status()
+
+        async def publish(i: int) -> None:
+            body = make_update(i)
+            recorder.mark_sent(i)
+            posts.append(asyncio.create_task(deliver(i, body)))
+
+        await produce(count, rate, publish)
+        await asyncio.gather(*posts)
+        await asyncio.wait_for(recorder.done.wait(), timeout=120)
+
+    print(f"  webhook: {server.get_stats()}")
+    await server.stop()
+    await application.stop()
+    await application.shutdown()
+    return recorder
+
+
+def summarize(label: str, recorder: LatencyRecorder) -> None:
+    """Imprime latência e vazão."""
+    ordered = sorted(recorder.latencies_ms)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+    elapsed = recorder.last_handled - recorder.first_sent
+    print(
+        f"{label:<8} p50={statistics.median(ordered):8.2f}ms  p95={pct(0.95):8.2f}ms  "
+        f"p99={pct(0.99):8.2f}ms  max={ordered[-1]:8.2f}ms  vazão={len(ordered) / elapsed:9.1f} updates/s"
+    )
+
+
+async def run(args) -> None:
+    one_way = args.latency_ms / 1000
+    print(
+        f"{args.updates} updates, taxa={'rajada' if not args.rate else f'{args.rate}/s'}, "
+        f"atraso de rede={args.latency_ms}ms por trecho\n"
+    )
+
+    polling = await run_polling(args.updates, args.rate, one_way)
+    webhook = await run_webhook(args.updates, args.rate, one_way, args.port, args.max_connections)
+
+    print()
+    summarize("polling", polling)
+    summarize("webhook", webhook)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark de recebimento de updates (polling x webhook)")
+    parser.add_argument("--updates", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=0, help="Updates por segundo (0 = rajada)")
+    parser.add_argument("--latency-ms", type=float, default=40, help="Atraso simulado entre Telegram e bot")
+    parser.add_argument("--max-connections", type=int, default=40, help="Conexões simultâneas do webhook")
+    parser.add_argument("--port", type=int, default=18080)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
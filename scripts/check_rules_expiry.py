@@ -2,152 +2,196 @@
 """
 Script para verificar e remover usuários que não aceitaram regras no prazo.
 
-Executa verificação de usuários que entraram no grupo mas não aceitaram
-as regras dentro de 24 horas, removendo-os automaticamente.
+Remove do grupo quem entrou há mais de 24 horas sem aceitar as regras e
+encerra a pendência em user_rules (status 'removed'), então o usuário não
+volta na próxima verificação. Quem já saiu do grupo só tem a pendência
+encerrada. Ao final, os administradores recebem o resumo das remoções.
+
+A mesma verificação roda de hora em hora no bot (tarefa agendada
+`check_expired_rules`); ambos usam o mesmo lease de job, então nunca rodam
+ao mesmo tempo.
+
+Uso:
+    python3 scripts/check_rules_expiry.py [--wait SEGUNDOS]
 """
 
 import sys
 import os
 import asyncio
+import argparse
+import html
 import logging
 from datetime import datetime
+from typing import Any, Dict, List
 
 # Adiciona o diretório raiz e src ao path para importar módulos
 root_dir = os.path.join(os.path.dirname(__file__), '..')
 sys.path.append(root_dir)
 sys.path.append(os.path.join(root_dir, 'src'))
 
-from src.sentinela.clients.db_client import get_expired_rules_users, mark_user_expired
-from src.sentinela.services.group_service import remove_user_from_group, notify_administrators
+from telegram import Bot
+
 from src.sentinela.core.logging_config import setup_logging
+from src.sentinela.core.config import TELEGRAM_TOKEN, TELEGRAM_GROUP_ID, WELCOME_TOPIC_ID, RULES_TOPIC_ID
+from src.sentinela.application.use_cases.welcome_management_use_case import WelcomeManagementUseCase
+from src.sentinela.infrastructure.config.dependency_injection import configure_dependencies, get_container
+from src.sentinela.infrastructure.events.transport import SQLiteEventTransport, RemoteEventBus
+from src.sentinela.infrastructure.external_services.group_client import GroupClient
+from src.sentinela.infrastructure.external_services.message_scheduler import OutboundMessageScheduler, SendPriority
+from src.sentinela.infrastructure.scheduling.job_lease import LeaseLostError, SQLiteJobLeaseStore, default_owner_id
 
 logger = logging.getLogger(__name__)
 
-async def process_expired_users():
+# Mesmo nome da tarefa agendada no bot (ScheduledTask.create_rules_check_task)
+JOB_NAME = "check_expired_rules"
+
+
+async def process_expired_users(wait: float) -> int:
     """
     Processa usuários que expiraram sem aceitar regras.
+
+    Args:
+        wait: Segundos aguardando uma execução em andamento terminar
+
+    Returns:
+        int: Código de saída (0 = verificação executada)
     """
     logger.info("=== VERIFICANDO USUÁRIOS COM REGRAS EXPIRADAS ===")
 
+    configure_dependencies()
+    container = get_container()
+
+    bot = Bot(token=TELEGRAM_TOKEN)
+    # Remoções pelo Telegram; o índice de membros é atualizado a cada uma
+    container.get(GroupClient).bind(bot)
+    # Resumo aos administradores respeitando os limites de envio
+    outbound = OutboundMessageScheduler(bot)
+    # Informa o bot em execução sobre as remoções feitas por este processo
+    bot_events = RemoteEventBus(container.get(SQLiteEventTransport), origin="check_rules_expiry")
+
+    use_case = WelcomeManagementUseCase(
+        user_repository=container.get("user_repository"),
+        member_repository=container.get("group_member_repository"),
+        event_bus=bot_events,
+        group_id=int(TELEGRAM_GROUP_ID),
+        welcome_topic_id=int(WELCOME_TOPIC_ID) if WELCOME_TOPIC_ID else None,
+        rules_topic_id=int(RULES_TOPIC_ID) if RULES_TOPIC_ID else None,
+        rules_acceptance_hours=24,
+        group_client=container.get(GroupClient)
+    )
+
+    leases = container.get(SQLiteJobLeaseStore)
     try:
-        # Busca usuários expirados
-        expired_users = get_expired_rules_users()
-        logger.info(f"Encontrados {len(expired_users)} usuários com regras expiradas")
-
-        removed_count = 0
-        failed_count = 0
-
-        for user_data in expired_users:
-            user_id = user_data['user_id']
-            username = user_data['username']
-
-            try:
-                logger.info(f"Processando usuário expirado: {username} (ID: {user_id})")
-
-                # Remove do grupo
-                removal_success = await remove_user_from_group(
-                    user_id,
-                    "Não aceitou regras dentro do prazo (24h)"
-                )
-
-                if removal_success:
-                    # Marca como expirado no banco
-                    mark_user_expired(user_id)
-                    removed_count += 1
-                    logger.warning(f"🚫 Usuário {username} (ID: {user_id}) removido por não aceitar regras")
-                else:
-                    failed_count += 1
-                    logger.error(f"❌ Falha ao remover usuário {username} (ID: {user_id})")
-
-            except Exception as e:
-                logger.error(f"❌ Erro ao processar usuário {username} (ID: {user_id}): {e}")
-                failed_count += 1
-
-        # Log final
-        logger.info(f"=== VERIFICAÇÃO DE REGRAS CONCLUÍDA ===")
-        logger.info(f"📊 ESTATÍSTICAS:")
-        logger.info(f"   • Usuários expirados encontrados: {len(expired_users)}")
-        logger.info(f"   • Usuários removidos com sucesso: {removed_count}")
-        logger.info(f"   • Falhas na remoção: {failed_count}")
-
-        # Notifica administradores se houver remoções
-        if removed_count > 0:
-            logger.info("📬 Notificando administradores sobre remoções por regras...")
+        async with leases.lease(JOB_NAME, default_owner_id("check_rules_expiry"), wait_timeout=wait) as lease:
+            if not lease.acquired:
+                logger.warning(f"⏭️ Verificação já em execução por {lease.holder}; nada a fazer")
+                return 1
 
-            # Prepara dados para notificação
-            removed_users_data = []
-            for user_data in expired_users[:removed_count]:  # Só os que foram removidos
-                removed_users_data.append({
-                    'user_id': user_data['user_id'],
-                    'client_name': user_data['username'],
-                    'cpf': 'N/A',  # Não temos CPF para estes usuários
-                })
+            result = await use_case.check_expired_rules_acceptance()
 
-            # Envia notificação customizada
-            await notify_administrators_rules_expiry(removed_users_data)
+        if not result.success:
+            logger.error(f"❌ ERRO CRÍTICO durante verificação de regras: {result.message}")
+            return 1
 
-        if failed_count > 0:
-            logger.warning(f"⚠️ {failed_count} usuário(s) não puderam ser removidos - verificar manualmente")
+        removed_users = result.data['removed_users']
+        for user in removed_users:
+            logger.warning(f"🚫 Usuário {user['username']} (ID: {user['user_id']}) removido por não aceitar regras")
 
-    except Exception as e:
-        logger.error(f"❌ ERRO CRÍTICO durante verificação de regras: {e}")
+        logger.info("=== VERIFICAÇÃO DE REGRAS CONCLUÍDA ===")
+        logger.info("📊 ESTATÍSTICAS:")
+        logger.info(f"   • Usuários removidos: {result.data['expired_count']}")
+        logger.info(f"   • Já fora do grupo: {result.data['already_left']}")
+        logger.info(f"   • Falhas na remoção: {result.data['failed_count']}")
 
-async def notify_administrators_rules_expiry(removed_users: list) -> bool:
+        if removed_users:
+            logger.info("📬 Notificando administradores sobre remoções por regras...")
+            await notify_administrators_rules_expiry(
+                outbound, await container.get("admin_repository").list_administrators(), removed_users
+            )
+
+        if result.data['failed_count']:
+            logger.warning(
+                f"⚠️ {result.data['failed_count']} usuário(s) não puderam ser removidos; "
+                f"nova tentativa na próxima verificação"
+            )
+        return 0
+
+    except LeaseLostError as e:
+        logger.error(f"❌ Verificação interrompida: {e}")
+        return 1
+
+    finally:
+        await outbound.shutdown()
+        await bot_events.close()
+
+
+async def notify_administrators_rules_expiry(
+    outbound: OutboundMessageScheduler,
+    administrators: List[Dict[str, Any]],
+    removed_users: List[Dict[str, Any]]
+) -> bool:
     """
     Notifica administradores sobre usuários removidos por não aceitar regras.
 
     Args:
-        removed_users: Lista de usuários removidos
+        outbound: Fila de envios
+        administrators: Administradores ativos (AdminRepository.list_administrators)
+        removed_users: Usuários removidos (user_id, username)
 
     Returns:
-        bool: True se notificou com sucesso
+        bool: True se ao menos um administrador foi notificado
     """
-    try:
-        from src.sentinela.services.group_service import get_group_administrators, send_private_message
-
-        # Busca administradores
-        administrators = await get_group_administrators()
-        if not administrators:
-            logger.warning("Nenhum administrador encontrado para notificar")
-            return False
-
-        # Monta a mensagem específica para regras
-        message = "⚠️ <b>REMOÇÃO AUTOMÁTICA - REGRAS NÃO ACEITAS</b> ⚠️\n\n"
-        message += f"📅 <b>Data:</b> {datetime.now().strftime('%d/%m/%Y às %H:%M')}\n\n"
-        message += f"🚫 <b>USUÁRIOS REMOVIDOS:</b> {len(removed_users)}\n"
-        message += f"📋 <b>Motivo:</b> Não aceitaram regras em 24 horas\n\n"
-
-        for i, user in enumerate(removed_users, 1):
-            message += f"{i}. <b>{user.get('client_name', 'Nome não disponível')}</b>\n"
-            message += f"   • ID: {user.get('user_id', 'N/A')}\n"
-            message += f"   • Status: Removido por expiração de regras\n\n"
-
-        message += "⚙️ <b>Ação Automática:</b> Sistema Sentinela\n"
-        message += "📝 <b>Configuração:</b> 24h para aceitar regras\n\n"
-        message += "🔧 <i>Sistema Sentinela - OnCabo</i>"
-
-        # Envia para todos os administradores
-        success_count = 0
-        for admin in administrators:
-            if await send_private_message(admin['user_id'], message):
-                success_count += 1
-
-        logger.info(f"Notificações de regras enviadas para {success_count}/{len(administrators)} administradores")
-        return success_count > 0
-
-    except Exception as e:
-        logger.error(f"Erro ao notificar administradores sobre regras: {e}")
+    if not administrators:
+        logger.warning("Nenhum administrador encontrado para notificar")
         return False
 
+    message = "⚠️ <b>REMOÇÃO AUTOMÁTICA - REGRAS NÃO ACEITAS</b> ⚠️\n\n"
+    message += f"📅 <b>Data:</b> {datetime.now().strftime('%d/%m/%Y às %H:%M')}\n\n"
+    message += f"🚫 <b>USUÁRIOS REMOVIDOS:</b> {len(removed_users)}\n"
+    message += "📋 <b>Motivo:</b> Não aceitaram regras em 24 horas\n\n"
+
+    for i, user in enumerate(removed_users, 1):
+        message += f"{i}. <b>{html.escape(user['username'] or 'Nome não disponível')}</b>\n"
+        message += f"   • ID: {user['user_id']}\n\n"
+
+    message += "⚙️ <b>Ação Automática:</b> Sistema Sentinela\n"
+    message += "📝 <b>Configuração:</b> 24h para aceitar regras\n\n"
+    message += "🔧 <i>Sistema Sentinela - OnCabo</i>"
+
+    success_count = 0
+    for admin in administrators:
+        try:
+            await outbound.send_message(
+                chat_id=admin['user_id'],
+                text=message,
+                parse_mode='HTML',
+                priority=SendPriority.NOTIFICATION
+            )
+            success_count += 1
+        except Exception as e:
+            logger.error(f"Erro ao notificar administrador {admin['user_id']}: {e}")
+
+    logger.info(f"Notificações de regras enviadas para {success_count}/{len(administrators)} administradores")
+    return success_count > 0
+
+
 def main():
     """Função principal do script."""
+    parser = argparse.ArgumentParser(description="Remove usuários que não aceitaram as regras no prazo")
+    parser.add_argument(
+        "--wait", type=float, default=0,
+        help="Segundos aguardando a verificação em andamento terminar (padrão: não espera)"
+    )
+    args = parser.parse_args()
+
     setup_logging()
     logger.info(f"Verificação de regras expiradas iniciada em {datetime.now()}")
 
-    # Executa a verificação
-    asyncio.run(process_expired_users())
+    exit_code = asyncio.run(process_expired_users(args.wait))
 
     logger.info("Verificação de regras expiradas finalizada")
+    sys.exit(exit_code)
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
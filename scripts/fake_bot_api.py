@@ -0,0 +1,148 @@
+"""
+API do Telegram em memória para benchmarks e testes de carga.
+
+Implementa o BaseRequest do python-telegram-bot: a Application roda sem
+rede, as chamadas do bot são contabilizadas e respondidas com objetos
+mínimos válidos, e getUpdates serve updates sintéticos com long polling.
+getFile responde como um Bot API local: caminho de um arquivo sintético
+em disco, lido sem rede.
+"""
+
+import os
+import json
+import time
+import asyncio
+import tempfile
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from telegram.request import BaseRequest, RequestData
+
+FAKE_TOKEN = "123456:BENCHMARK"
+BOT_USER = {"id": 123456, "is_bot": True, "first_name": "Sentinela", "username": "sentinela_bench_bot"}
+
+# Tamanho dos arquivos servidos por getFile
+FAKE_FILE_SIZE = 180_000
+
+# Métodos que devolvem a mensagem enviada/editada
+MESSAGE_METHODS = {"sendMessage", "sendPhoto", "sendDocument", "editMessageText", "editMessageReplyMarkup", "forwardMessage"}
+
+
+class FakeBotAPI(BaseRequest):
+    """
+    Bot API falsa que registra as chamadas.
+
+    - `one_way_delay`: atraso de rede em cada trecho do getUpdates
+    - `call_latency`: atraso das demais chamadas (sendMessage etc.)
+    """
+
+    def __init__(self, one_way_delay: float = 0.0, call_latency: float = 0.0):
+        self.one_way_delay = one_way_delay
+        self.call_latency = call_latency
+        self.pending: List[dict] = []
+        self.calls: Counter = Counter()
+        self._new_updates = asyncio.Event()
+        self._message_id = 0
+        self._file_path: Optional[str] = None
+
+    @property
+    def read_timeout(self) -> Optional[float]:
+        return None
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        if self._file_path:
+            os.unlink(self._file_path)
+            self._file_path = None
+
+    def _fake_file(self) -> str:
+        """Arquivo servido por getFile (criado na primeira chamada)."""
+        if self._file_path is None:
+            fd, self._file_path = tempfile.mkstemp(suffix=".jpg", prefix="fake_bot_api_")
+            with os.fdopen(fd, "wb") as f:
+                f.write(bytes(FAKE_FILE_SIZE))
+        return self._file_path
+
+    def push(self, update: dict) -> None:
+        """Disponibiliza um update para o próximo getUpdates."""
+        self.pending.append(update)
+        self._new_updates.set()
+
+    async def do_request(
+        self,
+        url: str,
+        method: str,
+        request_data: Optional[RequestData] = None,
+        read_timeout=None,
+        write_timeout=None,
+        connect_timeout=None,
+        pool_timeout=None
+    ) -> Tuple[int, bytes]:
+        endpoint = url.rsplit("/", 1)[-1]
+        params = request_data.parameters if request_data else {}
+        self.calls[endpoint] += 1
+
+        if endpoint == "getUpdates":
+            result = await self._get_updates(int(params.get("offset") or 0), float(params.get("timeout") or 0))
+        else:
+            if self.call_latency and endpoint != "getMe":
+                await asyncio.sleep(self.call_latency)
+            result = self._respond(endpoint, params)
+
+        return 200, json.dumps({"ok": True, "result": result}).encode()
+
+    def _respond(self, endpoint: str, params: Dict[str, Any]) -> Any:
+        if endpoint == "getMe":
+            return BOT_USER
+        if endpoint in MESSAGE_METHODS:
+            self._message_id += 1
+            chat_id = int(params.get("chat_id", 0))
+            return {
+                "message_id": params.get("message_id") or self._message_id,
+                "date": int(time.time()),
+                "chat": {"id": chat_id, "type": "private" if chat_id > 0 else "supergroup"},
+                "from": BOT_USER,
+                "text": params.get("text", "")
+            }
+        if endpoint == "createChatInviteLink":
+            return {
+                "invite_link": f"https://t.me/+bench{self.calls[endpoint]}",
+                "creator": BOT_USER,
+                "creates_join_request": False,
+                "is_primary": False,
+                "is_revoked": False,
+                "member_limit": params.get("member_limit"),
+                "expire_date": params.get("expire_date")
+            }
+        if endpoint == "getFile":
+            file_id = str(params.get("file_id", ""))
+            return {
+                "file_id": file_id,
+                "file_unique_id": f"u-{file_id}",
+                "file_size": FAKE_FILE_SIZE,
+                "file_path": self._fake_file()
+            }
+        if endpoint == "getChatMember":
+            return {"status": "member", "user": {"id": int(params.get("user_id", 0)), "is_bot": False, "first_name": "Gamer"}}
+        if endpoint == "getChatAdministrators":
+            return [{"status": "creator", "user": BOT_USER, "is_anonymous": False}]
+        return True
+
+    async def _get_updates(self, offset: int, timeout: float) -> List[dict]:
+        # Requisição do bot chegando ao Telegram
+        await asyncio.sleep(self.one_way_delay)
+
+        self.pending = [u for u in self.pending if u["update_id"] >= offset]
+        if not self.pending and timeout:
+            self._new_updates.clear()
+            try:
+                await asyncio.wait_for(self._new_updates.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        batch = self.pending[:100]
+        # Resposta voltando ao bot
+        await asyncio.sleep(self.one_way_delay)
+        return batch
@@ -0,0 +1,622 @@
+#!/usr/bin/env python3
+"""
+Teste de carga sintético do TelegramBotHandler.
+
+Sobe a Application com os handlers reais (register_handlers), o
+container de dependências real e bancos SQLite temporários. Só as
+bordas externas são falsas:
+
+- API do Telegram: FakeBotAPI (sem rede, registra as chamadas)
+- HubSoft: MockHubSoftAPIService com perfil de latência e erros,
+  inclusive na consulta legada de CPF (síncrona, como em produção) e no
+  envio dos anexos do /suporte (no lugar do HubSoftAtendimentoClient)
+
+Cada usuário sintético percorre uma jornada completa, esperando a
+resposta do bot antes do próximo passo:
+
+    /start -> CPF -> entrada no grupo -> /suporte -> categoria -> jogo
+    -> quando começou -> descrição -> fotos -> continuar -> confirmar -> /status
+
+Relatório: vazão, latência por etapa (p50/p95/p99), erros, consultas
+SQL por update, atraso do event loop e chamadas à API do Telegram.
+Com limites (--max-*) ou --baseline, sai com código 1 se a rodada
+regredir, para uso como gate no CI.
+
+Uso:
+    python scripts/load_test.py [--users 100] [--arrival-rate 20] [--hubsoft-latency-ms 150]
+    python scripts/load_test.py --users 30 --rate-limits off --max-p99-ms 3000 --report load.json
+    python scripts/load_test.py --baseline load.json --tolerance 0.3
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import sqlite3
+import asyncio
+import logging
+import argparse
+import tempfile
+import contextvars
+from collections import Counter, defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Adiciona o diretório raiz ao path
+root_dir = os.path.join(os.path.dirname(__file__), '..')
+sys.path.append(root_dir)
+
+from scripts.fake_bot_api import FakeBotAPI, FAKE_TOKEN, BOT_USER
+
+GROUP_ID = -1001234567890
+
+CATEGORIES = ["connectivity", "performance", "game_issues", "configuration", "others"]
+GAMES = ["valorant", "csgo", "lol", "fortnite", "apex", "gta", "mobile", "other"]
+TIMINGS = ["now", "yesterday", "week", "lastweek", "longtime", "always"]
+
+# Etapa corrente (rótulo do update em processamento) para atribuir consultas SQL
+_current_step: contextvars.ContextVar[str] = contextvars.ContextVar("load_test_step", default="background")
+
+
+def prepare_environment(workdir: str, args) -> None:
+    """Configura o ambiente antes de importar o código do bot (config lê no import)."""
+    os.environ.update({
+        "TELEGRAM_TOKEN": FAKE_TOKEN,
+        "TELEGRAM_GROUP_ID": str(GROUP_ID),
+        "DATABASE_FILE": os.path.join(workdir, "sentinela.db"),
+        "AUDIT_DATABASE_FILE": os.path.join(workdir, "audit.db"),
+        "BOT_MODE": "polling",
+        "UPDATE_CONCURRENCY": str(args.concurrency),
+        "ADMIN_USER_IDS": "",
+    })
+
+
+def generate_cpf(rng: random.Random) -> str:
+    """Gera um CPF com dígitos verificadores válidos."""
+    digits = [rng.randint(0, 9) for _ in range(9)]
+    # Evita sequências repetidas (rejeitadas pela validação)
+    if len(set(digits)) == 1:
+        digits[0] = (digits[0] + 1) % 10
+    for length in (9, 10):
+        total = sum(d * w for d, w in zip(digits, range(length + 1, 1, -1)))
+        check = (total * 10) % 11
+        digits.append(0 if check == 10 else check)
+    return "".join(map(str, digits))
+
+
+class UpdateFactory:
+    """Monta os dicionários de update no formato da Bot API."""
+
+    def __init__(self):
+        self._update_id = 0
+
+    def _next_id(self) -> int:
+        self._update_id += 1
+        return self._update_id
+
+    @staticmethod
+    def _user(user_id: int) -> Dict[str, Any]:
+        return {"id": user_id, "is_bot": False, "first_name": f"Gamer{user_id}", "username": f"gamer{user_id}"}
+
+    def message(self, user_id: int, text: str) -> Dict[str, Any]:
+        update_id = self._next_id()
+        message = {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": user_id, "type": "private"},
+            "from": self._user(user_id),
+            "text": text,
+        }
+        if text.startswith("/"):
+            message["entities"] = [{"type": "bot_command", "offset": 0, "length": len(text)}]
+        return {"update_id": update_id, "message": message}
+
+    def photo(self, user_id: int, index: int) -> Dict[str, Any]:
+        update_id = self._next_id()
+        return {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": int(time.time()),
+                "chat": {"id": user_id, "type": "private"},
+                "from": self._user(user_id),
+                "photo": [{
+                    "file_id": f"photo-{user_id}-{index}",
+                    "file_unique_id": f"u{user_id}{index}",
+                    "width": 1280,
+                    "height": 720,
+                    "file_size": 180_000,
+                }],
+            },
+        }
+
+    def callback(self, user_id: int, data: str) -> Dict[str, Any]:
+        update_id = self._next_id()
+        return {
+            "update_id": update_id,
+            "callback_query": {
+                "id": str(update_id),
+                "from": self._user(user_id),
+                "chat_instance": str(user_id),
+                "data": data,
+                "message": {
+                    "message_id": update_id,
+                    "date": int(time.time()),
+                    "chat": {"id": user_id, "type": "private"},
+                    "from": BOT_USER,
+                    "text": "wizard",
+                },
+            },
+        }
+
+    def join(self, user_id: int) -> Dict[str, Any]:
+        user = self._user(user_id)
+        return {
+            "update_id": self._next_id(),
+            "chat_member": {
+                "chat": {"id": GROUP_ID, "type": "supergroup", "title": "OnCabo Gaming"},
+                "from": user,
+                "date": int(time.time()),
+                "old_chat_member": {"status": "left", "user": user},
+                "new_chat_member": {"status": "member", "user": user},
+            },
+        }
+
+
+def build_journey(rng: random.Random, factory: UpdateFactory, user_id: int, join_ratio: float) -> List[Tuple[str, Callable[[], Dict[str, Any]]]]:
+    """Passos da jornada de um usuário: (etapa, construtor do update)."""
+    cpf = generate_cpf(rng)
+    steps: List[Tuple[str, Callable[[], Dict[str, Any]]]] = [
+        ("start", lambda: factory.message(user_id, "/start")),
+        ("cpf", lambda: factory.message(user_id, cpf)),
+    ]
+    if rng.random() < join_ratio:
+        steps.append(("join", lambda: factory.join(user_id)))
+
+    category, game, timing = rng.choice(CATEGORIES), rng.choice(GAMES), rng.choice(TIMINGS)
+    steps += [
+        ("suporte", lambda: factory.message(user_id, "/suporte")),
+        ("wizard_category", lambda: factory.callback(user_id, f"sup_cat_{category}")),
+        ("wizard_game", lambda: factory.callback(user_id, f"sup_game_{game}")),
+        ("wizard_timing", lambda: factory.callback(user_id, f"sup_timing_{timing}")),
+        ("description", lambda: factory.message(user_id, f"Ping alto em {game} desde {timing}, perda de pacotes à noite")),
+    ]
+    photos = rng.randint(0, 2)
+    for index in range(photos):
+        steps.append(("photo", lambda index=index: factory.photo(user_id, index)))
+    steps += [
+        ("wizard_attachments", lambda: factory.callback(user_id, "sup_att_continue" if photos else "sup_att_skip")),
+        ("wizard_confirm", lambda: factory.callback(user_id, "sup_confirm_create")),
+        ("status", lambda: factory.message(user_id, "/status")),
+    ]
+    return steps
+
+
+class QueryCounter:
+    """Conta comandos SQL por etapa (sqlite3.connect com trace callback)."""
+
+    def __init__(self):
+        self.by_step: Counter = Counter()
+        self._original_connect = sqlite3.connect
+
+    def install(self) -> None:
+        original = self._original_connect
+        by_step = self.by_step
+
+        def connect(*args, **kwargs):
+            conn = original(*args, **kwargs)
+            step = _current_step.get()
+
+            def trace(statement: str) -> None:
+                by_step[step] += 1
+
+            conn.set_trace_callback(trace)
+            return conn
+
+        sqlite3.connect = connect
+
+    def uninstall(self) -> None:
+        sqlite3.connect = self._original_connect
+
+
+class ErrorCounter(logging.Handler):
+    """Conta logs de erro do bot (os handlers capturam e logam as exceções)."""
+
+    def __init__(self):
+        super().__init__(level=logging.ERROR)
+        self.by_step: Counter = Counter()
+        self.samples: Counter = Counter()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if not record.name.startswith("src.sentinela"):
+            return
+        self.by_step[_current_step.get()] += 1
+        self.samples[record.getMessage()[:120]] += 1
+
+
+class LoopLagMonitor:
+    """Mede o atraso do event loop (sleep agendado x acordado de fato)."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples_ms: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples_ms.append(max(0.0, (loop.time() - scheduled - self.interval) * 1000))
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+
+def build_processor_class():
+    """PerUserUpdateProcessor instrumentado (import tardio: depende do ambiente)."""
+    from src.sentinela.presentation.update_processor import PerUserUpdateProcessor
+
+    class TimedUpdateProcessor(PerUserUpdateProcessor):
+        """Mede o tempo de cada update e avisa o driver quando termina."""
+
+        def __init__(self, max_concurrent_updates: int):
+            super().__init__(max_concurrent_updates)
+            self.pending: Dict[int, Tuple[str, float, asyncio.Future]] = {}
+            self.service_ms: Dict[str, List[float]] = defaultdict(list)
+            self.end_to_end_ms: Dict[str, List[float]] = defaultdict(list)
+
+        async def do_process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+            step, enqueued_at, done = self.pending.pop(update.update_id)
+            token = _current_step.set(step)
+            started = time.perf_counter()
+            try:
+                await super().do_process_update(update, coroutine)
+            finally:
+                finished = time.perf_counter()
+                _current_step.reset(token)
+                self.service_ms[step].append((finished - started) * 1000)
+                self.end_to_end_ms[step].append((finished - enqueued_at) * 1000)
+                if not done.done():
+                    done.set_result(None)
+
+    return TimedUpdateProcessor
+
+
+async def start_services(application) -> None:
+    """
+    Mesmos serviços de background que main.py sobe no post_init.
+
+    Ficam de fora só o agendador de tarefas e a reverificação de contratos:
+    rodam em horários fixos e não fazem parte da jornada medida.
+    """
+    from src.sentinela.core import config
+    from src.sentinela.infrastructure.config.dependency_injection import get_container
+    from src.sentinela.infrastructure.events.outbox import OutboxRelay
+    from src.sentinela.infrastructure.events.transport import EventTransportConsumer
+    from src.sentinela.infrastructure.repositories.authorization_snapshot import AuthorizationSnapshot
+    from src.sentinela.infrastructure.repositories.membership_index import MembershipIndex
+    from src.sentinela.infrastructure.repositories.sqlite_conversation_state_store import SQLiteConversationStateStore
+    from src.sentinela.infrastructure.external_services.message_scheduler import OutboundMessageScheduler
+    from src.sentinela.infrastructure.external_services.attachment_pipeline import AttachmentUploadPipeline
+    from src.sentinela.infrastructure.external_services.group_client import GroupClient
+    from src.sentinela.infrastructure.external_services.invite_link_pool import InviteLinkPool
+    from src.sentinela.infrastructure.external_services.membership_executor import MembershipActionExecutor
+    from src.sentinela.infrastructure.scheduling.membership_index_sync import MembershipIndexSync
+    from src.sentinela.core.access_control import PermissionManager
+
+    container = get_container()
+    # Repositórios criam as tabelas no construtor
+    container.get("cpf_verification_repository")
+    container.get(OutboundMessageScheduler).bind(application.bot)
+    container.get(AttachmentUploadPipeline).bind(application.bot)
+    container.get(MembershipActionExecutor).bind(application.bot)
+    container.get(MembershipIndex).load()
+    container.get(GroupClient).bind(application.bot)
+    container.get(MembershipIndexSync).bind(application.bot)
+    container.get(AuthorizationSnapshot).load()
+    await container.get(SQLiteConversationStateStore).load()
+    await PermissionManager.refresh_admins()
+    await container.get(OutboxRelay).start()
+    await container.get(EventTransportConsumer).start()
+    container.get(InviteLinkPool).bind(application.bot)
+    if config.INVITE_POOL_ENABLED:
+        await container.get(InviteLinkPool).start()
+
+
+async def stop_services() -> None:
+    """Mesmo encerramento de main.py (post_shutdown)."""
+    from src.sentinela.infrastructure.config.dependency_injection import get_container
+    from src.sentinela.infrastructure.events.event_bus import EventBus
+    from src.sentinela.infrastructure.events.audit_log import AuditLogWriter
+    from src.sentinela.infrastructure.events.outbox import OutboxRelay
+    from src.sentinela.infrastructure.events.transport import EventTransportConsumer
+    from src.sentinela.infrastructure.repositories.sqlite_conversation_state_store import SQLiteConversationStateStore
+    from src.sentinela.infrastructure.external_services.message_scheduler import OutboundMessageScheduler
+    from src.sentinela.infrastructure.external_services.join_aggregator import JoinBurstAggregator
+    from src.sentinela.infrastructure.external_services.attachment_pipeline import AttachmentUploadPipeline
+    from src.sentinela.infrastructure.external_services.invite_link_pool import InviteLinkPool
+    from src.sentinela.infrastructure.repositories.membership_index import MembershipIndex
+
+    container = get_container()
+    await container.get(InviteLinkPool).stop()
+    await container.get(EventTransportConsumer).stop()
+    await container.get(OutboxRelay).stop()
+    await container.get(JoinBurstAggregator).shutdown()
+    await container.get(AttachmentUploadPipeline).shutdown()
+    await container.get(EventBus).shutdown()
+    await container.get(AuditLogWriter).shutdown()
+    await container.get(OutboundMessageScheduler).shutdown()
+    await container.get(SQLiteConversationStateStore).shutdown()
+    await container.get(MembershipIndex).shutdown()
+
+
+def configure_fakes(args):
+    """Container real com HubSoft e limites do Telegram do perfil escolhido."""
+    from src.sentinela.infrastructure.config.dependency_injection import configure_dependencies, get_container
+    from src.sentinela.domain.repositories.hubsoft_repository import HubSoftAPIRepository
+    from src.sentinela.infrastructure.external_services.mock_hubsoft_api_service import MockHubSoftAPIService
+    from src.sentinela.infrastructure.external_services.message_scheduler import OutboundMessageScheduler
+    from src.sentinela.infrastructure.external_services.attachment_pipeline import AttachmentUploadPipeline
+    from src.sentinela.integrations.hubsoft import cliente
+
+    configure_dependencies()
+    container = get_container()
+    hubsoft = MockHubSoftAPIService(
+        response_delay=args.hubsoft_latency_ms / 1000,
+        latency_jitter=args.hubsoft_jitter_ms / 1000,
+        slow_rate=args.hubsoft_slow_rate,
+        slow_delay=args.hubsoft_slow_ms / 1000,
+        error_rate=args.hubsoft_error_rate,
+        seed=args.seed
+    )
+    container.register_instance(HubSoftAPIRepository, hubsoft)
+    # Consulta legada de CPF (síncrona) usada pela verificação
+    cliente.get_client_info = lambda cpf, full_data=True: hubsoft.legacy_client_info(cpf)
+    # Anexos do /suporte vão para o mock (o cliente real pede token ao HubSoft)
+    container.register_instance(AttachmentUploadPipeline, AttachmentUploadPipeline(atendimento_client=hubsoft))
+
+    if args.rate_limits == "off":
+        container.register_instance(OutboundMessageScheduler, OutboundMessageScheduler(
+            global_rate=100_000, private_chat_rate=100_000, group_chat_per_minute=6_000_000
+        ))
+    return hubsoft
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+def summarize(samples: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+    summary = {}
+    for step, values in samples.items():
+        ordered = sorted(values)
+        summary[step] = {
+            "count": len(ordered),
+            "p50_ms": round(percentile(ordered, 0.50), 2),
+            "p95_ms": round(percentile(ordered, 0.95), 2),
+            "p99_ms": round(percentile(ordered, 0.99), 2),
+            "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+        }
+    return summary
+
+
+async def run(args) -> Dict[str, Any]:
+    from telegram import Update
+    from telegram.ext import Application
+    from src.sentinela.presentation.telegram_bot_new import register_handlers
+
+    hubsoft = configure_fakes(args)
+
+    api = FakeBotAPI(call_latency=args.telegram_latency_ms / 1000)
+    processor = build_processor_class()(args.concurrency)
+    application = Application.builder().token(FAKE_TOKEN).request(api).concurrent_updates(processor).build()
+    register_handlers(application)
+
+    queries = QueryCounter()
+    errors = ErrorCounter()
+    logging.getLogger().addHandler(errors)
+    lag = LoopLagMonitor()
+
+    queries.install()
+    await application.initialize()
+    await start_services(application)
+    await application.start()
+    lag.start()
+
+    rng = random.Random(args.seed)
+    factory = UpdateFactory()
+    loop = asyncio.get_running_loop()
+
+    async def send(step: str, data: Dict[str, Any]) -> None:
+        update = Update.de_json(data, application.bot)
+        done = loop.create_future()
+        processor.pending[update.update_id] = (step, time.perf_counter(), done)
+        await application.update_queue.put(update)
+        await done
+
+    async def journey(user_id: int) -> None:
+        for step, make in build_journey(rng, factory, user_id, args.join_ratio):
+            await send(step, make())
+            if args.think_ms:
+                await asyncio.sleep(rng.uniform(0, 2 * args.think_ms) / 1000)
+
+    started = time.perf_counter()
+    journeys = []
+    for index in range(args.users):
+        if args.arrival_rate:
+            delay = started + index / args.arrival_rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        journeys.append(asyncio.create_task(journey(200000 + index)))
+    await asyncio.wait_for(asyncio.gather(*journeys), timeout=args.timeout)
+    elapsed = time.perf_counter() - started
+
+    await lag.stop()
+    await application.stop()
+    await stop_services()
+    await application.shutdown()
+    queries.uninstall()
+    logging.getLogger().removeHandler(errors)
+
+    total_updates = sum(len(v) for v in processor.service_ms.values())
+    total_errors = sum(errors.by_step.values())
+    lag_sorted = sorted(lag.samples_ms)
+
+    return {
+        "config": {
+            "users": args.users,
+            "arrival_rate": args.arrival_rate,
+            "concurrency": args.concurrency,
+            "rate_limits": args.rate_limits,
+            "hubsoft_latency_ms": args.hubsoft_latency_ms,
+            "hubsoft_error_rate": args.hubsoft_error_rate,
+            "seed": args.seed,
+        },
+        "elapsed_s": round(elapsed, 3),
+        "updates": total_updates,
+        "throughput_updates_s": round(total_updates / elapsed, 2) if elapsed else 0.0,
+        "latency": summarize(processor.end_to_end_ms),
+        "service_time": summarize(processor.service_ms),
+        "errors": {
+            "total": total_errors,
+            "rate": round(total_errors / total_updates, 4) if total_updates else 0.0,
+            "by_step": dict(errors.by_step),
+            "top": errors.samples.most_common(5),
+        },
+        "db_queries": {
+            "total": sum(queries.by_step.values()),
+            "per_update": round(sum(v for k, v in queries.by_step.items() if k != "background") / total_updates, 2) if total_updates else 0.0,
+            "by_step": {
+                step: round(count / len(processor.service_ms[step]), 2) if processor.service_ms.get(step) else count
+                for step, count in queries.by_step.items()
+            },
+        },
+        "event_loop_lag": {
+            "p50_ms": round(percentile(lag_sorted, 0.50), 2),
+            "p99_ms": round(percentile(lag_sorted, 0.99), 2),
+            "max_ms": round(lag_sorted[-1], 2) if lag_sorted else 0.0,
+        },
+        "bot_api_calls": dict(api.calls),
+        "hubsoft_requests": hubsoft._request_count,
+        "processor": processor.get_stats(),
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"\n{report['updates']} updates de {report['config']['users']} usuários em {report['elapsed_s']:.2f}s "
+        f"({report['throughput_updates_s']:.1f} updates/s)\n"
+    )
+    print(f"{'etapa':<20}{'n':>6}{'p50':>10}{'p95':>10}{'p99':>10}{'serviço p99':>14}{'SQL/upd':>9}")
+    for step, stats in sorted(report["latency"].items()):
+        service = report["service_time"][step]
+        sql = report["db_queries"]["by_step"].get(step, 0)
+        print(
+            f"{step:<20}{stats['count']:>6}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}"
+            f"{stats['p99_ms']:>10.1f}{service['p99_ms']:>14.1f}{sql:>9}"
+        )
+    errors = report["errors"]
+    lag = report["event_loop_lag"]
+    print(f"\nerros: {errors['total']} ({errors['rate']:.2%})  {errors['by_step']}")
+    for message, count in errors["top"]:
+        print(f"  {count:5d}x {message}")
+    print(f"SQL: {report['db_queries']['total']} comandos ({report['db_queries']['per_update']} por update)")
+    print(f"atraso do event loop: p50={lag['p50_ms']}ms  p99={lag['p99_ms']}ms  max={lag['max_ms']}ms")
+    print(f"API do Telegram: {report['bot_api_calls']}")
+    print(f"HubSoft: {report['hubsoft_requests']} requisições")
+
+
+def check_gates(report: Dict[str, Any], args) -> List[str]:
+    """Retorna as violações dos limites e do baseline."""
+    failures = []
+    worst_p99 = max((s["p99_ms"] for s in report["latency"].values()), default=0.0)
+    if args.max_p99_ms is not None and worst_p99 > args.max_p99_ms:
+        failures.append(f"p99 {worst_p99:.1f}ms > {args.max_p99_ms}ms")
+    if args.max_error_rate is not None and report["errors"]["rate"] > args.max_error_rate:
+        failures.append(f"taxa de erro {report['errors']['rate']:.2%} > {args.max_error_rate:.2%}")
+    if args.max_loop_lag_ms is not None and report["event_loop_lag"]["p99_ms"] > args.max_loop_lag_ms:
+        failures.append(f"atraso do event loop p99 {report['event_loop_lag']['p99_ms']}ms > {args.max_loop_lag_ms}ms")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        tolerance = 1 + args.tolerance
+        if report["throughput_updates_s"] * tolerance < baseline["throughput_updates_s"]:
+            failures.append(f"vazão {report['throughput_updates_s']} < baseline {baseline['throughput_updates_s']}")
+        for step, stats in report["latency"].items():
+            reference = baseline["latency"].get(step)
+            if reference and stats["p99_ms"] > reference["p99_ms"] * tolerance:
+                failures.append(f"{step}: p99 {stats['p99_ms']}ms > baseline {reference['p99_ms']}ms")
+        for step, per_update in report["db_queries"]["by_step"].items():
+            reference = baseline["db_queries"]["by_step"].get(step)
+            if step != "background" and reference is not None and per_update > reference:
+                failures.append(f"{step}: {per_update} comandos SQL por update > baseline {reference}")
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Teste de carga sintético do TelegramBotHandler")
+    parser.add_argument("--users", type=int, default=100, help="Usuários sintéticos (uma jornada cada)")
+    parser.add_argument("--arrival-rate", type=float, default=20, help="Novos usuários por segundo (0 = todos juntos)")
+    parser.add_argument("--think-ms", type=float, default=50, help="Pausa média do usuário entre passos")
+    parser.add_argument("--join-ratio", type=float, default=0.5, help="Fração de usuários que entra no grupo")
+    parser.add_argument("--concurrency", type=int, default=64, help="UPDATE_CONCURRENCY")
+    parser.add_argument("--rate-limits", choices=["production", "off"], default="production",
+                        help="Limites de envio do Telegram no OutboundMessageScheduler")
+    parser.add_argument("--telegram-latency-ms", type=float, default=30)
+    parser.add_argument("--hubsoft-latency-ms", type=float, default=150)
+    parser.add_argument("--hubsoft-jitter-ms", type=float, default=100)
+    parser.add_argument("--hubsoft-slow-rate", type=float, default=0.02)
+    parser.add_argument("--hubsoft-slow-ms", type=float, default=2000)
+    parser.add_argument("--hubsoft-error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=600, help="Tempo máximo da rodada (segundos)")
+    parser.add_argument("--report", help="Grava o relatório em JSON")
+    parser.add_argument("--baseline", help="Relatório JSON de referência para comparação")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Piora aceita em relação ao baseline")
+    parser.add_argument("--max-p99-ms", type=float, help="Falha se o p99 de alguma etapa passar disso")
+    parser.add_argument("--max-error-rate", type=float, help="Falha se a taxa de erros passar disso")
+    parser.add_argument("--max-loop-lag-ms", type=float, help="Falha se o p99 do atraso do event loop passar disso")
+    parser.add_argument("--verbose", action="store_true", help="Mostra os logs do bot")
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO)
+    else:
+        # Erros continuam chegando ao ErrorCounter, só não vão para o terminal
+        logging.getLogger().setLevel(logging.ERROR)
+        logging.getLogger().addHandler(logging.NullHandler())
+
+    with tempfile.TemporaryDirectory(prefix="sentinela-load-") as workdir:
+        prepare_environment(workdir, args)
+        report = asyncio.run(run(args))
+
+    print_report(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nRelatório salvo em {args.report}")
+
+    failures = check_gates(report, args)
+    if failures:
+        print("\n❌ Regressão detectada:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    if any(v is not None for v in (args.max_p99_ms, args.max_error_rate, args.max_loop_lag_ms)) or args.baseline:
+        print("\n✅ Dentro dos limites")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Consulta e exportação da trilha de auditoria.
+
+Lê o audit log gravado em lote pelos handlers globais de auditoria
+(TicketAuditHandler / UserActivityAuditHandler).
+
+Uso:
+    python scripts/query_audit_log.py --user 123456789
+    python scripts/query_audit_log.py --ticket 42 --format jsonl --output ticket_42.jsonl
+    python scripts/query_audit_log.py --user 123456789 --since 2025-01-01 --format csv
+"""
+
+import sys
+import os
+import csv
+import json
+import argparse
+from datetime import datetime
+
+# Adiciona o diretório raiz ao path
+root_dir = os.path.join(os.path.dirname(__file__), '..')
+sys.path.append(root_dir)
+
+# Tenta importar config, se falhar usa caminho padrão
+try:
+    from src.sentinela.core.config import AUDIT_DATABASE_FILE
+except (ImportError, ValueError):
+    AUDIT_DATABASE_FILE = "data/database/audit.db"
+
+from src.sentinela.infrastructure.events.audit_log import AuditLogWriter
+
+COLUMNS = ["id", "occurred_at", "category", "event_type", "event_id", "user_id", "ticket_id", "recorded_at"]
+
+
+def write_table(records: list, out) -> None:
+    """Imprime registros em formato legível."""
+    for record in records:
+        ticket = f" ticket={record['ticket_id']}" if record['ticket_id'] is not None else ""
+        user = f" user={record['user_id']}" if record['user_id'] is not None else ""
+        out.write(f"{record['occurred_at']}  {record['event_type']:<32}{user}{ticket}\n")
+    out.write(f"\n{len(records)} registros\n")
+
+
+def write_jsonl(records: list, out) -> None:
+    """Exporta registros em JSON Lines."""
+    for record in records:
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def write_csv(records: list, out) -> None:
+    """Exporta registros em CSV (payload como JSON)."""
+    writer = csv.writer(out)
+    writer.writerow(COLUMNS + ["payload"])
+    for record in records:
+        writer.writerow([record[c] for c in COLUMNS] + [json.dumps(record['payload'], ensure_ascii=False)])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Consulta a trilha de auditoria")
+    parser.add_argument("--db", default=AUDIT_DATABASE_FILE, help="Arquivo SQLite da auditoria")
+    parser.add_argument("--user", type=int, help="ID do usuário no Telegram")
+    parser.add_argument("--ticket", type=int, help="ID do ticket")
+    parser.add_argument("--event-type", help="Nome do evento (ex.: TicketCreated)")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="Data/hora inicial (ISO)")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="Data/hora final (ISO)")
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--format", choices=["table", "jsonl", "csv"], default="table")
+    parser.add_argument("--output", help="Arquivo de saída (padrão: stdout)")
+    args = parser.parse_args()
+
+    if args.user is None and args.ticket is None and args.event_type is None:
+        parser.error("informe --user, --ticket ou --event-type")
+
+    if not os.path.exists(args.db):
+        print(f"❌ Audit log não encontrado: {args.db}")
+        sys.exit(1)
+
+    records = AuditLogWriter(args.db).query(
+        user_id=args.user,
+        ticket_id=args.ticket,
+        event_type=args.event_type,
+        since=args.since,
+        until=args.until,
+        limit=args.limit
+    )
+
+    writers = {"table": write_table, "jsonl": write_jsonl, "csv": write_csv}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            writers[args.format](records, out)
+        print(f"✅ {len(records)} registros exportados para {args.output}")
+    else:
+        writers[args.format](records, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
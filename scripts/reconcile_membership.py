@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Reconciliação de membros do grupo - execução manual.
+
+A reconciliação roda de hora em hora dentro do bot (tarefa agendada
+`cleanup_inactive_members`). Por padrão, este script apenas simula: imprime
+quem seria removido (e por qual critério) ou restaurado, sem tocar no
+grupo. Com --apply, executa o plano usando o mesmo lease de job do bot.
+
+Uso:
+    python3 scripts/reconcile_membership.py [--limit N]
+    python3 scripts/reconcile_membership.py --apply [--max-removals N] [--wait SEGUNDOS]
+"""
+
+import sys
+import os
+import asyncio
+import argparse
+import logging
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+sys.path.insert(0, str(root_dir / "src"))
+
+from telegram import Bot
+
+from sentinela.infrastructure.config.dependency_injection import configure_dependencies, get_container
+from sentinela.infrastructure.events.transport import SQLiteEventTransport, RemoteEventBus
+from sentinela.infrastructure.external_services.membership_executor import MembershipActionExecutor
+from sentinela.infrastructure.external_services.message_scheduler import OutboundMessageScheduler
+from sentinela.infrastructure.repositories.membership_index import MembershipIndex
+from sentinela.infrastructure.repositories.sqlite_membership_sets import SQLiteMembershipSets
+from sentinela.infrastructure.scheduling.job_lease import SQLiteJobLeaseStore, default_owner_id
+from sentinela.infrastructure.scheduling.membership_reconciler import MembershipReconciler
+
+# Mesmo nome da tarefa agendada no bot (ScheduledTask.create_cleanup_task)
+JOB_NAME = "cleanup_inactive_members"
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+async def apply(args: argparse.Namespace) -> int:
+    """Aplica o plano com bot, fila de envios e eventos próprios deste processo."""
+    token = os.getenv("TELEGRAM_TOKEN")
+    group_id = int(os.getenv("TELEGRAM_GROUP_ID", "0"))
+    if not token or not group_id:
+        raise ValueError("TELEGRAM_TOKEN e TELEGRAM_GROUP_ID são obrigatórios")
+
+    container = get_container()
+    bot = Bot(token=token)
+    executor = container.get(MembershipActionExecutor)
+    executor.bind(bot)
+    outbound = OutboundMessageScheduler(bot)
+    # Banimentos chegam ao bot em execução (auditoria) pelo transporte de eventos
+    bot_events = RemoteEventBus(container.get(SQLiteEventTransport), origin="reconcile_membership")
+    reconciler = MembershipReconciler(
+        container.get(SQLiteMembershipSets),
+        executor,
+        bot_events,
+        outbound,
+        index=container.get(MembershipIndex),
+        max_removals=args.max_removals if args.max_removals is not None else container.get(MembershipReconciler).max_removals
+    )
+
+    try:
+        leases = container.get(SQLiteJobLeaseStore)
+        async with leases.lease(JOB_NAME, default_owner_id("reconcile_membership"), wait_timeout=args.wait) as lease:
+            if not lease.acquired:
+                logger.warning(f"⏭️ Reconciliação já em execução por {lease.holder}; nada a fazer")
+                return 1
+            await reconciler.reconcile()
+        stats = reconciler.get_stats()
+        logger.info(
+            f"✅ Reconciliação aplicada: {stats['removed']} removidos, "
+            f"{stats['restored']} restaurados, {stats['failed']} falhas"
+        )
+        return 0 if stats['failed'] == 0 else 1
+    except RuntimeError as e:
+        logger.error(f"❌ {e}")
+        return 1
+    finally:
+        await outbound.shutdown()
+        await bot_events.close()
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description="Reconciliação de membros do grupo (simulação por padrão)")
+    parser.add_argument("--apply", action="store_true", help="Executa as remoções e restaurações")
+    parser.add_argument(
+        "--max-removals", type=int, default=None,
+        help="Limite de remoções desta execução (padrão: MEMBERSHIP_RECONCILE_MAX_REMOVALS)"
+    )
+    parser.add_argument("--limit", type=int, default=100, help="Ações listadas no relatório (padrão: 100)")
+    parser.add_argument(
+        "--wait", type=float, default=0,
+        help="Segundos aguardando a reconciliação em andamento terminar (padrão: não espera)"
+    )
+    args = parser.parse_args()
+
+    from dotenv import load_dotenv
+    load_dotenv()
+    configure_dependencies()
+
+    if not args.apply:
+        plan = get_container().get(MembershipReconciler).plan()
+        print(plan.format_report(limit=args.limit))
+        print("\nSimulação: nada foi alterado. Use --apply para executar.")
+        sys.exit(0)
+
+    sys.exit(asyncio.run(apply(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Ferramenta da dead-letter queue de eventos de domínio.
+
+Eventos que falharam em todas as tentativas de entrega do outbox
+ficam em `event_dead_letters`. Depois de corrigir a causa da falha,
+devolva-os ao outbox: o OutboxRelay do bot os entrega novamente.
+
+Uso:
+    python scripts/replay_dead_letters.py stats
+    python scripts/replay_dead_letters.py list [--limit 50] [--all]
+    python scripts/replay_dead_letters.py replay [--id 3 --id 7] [--type TicketCreated]
+    python scripts/replay_dead_letters.py purge [--days 7]
+"""
+
+import sys
+import os
+import asyncio
+import argparse
+
+# Adiciona o diretório raiz ao path
+root_dir = os.path.join(os.path.dirname(__file__), '..')
+sys.path.append(root_dir)
+
+# Tenta importar config, se falhar usa caminho padrão
+try:
+    from src.sentinela.core.config import DATABASE_FILE
+except (ImportError, ValueError):
+    DATABASE_FILE = "data/database/sentinela.db"
+
+from src.sentinela.infrastructure.events.outbox import SQLiteEventOutbox
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Executa o subcomando escolhido."""
+    outbox = SQLiteEventOutbox(args.db)
+
+    if args.command == "stats":
+        for key, value in (await outbox.get_stats()).items():
+            print(f"{key:<14} {value}")
+
+    elif args.command == "list":
+        dead_letters = await outbox.list_dead_letters(limit=args.limit, include_replayed=args.all)
+        if not dead_letters:
+            print("✅ Dead-letter queue vazia")
+            return
+        for item in dead_letters:
+            replayed = f"  (reprocessado em {item['replayed_at']})" if item['replayed_at'] else ""
+            print(
+                f"#{item['id']:<5} {item['event_type']:<28} tentativas={item['attempts']}  "
+                f"falhou em {item['failed_at']}{replayed}"
+            )
+            print(f"       {item['last_error']}")
+
+    elif args.command == "replay":
+        count = await outbox.replay_dead_letters(dead_letter_ids=args.id, event_type=args.type)
+        print(f"🔁 {count} eventos devolvidos ao outbox")
+
+    elif args.command == "purge":
+        count = await outbox.purge_dispatched(older_than_days=args.days)
+        print(f"🧹 {count} eventos entregues removidos do outbox")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Dead-letter queue de eventos de domínio")
+    parser.add_argument("--db", default=DATABASE_FILE, help="Caminho do banco SQLite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("stats", help="Resumo do outbox")
+
+    list_parser = subparsers.add_parser("list", help="Lista eventos na dead-letter queue")
+    list_parser.add_argument("--limit", type=int, default=50)
+    list_parser.add_argument("--all", action="store_true", help="Inclui eventos já reprocessados")
+
+    replay_parser = subparsers.add_parser("replay", help="Devolve eventos ao outbox")
+    replay_parser.add_argument("--id", type=int, action="append", help="ID da dead letter (repetível)")
+    replay_parser.add_argument("--type", help="Nome do tipo de evento")
+
+    purge_parser = subparsers.add_parser("purge", help="Remove eventos já entregues do outbox")
+    purge_parser.add_argument("--days", type=int, default=7)
+
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ Implementa a lógica de aplicação para comandos
 relacionados à verificação de CPF.
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, List
 
@@ -102,7 +103,7 @@ class StartCPFVerificationHandler(CommandHandler[StartCPFVerificationCommand]):
 
             # Publica eventos de domínio
             for event in verification.get_domain_events():
-                await self.event_bus.publish(event)
+                await self.event_bus.publish_nowait(event)
 
             logger.info(f"Verificação iniciada para usuário {command.username} (ID: {command.user_id})")
 
@@ -242,7 +243,7 @@ class SubmitCPFForVerificationHandler(CommandHandler[SubmitCPFForVerificationCom
             await self.verification_repository.save(verification)
 
             for event in verification.get_domain_events():
-                await self.event_bus.publish(event)
+                await self.event_bus.publish_nowait(event)
 
             logger.info(f"[CPF Handler] ✅✅✅ CPF verificado com sucesso para usuário {command.username} - CPF: {cpf_masked}")
 
@@ -275,14 +276,14 @@ class SubmitCPFForVerificationHandler(CommandHandler[SubmitCPFForVerificationCom
         """
         try:
             # Importa dinamicamente para evitar dependência circular
-            from ....integrations.hubsoft.cliente import get_client_info
+            from ...integrations.hubsoft.cliente import get_client_info
 
             # Log para debug
             cpf_masked = f"{str(cpf)[:3]}***{str(cpf)[-2:]}"
             logger.info(f"Consultando HubSoft para CPF {cpf_masked}")
 
             # Usa função otimizada (não deprecated)
-            client_data = get_client_info(str(cpf), full_data=True)
+            client_data = await asyncio.to_thread(get_client_info, str(cpf), full_data=True)
 
             if client_data:
                 # Campo correto retornado pela API HubSoft
@@ -356,7 +357,7 @@ class CancelCPFVerificationHandler(CommandHandler[CancelCPFVerificationCommand])
 
             # Publica eventos
             for event in verification.get_domain_events():
-                await self.event_bus.publish(event)
+                await self.event_bus.publish_nowait(event)
 
             logger.info(f"Verificação cancelada para usuário {command.username}")
 
@@ -416,8 +417,8 @@ class ResolveCPFDuplicateHandler(CommandHandler[ResolveCPFDuplicateCommand]):
             
             cpf = CPF.from_raw(last_attempt.cpf_provided)
 
-            from ....integrations.hubsoft.cliente import get_client_info
-            client_data = get_client_info(str(cpf), full_data=True)
+            from ...integrations.hubsoft.cliente import get_client_info
+            client_data = await asyncio.to_thread(get_client_info, str(cpf), full_data=True)
             if not client_data:
                  return CommandResult.failure("client_not_found_after_resolution", "Cliente não encontrado no Hubsoft após resolução.")
 
@@ -425,7 +426,7 @@ class ResolveCPFDuplicateHandler(CommandHandler[ResolveCPFDuplicateCommand]):
             await self.verification_repository.save(verification)
 
             for event in verification.get_domain_events():
-                await self.event_bus.publish(event)
+                await self.event_bus.publish_nowait(event)
 
             logger.info(f"Conflito resolvido e verificação {command.verification_id} completada.")
             
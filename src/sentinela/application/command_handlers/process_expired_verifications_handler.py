@@ -5,13 +5,11 @@ Handler para processar verificações de CPF expiradas.
 """
 
 import logging
-from datetime import datetime
 from typing import Dict, Any
 
 from ..commands.cpf_verification_commands import ProcessExpiredVerificationsCommand
 from .base import CommandHandler
 from ...domain.repositories.cpf_verification_repository import CPFVerificationRepository
-from ...domain.entities.cpf_verification import VerificationStatus
 from ...infrastructure.events.event_bus import EventBus
 
 logger = logging.getLogger(__name__)
@@ -49,9 +47,8 @@ class ProcessExpiredVerificationsHandler(CommandHandler[ProcessExpiredVerificati
 
             for verification in expired_verifications:
                 try:
-                    # Atualiza status para expirado
-                    verification.status = VerificationStatus.EXPIRED
-                    verification.completed_at = datetime.now()
+                    # Atualiza status para expirado (completed_at = agora)
+                    verification.expire_verification()
 
                     # Salva no repositório
                     await self.verification_repository.save(verification)
@@ -1,4 +1,5 @@
 
+import asyncio
 import logging
 from .base import CommandHandler, CommandResult
 from ..commands.cpf_verification_commands import ResolveCPFDuplicateCommand
@@ -53,8 +54,8 @@ class ResolveCPFDuplicateHandler(CommandHandler[ResolveCPFDuplicateCommand]):
             
             cpf = CPF.from_raw(last_attempt.cpf_provided)
 
-            from ....integrations.hubsoft.cliente import get_client_info
-            client_data = get_client_info(str(cpf), full_data=True)
+            from ...integrations.hubsoft.cliente import get_client_info
+            client_data = await asyncio.to_thread(get_client_info, str(cpf), full_data=True)
             if not client_data:
                  return CommandResult.failure("client_not_found_after_resolution", "Cliente não encontrado no Hubsoft após resolução.")
 
@@ -62,7 +63,7 @@ class ResolveCPFDuplicateHandler(CommandHandler[ResolveCPFDuplicateCommand]):
             await self.verification_repository.save(verification)
 
             for event in verification.get_domain_events():
-                await self.event_bus.publish(event)
+                await self.event_bus.publish_nowait(event)
 
             logger.info(f"Conflito resolvido e verificação {command.verification_id} completada com sucesso.")
             
@@ -412,13 +412,8 @@ class CPFVerificationUseCase(UseCase):
         """
         try:
             command = ProcessExpiredVerificationsCommand()
-            result = await self.expire_handler.handle(command)
-
-            return {
-                "success": result.success,
-                "message": result.message,
-                "data": result.data
-            }
+            # O handler já devolve o dict com success e as contagens
+            return await self.expire_handler.handle(command)
 
         except Exception as e:
             logger.error(f"Erro ao processar verificações expiradas: {e}")
@@ -183,7 +183,6 @@ class GroupManagementUseCase(UseCase):
             user_id = user.id if user else UserId(telegram_id)
 
             member = GroupMember(
-                id=UserId(telegram_id),  # Usando telegram_id como ID temporário
                 user_id=user_id,
                 telegram_id=telegram_id,
                 username=username,
@@ -38,6 +38,7 @@ from ...domain.repositories.hubsoft_repository import (
     HubSoftCacheRepository
 )
 from ...domain.entities.hubsoft_integration import IntegrationType, IntegrationPriority
+from ...infrastructure.events.event_bus import EventBus
 
 logger = logging.getLogger(__name__)
 
@@ -86,7 +87,8 @@ class HubSoftIntegrationUseCase:
         status_handler: GetHubSoftIntegrationStatusHandler,
         integration_repository: HubSoftIntegrationRepository,
         api_repository: HubSoftAPIRepository,
-        cache_repository: HubSoftCacheRepository
+        cache_repository: HubSoftCacheRepository,
+        event_bus: EventBus
     ):
         self.schedule_handler = schedule_handler
         self.sync_ticket_handler = sync_ticket_handler
@@ -99,6 +101,7 @@ class HubSoftIntegrationUseCase:
         self.integration_repository = integration_repository
         self.api_repository = api_repository
         self.cache_repository = cache_repository
+        self.event_bus = event_bus
 
     # Operações de Criação de Atendimento
 
@@ -259,6 +262,19 @@ class HubSoftIntegrationUseCase:
                 f"id={id_atendimento}, user={user_id}"
             )
 
+            # Side effects (notificações, auditoria) rodam em background:
+            # a confirmação para o usuário não espera por eles
+            await self._publish_ticket_created(
+                user_id=user_id,
+                username=user_telegram,
+                category=category,
+                game_name=game_name,
+                timing=timing,
+                description=description,
+                protocolo=protocolo,
+                id_atendimento=id_atendimento
+            )
+
             return HubSoftOperationResult(
                 success=True,
                 message=f"Atendimento criado com sucesso. Protocolo: {protocolo}",
@@ -279,6 +295,44 @@ class HubSoftIntegrationUseCase:
                 error_code="CREATE_TICKET_ERROR"
             )
 
+    async def _publish_ticket_created(
+        self,
+        user_id: int,
+        username: str,
+        category: str,
+        game_name: str,
+        timing: str,
+        description: str,
+        protocolo: Optional[str],
+        id_atendimento: Optional[Any]
+    ) -> None:
+        """
+        Publica TicketCreated sem bloquear a criação do atendimento.
+
+        Falhas na publicação são apenas registradas em log.
+        """
+        try:
+            from ...domain.events.ticket_events import TicketCreated
+            from ...domain.value_objects.identifiers import TicketId, Protocol
+
+            if not protocolo or not id_atendimento:
+                return
+
+            await self.event_bus.publish_nowait(
+                TicketCreated(
+                    ticket_id=TicketId(int(id_atendimento)),
+                    user_id=user_id,
+                    username=username,
+                    category=category,
+                    affected_game=game_name,
+                    problem_timing=timing,
+                    description=description,
+                    protocol=Protocol.hubsoft(str(protocolo))
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Não foi possível publicar TicketCreated para user {user_id}: {e}")
+
     # Operações de Sincronização de Tickets
 
     async def sync_ticket_to_hubsoft(
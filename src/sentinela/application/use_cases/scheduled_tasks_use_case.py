@@ -4,8 +4,9 @@ Scheduled Tasks Use Case.
 Coordena execução de tarefas agendadas do sistema.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -30,12 +31,17 @@ class TaskExecutionResult:
     error: Optional[str] = None
 
 
+# Rotina executada no processo quando a tarefa dispara
+TaskHandler = Callable[[], Awaitable[Any]]
+
+
 class ScheduledTasksUseCase(UseCase):
     """
     Use Case para gerenciamento de tarefas agendadas.
 
     Coordena registro, execução e monitoramento de tarefas
-    periódicas do sistema.
+    periódicas do sistema. Os horários são controlados pelo
+    DeadlineScheduler (infraestrutura), que chama `run_task`.
     """
 
     def __init__(
@@ -50,14 +56,21 @@ class ScheduledTasksUseCase(UseCase):
         """
         self.event_bus = event_bus
         self._registered_tasks: Dict[str, ScheduledTask] = {}
+        self._handlers: Dict[str, TaskHandler] = {}
         self._task_history: List[TaskExecutionResult] = []
 
-    async def register_task(self, task: ScheduledTask) -> UseCaseResult:
+    async def register_task(
+        self,
+        task: ScheduledTask,
+        handler: Optional[TaskHandler] = None
+    ) -> UseCaseResult:
         """
         Registra nova tarefa agendada.
 
         Args:
             task: Tarefa a ser registrada
+            handler: Rotina executada no processo a cada disparo (opcional;
+                sem ela a tarefa só publica ScheduledTaskTriggeredEvent)
 
         Returns:
             UseCaseResult: Resultado do registro
@@ -69,6 +82,8 @@ class ScheduledTasksUseCase(UseCase):
                 logger.warning(f"Tarefa {task.task_id} já registrada. Sobrescrevendo.")
 
             self._registered_tasks[task.task_id] = task
+            if handler is not None:
+                self._handlers[task.task_id] = handler
 
             logger.info(f"Tarefa {task.name} registrada com sucesso")
 
@@ -85,13 +100,20 @@ class ScheduledTasksUseCase(UseCase):
                 message=f"Erro ao registrar tarefa: {str(e)}"
             )
 
-    async def register_default_tasks(self) -> UseCaseResult:
+    async def register_default_tasks(
+        self,
+        handlers: Optional[Dict[str, TaskHandler]] = None
+    ) -> UseCaseResult:
         """
         Registra todas as tarefas padrão do sistema.
 
+        Args:
+            handlers: Rotinas por task_id executadas no processo (opcional)
+
         Returns:
             UseCaseResult: Resultado do registro
         """
+        handlers = handlers or {}
         try:
             logger.info("Registrando tarefas padrão do sistema")
 
@@ -101,12 +123,14 @@ class ScheduledTasksUseCase(UseCase):
                 ScheduledTask.create_invite_cleanup_task(),
                 ScheduledTask.create_verification_expiry_task(),
                 ScheduledTask.create_hubsoft_sync_task(),
-                ScheduledTask.create_member_cpf_check_task()
+                ScheduledTask.create_member_cpf_check_task(),
+                ScheduledTask.create_membership_sync_task(),
+                ScheduledTask.create_backup_task()
             ]
 
             registered_count = 0
             for task in default_tasks:
-                result = await self.register_task(task)
+                result = await self.register_task(task, handlers.get(task.task_id))
                 if result.success:
                     registered_count += 1
 
@@ -142,20 +166,13 @@ class ScheduledTasksUseCase(UseCase):
                 if task.should_run():
                     logger.info(f"Executando tarefa: {task.name}")
 
-                    result = await self._execute_task(task)
+                    result = await self.run_task(task_id, scheduled_for=task.next_run)
 
                     if result.success:
                         executed_tasks.append(task.name)
                     else:
                         failed_tasks.append(task.name)
 
-                    # Guarda histórico
-                    self._task_history.append(result)
-
-                    # Limita histórico a 100 últimas execuções
-                    if len(self._task_history) > 100:
-                        self._task_history = self._task_history[-100:]
-
             logger.info(
                 f"Execução concluída: {len(executed_tasks)} sucesso, "
                 f"{len(failed_tasks)} falhas"
@@ -177,6 +194,77 @@ class ScheduledTasksUseCase(UseCase):
                 message=f"Erro ao executar tarefas: {str(e)}"
             )
 
+    async def run_task(
+        self,
+        task_id: str,
+        scheduled_for: Optional[datetime] = None,
+        next_run: Optional[datetime] = None
+    ) -> TaskExecutionResult:
+        """
+        Executa uma tarefa registrada e atualiza seus horários.
+
+        Args:
+            task_id: ID da tarefa
+            scheduled_for: Horário agendado desta execução (padrão: agora)
+            next_run: Próximo horário já calculado pelo agendador
+                (padrão: calculado a partir de `scheduled_for`)
+
+        Returns:
+            TaskExecutionResult: Resultado da execução
+
+        Raises:
+            KeyError: Se a tarefa não estiver registrada
+        """
+        task = self._registered_tasks[task_id]
+        scheduled_for = scheduled_for or datetime.now()
+
+        result = await self._execute_task(task)
+
+        self._registered_tasks[task_id] = task.with_run(
+            last_run=scheduled_for,
+            next_run=next_run or task.next_run_after(scheduled_for)
+        )
+
+        # Guarda histórico (limitado às 100 últimas execuções)
+        self._task_history.append(result)
+        if len(self._task_history) > 100:
+            self._task_history = self._task_history[-100:]
+
+        return result
+
+    def get_task(self, task_id: str) -> Optional[ScheduledTask]:
+        """
+        Retorna a tarefa registrada.
+
+        Args:
+            task_id: ID da tarefa
+
+        Returns:
+            Optional[ScheduledTask]: Tarefa ou None
+        """
+        return self._registered_tasks.get(task_id)
+
+    def get_tasks(self) -> List[ScheduledTask]:
+        """
+        Retorna todas as tarefas registradas.
+
+        Returns:
+            List[ScheduledTask]: Tarefas
+        """
+        return list(self._registered_tasks.values())
+
+    def has_handler(self, task_id: str) -> bool:
+        """
+        Verifica se a tarefa tem rotina executada no processo.
+
+        Args:
+            task_id: ID da tarefa
+
+        Returns:
+            bool: True se há handler registrado
+        """
+        return task_id in self._handlers
+
     async def get_task_status(self, task_id: str) -> UseCaseResult:
         """
         Obtém status de uma tarefa.
@@ -211,6 +299,8 @@ class ScheduledTasksUseCase(UseCase):
                 'is_enabled': task.is_enabled,
                 'next_run': task.next_run.isoformat(),
                 'last_run': task.last_run.isoformat() if task.last_run else None,
+                'cron': task.cron,
+                'in_process': task_id in self._handlers,
                 'last_execution': {
                     'status': last_execution.status.value,
                     'duration': last_execution.duration_seconds,
@@ -290,8 +380,7 @@ class ScheduledTasksUseCase(UseCase):
                     message="Tarefa já está habilitada"
                 )
 
-            # Como é frozen, não podemos modificar.
-            # Em produção, criaria nova instância com is_enabled=True
+            self._registered_tasks[task_id] = old_task.with_enabled(True)
             logger.info(f"Tarefa {task_id} habilitada")
 
             return UseCaseResult(
@@ -306,71 +395,126 @@ class ScheduledTasksUseCase(UseCase):
                 message=f"Erro ao habilitar tarefa: {str(e)}"
             )
 
+    async def disable_task(self, task_id: str) -> UseCaseResult:
+        """
+        Desabilita uma tarefa.
+
+        Args:
+            task_id: ID da tarefa
+
+        Returns:
+            UseCaseResult: Resultado da operação
+        """
+        try:
+            if task_id not in self._registered_tasks:
+                return UseCaseResult(
+                    success=False,
+                    message="Tarefa não encontrada"
+                )
+
+            old_task = self._registered_tasks[task_id]
+
+            if not old_task.is_enabled:
+                return UseCaseResult(
+                    success=True,
+                    message="Tarefa já está desabilitada"
+                )
+
+            self._registered_tasks[task_id] = old_task.with_enabled(False)
+            logger.info(f"Tarefa {task_id} desabilitada")
+
+            return UseCaseResult(
+                success=True,
+                message=f"Tarefa '{old_task.name}' desabilitada"
+            )
+
+        except Exception as e:
+            logger.error(f"Erro ao desabilitar tarefa {task_id}: {e}")
+            return UseCaseResult(
+                success=False,
+                message=f"Erro ao desabilitar tarefa: {str(e)}"
+            )
+
     # Private helper methods
 
     async def _execute_task(self, task: ScheduledTask) -> TaskExecutionResult:
         """
         Executa uma tarefa específica.
 
+        Publica ScheduledTaskTriggeredEvent e, se houver handler no processo,
+        executa-o respeitando `task.timeout_seconds`.
+
         Args:
             task: Tarefa a executar
 
         Returns:
             TaskExecutionResult: Resultado da execução
         """
+        from ...domain.events.system_events import (
+            ScheduledTaskTriggeredEvent,
+            ScheduledTaskCompletedEvent,
+            ScheduledTaskFailedEvent
+        )
+
         started_at = datetime.now()
+        status = TaskStatus.COMPLETED
+        error: Optional[str] = None
 
         try:
             logger.info(f"Executando tarefa: {task.name} (ID: {task.task_id})")
 
-            # Publica evento para execução da tarefa
-            from ...domain.events.system_events import ScheduledTaskTriggeredEvent
-
             await self.event_bus.publish(
                 ScheduledTaskTriggeredEvent(
-                    aggregate_id=task.task_id,
                     task_id=task.task_id,
                     task_name=task.name,
                     triggered_at=started_at
                 )
             )
 
-            # Calcula próxima execução
-            next_run = task.get_next_run_time()
+            handler = self._handlers.get(task.task_id)
+            if handler is not None:
+                await asyncio.wait_for(handler(), timeout=task.timeout_seconds)
 
-            # Atualiza tarefa (em produção, recriaria com novos valores)
-            logger.info(f"Próxima execução de '{task.name}': {next_run}")
+        except asyncio.TimeoutError:
+            status = TaskStatus.TIMED_OUT
+            error = f"Tempo limite de {task.timeout_seconds}s excedido"
+        except Exception as e:
+            status = TaskStatus.FAILED
+            error = str(e)
 
-            finished_at = datetime.now()
-            duration = (finished_at - started_at).total_seconds()
+        finished_at = datetime.now()
+        duration = (finished_at - started_at).total_seconds()
 
-            logger.info(
-                f"Tarefa '{task.name}' executada com sucesso em {duration:.2f}s"
-            )
-
-            return TaskExecutionResult(
-                success=True,
+        if status == TaskStatus.COMPLETED:
+            logger.info(f"Tarefa '{task.name}' executada com sucesso em {duration:.2f}s")
+            event = ScheduledTaskCompletedEvent(
                 task_id=task.task_id,
-                message="Tarefa executada com sucesso",
-                started_at=started_at,
-                finished_at=finished_at,
+                task_name=task.name,
                 duration_seconds=duration,
-                status=TaskStatus.COMPLETED
+                completed_at=finished_at
             )
-
-        except Exception as e:
-            finished_at = datetime.now()
-            duration = (finished_at - started_at).total_seconds()
-
-            logger.error(f"Erro ao executar tarefa '{task.name}': {e}")
-
-            return TaskExecutionResult(
-                success=False,
+        else:
+            logger.error(f"Erro ao executar tarefa '{task.name}': {error}")
+            event = ScheduledTaskFailedEvent(
                 task_id=task.task_id,
-                message=f"Erro na execução: {str(e)}",
-                started_at=started_at,
-                finished_at=finished_at,
-                duration_seconds=duration,
-                status=TaskStatus.FAILED,
-                error=str(e)
+                task_name=task.name,
+                error=error,
+                failed_at=finished_at,
+                retry_count=0
             )
+
+        try:
+            await self.event_bus.publish(event)
+        except Exception as e:
+            logger.error(f"Erro ao publicar resultado da tarefa '{task.name}': {e}")
+
+        return TaskExecutionResult(
+            success=status == TaskStatus.COMPLETED,
+            task_id=task.task_id,
+            message="Tarefa executada com sucesso" if error is None else f"Erro na execução: {error}",
+            started_at=started_at,
+            finished_at=finished_at,
+            duration_seconds=duration,
+            status=status,
+            error=error
+        )
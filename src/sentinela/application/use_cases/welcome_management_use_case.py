@@ -6,16 +6,18 @@ incluindo mensagens, aceitação de regras e concessão de acesso.
 """
 
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from ..use_cases.base import UseCase, UseCaseResult
 from ...domain.repositories.user_repository import UserRepository
 from ...domain.repositories.group_member_repository import GroupMemberRepository
+from ...domain.entities.group_member import GroupMember, MemberRole
 from ...domain.value_objects.welcome_message import WelcomeMessage, WelcomeMessageType
 from ...domain.value_objects.identifiers import UserId
 from ...infrastructure.events.event_bus import EventBus
+from ...infrastructure.external_services.group_client import GroupClient
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +63,8 @@ class WelcomeManagementUseCase(UseCase):
         group_id: int,
         welcome_topic_id: Optional[int] = None,
         rules_topic_id: Optional[int] = None,
-        rules_acceptance_hours: int = 24
+        rules_acceptance_hours: int = 24,
+        group_client: Optional[GroupClient] = None
     ):
         """
         Inicializa o use case.
@@ -74,6 +77,7 @@ class WelcomeManagementUseCase(UseCase):
             welcome_topic_id: ID do tópico de boas-vindas (opcional)
             rules_topic_id: ID do tópico de regras (opcional)
             rules_acceptance_hours: Horas para aceitar regras (padrão 24h)
+            group_client: Cliente do grupo (remove quem não aceitou as regras)
         """
         self.user_repository = user_repository
         self.member_repository = member_repository
@@ -82,6 +86,7 @@ class WelcomeManagementUseCase(UseCase):
         self.welcome_topic_id = welcome_topic_id
         self.rules_topic_id = rules_topic_id
         self.rules_acceptance_hours = rules_acceptance_hours
+        self.group_client = group_client
 
     async def handle_new_member(
         self,
@@ -129,9 +134,8 @@ class WelcomeManagementUseCase(UseCase):
             # Publica evento para envio de mensagens
             from ...domain.events.user_events import NewMemberJoinedEvent
 
-            await self.event_bus.publish(
+            await self.event_bus.publish_nowait(
                 NewMemberJoinedEvent(
-                    aggregate_id=str(user_id),
                     user_id=user_id,
                     username=username,
                     first_name=first_name,
@@ -156,6 +160,60 @@ class WelcomeManagementUseCase(UseCase):
                 message=f"Erro ao processar novo membro: {str(e)}"
             )
 
+    async def handle_new_members(self, members: List[Dict[str, Any]]) -> UseCaseResult:
+        """
+        Processa uma rajada de entradas de uma só vez.
+
+        Os membros são gravados numa única transação; as mensagens de
+        boas-vindas agrupadas ficam a cargo da apresentação.
+
+        Args:
+            members: Dicionários com user_id, username, first_name e last_name
+
+        Returns:
+            UseCaseResult: Resultado com a quantidade processada em data['count']
+        """
+        if not members:
+            return UseCaseResult.success_result(data={'count': 0})
+
+        try:
+            logger.info(f"Processando {len(members)} novos membros em lote")
+
+            await self.member_repository.save_many([
+                self._pending_member(
+                    member['user_id'],
+                    member['username'],
+                    member['first_name'],
+                    member.get('last_name')
+                )
+                for member in members
+            ])
+
+            from ...domain.events.user_events import NewMemberJoinedEvent
+
+            joined_at = datetime.now()
+            for member in members:
+                await self.event_bus.publish_nowait(
+                    NewMemberJoinedEvent(
+                        user_id=member['user_id'],
+                        username=member['username'],
+                        first_name=member['first_name'],
+                        joined_at=joined_at
+                    )
+                )
+
+            return UseCaseResult.success_result(
+                data={'count': len(members)},
+                message=f"{len(members)} novos membros processados"
+            )
+
+        except Exception as e:
+            logger.error(f"Erro ao processar lote de {len(members)} novos membros: {e}")
+            return UseCaseResult(
+                success=False,
+                message=f"Erro ao processar novos membros: {str(e)}"
+            )
+
     async def accept_rules(
         self,
         user_id: int,
@@ -204,9 +262,8 @@ class WelcomeManagementUseCase(UseCase):
             # Publica evento
             from ...domain.events.user_events import RulesAcceptedEvent
 
-            await self.event_bus.publish(
+            await self.event_bus.publish_nowait(
                 RulesAcceptedEvent(
-                    aggregate_id=str(user_id),
                     user_id=user_id,
                     username=username,
                     access_granted=access_granted,
@@ -247,6 +304,8 @@ class WelcomeManagementUseCase(UseCase):
             unverified = await self.member_repository.find_unverified_members()
 
             expired_count = 0
+            already_left = 0
+            failed_count = 0
             removed_users = []
 
             for member in unverified:
@@ -258,17 +317,29 @@ class WelcomeManagementUseCase(UseCase):
                         member.username or member.first_name
                     )
 
-                    if result.success:
+                    if not result.success:
+                        failed_count += 1
+                    elif result.data['removed']:
                         expired_count += 1
-                        removed_users.append(member.username or member.first_name)
-
-            logger.info(f"Verificação concluída: {expired_count} usuários removidos")
+                        removed_users.append({
+                            'user_id': member.telegram_id,
+                            'username': member.username or member.first_name
+                        })
+                    else:
+                        already_left += 1
+
+            logger.info(
+                f"Verificação concluída: {expired_count} usuários removidos, "
+                f"{already_left} já fora do grupo, {failed_count} falhas"
+            )
 
             return UseCaseResult(
                 success=True,
                 message=f"Verificação concluída: {expired_count} usuários removidos",
                 data={
                     'expired_count': expired_count,
+                    'already_left': already_left,
+                    'failed_count': failed_count,
                     'removed_users': removed_users
                 }
             )
@@ -282,6 +353,24 @@ class WelcomeManagementUseCase(UseCase):
 
     # Private helper methods
 
+    @staticmethod
+    def _pending_member(
+        user_id: int,
+        username: str,
+        first_name: str,
+        last_name: Optional[str]
+    ) -> GroupMember:
+        """Membro recém-chegado, pendente de aceitar as regras."""
+        return GroupMember(
+            user_id=UserId(user_id),
+            telegram_id=user_id,
+            username=username,
+            first_name=first_name,
+            last_name=last_name,
+            role=MemberRole.NEW_MEMBER,
+            is_verified=False
+        )
+
     async def _mark_pending_rules_acceptance(
         self,
         user_id: int,
@@ -290,24 +379,9 @@ class WelcomeManagementUseCase(UseCase):
         last_name: Optional[str]
     ) -> None:
         """Marca usuário como pendente de aceitar regras."""
-        # Busca ou cria usuário
-        user = await self.user_repository.find_by_telegram_id(user_id)
-
-        if not user:
-            from ...domain.entities.user import User
-
-            user = User(
-                id=UserId(user_id),
-                telegram_id=user_id,
-                telegram_username=username,
-                cpf=None,
-                is_verified=False,
-                is_banned=False
-            )
-
-        # Marca como pendente (não verificado)
-        user.is_verified = False
-        await self.user_repository.save(user)
+        await self.member_repository.save(
+            self._pending_member(user_id, username, first_name, last_name)
+        )
 
         logger.info(f"Usuário {username} marcado como pendente de regras")
 
@@ -332,7 +406,6 @@ class WelcomeManagementUseCase(UseCase):
 
             await self.event_bus.publish(
                 GamingAccessRequestedEvent(
-                    aggregate_id=str(user_id),
                     user_id=user_id,
                     username=username,
                     requested_at=datetime.now()
@@ -351,27 +424,56 @@ class WelcomeManagementUseCase(UseCase):
         user_id: int,
         username: str
     ) -> UseCaseResult:
-        """Remove membro que não aceitou regras."""
-        try:
-            # Publica evento de remoção
-            from ...domain.events.user_events import UserBanned
+        """
+        Remove membro que não aceitou regras e encerra a pendência.
 
-            await self.event_bus.publish(
-                UserBanned(
-                    aggregate_id=str(user_id),
-                    user_id=user_id,
-                    username=username,
-                    reason="Não aceitou regras em 24 horas",
-                    banned_by="system",
-                    ban_date=datetime.now()
-                )
+        Quem já saiu do grupo só tem a pendência encerrada. Se a remoção
+        falhar, a pendência continua e a próxima verificação tenta de novo.
+
+        Args:
+            user_id: ID do usuário no Telegram
+            username: Username ou primeiro nome
+
+        Returns:
+            UseCaseResult: data['removed'] indica se o usuário foi removido agora
+        """
+        if self.group_client is None:
+            return UseCaseResult(
+                success=False,
+                message="Cliente do grupo não configurado"
             )
 
-            logger.info(f"Usuário {username} removido por não aceitar regras")
+        try:
+            in_group = await self.group_client.is_user_in_group(user_id)
+            if in_group and not await self.group_client.remove_user_from_group(user_id):
+                return UseCaseResult(
+                    success=False,
+                    message="Falha ao remover do grupo"
+                )
+
+            # Sai de user_rules 'pending': não volta na próxima verificação
+            await self.member_repository.delete(UserId(user_id))
+
+            if in_group:
+                from ...domain.events.user_events import UserBanned
+
+                await self.event_bus.publish(
+                    UserBanned(
+                        user_id=user_id,
+                        username=username,
+                        reason="Não aceitou regras em 24 horas",
+                        banned_by="system",
+                        ban_date=datetime.now()
+                    )
+                )
+                logger.info(f"Usuário {username} removido por não aceitar regras")
+            else:
+                logger.info(f"Usuário {username} já não está no grupo; pendência de regras encerrada")
 
             return UseCaseResult(
                 success=True,
-                message="Usuário removido"
+                message="Usuário removido" if in_group else "Usuário já fora do grupo",
+                data={'removed': in_group}
             )
 
         except Exception as e:
@@ -1,7 +1,9 @@
+import asyncio
 import logging
+import time
 from enum import Enum
 from functools import wraps
-from typing import List, Set, Callable, Any
+from typing import Dict, FrozenSet, List, Optional, Set, Callable, Any
 from telegram import Update
 from telegram.ext import ContextTypes
 
@@ -14,7 +16,14 @@ class AccessLevel(Enum):
     SUPER_ADMIN = "super_admin"  # Super administradores (futuro)
 
 class PermissionManager:
-    """Gerenciador de permissões e controle de acesso"""
+    """
+    Gerenciador de permissões e controle de acesso.
+
+    O conjunto de administradores fica em memória e é recarregado do
+    AdminRepository em background a cada `ADMIN_CACHE_TTL` segundos (ou
+    após `invalidate_admins`). As verificações não fazem I/O: consultam o
+    conjunto em cache e as permissões pré-calculadas por nível.
+    """
 
     # Definição dos comandos por nível de acesso
     COMMAND_PERMISSIONS = {
@@ -32,53 +41,111 @@ class PermissionManager:
         }
     }
 
+    # Níveis que satisfazem cada nível exigido
+    LEVEL_HIERARCHY = {
+        AccessLevel.USER: frozenset({AccessLevel.USER, AccessLevel.ADMIN, AccessLevel.SUPER_ADMIN}),
+        AccessLevel.ADMIN: frozenset({AccessLevel.ADMIN, AccessLevel.SUPER_ADMIN}),
+        AccessLevel.SUPER_ADMIN: frozenset({AccessLevel.SUPER_ADMIN})
+    }
+
+    ADMIN_CACHE_TTL = 300  # segundos
+
+    # Pré-calculado: comandos permitidos por nível (frozenset para lookup O(1))
+    _level_commands: Dict[AccessLevel, FrozenSet[str]] = {
+        level: frozenset(commands) for level, commands in COMMAND_PERMISSIONS.items()
+    }
+
+    _admin_ids: FrozenSet[int] = frozenset()
+    _admins_loaded_at: Optional[float] = None
+    _refresh_task: Optional[asyncio.Task] = None
+
     @classmethod
-    def get_user_access_level(cls, user_id: int) -> AccessLevel:
+    async def refresh_admins(cls) -> int:
         """
-        Determina o nível de acesso de um usuário.
-        Prioriza administradores detectados automaticamente, com fallback para configuração manual.
+        Recarrega o conjunto de administradores do repositório.
 
-        Args:
-            user_id: ID do usuário no Telegram
+        Inclui os IDs de ADMIN_USER_IDS (configuração manual). O repositório
+        devolve lista vazia quando a consulta falha; nesse caso o conjunto
+        anterior é mantido e a recarga é tentada de novo na próxima
+        verificação.
 
         Returns:
-            AccessLevel: Nível de acesso do usuário
+            int: Número de administradores em cache
         """
-        try:
-            # 1. Primeiro verifica se é administrador detectado automaticamente
-            from ..infrastructure.config.dependency_injection import get_container
-            from ..domain.repositories.admin_repository import AdminRepository
-            import asyncio
+        from ..infrastructure.config.dependency_injection import get_container
+        from ..domain.repositories.admin_repository import AdminRepository
+
+        admin_repo = get_container().get(AdminRepository)
+        admins = await admin_repo.list_administrators(active_only=True)
 
-            container = get_container()
-            admin_repo = container.get(AdminRepository)
+        if not admins and cls._admin_ids:
+            logger.warning(
+                f"Consulta de administradores sem resultado; mantendo os {len(cls._admin_ids)} IDs em cache"
+            )
+            return len(cls._admin_ids)
 
-            # Verifica no banco de administradores
-            is_admin = asyncio.run(admin_repo.is_administrator(user_id))
-            if is_admin:
-                return AccessLevel.ADMIN
+        cls.set_admin_ids(frozenset(admin['user_id'] for admin in admins))
+        logger.debug(f"Cache de administradores atualizado: {len(cls._admin_ids)} IDs")
+        return len(cls._admin_ids)
 
-            # 2. Fallback para configuração manual (para compatibilidade)
-            from src.sentinela.core.config import ADMIN_USER_IDS
-            if ADMIN_USER_IDS and user_id in ADMIN_USER_IDS:
-                return AccessLevel.ADMIN
+    @classmethod
+    def set_admin_ids(cls, admin_ids: FrozenSet[int]) -> None:
+        """
+        Substitui o conjunto de administradores em cache de uma só vez.
 
-            # 3. Verificar se é usuário verificado (tem dados no sistema)
-            from ..domain.repositories.user_repository import UserRepository
-            from ..domain.value_objects.identifiers import UserId
+        Usado após a sincronização com o Telegram.
+
+        Args:
+            admin_ids: IDs dos administradores ativos
+        """
+        from .config import ADMIN_USER_IDS
 
-            user_repo = container.get(UserRepository)
-            user = asyncio.run(user_repo.find_by_telegram_id(user_id))
+        cls._admin_ids = frozenset(admin_ids) | frozenset(ADMIN_USER_IDS or [])
+        cls._admins_loaded_at = time.monotonic()
 
-            if user and user.cpf:
-                return AccessLevel.USER
-            else:
-                # Usuário não verificado - apenas acesso básico
-                return AccessLevel.USER
+    @classmethod
+    def invalidate_admins(cls) -> None:
+        """Força recarga do conjunto de administradores na próxima verificação."""
+        cls._admins_loaded_at = None
+
+    @classmethod
+    async def ensure_admins_loaded(cls) -> None:
+        """
+        Garante que o cache de administradores pode ser usado.
+
+        Na primeira chamada aguarda a carga. Depois disso, um cache vencido
+        continua sendo usado enquanto a recarga roda em background.
+        """
+        if cls._admins_loaded_at is None and not cls._admin_ids:
+            try:
+                await cls.refresh_admins()
+            except Exception as e:
+                logger.error(f"Erro ao carregar administradores: {e}")
+            return
 
+        if cls._admins_loaded_at is None or time.monotonic() - cls._admins_loaded_at > cls.ADMIN_CACHE_TTL:
+            if cls._refresh_task is None or cls._refresh_task.done():
+                cls._refresh_task = asyncio.create_task(cls._refresh_in_background())
+
+    @classmethod
+    async def _refresh_in_background(cls) -> None:
+        try:
+            await cls.refresh_admins()
         except Exception as e:
-            logger.error(f"Erro ao determinar nível de acesso para usuário {user_id}: {e}")
-            return AccessLevel.USER
+            logger.error(f"Erro ao recarregar administradores: {e}")
+
+    @classmethod
+    def get_user_access_level(cls, user_id: int) -> AccessLevel:
+        """
+        Determina o nível de acesso de um usuário a partir do cache.
+
+        Args:
+            user_id: ID do usuário no Telegram
+
+        Returns:
+            AccessLevel: Nível de acesso do usuário
+        """
+        return AccessLevel.ADMIN if user_id in cls._admin_ids else AccessLevel.USER
 
     @classmethod
     def has_permission(cls, user_id: int, command: str) -> bool:
@@ -92,15 +159,21 @@ class PermissionManager:
         Returns:
             bool: True se tem permissão, False caso contrário
         """
-        try:
-            user_level = cls.get_user_access_level(user_id)
-            allowed_commands = cls.COMMAND_PERMISSIONS.get(user_level, set())
+        return command in cls._level_commands.get(cls.get_user_access_level(user_id), frozenset())
 
-            return command in allowed_commands
+    @classmethod
+    def has_access(cls, user_id: int, required_level: AccessLevel) -> bool:
+        """
+        Verifica se o nível do usuário satisfaz o nível exigido.
 
-        except Exception as e:
-            logger.error(f"Erro ao verificar permissão do comando {command} para usuário {user_id}: {e}")
-            return False
+        Args:
+            user_id: ID do usuário
+            required_level: Nível mínimo exigido
+
+        Returns:
+            bool: True se tem acesso
+        """
+        return cls.get_user_access_level(user_id) in cls.LEVEL_HIERARCHY.get(required_level, frozenset())
 
     @classmethod
     def get_available_commands(cls, user_id: int) -> Set[str]:
@@ -113,12 +186,7 @@ class PermissionManager:
         Returns:
             Set[str]: Conjunto de comandos disponíveis
         """
-        try:
-            user_level = cls.get_user_access_level(user_id)
-            return cls.COMMAND_PERMISSIONS.get(user_level, set())
-        except Exception as e:
-            logger.error(f"Erro ao obter comandos disponíveis para usuário {user_id}: {e}")
-            return {"start"}  # Fallback mínimo
+        return set(cls._level_commands.get(cls.get_user_access_level(user_id), {"start"}))
 
     @classmethod
     def get_access_level_display(cls, level: AccessLevel) -> str:
@@ -149,17 +217,12 @@ def require_access(level: AccessLevel):
             user_id = user.id
             username = user.username or user.first_name
 
-            # Obtém nível do usuário
+            # Obtém nível do usuário (cache em memória, sem I/O)
+            await PermissionManager.ensure_admins_loaded()
             user_level = PermissionManager.get_user_access_level(user_id)
 
             # Verifica se tem acesso suficiente
-            required_levels = {
-                AccessLevel.USER: [AccessLevel.USER, AccessLevel.ADMIN, AccessLevel.SUPER_ADMIN],
-                AccessLevel.ADMIN: [AccessLevel.ADMIN, AccessLevel.SUPER_ADMIN],
-                AccessLevel.SUPER_ADMIN: [AccessLevel.SUPER_ADMIN]
-            }
-
-            if user_level not in required_levels.get(level, []):
+            if user_level not in PermissionManager.LEVEL_HIERARCHY.get(level, frozenset()):
                 await send_access_denied_message(update, user_level, level)
                 logger.warning(f"Acesso negado: {username} (ID: {user_id}, Nível: {user_level.value}) tentou acessar comando que requer {level.value}")
                 return
@@ -194,6 +257,7 @@ def require_command_permission(command_name: str):
             username = user.username or user.first_name
 
             # Verifica permissão específica do comando
+            await PermissionManager.ensure_admins_loaded()
             if not PermissionManager.has_permission(user_id, command_name):
                 user_level = PermissionManager.get_user_access_level(user_id)
                 await send_command_not_available_message(update, command_name, user_level)
@@ -261,7 +325,7 @@ def is_admin(user_id: int) -> bool:
     """
     return PermissionManager.get_user_access_level(user_id) == AccessLevel.ADMIN
 
-def is_verified_user(user_id: int) -> bool:
+async def is_verified_user(user_id: int) -> bool:
     """
     Função auxiliar para verificar se usuário está verificado.
 
@@ -274,11 +338,10 @@ def is_verified_user(user_id: int) -> bool:
     try:
         from ..infrastructure.config.dependency_injection import get_container
         from ..domain.repositories.user_repository import UserRepository
-        import asyncio
 
         container = get_container()
         user_repo = container.get(UserRepository)
-        user = asyncio.run(user_repo.find_by_telegram_id(user_id))
+        user = await user_repo.find_by_telegram_id(user_id)
 
         return user is not None and user.cpf is not None
     except Exception as e:
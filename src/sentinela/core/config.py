@@ -23,6 +23,25 @@ TELEGRAM_TOKEN = get_env_var("TELEGRAM_TOKEN")
 if not TELEGRAM_TOKEN:
     raise ValueError("A variável de ambiente TELEGRAM_TOKEN não foi definida no arquivo .env")
 
+# --- Modo de recebimento de updates ---
+# "polling" (padrão, desenvolvimento) ou "webhook" (servidor aiohttp embutido)
+BOT_MODE = (get_env_var("BOT_MODE", "polling") or "polling").lower()
+WEBHOOK_URL = get_env_var("WEBHOOK_URL")  # URL pública (proxy reverso) registrada no Telegram
+WEBHOOK_SECRET_TOKEN = get_env_var("WEBHOOK_SECRET_TOKEN")  # Enviado pelo Telegram em X-Telegram-Bot-Api-Secret-Token
+WEBHOOK_LISTEN = get_env_var("WEBHOOK_LISTEN", "0.0.0.0")
+WEBHOOK_PORT = int(get_env_var("WEBHOOK_PORT", "8080"))
+WEBHOOK_PATH = get_env_var("WEBHOOK_PATH", "/telegram/webhook")
+# Chama setWebhook no startup; "false" se o registro é feito por fora.
+# Rode uma única instância por token: o estado do processamento fica em memória
+WEBHOOK_REGISTER = (get_env_var("WEBHOOK_REGISTER", "true") or "true").lower() in ("true", "1", "yes", "on")
+WEBHOOK_MAX_CONNECTIONS = int(get_env_var("WEBHOOK_MAX_CONNECTIONS", "40"))
+
+# Updates processados em paralelo (usuários distintos); 1 = um por vez
+UPDATE_CONCURRENCY = int(get_env_var("UPDATE_CONCURRENCY", "64"))
+
+if BOT_MODE == "webhook" and not WEBHOOK_SECRET_TOKEN:
+    raise ValueError("BOT_MODE=webhook exige WEBHOOK_SECRET_TOKEN definido no arquivo .env")
+
 # --- Configurações do Grupo/Canal ---
 TELEGRAM_GROUP_ID = get_env_var("TELEGRAM_GROUP_ID")
 if not TELEGRAM_GROUP_ID:
@@ -33,6 +52,46 @@ RULES_TOPIC_ID = get_env_var("RULES_TOPIC_ID")  # ID do tópico de regras (opcio
 WELCOME_TOPIC_ID = get_env_var("WELCOME_TOPIC_ID")  # ID do tópico de boas-vindas (opcional)
 SUPPORT_TOPIC_ID = get_env_var("SUPPORT_TOPIC_ID", "148")  # ID do tópico de suporte (🆘 Suporte Gamer)
 
+# --- Boas-vindas em rajadas de entrada ---
+# A partir de JOIN_BATCH_THRESHOLD entradas em JOIN_BATCH_WINDOW_SECONDS, as boas-vindas
+# passam a sair agrupadas (uma mensagem de boas-vindas e uma de regras por janela)
+JOIN_BATCH_THRESHOLD = int(get_env_var("JOIN_BATCH_THRESHOLD", "5"))
+JOIN_BATCH_WINDOW_SECONDS = float(get_env_var("JOIN_BATCH_WINDOW_SECONDS", "3"))
+JOIN_BATCH_MAX_SIZE = int(get_env_var("JOIN_BATCH_MAX_SIZE", "20"))  # Usuários (e botões) por mensagem
+
+# --- Anexos de chamados ---
+# Fotos do /suporte são enviadas ao HubSoft em background após a criação do atendimento
+ATTACHMENT_UPLOAD_CONCURRENCY = int(get_env_var("ATTACHMENT_UPLOAD_CONCURRENCY", "3"))  # Transferências simultâneas
+ATTACHMENT_UPLOAD_MAX_ATTEMPTS = int(get_env_var("ATTACHMENT_UPLOAD_MAX_ATTEMPTS", "3"))  # Tentativas por anexo
+
+# --- Tarefas agendadas ---
+# Verificação diária de CPF, expiração de verificações e prazo das regras rodam
+# dentro do bot; o histórico fica em scheduled_task_runs (DATABASE_FILE)
+SCHEDULER_ENABLED = get_env_var("SCHEDULER_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+SCHEDULER_MAX_CONCURRENCY = int(get_env_var("SCHEDULER_MAX_CONCURRENCY", "2"))  # Tarefas simultâneas
+# Lease por job (tabela job_leases) compartilhado com os scripts manuais; um lease sem
+# heartbeat por JOB_LEASE_TTL_SECONDS (processo que morreu) é retomado automaticamente
+JOB_LEASE_TTL_SECONDS = float(get_env_var("JOB_LEASE_TTL_SECONDS", "120"))
+# Contratos reverificados continuamente no HubSoft (contract_checks) em vez de todos às 6:00;
+# a taxa usa o que sobra do limite da API e todo membro é consultado dentro do SLA
+CONTRACT_REVERIFY_ENABLED = get_env_var("CONTRACT_REVERIFY_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+CONTRACT_REVERIFY_SLA_HOURS = float(get_env_var("CONTRACT_REVERIFY_SLA_HOURS", "24"))
+CONTRACT_REVERIFY_MAX_PER_MINUTE = float(get_env_var("CONTRACT_REVERIFY_MAX_PER_MINUTE", "15"))  # Teto com orçamento sobrando
+CONTRACT_REVERIFY_RESERVE_PER_MINUTE = float(get_env_var("CONTRACT_REVERIFY_RESERVE_PER_MINUTE", "10"))  # Folga para uso interativo
+# Reconciliação de membros (cleanup_inactive_members, de hora em hora): remoções em lotes
+# com limite próprio de chamadas; acima de MAX_REMOVALS o plano não é aplicado
+MEMBERSHIP_RECONCILE_CALLS_PER_SECOND = float(get_env_var("MEMBERSHIP_RECONCILE_CALLS_PER_SECOND", "2"))
+MEMBERSHIP_RECONCILE_BATCH_SIZE = int(get_env_var("MEMBERSHIP_RECONCILE_BATCH_SIZE", "20"))
+MEMBERSHIP_RECONCILE_MAX_REMOVALS = int(get_env_var("MEMBERSHIP_RECONCILE_MAX_REMOVALS", "50"))
+# Índice de membros (group_members) conferido contra o Telegram a cada 10 minutos
+MEMBERSHIP_SYNC_CHECKS_PER_RUN = int(get_env_var("MEMBERSHIP_SYNC_CHECKS_PER_RUN", "60"))  # getChatMember por rodada
+# Pool de links de convite (uso único) criados em background e entregues na hora após a
+# verificação de CPF; links com menos de MIN_REMAINING de validade são revogados e repostos
+INVITE_POOL_ENABLED = get_env_var("INVITE_POOL_ENABLED", "true").lower() in ("true", "1", "yes", "on")
+INVITE_POOL_SIZE = int(get_env_var("INVITE_POOL_SIZE", "20"))
+INVITE_POOL_LINK_TTL_SECONDS = int(get_env_var("INVITE_POOL_LINK_TTL_SECONDS", "3600"))
+INVITE_POOL_MIN_REMAINING_SECONDS = int(get_env_var("INVITE_POOL_MIN_REMAINING_SECONDS", "900"))
+
 # --- Configurações de Notificações ---
 TECH_NOTIFICATION_CHANNEL_ID = get_env_var("TECH_NOTIFICATION_CHANNEL_ID")  # Canal técnico
 
@@ -60,6 +119,12 @@ INVITE_LINK_MEMBER_LIMIT = int(get_env_var("INVITE_LINK_MEMBER_LIMIT", "1"))  #
 
 # --- Configurações do Banco de Dados ---
 DATABASE_FILE = get_env_var("DATABASE_FILE", "data/database/sentinela.db")
+AUDIT_DATABASE_FILE = get_env_var("AUDIT_DATABASE_FILE", "data/database/audit.db")
+# Backup diário (03:00) dos dois bancos dentro do bot: cópia online em lotes de páginas,
+# exports JSONL comprimidos e manifest com checksums em BACKUP_DIR/sets/
+BACKUP_DIR = get_env_var("BACKUP_DIR", "backups")
+BACKUP_KEEP_SETS = int(get_env_var("BACKUP_KEEP_SETS", "7"))
+BACKUP_PAGES_PER_STEP = int(get_env_var("BACKUP_PAGES_PER_STEP", "256"))  # páginas copiadas por lote
 
 # --- Configurações da API Hubsoft ---
 HUBSOFT_HOST = get_env_var("HUBSOFT_HOST")
@@ -4,6 +4,9 @@ Base classes para Entities.
 Entities são objetos com identidade e ciclo de vida.
 """
 
+import os
+import threading
+import time
 from abc import ABC
 from typing import Any, List, TypeVar, Generic
 from datetime import datetime
@@ -11,6 +14,56 @@ from datetime import datetime
 
 EntityId = TypeVar('EntityId')
 
+_CROCKFORD_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+class _EventIdGenerator:
+    """
+    Gera IDs no formato ULID (26 caracteres, Crockford base32).
+
+    48 bits de timestamp em ms + 80 bits aleatórios. Dentro do mesmo
+    milissegundo a parte aleatória é incrementada, então os IDs são
+    únicos e crescentes na ordem de criação.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def new_id(self) -> str:
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms <= self._last_ms:
+                # Mesmo ms (ou relógio voltou): mantém ordem incrementando
+                now_ms = self._last_ms
+                self._last_random = (self._last_random + 1) & ((1 << 80) - 1)
+                if self._last_random == 0:
+                    now_ms += 1
+            else:
+                self._last_random = int.from_bytes(os.urandom(10), "big")
+            self._last_ms = now_ms
+            value = (now_ms << 80) | self._last_random
+
+        chars = []
+        for _ in range(26):
+            chars.append(_CROCKFORD_BASE32[value & 0x1F])
+            value >>= 5
+        return "".join(reversed(chars))
+
+
+_event_ids = _EventIdGenerator()
+
+
+def new_event_id() -> str:
+    """
+    Gera ID único e ordenável para eventos de domínio.
+
+    Returns:
+        str: ID no formato ULID
+    """
+    return _event_ids.new_id()
+
 
 class DomainEvent:
     """
@@ -18,11 +71,20 @@ class DomainEvent:
 
     Representa algo que aconteceu no domínio e é relevante
     para outros bounded contexts.
+
+    `event_id` é um ULID único por instância; igualdade e hash usam
+    apenas o `event_id`, então eventos com os mesmos dados continuam
+    distintos e uma reentrega (mesmo `event_id`) é reconhecida.
+
+    Eventos com `synchronous = True` são sempre processados antes de
+    `publish_nowait` retornar (ex.: mudanças que afetam a resposta ao usuário).
     """
 
+    synchronous = False
+
     def __init__(self, occurred_at: datetime = None):
         self.occurred_at = occurred_at or datetime.now()
-        self.event_id = f"{self.__class__.__name__}_{int(self.occurred_at.timestamp()*1000)}"
+        self.event_id = new_event_id()
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, DomainEvent):
@@ -33,7 +95,8 @@ class DomainEvent:
         """Para compatibilidade com dataclasses."""
         if not hasattr(self, 'occurred_at'):
             object.__setattr__(self, 'occurred_at', datetime.now())
-            object.__setattr__(self, 'event_id', f"{self.__class__.__name__}_{int(self.occurred_at.timestamp()*1000)}")
+        if not hasattr(self, 'event_id'):
+            object.__setattr__(self, 'event_id', new_event_id())
 
     def __hash__(self) -> int:
         return hash(self.event_id)
@@ -74,8 +74,10 @@ class GroupMember(Entity):
     message_count: int = 0
     warnings_count: int = 0
     kick_reason: Optional[str] = None
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+
+    def __post_init__(self):
+        # created_at/updated_at vêm de Entity (somente leitura)
+        super().__init__(self.user_id)
 
     def is_active_member(self) -> bool:
         """Verifica se é membro ativo do grupo."""
@@ -107,7 +109,7 @@ class GroupMember(Entity):
         """Marca membro como tendo saído do grupo."""
         self.status = MemberStatus.LEFT
         self.left_at = datetime.now()
-        self.updated_at = datetime.now()
+        self._touch()
 
     def mark_as_kicked(self, reason: str) -> None:
         """
@@ -119,14 +121,14 @@ class GroupMember(Entity):
         self.status = MemberStatus.KICKED
         self.left_at = datetime.now()
         self.kick_reason = reason
-        self.updated_at = datetime.now()
+        self._touch()
 
     def promote_to_verified_gamer(self) -> None:
         """Promove para gamer verificado."""
         if self.role in [MemberRole.NEW_MEMBER, MemberRole.GUEST, MemberRole.GAMER]:
             self.role = MemberRole.GAMER_VERIFIED
             self.is_verified = True
-            self.updated_at = datetime.now()
+            self._touch()
 
     def add_warning(self) -> int:
         """
@@ -136,13 +138,13 @@ class GroupMember(Entity):
             int: Número total de advertências
         """
         self.warnings_count += 1
-        self.updated_at = datetime.now()
+        self._touch()
         return self.warnings_count
 
     def update_last_activity(self) -> None:
         """Atualiza timestamp da última atividade."""
         self.last_activity = datetime.now()
-        self.updated_at = datetime.now()
+        self._touch()
 
     def increment_message_count(self) -> int:
         """
@@ -13,7 +13,7 @@ from ..entities.base import DomainEvent
 from ..value_objects.identifiers import ConversationId, TicketId
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class ConversationStarted(DomainEvent):
     """
     Evento disparado quando uma nova conversa de suporte é iniciada.
@@ -35,7 +35,7 @@ class ConversationStarted(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class ConversationCompleted(DomainEvent):
     """
     Evento disparado quando uma conversa é completada com sucesso.
@@ -61,7 +61,7 @@ class ConversationCompleted(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class ConversationCancelled(DomainEvent):
     """
     Evento disparado quando uma conversa é cancelada.
@@ -89,7 +89,7 @@ class ConversationCancelled(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class ConversationStepCompleted(DomainEvent):
     """
     Evento disparado quando um passo da conversa é completado.
@@ -110,7 +110,7 @@ class ConversationStepCompleted(DomainEvent):
     data: dict
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class ConversationTimedOut(DomainEvent):
     """
     Evento disparado quando uma conversa expira por timeout.
@@ -12,7 +12,7 @@ from typing import Optional
 from ..entities.base import DomainEvent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class TopicDiscoveredEvent(DomainEvent):
     """
     Evento disparado quando novo tópico é descoberto.
@@ -29,7 +29,7 @@ class TopicDiscoveredEvent(DomainEvent):
     discovered_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class TopicActivityUpdatedEvent(DomainEvent):
     """
     Evento disparado quando atividade de tópico é atualizada.
@@ -44,7 +44,7 @@ class TopicActivityUpdatedEvent(DomainEvent):
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class TopicNameChangedEvent(DomainEvent):
     """
     Evento disparado quando nome de tópico muda.
@@ -61,7 +61,7 @@ class TopicNameChangedEvent(DomainEvent):
     changed_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class TopicMarkedInactiveEvent(DomainEvent):
     """
     Evento disparado quando tópico é marcado como inativo.
@@ -76,7 +76,7 @@ class TopicMarkedInactiveEvent(DomainEvent):
     marked_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class MemberJoinedGroupEvent(DomainEvent):
     """
     Evento disparado quando membro entra no grupo.
@@ -91,7 +91,7 @@ class MemberJoinedGroupEvent(DomainEvent):
     joined_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class MemberLeftGroupEvent(DomainEvent):
     """
     Evento disparado quando membro sai do grupo.
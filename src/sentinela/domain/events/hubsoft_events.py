@@ -13,7 +13,7 @@ from ..entities.base import DomainEvent
 from ..entities.hubsoft_integration import IntegrationId
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class IntegrationScheduled(DomainEvent):
     """
     Evento disparado quando uma integração é agendada.
@@ -35,7 +35,7 @@ class IntegrationScheduled(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class IntegrationStarted(DomainEvent):
     """
     Evento disparado quando uma integração é iniciada.
@@ -57,7 +57,7 @@ class IntegrationStarted(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class IntegrationAttemptMade(DomainEvent):
     """
     Evento disparado quando uma tentativa de integração é feita.
@@ -83,7 +83,7 @@ class IntegrationAttemptMade(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class IntegrationCompleted(DomainEvent):
     """
     Evento disparado quando uma integração é completada com sucesso.
@@ -111,7 +111,7 @@ class IntegrationCompleted(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class IntegrationFailed(DomainEvent):
     """
     Evento disparado quando uma integração falha definitivamente.
@@ -137,7 +137,7 @@ class IntegrationFailed(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class IntegrationRetryScheduled(DomainEvent):
     """
     Evento disparado quando um retry é agendado após falha.
@@ -161,7 +161,7 @@ class IntegrationRetryScheduled(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class IntegrationCancelled(DomainEvent):
     """
     Evento disparado quando uma integração é cancelada.
@@ -183,7 +183,7 @@ class IntegrationCancelled(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class IntegrationPriorityChanged(DomainEvent):
     """
     Evento disparado quando a prioridade de uma integração muda.
@@ -207,7 +207,7 @@ class IntegrationPriorityChanged(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class HubSoftTicketSynced(DomainEvent):
     """
     Evento disparado quando um ticket é sincronizado com HubSoft.
@@ -229,7 +229,7 @@ class HubSoftTicketSynced(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class HubSoftUserDataFetched(DomainEvent):
     """
     Evento disparado quando dados de usuário são buscados no HubSoft.
@@ -251,7 +251,7 @@ class HubSoftUserDataFetched(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class HubSoftRateLimitHit(DomainEvent):
     """
     Evento disparado quando rate limit do HubSoft é atingido.
@@ -275,7 +275,7 @@ class HubSoftRateLimitHit(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class HubSoftConnectionRestored(DomainEvent):
     """
     Evento disparado quando conexão com HubSoft é restaurada.
@@ -295,7 +295,7 @@ class HubSoftConnectionRestored(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class HubSoftBulkSyncCompleted(DomainEvent):
     """
     Evento disparado quando sincronização em lote é completada.
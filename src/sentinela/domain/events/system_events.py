@@ -12,7 +12,7 @@ from typing import Optional
 from ..entities.base import DomainEvent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class ScheduledTaskTriggeredEvent(DomainEvent):
     """
     Evento disparado quando tarefa agendada é acionada.
@@ -27,7 +27,7 @@ class ScheduledTaskTriggeredEvent(DomainEvent):
     triggered_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class ScheduledTaskCompletedEvent(DomainEvent):
     """
     Evento disparado quando tarefa agendada é concluída.
@@ -44,7 +44,7 @@ class ScheduledTaskCompletedEvent(DomainEvent):
     completed_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class ScheduledTaskFailedEvent(DomainEvent):
     """
     Evento disparado quando tarefa agendada falha.
@@ -63,7 +63,7 @@ class ScheduledTaskFailedEvent(DomainEvent):
     retry_count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class SystemHealthCheckEvent(DomainEvent):
     """
     Evento disparado durante health check do sistema.
@@ -78,7 +78,7 @@ class SystemHealthCheckEvent(DomainEvent):
     details: Optional[dict] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class SystemStartedEvent(DomainEvent):
     """
     Evento disparado quando sistema é iniciado.
@@ -93,7 +93,7 @@ class SystemStartedEvent(DomainEvent):
     config: Optional[dict] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class SystemShutdownEvent(DomainEvent):
     """
     Evento disparado quando sistema é encerrado.
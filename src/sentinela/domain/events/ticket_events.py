@@ -13,7 +13,7 @@ from ..entities.base import DomainEvent
 from ..value_objects.identifiers import TicketId, UserId, HubSoftId, Protocol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class TicketCreated(DomainEvent):
     """
     Evento disparado quando um novo ticket é criado.
@@ -43,7 +43,7 @@ class TicketCreated(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class TicketAssigned(DomainEvent):
     """
     Evento disparado quando um ticket é atribuído a um técnico.
@@ -63,7 +63,7 @@ class TicketAssigned(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class TicketStatusChanged(DomainEvent):
     """
     Evento disparado quando o status de um ticket muda.
@@ -85,7 +85,7 @@ class TicketStatusChanged(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class TicketSyncedWithHubSoft(DomainEvent):
     """
     Evento disparado quando um ticket é sincronizado com o HubSoft.
@@ -105,7 +105,7 @@ class TicketSyncedWithHubSoft(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class TicketClosed(DomainEvent):
     """
     Evento disparado quando um ticket é fechado.
@@ -122,7 +122,7 @@ class TicketClosed(DomainEvent):
     closed_by: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class TicketReopened(DomainEvent):
     """
     Evento disparado quando um ticket é reaberto.
@@ -139,7 +139,7 @@ class TicketReopened(DomainEvent):
     reopened_by: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class TicketUrgencyElevated(DomainEvent):
     """
     Evento disparado quando a urgência de um ticket é elevada.
@@ -156,7 +156,7 @@ class TicketUrgencyElevated(DomainEvent):
     reason: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class TechNotificationRequiredEvent(DomainEvent):
     """
     Evento disparado quando notificação técnica é necessária.
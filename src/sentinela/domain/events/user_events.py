@@ -13,7 +13,7 @@ from ..entities.base import DomainEvent
 from ..value_objects.identifiers import UserId
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class UserRegistered(DomainEvent):
     """
     Evento disparado quando um novo usuário se registra.
@@ -33,7 +33,7 @@ class UserRegistered(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class UserBanned(DomainEvent):
     """
     Evento disparado quando um usuário é banido.
@@ -57,7 +57,7 @@ class UserBanned(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class UserUnbanned(DomainEvent):
     """
     Evento disparado quando um usuário é desbanido.
@@ -79,7 +79,7 @@ class UserUnbanned(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class CPFValidated(DomainEvent):
     """
     Evento disparado quando um CPF é validado.
@@ -102,7 +102,7 @@ class CPFValidated(DomainEvent):
             object.__setattr__(self, 'validation_date', datetime.now())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class UserProfileUpdated(DomainEvent):
     """
     Evento disparado quando o perfil de um usuário é atualizado.
@@ -119,7 +119,7 @@ class UserProfileUpdated(DomainEvent):
     updated_by: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class UserLastSeenUpdated(DomainEvent):
     """
     Evento disparado quando a última atividade do usuário é atualizada.
@@ -136,7 +136,7 @@ class UserLastSeenUpdated(DomainEvent):
     activity_type: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class UserPermissionGrantedEvent(DomainEvent):
     """
     Evento disparado quando permissões são concedidas a um usuário.
@@ -153,7 +153,7 @@ class UserPermissionGrantedEvent(DomainEvent):
     granted_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class UserAccessRevokedEvent(DomainEvent):
     """
     Evento disparado quando acesso de um usuário é revogado.
@@ -170,7 +170,7 @@ class UserAccessRevokedEvent(DomainEvent):
     revoked_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class UserPromotedEvent(DomainEvent):
     """
     Evento disparado quando usuário é promovido a novo nível.
@@ -187,7 +187,7 @@ class UserPromotedEvent(DomainEvent):
     promoted_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class AdminNotificationRequiredEvent(DomainEvent):
     """
     Evento disparado quando admins precisam ser notificados.
@@ -206,7 +206,7 @@ class AdminNotificationRequiredEvent(DomainEvent):
     created_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class InviteLinkRequestedEvent(DomainEvent):
     """
     Evento disparado quando um link de convite é solicitado.
@@ -221,7 +221,7 @@ class InviteLinkRequestedEvent(DomainEvent):
     created_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class InviteLinkCreatedEvent(DomainEvent):
     """
     Evento disparado quando um link de convite é criado no Telegram.
@@ -242,7 +242,7 @@ class InviteLinkCreatedEvent(DomainEvent):
     created_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class InviteLinkRevokedEvent(DomainEvent):
     """
     Evento disparado quando um link de convite é revogado.
@@ -259,7 +259,7 @@ class InviteLinkRevokedEvent(DomainEvent):
     revoked_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class InviteLinkUsedEvent(DomainEvent):
     """
     Evento disparado quando um link de convite é usado.
@@ -276,7 +276,7 @@ class InviteLinkUsedEvent(DomainEvent):
     used_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class InviteLinkExpiredEvent(DomainEvent):
     """
     Evento disparado quando um link de convite expira.
@@ -291,7 +291,7 @@ class InviteLinkExpiredEvent(DomainEvent):
     expired_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class InviteCleanupRequestedEvent(DomainEvent):
     """
     Evento disparado quando limpeza de convites é solicitada.
@@ -302,7 +302,7 @@ class InviteCleanupRequestedEvent(DomainEvent):
     requested_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class NewMemberJoinedEvent(DomainEvent):
     """
     Evento disparado quando novo membro entra no grupo.
@@ -319,7 +319,7 @@ class NewMemberJoinedEvent(DomainEvent):
     joined_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class RulesAcceptedEvent(DomainEvent):
     """
     Evento disparado quando usuário aceita as regras.
@@ -336,7 +336,7 @@ class RulesAcceptedEvent(DomainEvent):
     accepted_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class GamingAccessRequestedEvent(DomainEvent):
     """
     Evento disparado quando acesso gaming é solicitado.
@@ -351,7 +351,7 @@ class GamingAccessRequestedEvent(DomainEvent):
     requested_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class WelcomeMessageSentEvent(DomainEvent):
     """
     Evento disparado quando mensagem de boas-vindas é enviada.
@@ -13,7 +13,7 @@ from ..entities.base import DomainEvent
 from ..entities.cpf_verification import VerificationId
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class VerificationStarted(DomainEvent):
     """
     Evento disparado quando uma verificação de CPF é iniciada.
@@ -35,7 +35,7 @@ class VerificationStarted(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class VerificationAttemptMade(DomainEvent):
     """
     Evento disparado quando uma tentativa de verificação é feita.
@@ -61,7 +61,7 @@ class VerificationAttemptMade(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class VerificationCompleted(DomainEvent):
     """
     Evento disparado quando uma verificação é completada com sucesso.
@@ -75,6 +75,9 @@ class VerificationCompleted(DomainEvent):
         success: Se foi bem-sucedida
         occurred_at: Timestamp do evento
     """
+    # Altera quem pode usar o bot: precisa ser aplicado antes da resposta
+    synchronous = True
+
     verification_id: VerificationId
     user_id: int
     username: str
@@ -87,7 +90,7 @@ class VerificationCompleted(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class VerificationFailed(DomainEvent):
     """
     Evento disparado quando uma verificação falha.
@@ -113,7 +116,7 @@ class VerificationFailed(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class VerificationCancelled(DomainEvent):
     """
     Evento disparado quando uma verificação é cancelada.
@@ -135,7 +138,7 @@ class VerificationCancelled(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class VerificationExpired(DomainEvent):
     """
     Evento disparado quando uma verificação expira.
@@ -148,6 +151,9 @@ class VerificationExpired(DomainEvent):
         expires_at: Timestamp de expiração
         occurred_at: Timestamp do evento
     """
+    # Altera quem pode usar o bot: precisa ser aplicado antes da resposta
+    synchronous = True
+
     verification_id: VerificationId
     user_id: int
     username: str
@@ -159,7 +165,7 @@ class VerificationExpired(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class CPFDuplicateDetected(DomainEvent):
     """
     Evento disparado quando um CPF duplicado é detectado.
@@ -185,7 +191,7 @@ class CPFDuplicateDetected(DomainEvent):
         super().__post_init__()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class CPFRemapped(DomainEvent):
     """
     Evento disparado quando um CPF é remapeado para um novo usuário.
@@ -199,6 +205,9 @@ class CPFRemapped(DomainEvent):
         reason: Motivo do remapeamento
         occurred_at: Timestamp do evento
     """
+    # Altera quem pode usar o bot: precisa ser aplicado antes da resposta
+    synchronous = True
+
     cpf_number: str  # Mascarado
     old_user_id: int
     new_user_id: int
@@ -32,6 +32,23 @@ class GroupMemberRepository(ABC):
         """
         pass
 
+    async def save_many(self, members: List[GroupMember]) -> int:
+        """
+        Salva ou atualiza vários membros.
+
+        Implementações devem gravar tudo numa única transação; o padrão
+        apenas chama `save` para cada membro.
+
+        Args:
+            members: Entidades dos membros
+
+        Returns:
+            int: Quantidade de membros salvos
+        """
+        for member in members:
+            await self.save(member)
+        return len(members)
+
     @abstractmethod
     async def find_by_telegram_id(self, telegram_id: int) -> Optional[GroupMember]:
         """
@@ -0,0 +1,170 @@
+"""
+Cron Expression Value Object.
+
+Expressões cron de 5 campos (minuto, hora, dia do mês, mês, dia da
+semana), no mesmo formato do crontab usado no deploy.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import FrozenSet, Tuple
+
+
+# (nome, mínimo, máximo)
+_FIELDS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 6),
+)
+
+_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+
+
+class InvalidCronExpressionError(ValueError):
+    """Expressão cron inválida."""
+    pass
+
+
+def _parse_field(text: str, minimum: int, maximum: int) -> FrozenSet[int]:
+    values = set()
+    for part in text.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError("passo deve ser positivo")
+
+        if part == "*":
+            start, end = minimum, maximum
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(part)
+            # "5/15" = de 5 até o fim, de 15 em 15
+            end = maximum if step > 1 else start
+
+        if start < minimum or end > maximum or start > end:
+            raise ValueError(f"fora do intervalo {minimum}-{maximum}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronExpression:
+    """
+    Value Object representando uma expressão cron.
+
+    Suporta `*`, listas (`1,15`), intervalos (`1-5`), passos (`*/10`,
+    `0-30/5`) e os atalhos `@hourly`, `@daily`, `@weekly` e `@monthly`.
+    Domingo é 0 (7 também é aceito). Como no cron, se dia do mês e dia da
+    semana forem restritos, basta um dos dois coincidir.
+
+    Attributes:
+        expression: Texto original
+    """
+
+    expression: str
+
+    def __post_init__(self):
+        # Valida já na criação
+        self._fields
+
+    @property
+    def _fields(self) -> Tuple[FrozenSet[int], ...]:
+        cached = self.__dict__.get("_parsed")
+        if cached is not None:
+            return cached
+
+        text = _ALIASES.get(self.expression.strip(), self.expression.strip())
+        parts = text.split()
+        if len(parts) != 5:
+            raise InvalidCronExpressionError(f"Expressão cron deve ter 5 campos: '{self.expression}'")
+
+        parsed = []
+        for part, (name, minimum, maximum) in zip(parts, _FIELDS):
+            try:
+                values = _parse_field(part, minimum, maximum if name != "weekday" else 7)
+            except ValueError as e:
+                raise InvalidCronExpressionError(f"Campo {name} inválido em '{self.expression}': {e}") from e
+            if name == "weekday" and 7 in values:
+                values = (values - {7}) | {0}
+            parsed.append(values)
+
+        parsed = tuple(parsed)
+        object.__setattr__(self, "_parsed", parsed)
+        object.__setattr__(self, "_day_restricted", parts[2] != "*")
+        object.__setattr__(self, "_weekday_restricted", parts[4] != "*")
+        return parsed
+
+    def matches(self, moment: datetime) -> bool:
+        """
+        Verifica se o minuto informado satisfaz a expressão.
+
+        Args:
+            moment: Data/hora (segundos ignorados)
+
+        Returns:
+            bool: True se a expressão dispara neste minuto
+        """
+        minutes, hours, days, months, weekdays = self._fields
+        if moment.minute not in minutes or moment.hour not in hours or moment.month not in months:
+            return False
+        return self._day_matches(moment, days, weekdays)
+
+    def _day_matches(self, moment: datetime, days, weekdays) -> bool:
+        # datetime.weekday(): segunda = 0; cron: domingo = 0
+        weekday = (moment.weekday() + 1) % 7
+        day_ok = moment.day in days
+        weekday_ok = weekday in weekdays
+        if self._day_restricted and self._weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """
+        Calcula o próximo disparo estritamente depois de `after`.
+
+        Args:
+            after: Referência
+
+        Returns:
+            datetime: Próximo horário que satisfaz a expressão
+
+        Raises:
+            InvalidCronExpressionError: Se não houver disparo em 5 anos
+        """
+        minutes, hours, days, months, weekdays = self._fields
+        moment = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = after + timedelta(days=366 * 5)
+
+        while moment <= limit:
+            if moment.month not in months:
+                # Pula para o 1º dia do próximo mês
+                year = moment.year + (moment.month == 12)
+                month = moment.month % 12 + 1
+                moment = moment.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(moment, days, weekdays):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if moment.hour not in hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+                continue
+            if moment.minute not in minutes:
+                moment += timedelta(minutes=1)
+                continue
+            return moment
+
+        raise InvalidCronExpressionError(f"Expressão '{self.expression}' não dispara nos próximos 5 anos")
+
+    def __str__(self) -> str:
+        return self.expression
@@ -4,11 +4,13 @@ Scheduled Task Value Object.
 Representa tarefas agendadas do sistema.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from typing import Optional, Callable
 from enum import Enum
 
+from .cron_expression import CronExpression
+
 
 class TaskFrequency(Enum):
     """Frequência de execução de tarefas."""
@@ -37,6 +39,16 @@ class TaskStatus(Enum):
     COMPLETED = "completed"     # Concluída
     FAILED = "failed"          # Falhou
     CANCELLED = "cancelled"     # Cancelada
+    TIMED_OUT = "timed_out"     # Excedeu timeout_seconds
+    SKIPPED = "skipped"         # Execução anterior ainda em andamento
+
+
+class CatchUpPolicy(Enum):
+    """O que fazer com execuções perdidas (processo parado no horário)."""
+
+    SKIP = "skip"               # Ignora e segue para o próximo horário
+    RUN_ONCE = "run_once"       # Executa uma vez, cobrindo todas as perdidas
+    RUN_ALL = "run_all"         # Executa cada horário perdido (com limite)
 
 
 @dataclass(frozen=True)
@@ -56,6 +68,10 @@ class ScheduledTask:
         max_retries: Máximo de tentativas
         timeout_seconds: Timeout em segundos
         is_enabled: Se tarefa está habilitada
+        cron: Expressão cron (tem precedência sobre frequency)
+        interval_seconds: Intervalo fixo entre execuções (se não houver cron)
+        jitter_seconds: Atraso aleatório máximo somado a cada disparo
+        catch_up: Política para execuções perdidas
     """
 
     task_id: str
@@ -69,6 +85,15 @@ class ScheduledTask:
     max_retries: int = 3
     timeout_seconds: int = 300  # 5 minutos padrão
     is_enabled: bool = True
+    cron: Optional[str] = None
+    interval_seconds: Optional[int] = None
+    jitter_seconds: int = 0
+    catch_up: CatchUpPolicy = CatchUpPolicy.RUN_ONCE
+
+    def __post_init__(self):
+        if self.cron:
+            # Valida a expressão na criação da tarefa
+            CronExpression(self.cron)
 
     def should_run(self) -> bool:
         """
@@ -98,7 +123,24 @@ class ScheduledTask:
         Returns:
             datetime: Próxima execução
         """
-        base_time = self.last_run or datetime.now()
+        return self.next_run_after(self.last_run or datetime.now())
+
+    def next_run_after(self, after: datetime) -> datetime:
+        """
+        Calcula o primeiro horário de execução depois de `after`.
+
+        Args:
+            after: Referência (normalmente o último horário agendado)
+
+        Returns:
+            datetime: Próxima execução (datetime.max para tarefas únicas)
+        """
+        if self.cron:
+            return CronExpression(self.cron).next_after(after)
+        if self.interval_seconds:
+            return after + timedelta(seconds=self.interval_seconds)
+
+        base_time = after
 
         if self.frequency == TaskFrequency.HOURLY:
             return base_time + timedelta(hours=1)
@@ -113,6 +155,31 @@ class ScheduledTask:
             # Custom - retorna próxima hora por padrão
             return base_time + timedelta(hours=1)
 
+    def with_run(self, last_run: datetime, next_run: datetime) -> 'ScheduledTask':
+        """
+        Cria cópia registrando uma execução.
+
+        Args:
+            last_run: Horário agendado da execução feita
+            next_run: Próximo horário
+
+        Returns:
+            ScheduledTask: Nova instância
+        """
+        return replace(self, last_run=last_run, next_run=next_run)
+
+    def with_enabled(self, is_enabled: bool) -> 'ScheduledTask':
+        """
+        Cria cópia habilitada ou desabilitada.
+
+        Args:
+            is_enabled: Novo estado
+
+        Returns:
+            ScheduledTask: Nova instância
+        """
+        return replace(self, is_enabled=is_enabled)
+
     @staticmethod
     def create_cleanup_task() -> 'ScheduledTask':
         """
@@ -123,12 +190,34 @@ class ScheduledTask:
         """
         return ScheduledTask(
             task_id="cleanup_inactive_members",
-            name="Limpeza de Membros Inativos",
-            description="Remove membros sem contrato ativo do grupo",
-            frequency=TaskFrequency.DAILY,
+            name="Reconciliação de Membros",
+            description="Remove do grupo quem não atende mais aos critérios (contrato, CPF, regras, banimento)",
+            frequency=TaskFrequency.HOURLY,
             priority=TaskPriority.HIGH,
             next_run=datetime.now() + timedelta(hours=1),
-            timeout_seconds=600  # 10 minutos
+            timeout_seconds=600,  # 10 minutos
+            jitter_seconds=300
+        )
+
+    @staticmethod
+    def create_membership_sync_task() -> 'ScheduledTask':
+        """
+        Cria tarefa de conferência do índice de membros.
+
+        Returns:
+            ScheduledTask: Tarefa configurada
+        """
+        return ScheduledTask(
+            task_id="sync_membership_index",
+            name="Conferência do Índice de Membros",
+            description="Confere o índice local de membros contra o Telegram e corrige divergências",
+            frequency=TaskFrequency.CUSTOM,
+            priority=TaskPriority.LOW,
+            next_run=datetime.now() + timedelta(minutes=5),
+            timeout_seconds=300,
+            interval_seconds=600,
+            jitter_seconds=60,
+            catch_up=CatchUpPolicy.SKIP
         )
 
     @staticmethod
@@ -146,7 +235,8 @@ class ScheduledTask:
             frequency=TaskFrequency.HOURLY,
             priority=TaskPriority.CRITICAL,
             next_run=datetime.now() + timedelta(minutes=30),
-            timeout_seconds=300
+            timeout_seconds=300,
+            jitter_seconds=60
         )
 
     @staticmethod
@@ -164,7 +254,9 @@ class ScheduledTask:
             frequency=TaskFrequency.HOURLY,
             priority=TaskPriority.NORMAL,
             next_run=datetime.now() + timedelta(minutes=15),
-            timeout_seconds=180
+            timeout_seconds=180,
+            jitter_seconds=60,
+            catch_up=CatchUpPolicy.SKIP
         )
 
     @staticmethod
@@ -209,7 +301,8 @@ class ScheduledTask:
         Cria tarefa de verificação de CPF de membros do grupo.
 
         Verifica diariamente se todos os membros (exceto admins) têm CPF vinculado.
-        Remove membros sem CPF após 24h de notificação.
+        Remove membros sem CPF após 24h de notificação. Roda às 6:00, mesmo
+        horário do antigo cron de `deployment/install.sh`.
 
         Returns:
             ScheduledTask: Tarefa configurada
@@ -221,5 +314,30 @@ class ScheduledTask:
             frequency=TaskFrequency.DAILY,
             priority=TaskPriority.HIGH,
             next_run=datetime.now() + timedelta(hours=2),
-            timeout_seconds=600  # 10 minutos
+            timeout_seconds=3600,  # Checkup completo (vários lotes de DMs)
+            cron="0 6 * * *",
+            jitter_seconds=120
+        )
+
+    @staticmethod
+    def create_backup_task() -> 'ScheduledTask':
+        """
+        Cria tarefa de backup dos bancos.
+
+        Roda às 3:00, horário do antigo cron de `scripts/setup_cron_backup.sh`.
+
+        Returns:
+            ScheduledTask: Tarefa configurada
+        """
+        return ScheduledTask(
+            task_id="backup_databases",
+            name="Backup dos Bancos",
+            description="Cópia online dos bancos, exports JSONL e rotação dos conjuntos de backup",
+            frequency=TaskFrequency.DAILY,
+            priority=TaskPriority.NORMAL,
+            next_run=datetime.now() + timedelta(hours=1),
+            timeout_seconds=1800,
+            cron="0 3 * * *",
+            jitter_seconds=300,
+            catch_up=CatchUpPolicy.SKIP
         )
@@ -137,6 +137,75 @@ class WelcomeMessage:
             button_callback=f"accept_rules_{user_id}"
         )
 
+    @staticmethod
+    def create_batch_welcome(
+        welcome_topic_id: Optional[int] = None
+    ) -> 'WelcomeMessage':
+        """
+        Cria mensagem de boas-vindas para vários membros de uma vez.
+
+        Placeholders: {user_mentions} e {count}.
+
+        Args:
+            welcome_topic_id: ID do tópico de boas-vindas
+
+        Returns:
+            WelcomeMessage: Mensagem configurada
+        """
+        text = (
+            "🎮 <b>Sejam muito bem-vindos(as) à Comunidade OnCabo Gaming!</b> 🔥\n\n"
+            "{user_mentions}\n\n"
+            "Que alegria ter vocês {count} aqui com a gente! 🎉\n\n"
+            "📋 <b>PRÓXIMO PASSO IMPORTANTE:</b>\n\n"
+            "Por favor, vão até o tópico \"<b>📋 Regras da Comunidade</b>\" e:\n"
+            "1️⃣ Leiam nossas regras com atenção\n"
+            "2️⃣ Cliquem no seu botão \"<b>✅ Li e aceito</b>\"\n\n"
+            "⏰ Vocês têm <b>24 horas</b> para aceitar\n"
+            "⚠️ Sem aceitar, a remoção é automática\n\n"
+            "🚀 <b>Aproveitem a comunidade! Bons jogos!</b> 🎯"
+        )
+
+        return WelcomeMessage(
+            message_type=WelcomeMessageType.INITIAL_WELCOME,
+            text=text,
+            parse_mode="HTML",
+            topic_id=welcome_topic_id,
+            has_button=False
+        )
+
+    @staticmethod
+    def create_batch_rules_reminder(
+        rules_topic_id: int
+    ) -> 'WelcomeMessage':
+        """
+        Cria lembrete de regras para vários membros, com um botão por usuário.
+
+        Placeholders: {user_mentions}; no botão, {username}. O callback de
+        cada botão segue o formato `accept_rules_{user_id}`.
+
+        Args:
+            rules_topic_id: ID do tópico de regras
+
+        Returns:
+            WelcomeMessage: Mensagem configurada
+        """
+        text = (
+            "📋 <b>{user_mentions}, leiam as regras acima com atenção!</b>\n\n"
+            "A permanência no grupo depende da aceitação das regras.\n\n"
+            "⏰ <b>Prazo:</b> 24 horas\n"
+            "👇 <b>Após ler, cada um clica no seu botão:</b>"
+        )
+
+        return WelcomeMessage(
+            message_type=WelcomeMessageType.RULES_REMINDER,
+            text=text,
+            parse_mode="HTML",
+            topic_id=rules_topic_id,
+            has_button=True,
+            button_text="✅ {username}: li e aceito as regras",
+            button_callback="accept_rules_{user_id}"
+        )
+
     @staticmethod
     def create_rules_accepted() -> 'WelcomeMessage':
         """
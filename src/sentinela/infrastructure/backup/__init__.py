@@ -0,0 +1,6 @@
+"""
+Backup Infrastructure Layer.
+
+Cópias online dos bancos SQLite (API de backup em lotes de páginas),
+exports JSONL comprimidos por tabela e conjuntos de backup com checksums.
+"""
@@ -0,0 +1,547 @@
+"""
+Backups online dos bancos SQLite.
+
+A cópia usa `sqlite3.Connection.backup` em lotes de páginas: entre um lote
+e outro o banco fica livre, então o bot continua gravando durante o
+backup. Os exports JSONL são lidos da cópia (não do banco em uso), linha a
+linha, e gravados comprimidos.
+
+Cada execução gera um conjunto em `backups/sets/<timestamp>_<rótulo>/`:
+
+    <nome>.db                       cópia de cada banco
+    exports/<nome>/<tabela>.jsonl.gz
+    manifest.json                   sha256 e tamanho de cada arquivo,
+                                    linhas e checksum do conteúdo de cada tabela
+
+O manifest é gravado por último; conjunto sem manifest está incompleto.
+"""
+
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+_CHUNK_SIZE = 1024 * 1024
+# Conjunto incompleto modificado há menos que isto pode estar em criação
+INCOMPLETE_GRACE_SECONDS = 3600
+
+
+def online_snapshot(
+    source_path: str,
+    dest_path: str,
+    pages_per_step: int = 256,
+    sleep_seconds: float = 0.01,
+    progress: Optional[Callable[[int, int, int], None]] = None
+) -> str:
+    """
+    Copia um banco em uso para `dest_path` com a API de backup do SQLite.
+
+    A cópia é feita em lotes de `pages_per_step` páginas com uma pausa
+    entre eles, liberando o banco para o processo do bot. O arquivo final
+    só aparece em `dest_path` depois de concluído e conferido, sempre em
+    journal_mode=DELETE (um único arquivo, sem -wal/-shm).
+
+    Args:
+        source_path: Banco de origem
+        dest_path: Arquivo de destino
+        pages_per_step: Páginas copiadas por lote
+        sleep_seconds: Pausa entre lotes
+        progress: Callback (status, restantes, total) de sqlite3.backup
+
+    Returns:
+        str: journal_mode do banco de origem
+
+    Raises:
+        sqlite3.DatabaseError: Se a cópia falhar na verificação de integridade
+    """
+    dest = Path(dest_path)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    partial = dest.with_name(dest.name + ".partial")
+    if partial.exists():
+        partial.unlink()
+
+    source = sqlite3.connect(f"file:{Path(source_path).resolve()}?mode=ro", uri=True, timeout=30)
+    target = sqlite3.connect(partial)
+    try:
+        journal_mode = source.execute("PRAGMA journal_mode").fetchone()[0]
+        source.backup(target, pages=pages_per_step, progress=progress, sleep=sleep_seconds)
+        target.execute("PRAGMA journal_mode=DELETE")
+        result = target.execute("PRAGMA quick_check").fetchone()[0]
+        if result != "ok":
+            raise sqlite3.DatabaseError(f"Cópia de {source_path} inválida: {result}")
+    finally:
+        target.close()
+        source.close()
+
+    os.replace(partial, dest)
+    return journal_mode
+
+
+def list_tables(conn: sqlite3.Connection) -> List[str]:
+    """
+    Tabelas de usuário do banco (sem as internas do SQLite).
+
+    Args:
+        conn: Conexão aberta
+
+    Returns:
+        list: Nomes das tabelas em ordem alfabética
+    """
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def iter_table_lines(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: Optional[List[str]] = None,
+    batch_size: int = 1000
+) -> Iterator[str]:
+    """
+    Linhas da tabela serializadas como JSON, uma por vez.
+
+    A ordem (rowid) e a serialização são estáveis, então o sha256 das
+    linhas identifica o conteúdo da tabela independente do arquivo .db.
+    BLOBs viram {"$b64": ...}.
+
+    Args:
+        conn: Conexão aberta (normalmente com a cópia)
+        table: Nome da tabela
+        columns: Colunas exportadas (padrão: todas)
+        batch_size: Linhas lidas do cursor por vez
+
+    Yields:
+        str: Objeto JSON da linha, terminado em "\\n"
+    """
+    selected = ", ".join(_quote(column) for column in columns) if columns else "*"
+    try:
+        cursor = conn.execute(f"SELECT {selected} FROM {_quote(table)} ORDER BY rowid")
+    except sqlite3.OperationalError:
+        # Tabela WITHOUT ROWID: ordena pela primeira coluna selecionada
+        cursor = conn.execute(f"SELECT {selected} FROM {_quote(table)} ORDER BY 1")
+    columns = [description[0] for description in cursor.description]
+
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        for row in rows:
+            record = {
+                column: {'$b64': base64.b64encode(value).decode()} if isinstance(value, bytes) else value
+                for column, value in zip(columns, row)
+            }
+            yield json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n"
+
+
+def table_digest(conn: sqlite3.Connection, table: str, columns: Optional[List[str]] = None) -> Tuple[int, str]:
+    """
+    Quantidade de linhas e sha256 do conteúdo de uma tabela.
+
+    Args:
+        conn: Conexão aberta
+        table: Nome da tabela
+        columns: Colunas consideradas (padrão: todas)
+
+    Returns:
+        tuple: (linhas, sha256 hex)
+    """
+    digest = hashlib.sha256()
+    rows = 0
+    for line in iter_table_lines(conn, table, columns):
+        digest.update(line.encode())
+        rows += 1
+    return rows, digest.hexdigest()
+
+
+def export_table_jsonl(
+    conn: sqlite3.Connection,
+    table: str,
+    dest_path: Path,
+    columns: Optional[List[str]] = None
+) -> Tuple[int, str]:
+    """
+    Exporta uma tabela para JSONL comprimido, em streaming.
+
+    Args:
+        conn: Conexão aberta (normalmente com a cópia)
+        table: Nome da tabela
+        dest_path: Arquivo .jsonl.gz de destino
+        columns: Colunas exportadas (padrão: todas)
+
+    Returns:
+        tuple: (linhas, sha256 do conteúdo descomprimido)
+    """
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    rows = 0
+    with gzip.open(dest_path, "wt", encoding="utf-8") as output:
+        for line in iter_table_lines(conn, table, columns):
+            output.write(line)
+            digest.update(line.encode())
+            rows += 1
+    return rows, digest.hexdigest()
+
+
+def _quote(identifier: str) -> str:
+    """Identificador SQL entre aspas."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def file_sha256(path: Path) -> str:
+    """
+    sha256 de um arquivo, lido em blocos.
+
+    Args:
+        path: Arquivo
+
+    Returns:
+        str: sha256 hex
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BackupManager:
+    """Cria, confere, rotaciona e restaura conjuntos de backup."""
+
+    def __init__(
+        self,
+        databases: Dict[str, str],
+        backup_dir: str = "backups",
+        keep_sets: int = 7,
+        pages_per_step: int = 256,
+        sleep_seconds: float = 0.01
+    ):
+        """
+        Inicializa o gerenciador.
+
+        Args:
+            databases: nome -> caminho de cada banco incluído nos backups
+            backup_dir: Diretório raiz dos backups
+            keep_sets: Conjuntos completos mantidos na rotação
+            pages_per_step: Páginas copiadas por lote
+            sleep_seconds: Pausa entre lotes
+        """
+        self.databases = databases
+        self.sets_dir = Path(backup_dir) / "sets"
+        self.keep_sets = keep_sets
+        self.pages_per_step = pages_per_step
+        self.sleep_seconds = sleep_seconds
+        self._stats = {
+            'sets_created': 0,
+            'sets_rotated': 0,
+            'verifications': 0,
+            'verification_failures': 0,
+            'restores': 0
+        }
+        self._last_set: Optional[Dict[str, Any]] = None
+
+    def create_set(
+        self,
+        label: str = "auto",
+        export: bool = True,
+        keep_snapshots: bool = True,
+        tables: Optional[List[str]] = None,
+        columns: Optional[Dict[str, List[str]]] = None
+    ) -> Path:
+        """
+        Cria um conjunto de backup completo (bloqueante).
+
+        Args:
+            label: Rótulo no nome do diretório (auto, manual, critical...)
+            export: Gera os exports JSONL comprimidos
+            keep_snapshots: Mantém as cópias .db no conjunto (False = só exports)
+            tables: Restringe os exports a estas tabelas (padrão: todas)
+            columns: Colunas exportadas por tabela (padrão: todas); o checksum
+                da tabela passa a valer só para as colunas exportadas
+
+        Returns:
+            Path: Diretório do conjunto
+        """
+        started = datetime.now()
+        set_dir = self.sets_dir / f"{started:%Y%m%d_%H%M%S}_{label}"
+        set_dir.mkdir(parents=True, exist_ok=False)
+
+        manifest: Dict[str, Any] = {
+            'version': MANIFEST_VERSION,
+            'label': label,
+            'created_at': started.isoformat(),
+            'sqlite_version': sqlite3.sqlite_version,
+            'databases': {},
+            'files': {}
+        }
+
+        for name, path in self.databases.items():
+            if not Path(path).exists():
+                logger.warning(f"Banco '{name}' não encontrado em {path}; fora do backup")
+                continue
+
+            snapshot = set_dir / f"{name}.db"
+            journal_mode = online_snapshot(path, str(snapshot), self.pages_per_step, self.sleep_seconds)
+
+            with sqlite3.connect(f"file:{snapshot}?mode=ro", uri=True) as conn:
+                table_info: Dict[str, Dict[str, Any]] = {}
+                for table in list_tables(conn):
+                    if export and (tables is None or table in tables):
+                        relative = f"exports/{name}/{table}.jsonl.gz"
+                        table_columns = (columns or {}).get(table)
+                        rows, digest = export_table_jsonl(conn, table, set_dir / relative, table_columns)
+                        table_info[table] = {'rows': rows, 'sha256': digest, 'export': relative}
+                        if table_columns:
+                            table_info[table]['columns'] = table_columns
+                    elif keep_snapshots:
+                        rows, digest = table_digest(conn, table)
+                        table_info[table] = {'rows': rows, 'sha256': digest}
+
+            entry: Dict[str, Any] = {'source': str(path), 'journal_mode': journal_mode, 'tables': table_info}
+            if keep_snapshots:
+                entry['snapshot'] = snapshot.name
+            else:
+                snapshot.unlink()
+            manifest['databases'][name] = entry
+
+        for file in sorted(p for p in set_dir.rglob("*") if p.is_file()):
+            manifest['files'][file.relative_to(set_dir).as_posix()] = {
+                'sha256': file_sha256(file),
+                'size': file.stat().st_size
+            }
+        manifest['duration_seconds'] = round((datetime.now() - started).total_seconds(), 3)
+
+        partial = set_dir / (MANIFEST_NAME + ".partial")
+        partial.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(partial, set_dir / MANIFEST_NAME)
+
+        self._stats['sets_created'] += 1
+        self._last_set = {
+            'path': str(set_dir),
+            'created_at': manifest['created_at'],
+            'duration_seconds': manifest['duration_seconds'],
+            'size': sum(f['size'] for f in manifest['files'].values())
+        }
+        logger.info(
+            f"Backup criado em {set_dir} ({len(manifest['files'])} arquivos, "
+            f"{self._last_set['size']:,} bytes, {manifest['duration_seconds']}s)"
+        )
+        return set_dir
+
+    def list_sets(self) -> List[Dict[str, Any]]:
+        """
+        Conjuntos existentes, do mais antigo ao mais novo.
+
+        O rótulo vem do nome do diretório (<data>_<hora>_<rótulo>), então
+        também é conhecido para conjuntos incompletos.
+
+        Returns:
+            list: Dicts com path, complete, label, created_at e size
+        """
+        if not self.sets_dir.exists():
+            return []
+        result = []
+        for set_dir in sorted(p for p in self.sets_dir.iterdir() if p.is_dir()):
+            manifest = self.read_manifest(set_dir)
+            parts = set_dir.name.split("_", 2)
+            result.append({
+                'path': set_dir,
+                'complete': manifest is not None,
+                'label': manifest['label'] if manifest else (parts[2] if len(parts) == 3 else None),
+                'created_at': manifest['created_at'] if manifest else None,
+                'size': sum(f['size'] for f in manifest['files'].values()) if manifest else None
+            })
+        return result
+
+    def rotate(self, keep: Optional[int] = None, label: Optional[str] = None) -> int:
+        """
+        Apaga os conjuntos completos mais antigos e os incompletos abandonados.
+
+        Um conjunto incompleto só é apagado se nada nele foi modificado nos
+        últimos INCOMPLETE_GRACE_SECONDS (senão pode estar em criação por
+        outro processo, ex.: scripts/backup.py).
+
+        Args:
+            keep: Conjuntos completos mantidos (padrão: keep_sets)
+            label: Rotaciona só conjuntos com este rótulo (completos e incompletos)
+
+        Returns:
+            int: Conjuntos apagados
+        """
+        keep = self.keep_sets if keep is None else keep
+        sets = [s for s in self.list_sets() if label is None or s['label'] == label]
+        complete = [s for s in sets if s['complete']]
+        cutoff = datetime.now().timestamp() - INCOMPLETE_GRACE_SECONDS
+        incomplete = [s for s in sets if not s['complete'] and self._last_modified(s['path']) < cutoff]
+
+        doomed = complete[:max(0, len(complete) - keep)] + incomplete
+        for entry in doomed:
+            shutil.rmtree(entry['path'])
+            logger.info(f"Backup antigo removido: {entry['path']}")
+        self._stats['sets_rotated'] += len(doomed)
+        return len(doomed)
+
+    def verify_set(self, set_dir: Path) -> List[str]:
+        """
+        Confere um conjunto contra o seu manifest.
+
+        Recalcula o sha256 de cada arquivo, roda integrity_check nas cópias
+        e confere linhas e checksum de conteúdo de cada tabela.
+
+        Args:
+            set_dir: Diretório do conjunto
+
+        Returns:
+            list: Problemas encontrados (vazia = conjunto íntegro)
+        """
+        self._stats['verifications'] += 1
+        manifest = self.read_manifest(set_dir)
+        if manifest is None:
+            self._stats['verification_failures'] += 1
+            return [f"{set_dir}: sem {MANIFEST_NAME} (backup incompleto)"]
+
+        problems = []
+        for relative, expected in manifest['files'].items():
+            path = set_dir / relative
+            if not path.exists():
+                problems.append(f"{relative}: arquivo ausente")
+            elif path.stat().st_size != expected['size'] or file_sha256(path) != expected['sha256']:
+                problems.append(f"{relative}: checksum diferente do manifest")
+
+        if not problems:
+            for name, entry in manifest['databases'].items():
+                if 'snapshot' in entry:
+                    problems += self._verify_database(set_dir / entry['snapshot'], entry['tables'], name)
+
+        if problems:
+            self._stats['verification_failures'] += 1
+        return problems
+
+    def restore(self, set_dir: Path, name: str, target_path: str) -> None:
+        """
+        Restaura um banco do conjunto e confere o resultado.
+
+        O conjunto é conferido antes; a cópia é restaurada para um arquivo
+        temporário ao lado do destino, conferida tabela a tabela contra os
+        checksums do manifest e só então substitui o destino. Pare o bot
+        antes de restaurar o banco que ele usa.
+
+        Args:
+            set_dir: Diretório do conjunto
+            name: Nome do banco no manifest (ex.: main, audit)
+            target_path: Arquivo a substituir
+
+        Raises:
+            ValueError: Se o conjunto ou o banco restaurado não conferem
+        """
+        problems = self.verify_set(set_dir)
+        if problems:
+            raise ValueError("Conjunto de backup inválido: " + "; ".join(problems))
+
+        manifest = self.read_manifest(set_dir)
+        entry = manifest['databases'].get(name)
+        if not entry or 'snapshot' not in entry:
+            raise ValueError(f"Banco '{name}' sem cópia neste conjunto")
+
+        target = Path(target_path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(prefix=target.name + ".", suffix=".restore", dir=target.parent)
+        os.close(fd)
+        try:
+            online_snapshot(str(set_dir / entry['snapshot']), temporary, self.pages_per_step, 0)
+            problems = self._verify_database(Path(temporary), entry['tables'], name)
+            if problems:
+                raise ValueError("Banco restaurado não confere: " + "; ".join(problems))
+            if entry.get('journal_mode', 'delete') == 'wal':
+                with sqlite3.connect(temporary) as conn:
+                    conn.execute("PRAGMA journal_mode=WAL")
+
+            # Journal do banco antigo não pode ser aplicado sobre o restaurado
+            for suffix in ("-wal", "-shm", "-journal"):
+                stale = Path(str(target) + suffix)
+                if stale.exists():
+                    stale.unlink()
+            os.replace(temporary, target)
+        finally:
+            if os.path.exists(temporary):
+                os.unlink(temporary)
+
+        self._stats['restores'] += 1
+        logger.info(f"Banco '{name}' restaurado de {set_dir} em {target}")
+
+    @staticmethod
+    def read_manifest(set_dir: Path) -> Optional[Dict[str, Any]]:
+        """
+        Lê o manifest de um conjunto.
+
+        Args:
+            set_dir: Diretório do conjunto
+
+        Returns:
+            Optional[dict]: Manifest, ou None se o conjunto está incompleto
+        """
+        path = set_dir / MANIFEST_NAME
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    # Private helper methods
+
+    @staticmethod
+    def _last_modified(set_dir: Path) -> float:
+        """Última modificação do diretório ou de qualquer arquivo dentro dele."""
+        latest = set_dir.stat().st_mtime
+        for path in set_dir.rglob("*"):
+            try:
+                latest = max(latest, path.stat().st_mtime)
+            except FileNotFoundError:
+                continue
+        return latest
+
+    @staticmethod
+    def _verify_database(path: Path, tables: Dict[str, Dict[str, Any]], name: str) -> List[str]:
+        """Integridade e conteúdo de cada tabela de um banco."""
+        problems = []
+        with sqlite3.connect(f"file:{path}?mode=ro", uri=True) as conn:
+            result = conn.execute("PRAGMA integrity_check").fetchone()[0]
+            if result != "ok":
+                return [f"{name}: integrity_check falhou ({result})"]
+            existing = set(list_tables(conn))
+            for table, expected in tables.items():
+                if table not in existing:
+                    problems.append(f"{name}.{table}: tabela ausente")
+                    continue
+                rows, digest = table_digest(conn, table, expected.get('columns'))
+                if rows != expected['rows'] or digest != expected['sha256']:
+                    problems.append(
+                        f"{name}.{table}: conteúdo diferente ({rows} linhas, esperado {expected['rows']})"
+                    )
+        return problems
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas dos backups.
+
+        Returns:
+            dict: Contadores, último conjunto criado e conjuntos existentes
+        """
+        sets = self.list_sets()
+        return {
+            **self._stats,
+            'last_set': self._last_set,
+            'complete_sets': sum(1 for s in sets if s['complete']),
+            'incomplete_sets': sum(1 for s in sets if not s['complete'])
+        }
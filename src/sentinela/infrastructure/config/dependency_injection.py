@@ -6,6 +6,8 @@ os princípios de Inversion of Control (IoC).
 """
 
 import logging
+import sqlite3
+from pathlib import Path
 from typing import Dict, Type, TypeVar, Callable, Any, Optional
 from abc import ABC, abstractmethod
 
@@ -276,6 +278,24 @@ def get_container() -> DIContainer:
     return _global_container
 
 
+def _enable_wal_mode(db_path: str) -> None:
+    """
+    Coloca o banco em modo WAL (persistente no arquivo).
+
+    Em WAL leituras não bloqueiam a gravação e vice-versa; só escritas
+    concorrentes disputam o lock. Sem isso, uma leitura em andamento
+    segura o commit de outra conexão e o event loop espera pelo lock.
+
+    Args:
+        db_path: Caminho do banco SQLite
+    """
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    with sqlite3.connect(db_path) as conn:
+        mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+    if mode != 'wal':
+        logger.warning(f"Banco {db_path} continua em journal_mode={mode}")
+
+
 def configure_dependencies() -> None:
     """
     Configura todas as dependências da aplicação.
@@ -297,6 +317,8 @@ def configure_dependencies() -> None:
     from ..repositories.sqlite_user_repository import SQLiteUserRepository
     from ...core.config import DATABASE_FILE
 
+    _enable_wal_mode(DATABASE_FILE)
+
     # Register repository with database path via factory
     def create_user_repository() -> SQLiteUserRepository:
         return SQLiteUserRepository(DATABASE_FILE)
@@ -308,10 +330,16 @@ def configure_dependencies() -> None:
     from ..repositories.sqlite_admin_repository import SQLiteAdminRepository
 
     def create_admin_repository() -> SQLiteAdminRepository:
-        return SQLiteAdminRepository(DATABASE_FILE)
+        from ...core.access_control import PermissionManager
+        # Sincronizações atualizam o cache de permissões deste processo
+        return SQLiteAdminRepository(DATABASE_FILE, on_admins_changed=PermissionManager.set_admin_ids)
 
     container.register_factory(AdminRepository, create_admin_repository)
 
+    # Estado do fluxo /suporte: working set em memória + gravação em lote
+    from ..repositories.sqlite_conversation_state_store import SQLiteConversationStateStore
+    container.register_instance(SQLiteConversationStateStore, SQLiteConversationStateStore(DATABASE_FILE))
+
     # === External Services ===
 
     # HubSoft services
@@ -323,8 +351,31 @@ def configure_dependencies() -> None:
     from ..external_services.invite_client_impl import InviteClientImpl
 
     container.register_singleton(HubSoftClient, HubSoftClientImpl)
-    container.register_singleton(GroupClient, GroupClientImpl)
-    container.register_singleton(InviteClient, InviteClientImpl)
+
+    # Índice de membros (group_members), mantido pelos updates chat_member
+    from ..repositories.membership_index import MembershipIndex
+    from ...core.config import TELEGRAM_GROUP_ID
+    membership_index = MembershipIndex(DATABASE_FILE)
+    container.register_instance(MembershipIndex, membership_index)
+    container.register_instance(GroupClient, GroupClientImpl(membership_index, int(TELEGRAM_GROUP_ID)))
+
+    # Pool de links de convite (reposto em background a partir do startup)
+    from ..repositories.sqlite_invite_link_pool import SQLiteInviteLinkStore
+    from ..external_services.invite_link_pool import InviteLinkPool
+    from ...core.config import INVITE_POOL_SIZE, INVITE_POOL_LINK_TTL_SECONDS, INVITE_POOL_MIN_REMAINING_SECONDS
+    invite_link_pool = InviteLinkPool(
+        SQLiteInviteLinkStore(DATABASE_FILE),
+        int(TELEGRAM_GROUP_ID),
+        target_size=INVITE_POOL_SIZE,
+        link_ttl_seconds=INVITE_POOL_LINK_TTL_SECONDS,
+        min_remaining_seconds=INVITE_POOL_MIN_REMAINING_SECONDS
+    )
+    container.register_instance(InviteLinkPool, invite_link_pool)
+    container.register_instance(InviteClient, InviteClientImpl(invite_link_pool))
+
+    # Fila central de envios ao Telegram (bot definido no startup com `bind`)
+    from ..external_services.message_scheduler import OutboundMessageScheduler
+    container.register_instance(OutboundMessageScheduler, OutboundMessageScheduler())
 
     # === Event System ===
 
@@ -332,6 +383,68 @@ def configure_dependencies() -> None:
     from ..events.event_bus import EventBus, InMemoryEventBus
     container.register_singleton(EventBus, InMemoryEventBus)
 
+    # Outbox transacional: eventos das verificações de CPF gravados na transação do save
+    from ..events.outbox import SQLiteEventOutbox, OutboxRelay
+    event_outbox = SQLiteEventOutbox(DATABASE_FILE)
+    container.register_instance(SQLiteEventOutbox, event_outbox)
+
+    event_bus_instance = container.get(EventBus)
+    event_bus_instance.attach_outbox(event_outbox)
+    container.register_instance(OutboxRelay, OutboxRelay(event_outbox, event_bus_instance))
+
+    # Audit log em lote (arquivo SQLite separado)
+    from ..events.audit_log import AuditLogWriter, set_audit_log_writer
+    from ...core.config import AUDIT_DATABASE_FILE
+    audit_log_writer = AuditLogWriter(AUDIT_DATABASE_FILE)
+    container.register_instance(AuditLogWriter, audit_log_writer)
+    set_audit_log_writer(audit_log_writer)
+
+    # Backups online dos dois bancos (tarefa backup_databases e scripts/backup.py)
+    from ..backup.sqlite_backup import BackupManager
+    from ...core.config import BACKUP_DIR, BACKUP_KEEP_SETS, BACKUP_PAGES_PER_STEP
+    container.register_instance(BackupManager, BackupManager(
+        {"main": DATABASE_FILE, "audit": AUDIT_DATABASE_FILE},
+        backup_dir=BACKUP_DIR,
+        keep_sets=BACKUP_KEEP_SETS,
+        pages_per_step=BACKUP_PAGES_PER_STEP
+    ))
+
+    # Transporte de eventos entre processos (scripts de cron -> bot)
+    from ..events.transport import SQLiteEventTransport, EventTransportConsumer
+    event_transport = SQLiteEventTransport(DATABASE_FILE)
+    container.register_instance(SQLiteEventTransport, event_transport)
+
+    transport_consumer = EventTransportConsumer(event_transport, event_bus_instance)
+
+    async def invalidate_hubsoft_client_cache(cpf):
+        from ...integrations.hubsoft.cache_manager import cache_manager, invalidate_client_cache
+        if cpf:
+            invalidate_client_cache(cpf)
+        else:
+            cache_manager.clear()
+
+    transport_consumer.register_invalidation("hubsoft_client", invalidate_hubsoft_client_cache)
+
+    # Snapshot de autorização (verificados / já interagiram), carregado no startup
+    from ..repositories.authorization_snapshot import AuthorizationSnapshot
+    authorization_snapshot = AuthorizationSnapshot(DATABASE_FILE)
+    container.register_instance(AuthorizationSnapshot, authorization_snapshot)
+
+    async def refresh_authorization_snapshot(user_id):
+        if user_id:
+            authorization_snapshot.refresh_user(int(user_id))
+        else:
+            authorization_snapshot.load()
+
+    transport_consumer.register_invalidation("authorization_snapshot", refresh_authorization_snapshot)
+
+    async def invalidate_admin_cache(_key):
+        from ...core.access_control import PermissionManager
+        PermissionManager.invalidate_admins()
+
+    transport_consumer.register_invalidation("admins", invalidate_admin_cache)
+    container.register_instance(EventTransportConsumer, transport_consumer)
+
     # === Application Layer ===
 
     # Command handlers
@@ -353,7 +466,7 @@ def configure_dependencies() -> None:
     from ..repositories.sqlite_cpf_verification_repository import SQLiteCPFVerificationRepository
 
     def create_cpf_verification_repository() -> SQLiteCPFVerificationRepository:
-        return SQLiteCPFVerificationRepository(DATABASE_FILE)
+        return SQLiteCPFVerificationRepository(DATABASE_FILE, outbox=event_outbox)
 
     container.register_factory(CPFVerificationRepository, create_cpf_verification_repository)
 
@@ -506,11 +619,107 @@ def configure_dependencies() -> None:
             group_id=int(TELEGRAM_GROUP_ID),
             welcome_topic_id=int(WELCOME_TOPIC_ID) if WELCOME_TOPIC_ID else None,
             rules_topic_id=int(RULES_TOPIC_ID) if RULES_TOPIC_ID else None,
-            rules_acceptance_hours=24
+            rules_acceptance_hours=24,
+            group_client=container.get(GroupClient)
         )
 
     container.register_factory(WelcomeManagementUseCase, create_welcome_management_use_case)
 
+    # Boas-vindas agrupadas em rajadas de entrada
+    from ..external_services.join_aggregator import JoinBurstAggregator
+    from ...core.config import JOIN_BATCH_THRESHOLD, JOIN_BATCH_WINDOW_SECONDS, JOIN_BATCH_MAX_SIZE
+    container.register_instance(JoinBurstAggregator, JoinBurstAggregator(
+        welcome_topic_id=int(WELCOME_TOPIC_ID) if WELCOME_TOPIC_ID else None,
+        rules_topic_id=int(RULES_TOPIC_ID) if RULES_TOPIC_ID else None,
+        batch_threshold=JOIN_BATCH_THRESHOLD,
+        window_seconds=JOIN_BATCH_WINDOW_SECONDS,
+        max_batch_size=JOIN_BATCH_MAX_SIZE,
+        rules_acceptance_hours=24
+    ))
+
+    # Anexos do /suporte enviados ao HubSoft em background
+    from ..external_services.attachment_pipeline import AttachmentUploadPipeline
+    from ...core.config import TECH_NOTIFICATION_CHANNEL_ID, ATTACHMENT_UPLOAD_CONCURRENCY, ATTACHMENT_UPLOAD_MAX_ATTEMPTS
+    container.register_instance(AttachmentUploadPipeline, AttachmentUploadPipeline(
+        tech_channel_id=int(TECH_NOTIFICATION_CHANNEL_ID) if TECH_NOTIFICATION_CHANNEL_ID else None,
+        max_concurrent_uploads=ATTACHMENT_UPLOAD_CONCURRENCY,
+        max_attempts=ATTACHMENT_UPLOAD_MAX_ATTEMPTS
+    ))
+
+    # Tarefas periódicas executadas dentro do bot (antes via cron)
+    from ...application.use_cases.scheduled_tasks_use_case import ScheduledTasksUseCase
+    from ..repositories.sqlite_task_run_history import SQLiteTaskRunHistory
+    from ..scheduling.deadline_scheduler import DeadlineScheduler
+    from ..scheduling.job_lease import SQLiteJobLeaseStore
+    from ...core.config import SCHEDULER_MAX_CONCURRENCY, JOB_LEASE_TTL_SECONDS
+    scheduled_tasks_use_case = ScheduledTasksUseCase(event_bus_instance)
+    container.register_instance(ScheduledTasksUseCase, scheduled_tasks_use_case)
+    task_run_history = SQLiteTaskRunHistory(DATABASE_FILE)
+    container.register_instance(SQLiteTaskRunHistory, task_run_history)
+    job_lease_store = SQLiteJobLeaseStore(DATABASE_FILE, default_ttl_seconds=JOB_LEASE_TTL_SECONDS)
+    container.register_instance(SQLiteJobLeaseStore, job_lease_store)
+    container.register_instance(DeadlineScheduler, DeadlineScheduler(
+        scheduled_tasks_use_case,
+        task_run_history,
+        max_concurrency=SCHEDULER_MAX_CONCURRENCY,
+        lease_store=job_lease_store,
+        lease_ttl_seconds=JOB_LEASE_TTL_SECONDS
+    ))
+
+    # Checkpoints do checkup diário (retomada após interrupção)
+    from ..repositories.sqlite_checkup_store import SQLiteCheckupStore
+    container.register_instance(SQLiteCheckupStore, SQLiteCheckupStore(DATABASE_FILE))
+
+    # Reverificação contínua de contratos (orçamento compartilhado com o uso interativo)
+    from ..repositories.sqlite_contract_check_store import SQLiteContractCheckStore
+    from ..scheduling.contract_reverifier import ContractReverifier
+    from ...integrations.hubsoft.rate_limiter import rate_limiter as hubsoft_rate_limiter
+    from ...core.config import (
+        CONTRACT_REVERIFY_SLA_HOURS, CONTRACT_REVERIFY_MAX_PER_MINUTE, CONTRACT_REVERIFY_RESERVE_PER_MINUTE
+    )
+    contract_check_store = SQLiteContractCheckStore(DATABASE_FILE)
+    container.register_instance(SQLiteContractCheckStore, contract_check_store)
+    container.register_instance(ContractReverifier, ContractReverifier(
+        contract_check_store,
+        hubsoft_rate_limiter,
+        sla_hours=CONTRACT_REVERIFY_SLA_HOURS,
+        max_per_minute=CONTRACT_REVERIFY_MAX_PER_MINUTE,
+        interactive_reserve_per_minute=CONTRACT_REVERIFY_RESERVE_PER_MINUTE
+    ))
+
+    # Reconciliação de membros por conjuntos (tarefa cleanup_inactive_members)
+    from ..repositories.sqlite_membership_sets import SQLiteMembershipSets
+    from ..external_services.membership_executor import MembershipActionExecutor
+    from ..scheduling.membership_reconciler import MembershipReconciler
+    from ...core.config import (
+        MEMBERSHIP_RECONCILE_CALLS_PER_SECOND, MEMBERSHIP_RECONCILE_BATCH_SIZE, MEMBERSHIP_RECONCILE_MAX_REMOVALS
+    )
+    membership_sets = SQLiteMembershipSets(DATABASE_FILE)
+    container.register_instance(SQLiteMembershipSets, membership_sets)
+    membership_executor = MembershipActionExecutor(
+        int(TELEGRAM_GROUP_ID),
+        calls_per_second=MEMBERSHIP_RECONCILE_CALLS_PER_SECOND,
+        batch_size=MEMBERSHIP_RECONCILE_BATCH_SIZE
+    )
+    container.register_instance(MembershipActionExecutor, membership_executor)
+    container.register_instance(MembershipReconciler, MembershipReconciler(
+        membership_sets,
+        membership_executor,
+        event_bus_instance,
+        container.get(OutboundMessageScheduler),
+        index=membership_index,
+        max_removals=MEMBERSHIP_RECONCILE_MAX_REMOVALS
+    ))
+
+    # Conferência do índice de membros contra o Telegram (tarefa sync_membership_index)
+    from ..scheduling.membership_index_sync import MembershipIndexSync
+    from ...core.config import MEMBERSHIP_SYNC_CHECKS_PER_RUN
+    container.register_instance(MembershipIndexSync, MembershipIndexSync(
+        membership_index,
+        int(TELEGRAM_GROUP_ID),
+        checks_per_run=MEMBERSHIP_SYNC_CHECKS_PER_RUN
+    ))
+
     # === String Aliases (Compatibilidade com código legado) ===
 
     # Repositories
@@ -521,6 +730,9 @@ def configure_dependencies() -> None:
     container.register_alias("hubsoft_integration_repository", HubSoftIntegrationRepository)
     container.register_alias("group_member_repository", GroupMemberRepository)
 
+    # Services
+    container.register_alias("duplicate_cpf_service", DuplicateCPFService)
+
     # Use Cases
     container.register_alias("cpf_verification_use_case", CPFVerificationUseCase)
     container.register_alias("hubsoft_integration_use_case", HubSoftIntegrationUseCase)
@@ -539,6 +751,13 @@ def configure_dependencies() -> None:
         event_bus = container.get(EventBus)
         registry = EventHandlerRegistry(event_bus)
         registry.register_all_handlers()
+
+        from ..events.handlers.cpf_verification_event_handlers import AuthorizationSnapshotHandler
+        from ...domain.events.verification_events import (
+            VerificationStarted, VerificationCompleted, VerificationExpired, CPFRemapped
+        )
+        for event_type in (VerificationStarted, VerificationCompleted, VerificationExpired, CPFRemapped):
+            registry.register_custom_handler(AuthorizationSnapshotHandler(authorization_snapshot, event_type))
         logger.info("✅ Event handlers registered successfully")
     except Exception as e:
         logger.error(f"⚠️ Failed to register event handlers: {e}")
@@ -0,0 +1,352 @@
+"""
+Audit log em lote para os handlers globais de auditoria.
+
+Os handlers só enfileiram registros; um writer em background grava
+os registros em lote (por tamanho ou por tempo) num SQLite separado
+e append-only, fora do caminho crítico dos eventos. A transação de cada
+lote roda em thread (asyncio.to_thread), sem bloquear o event loop.
+"""
+
+import asyncio
+import dataclasses
+import json
+import logging
+import sqlite3
+from datetime import datetime, date
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...domain.entities.base import DomainEvent
+
+logger = logging.getLogger(__name__)
+
+# Espera pelo lock do banco na gravação de um lote (fora do event loop)
+WRITE_BUSY_TIMEOUT_SECONDS = 30.0
+
+
+def _identifier(value: Any) -> Optional[int]:
+    """Extrai valor inteiro de um ID (int ou value object com `.value`)."""
+    value = getattr(value, 'value', value)
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _plain(value: Any) -> Any:
+    """Converte valores do evento para JSON legível (value objects viram o valor)."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        fields = vars(value)
+        if set(fields) == {'value'}:
+            return _plain(fields['value'])
+        return {k: _plain(v) for k, v in fields.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _plain(v) for k, v in value.items()}
+    return value
+
+
+class AuditLogWriter:
+    """
+    Writer de auditoria com fila limitada e gravação em lote.
+
+    - `record` nunca bloqueia: se a fila estiver cheia o registro é
+      descartado e contabilizado em `dropped`
+    - O writer grava quando acumula `batch_size` registros ou a cada
+      `flush_interval` segundos, em uma única transação por lote
+    - A tabela é append-only: registros nunca são alterados
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_queue_size: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 2.0
+    ):
+        """
+        Inicializa o writer.
+
+        Args:
+            db_path: Arquivo SQLite exclusivo da auditoria
+            max_queue_size: Registros aguardando gravação antes de descartar
+            batch_size: Registros por transação
+            flush_interval: Intervalo máximo entre gravações (segundos)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._writer_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats = {
+            'recorded': 0,
+            'written': 0,
+            'dropped': 0,
+            'batches': 0,
+            'write_errors': 0
+        }
+        self._ensure_table_exists()
+
+    def _ensure_table_exists(self) -> None:
+        """Cria a tabela de auditoria se não existir."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS audit_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    category TEXT NOT NULL,
+                    event_type TEXT NOT NULL,
+                    event_id TEXT,
+                    user_id INTEGER,
+                    ticket_id INTEGER,
+                    occurred_at TEXT NOT NULL,
+                    recorded_at TEXT NOT NULL,
+                    payload TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_log_user ON audit_log(user_id, occurred_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_log_ticket ON audit_log(ticket_id, occurred_at)")
+            conn.commit()
+
+    # ==================== ESCRITA ====================
+
+    def record(self, category: str, event: DomainEvent) -> bool:
+        """
+        Enfileira evento para auditoria sem bloquear.
+
+        Args:
+            category: Origem do registro (ex.: 'ticket', 'user_activity')
+            event: Evento auditado
+
+        Returns:
+            bool: False se o registro foi descartado por fila cheia
+        """
+        queue = self._ensure_writer()
+        try:
+            queue.put_nowait(self._build_row(category, event))
+        except asyncio.QueueFull:
+            self._stats['dropped'] += 1
+            if self._stats['dropped'] % 1000 == 1:
+                logger.warning(f"Fila de auditoria cheia: {self._stats['dropped']} registros descartados")
+            return False
+
+        self._stats['recorded'] += 1
+        return True
+
+    def _build_row(self, category: str, event: DomainEvent) -> Tuple:
+        """Monta a linha de auditoria a partir do evento."""
+        attributes = {k: v for k, v in vars(event).items() if not k.startswith('_')}
+        payload = json.dumps(_plain(attributes), ensure_ascii=False, default=str)
+
+        occurred_at = getattr(event, 'occurred_at', None) or datetime.now()
+        return (
+            category,
+            type(event).__name__,
+            getattr(event, 'event_id', None),
+            _identifier(getattr(event, 'user_id', None)),
+            _identifier(getattr(event, 'ticket_id', None)),
+            occurred_at.isoformat(),
+            datetime.now().isoformat(),
+            payload
+        )
+
+    def _ensure_writer(self) -> asyncio.Queue:
+        """
+        Inicia o writer no loop atual, se necessário.
+
+        Returns:
+            asyncio.Queue: Fila consumida pelo writer
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._queue is None or self._writer_loop is not loop:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._writer_loop = loop
+            self._writer_task = asyncio.create_task(self._run_writer(self._queue), name="audit-log-writer")
+
+        return self._queue
+
+    async def _run_writer(self, queue: asyncio.Queue) -> None:
+        """
+        Consome a fila e grava em lote por tamanho ou tempo.
+
+        Args:
+            queue: Fila de registros
+        """
+        while True:
+            batch = [await queue.get()]
+            deadline = asyncio.get_running_loop().time() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _write_batch(self, batch: List[Tuple]) -> None:
+        """
+        Grava lote em uma única transação (roda em thread).
+
+        Args:
+            batch: Linhas de auditoria
+        """
+        try:
+            with sqlite3.connect(self.db_path, timeout=WRITE_BUSY_TIMEOUT_SECONDS) as conn:
+                conn.executemany("""
+                    INSERT INTO audit_log (
+                        category, event_type, event_id, user_id, ticket_id,
+                        occurred_at, recorded_at, payload
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, batch)
+                conn.commit()
+            self._stats['written'] += len(batch)
+            self._stats['batches'] += 1
+        except Exception as e:
+            self._stats['write_errors'] += 1
+            logger.error(f"Erro ao gravar {len(batch)} registros de auditoria: {e}")
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda a gravação de todos os registros enfileirados.
+
+        Args:
+            timeout: Tempo máximo de espera em segundos
+
+        Returns:
+            bool: True se a fila foi esvaziada
+        """
+        if self._queue is None or self._writer_loop is not asyncio.get_running_loop():
+            return True
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def shutdown(self, timeout: Optional[float] = 10) -> None:
+        """
+        Grava registros pendentes e para o writer.
+
+        Args:
+            timeout: Tempo máximo para esvaziar a fila
+        """
+        if not await self.flush(timeout=timeout):
+            logger.warning(f"Audit log encerrado com {self._queue.qsize()} registros não gravados")
+
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+        self._writer_task = None
+        self._queue = None
+        self._writer_loop = None
+
+    # ==================== CONSULTA ====================
+
+    def query(
+        self,
+        user_id: Optional[int] = None,
+        ticket_id: Optional[int] = None,
+        event_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 500
+    ) -> List[Dict[str, Any]]:
+        """
+        Consulta a trilha de auditoria.
+
+        Args:
+            user_id: Filtra por usuário
+            ticket_id: Filtra por ticket
+            event_type: Filtra por nome do evento
+            since: Início do período
+            until: Fim do período
+            limit: Máximo de registros
+
+        Returns:
+            List[dict]: Registros em ordem cronológica
+        """
+        conditions = []
+        params: List[Any] = []
+        for column, value in (('user_id', user_id), ('ticket_id', ticket_id), ('event_type', event_type)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            conditions.append("occurred_at >= ?")
+            params.append(since.isoformat())
+        if until:
+            conditions.append("occurred_at <= ?")
+            params.append(until.isoformat())
+
+        query = "SELECT * FROM audit_log"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY occurred_at, id LIMIT ?"
+        params.append(limit)
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(query, params).fetchall()
+
+        return [{**dict(row), 'payload': json.loads(row['payload'])} for row in rows]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do writer.
+
+        Returns:
+            dict: Profundidade da fila e contadores
+        """
+        return {
+            'queue_depth': self._queue.qsize() if self._queue else 0,
+            'max_queue_size': self.max_queue_size,
+            'batch_size': self.batch_size,
+            'stats': self._stats.copy()
+        }
+
+
+# Instância global usada pelos handlers de auditoria
+_global_audit_log_writer: Optional[AuditLogWriter] = None
+
+
+def get_audit_log_writer() -> Optional[AuditLogWriter]:
+    """
+    Retorna o writer de auditoria global.
+
+    Returns:
+        Optional[AuditLogWriter]: Writer configurado ou None
+    """
+    return _global_audit_log_writer
+
+
+def set_audit_log_writer(writer: Optional[AuditLogWriter]) -> None:
+    """
+    Define o writer de auditoria global.
+
+    Args:
+        writer: Writer a usar nos handlers de auditoria
+    """
+    global _global_audit_log_writer
+    _global_audit_log_writer = writer
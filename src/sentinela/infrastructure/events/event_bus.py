@@ -6,21 +6,42 @@ assíncrona entre componentes da aplicação.
 """
 
 import asyncio
+import contextvars
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Type, Callable, Any, Optional
+from typing import Dict, List, Tuple, Type, Callable, Any, Optional
 from collections import defaultdict
 
 from ...domain.entities.base import DomainEvent
+from .idempotency import IdempotencyStore
 
 logger = logging.getLogger(__name__)
 
+# Marca publicações feitas de dentro de um handler. Publicações aninhadas
+# não passam pelos limites do bus para evitar deadlock (o handler externo
+# já ocupa um slot da fila e do semáforo global).
+_inside_dispatch: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "event_bus_inside_dispatch", default=False
+)
+
 
 class EventHandler(ABC):
     """
     Interface base para handlers de eventos.
+
+    Handlers podem declarar limites próprios sobrescrevendo os
+    atributos de classe abaixo:
+
+    - max_concurrency: execuções simultâneas permitidas (None = sem limite próprio)
+    - timeout: timeout em segundos (None = usa o timeout padrão do bus)
+    - idempotent: ignora reentregas do mesmo `event_id` dentro da janela
+      de idempotência do bus (handlers com efeitos externos)
     """
 
+    max_concurrency: Optional[int] = None
+    timeout: Optional[float] = None
+    idempotent: bool = False
+
     @abstractmethod
     async def handle(self, event: DomainEvent) -> None:
         """
@@ -53,6 +74,17 @@ class EventBus(ABC):
         """
         pass
 
+    async def publish_nowait(self, event: DomainEvent) -> None:
+        """
+        Publica um evento sem aguardar os handlers.
+
+        Implementações sem workers em background fazem publicação síncrona.
+
+        Args:
+            event: Evento a ser publicado
+        """
+        await self.publish(event)
+
     @abstractmethod
     def subscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
         """
@@ -80,51 +112,354 @@ class InMemoryEventBus(EventBus):
     """
     Implementação em memória do Event Bus.
 
+    Controla a carga gerada pelos handlers:
+    - Semáforo global limita handlers executando ao mesmo tempo
+    - Semáforo por handler respeita `EventHandler.max_concurrency`
+    - Timeout por execução (`EventHandler.timeout` ou padrão do bus)
+    - Fila limitada de eventos: quando cheia, publishers aguardam (backpressure)
+
+    Handlers inscritos em uma classe base recebem também os eventos das
+    subclasses (resolução pela MRO). A tabela de despacho é calculada uma
+    vez por tipo de evento e invalidada apenas em subscribe/unsubscribe.
+
+    `publish_nowait` entrega o evento a workers em background e retorna
+    imediatamente; eventos com `synchronous = True` continuam sendo
+    processados antes do retorno. `shutdown` drena a fila antes de encerrar.
+
+    Com um outbox anexado (`attach_outbox`), eventos gravados na transação
+    do agregado são marcados como entregues após o despacho; falhas de
+    handlers agendam nova tentativa pelo OutboxRelay ou, esgotadas as
+    tentativas, vão para a dead-letter queue. Só eventos gravados no outbox
+    (hoje: save de verificações de CPF) têm essa garantia; os demais são
+    entregues uma vez, em memória.
+
     Para produção, considerar usar Redis, RabbitMQ ou AWS EventBridge.
     """
 
-    def __init__(self, max_concurrent_handlers: int = 10, handler_timeout: int = 30):
+    def __init__(
+        self,
+        max_concurrent_handlers: int = 10,
+        handler_timeout: int = 30,
+        max_queue_size: int = 1000,
+        background_workers: int = 2,
+        idempotency_store: Optional[IdempotencyStore] = None
+    ):
         self._handlers: Dict[Type[DomainEvent], List[EventHandler]] = defaultdict(list)
         self._global_handlers: List[EventHandler] = []
+        self._dispatch_table: Dict[Type[DomainEvent], Tuple[EventHandler, ...]] = {}
         self._processing_events = False
         self._max_concurrent_handlers = max_concurrent_handlers
         self._handler_timeout = handler_timeout
+        self._max_queue_size = max_queue_size
+
+        # Controle de concorrência e backpressure
+        self._dispatch_semaphore = asyncio.Semaphore(max_concurrent_handlers)
+        self._queue_slots = asyncio.Semaphore(max_queue_size)
+        self._handler_semaphores: Dict[EventHandler, asyncio.Semaphore] = {}
+
+        # Despacho em background (publish_nowait)
+        self._background_workers = background_workers
+        self._background_queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._workers_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._accepting_background = True
+
+        # Outbox transacional (opcional)
+        self._outbox = None
+
+        # Janela de idempotência para handlers com `idempotent = True`
+        self._idempotency = idempotency_store or IdempotencyStore()
+
+        # Métricas
+        self._queue_depth = 0
+        self._blocked_publishers = 0
+        self._in_flight = 0
+        self._stats = {
+            'events_published': 0,
+            'handlers_executed': 0,
+            'handler_errors': 0,
+            'handler_timeouts': 0,
+            'backpressure_waits': 0,
+            'queue_depth_peak': 0,
+            'in_flight_peak': 0,
+            'events_deferred': 0,
+            'deferred_failures': 0,
+            'outbox_settle_errors': 0,
+            'duplicates_skipped': 0
+        }
+
+    def attach_outbox(self, outbox) -> None:
+        """
+        Anexa o outbox transacional usado para confirmar entregas.
+
+        Args:
+            outbox: SQLiteEventOutbox
+        """
+        self._outbox = outbox
+        logger.debug("Event outbox attached to event bus")
 
     async def publish(self, event: DomainEvent) -> None:
         """
         Publica evento para todos os handlers inscritos.
 
+        Aguarda um slot na fila de eventos se ela estiver cheia.
+
         Args:
             event: Evento a ser publicado
         """
+        if _inside_dispatch.get():
+            await self._dispatch(event)
+            return
+
+        await self._acquire_queue_slot()
+        await self._dispatch_admitted(event)
+
+    async def publish_nowait(self, event: DomainEvent) -> None:
+        """
+        Entrega o evento aos workers em background e retorna imediatamente.
+
+        Eventos marcados com `synchronous = True` são processados antes do
+        retorno. Se a fila de background estiver cheia, aguarda espaço
+        (backpressure) em vez de descartar o evento.
+
+        Args:
+            event: Evento a ser publicado
+        """
+        if getattr(event, 'synchronous', False) or not self._accepting_background:
+            await self.publish(event)
+            return
+
+        queue = self._ensure_background_workers()
+        self._stats['events_deferred'] += 1
+
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._stats['backpressure_waits'] += 1
+            await queue.put(event)
+
+    def _ensure_background_workers(self) -> asyncio.Queue:
+        """
+        Inicia os workers de background no loop atual, se necessário.
+
+        Returns:
+            asyncio.Queue: Fila consumida pelos workers
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._background_queue is None or self._workers_loop is not loop:
+            self._background_queue = asyncio.Queue(maxsize=self._max_queue_size)
+            self._workers_loop = loop
+            # Contexto limpo: workers criados de dentro de um handler não
+            # herdam _inside_dispatch (senão ignorariam semáforos e fila)
+            self._worker_tasks = [
+                asyncio.create_task(
+                    self._background_worker(self._background_queue),
+                    name=f"event-bus-worker-{i}",
+                    context=contextvars.Context()
+                )
+                for i in range(max(1, self._background_workers))
+            ]
+            logger.debug(f"Started {len(self._worker_tasks)} event bus background workers")
+
+        return self._background_queue
+
+    async def _background_worker(self, queue: asyncio.Queue) -> None:
+        """
+        Consome eventos da fila de background.
+
+        Args:
+            queue: Fila de eventos adiados
+        """
+        while True:
+            event = await queue.get()
+            try:
+                await self.publish(event)
+            except Exception as e:
+                self._stats['deferred_failures'] += 1
+                logger.error(f"Error dispatching deferred event {type(event).__name__}: {e}")
+            finally:
+                queue.task_done()
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda a fila de background esvaziar.
+
+        Args:
+            timeout: Tempo máximo de espera em segundos (None = sem limite)
+
+        Returns:
+            bool: True se todos os eventos pendentes foram processados
+        """
+        if self._background_queue is None:
+            return True
+
+        try:
+            await asyncio.wait_for(self._background_queue.join(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Event bus drain timed out with {self._background_queue.qsize()} events pending"
+            )
+            return False
+
+    async def _acquire_queue_slot(self) -> None:
+        """Reserva um slot na fila de eventos, aguardando se estiver cheia."""
+        if self._queue_slots.locked():
+            self._stats['backpressure_waits'] += 1
+            self._blocked_publishers += 1
+            try:
+                await self._queue_slots.acquire()
+            finally:
+                self._blocked_publishers -= 1
+        else:
+            await self._queue_slots.acquire()
+
+        self._queue_depth += 1
+        if self._queue_depth > self._stats['queue_depth_peak']:
+            self._stats['queue_depth_peak'] = self._queue_depth
+
+    async def _dispatch_admitted(self, event: DomainEvent) -> None:
+        """
+        Despacha evento que já ocupa um slot da fila e libera o slot ao final.
+
+        Args:
+            event: Evento a ser despachado
+        """
+        try:
+            await self._dispatch(event)
+        finally:
+            self._queue_depth -= 1
+            self._queue_slots.release()
+
+    async def _dispatch(self, event: DomainEvent) -> None:
+        """
+        Entrega o evento aos handlers e confirma a entrega no outbox.
+
+        Args:
+            event: Evento a ser entregue
+        """
+        failures = await self._deliver_to_handlers(event)
+
+        outbox_id = getattr(event, '_outbox_id', None)
+        if self._outbox is not None and outbox_id is not None:
+            await self._settle_outbox(outbox_id, failures)
+
+    async def _settle_outbox(self, outbox_id: int, failures: List[str]) -> None:
+        """
+        Registra no outbox o resultado do despacho.
+
+        Args:
+            outbox_id: ID da linha do outbox
+            failures: Handlers que falharam
+        """
+        try:
+            if failures:
+                await self._outbox.record_failure(outbox_id, "; ".join(failures))
+            else:
+                await self._outbox.mark_dispatched([outbox_id])
+        except Exception as e:
+            # Linha continua pendente: o relay reenvia depois
+            self._stats['outbox_settle_errors'] += 1
+            logger.error(f"Error updating outbox entry {outbox_id}: {e}")
+
+    async def deliver(self, event: DomainEvent) -> List[str]:
+        """
+        Entrega evento aos handlers e informa quais falharam.
+
+        Usado pelo OutboxRelay, que registra o resultado no outbox em lote.
+
+        Args:
+            event: Evento a ser entregue
+
+        Returns:
+            List[str]: Descrição das falhas (vazia se todos os handlers tiveram sucesso)
+        """
+        await self._acquire_queue_slot()
+        try:
+            return await self._deliver_to_handlers(event)
+        finally:
+            self._queue_depth -= 1
+            self._queue_slots.release()
+
+    async def _deliver_to_handlers(self, event: DomainEvent) -> List[str]:
+        """
+        Executa os handlers inscritos para o evento.
+
+        Args:
+            event: Evento a ser entregue
+
+        Returns:
+            List[str]: Descrição das falhas dos handlers
+        """
         event_type = type(event)
+        self._stats['events_published'] += 1
 
         logger.debug(f"Publishing event: {event_type.__name__}")
 
-        # Coleta todos os handlers para este tipo de evento
-        handlers = self._handlers.get(event_type, []).copy()
-        handlers.extend(self._global_handlers)
+        handlers = self._dispatch_table.get(event_type)
+        if handlers is None:
+            handlers = self._resolve_handlers(event_type)
 
         if not handlers:
             logger.debug(f"No handlers registered for event: {event_type.__name__}")
-            return
+            return []
 
         # Processa handlers em paralelo
-        await self._process_handlers_concurrently(event, handlers)
+        return await self._process_handlers_concurrently(event, handlers)
 
-    async def _process_handlers_concurrently(self, event: DomainEvent, handlers: List[EventHandler]) -> None:
+    def _resolve_handlers(self, event_type: Type[DomainEvent]) -> Tuple[EventHandler, ...]:
+        """
+        Calcula e guarda os handlers de um tipo de evento.
+
+        Percorre a MRO do tipo (do mais específico ao mais genérico) e
+        adiciona os handlers globais ao final. Um handler inscrito em mais
+        de um nível da hierarquia executa uma única vez.
+
+        Args:
+            event_type: Tipo concreto do evento
+
+        Returns:
+            Tuple[EventHandler, ...]: Handlers na ordem de execução
+        """
+        resolved: List[EventHandler] = []
+        for cls in event_type.__mro__:
+            for handler in self._handlers.get(cls, ()):
+                if handler not in resolved:
+                    resolved.append(handler)
+        for handler in self._global_handlers:
+            if handler not in resolved:
+                resolved.append(handler)
+
+        handlers = tuple(resolved)
+        self._dispatch_table[event_type] = handlers
+        return handlers
+
+    def _invalidate_dispatch_table(self) -> None:
+        """Descarta a tabela de despacho após mudança nas inscrições."""
+        self._dispatch_table.clear()
+
+    async def _process_handlers_concurrently(
+        self,
+        event: DomainEvent,
+        handlers: Tuple[EventHandler, ...]
+    ) -> List[str]:
         """
         Processa handlers de forma concorrente.
 
         Args:
             event: Evento a ser processado
             handlers: Lista de handlers a executar
+
+        Returns:
+            List[str]: Descrição das falhas dos handlers
         """
         tasks = []
+        failures = []
 
         for handler in handlers:
             task = asyncio.create_task(
-                self._safe_handle_event(handler, event),
+                self._run_handler(handler, event),
                 name=f"{handler.__class__.__name__}-{type(event).__name__}"
             )
             tasks.append(task)
@@ -138,25 +473,120 @@ class InMemoryEventBus(EventBus):
                 if isinstance(result, Exception):
                     handler_name = handlers[i].__class__.__name__
                     logger.error(f"Error in event handler {handler_name}: {result}")
+                    failures.append(f"{handler_name}: {type(result).__name__}: {result}")
+
+        return failures
+
+    async def _run_handler(self, handler: EventHandler, event: DomainEvent) -> None:
+        """
+        Executa handler respeitando a janela de idempotência e os limites.
+
+        Handlers com `idempotent = True` não processam novamente um
+        `event_id` já tratado com sucesso dentro da janela.
+
+        Args:
+            handler: Handler a executar
+            event: Evento a processar
+        """
+        idempotency_key = None
+        if handler.idempotent and getattr(event, 'event_id', None):
+            idempotency_key = f"{handler.__class__.__name__}:{event.event_id}"
+            if not self._idempotency.claim(idempotency_key):
+                self._stats['duplicates_skipped'] += 1
+                logger.debug(f"Skipping duplicate {type(event).__name__} for {handler.__class__.__name__}")
+                return
+
+        try:
+            await self._run_handler_limited(handler, event)
+        except BaseException:
+            # Falhou: libera a chave para que a reentrega seja processada
+            if idempotency_key:
+                self._idempotency.release(idempotency_key)
+            raise
+
+    async def _run_handler_limited(self, handler: EventHandler, event: DomainEvent) -> None:
+        """
+        Executa handler dentro dos semáforos global e do próprio handler.
+
+        Publicações aninhadas (feitas de dentro de outro handler) não
+        disputam os semáforos, pois o handler externo já ocupa um slot.
+
+        Args:
+            handler: Handler a executar
+            event: Evento a processar
+        """
+        if _inside_dispatch.get():
+            await self._safe_handle_event(handler, event)
+            return
+
+        _inside_dispatch.set(True)
+
+        handler_semaphore = self._handler_semaphores.get(handler)
+        if handler_semaphore is not None:
+            async with handler_semaphore:
+                async with self._dispatch_semaphore:
+                    await self._safe_handle_event(handler, event)
+        else:
+            async with self._dispatch_semaphore:
+                await self._safe_handle_event(handler, event)
 
     async def _safe_handle_event(self, handler: EventHandler, event: DomainEvent) -> None:
         """
-        Executa handler de forma segura com tratamento de erro.
+        Executa handler de forma segura com timeout e tratamento de erro.
 
         Args:
             handler: Handler a executar
             event: Evento a processar
         """
+        timeout = handler.timeout if handler.timeout is not None else self._handler_timeout
+
+        self._in_flight += 1
+        if self._in_flight > self._stats['in_flight_peak']:
+            self._stats['in_flight_peak'] = self._in_flight
+
         try:
-            await handler.handle(event)
+            await asyncio.wait_for(handler.handle(event), timeout=timeout)
+            self._stats['handlers_executed'] += 1
             logger.debug(f"Event handled successfully by {handler.__class__.__name__}")
+        except asyncio.TimeoutError:
+            self._stats['handler_timeouts'] += 1
+            logger.error(
+                f"Timeout ({timeout}s) in event handler {handler.__class__.__name__} "
+                f"for event {type(event).__name__}"
+            )
+            raise
         except Exception as e:
+            self._stats['handler_errors'] += 1
             logger.error(
                 f"Error in event handler {handler.__class__.__name__} "
                 f"for event {type(event).__name__}: {e}"
             )
-            # Em produção, poderia enviar para dead letter queue
             raise
+        finally:
+            self._in_flight -= 1
+
+    def _register_handler_limits(self, handler: EventHandler) -> None:
+        """
+        Cria o semáforo próprio do handler, se ele declarar max_concurrency.
+
+        Args:
+            handler: Handler inscrito
+        """
+        if handler.max_concurrency and handler not in self._handler_semaphores:
+            self._handler_semaphores[handler] = asyncio.Semaphore(handler.max_concurrency)
+
+    def _release_handler_limits(self, handler: EventHandler) -> None:
+        """
+        Remove o semáforo do handler se ele não tiver mais inscrições.
+
+        Args:
+            handler: Handler removido
+        """
+        still_subscribed = handler in self._global_handlers or any(
+            handler in handlers for handlers in self._handlers.values()
+        )
+        if not still_subscribed:
+            self._handler_semaphores.pop(handler, None)
 
     def subscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
         """
@@ -168,6 +598,8 @@ class InMemoryEventBus(EventBus):
         """
         if handler not in self._handlers[event_type]:
             self._handlers[event_type].append(handler)
+            self._register_handler_limits(handler)
+            self._invalidate_dispatch_table()
             logger.debug(f"Subscribed {handler.__class__.__name__} to {event_type.__name__}")
 
     def unsubscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
@@ -180,6 +612,8 @@ class InMemoryEventBus(EventBus):
         """
         if handler in self._handlers[event_type]:
             self._handlers[event_type].remove(handler)
+            self._release_handler_limits(handler)
+            self._invalidate_dispatch_table()
             logger.debug(f"Unsubscribed {handler.__class__.__name__} from {event_type.__name__}")
 
     def subscribe_to_all(self, handler: EventHandler) -> None:
@@ -191,6 +625,8 @@ class InMemoryEventBus(EventBus):
         """
         if handler not in self._global_handlers:
             self._global_handlers.append(handler)
+            self._register_handler_limits(handler)
+            self._invalidate_dispatch_table()
             logger.debug(f"Subscribed {handler.__class__.__name__} to all events")
 
     def unsubscribe_from_all(self, handler: EventHandler) -> None:
@@ -202,6 +638,8 @@ class InMemoryEventBus(EventBus):
         """
         if handler in self._global_handlers:
             self._global_handlers.remove(handler)
+            self._release_handler_limits(handler)
+            self._invalidate_dispatch_table()
             logger.debug(f"Unsubscribed {handler.__class__.__name__} from all events")
 
     def get_handler_count(self, event_type: Optional[Type[DomainEvent]] = None) -> int:
@@ -234,6 +672,9 @@ class InMemoryEventBus(EventBus):
         """
         Publica múltiplos eventos em lote.
 
+        Cada evento só vira uma task depois de conseguir um slot na fila,
+        então lotes grandes não criam milhares de tasks de uma vez.
+
         Args:
             events: Lista de eventos a publicar
         """
@@ -242,22 +683,77 @@ class InMemoryEventBus(EventBus):
 
         logger.debug(f"Publishing {len(events)} events in batch")
 
-        # Publica todos os eventos de forma concorrente
-        tasks = [self.publish(event) for event in events]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        if _inside_dispatch.get():
+            await asyncio.gather(*(self._dispatch(event) for event in events), return_exceptions=True)
+            return
+
+        pending = set()
+        for event in events:
+            await self._acquire_queue_slot()
+            task = asyncio.create_task(self._dispatch_admitted(event))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna métricas do event bus.
+
+        Returns:
+            dict: Profundidade da fila, handlers em execução, timeouts e contadores
+        """
+        return {
+            'max_concurrent_handlers': self._max_concurrent_handlers,
+            'handler_timeout': self._handler_timeout,
+            'max_queue_size': self._max_queue_size,
+            'queue_depth': self._queue_depth,
+            'blocked_publishers': self._blocked_publishers,
+            'in_flight': self._in_flight,
+            'timeouts': self._stats['handler_timeouts'],
+            'background_queue_depth': self._background_queue.qsize() if self._background_queue else 0,
+            'background_workers': len([t for t in self._worker_tasks if not t.done()]),
+            'idempotency': self._idempotency.get_stats(),
+            'stats': self._stats.copy()
+        }
 
     def clear_all_handlers(self) -> None:
         """Remove todos os handlers registrados."""
         self._handlers.clear()
         self._global_handlers.clear()
+        self._invalidate_dispatch_table()
+        self._handler_semaphores.clear()
         logger.debug("Cleared all event handlers")
 
 
-    async def shutdown(self) -> None:
-        """Encerra o event bus e limpa recursos."""
+    async def shutdown(self, drain_timeout: Optional[float] = 30) -> None:
+        """
+        Encerra o event bus e limpa recursos.
+
+        Eventos ainda na fila de background são processados antes de
+        encerrar; novos `publish_nowait` passam a ser síncronos.
+
+        Args:
+            drain_timeout: Tempo máximo para drenar a fila de background
+        """
         logger.info("Event bus sendo encerrado...")
+        self._accepting_background = False
+
+        if self._background_queue is not None and self._workers_loop is asyncio.get_running_loop():
+            await self.drain(timeout=drain_timeout)
+
+        for task in self._worker_tasks:
+            task.cancel()
+        if self._worker_tasks:
+            await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._background_queue = None
+        self._workers_loop = None
+
         self._handlers.clear()
         self._global_handlers.clear()
+        self._invalidate_dispatch_table()
         self._processing_events = False
         logger.info("Event bus encerrado com sucesso")
 
@@ -326,4 +822,15 @@ async def publish_event(event: DomainEvent) -> None:
         event: Evento a publicar
     """
     event_bus = get_event_bus()
-    await event_bus.publish(event)
\ No newline at end of file
+    await event_bus.publish(event)
+
+
+async def publish_event_nowait(event: DomainEvent) -> None:
+    """
+    Função de conveniência para publicar eventos sem aguardar handlers.
+
+    Args:
+        event: Evento a publicar
+    """
+    event_bus = get_event_bus()
+    await event_bus.publish_nowait(event)
\ No newline at end of file
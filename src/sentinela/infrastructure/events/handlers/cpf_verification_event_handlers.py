@@ -117,6 +117,9 @@ class VerificationCompletedHandler(EventHandler):
     - Ativar funcionalidades premium
     """
 
+    # Mensagem de sucesso ao usuário não deve ser enviada em dobro
+    idempotent = True
+
     @property
     def event_type(self) -> Type[DomainEvent]:
         return VerificationCompleted
@@ -293,6 +296,12 @@ class VerificationExpiredHandler(EventHandler):
     - Limpeza de recursos
     """
 
+    # Expirações em massa não podem disparar remoções ilimitadas na API do Telegram
+    max_concurrency = 5
+
+    # Remoção do grupo não deve ser repetida em reentregas
+    idempotent = True
+
     @property
     def event_type(self) -> Type[DomainEvent]:
         return VerificationExpired
@@ -483,6 +492,9 @@ class CPFRemappedHandler(EventHandler):
     - Atualização de permissões
     """
 
+    # Remapeamento notifica os usuários envolvidos; reentregas não repetem
+    idempotent = True
+
     @property
     def event_type(self) -> Type[DomainEvent]:
         return CPFRemapped
@@ -571,4 +583,44 @@ class CPFRemappedHandler(EventHandler):
             # Em produção, atualizaria permissões reais
 
         except Exception as e:
-            logger.error(f"Erro ao atualizar permissões: {e}")
\ No newline at end of file
+            logger.error(f"Erro ao atualizar permissões: {e}")
+
+class AuthorizationSnapshotHandler(EventHandler):
+    """
+    Mantém o AuthorizationSnapshot atualizado pelos eventos de verificação.
+
+    Uma instância por tipo de evento (VerificationStarted,
+    VerificationCompleted, VerificationExpired, CPFRemapped).
+    """
+
+    def __init__(self, snapshot, event_type: Type[DomainEvent]):
+        """
+        Args:
+            snapshot: AuthorizationSnapshot a atualizar
+            event_type: Tipo de evento tratado por esta instância
+        """
+        self._snapshot = snapshot
+        self._event_type = event_type
+
+    @property
+    def event_type(self) -> Type[DomainEvent]:
+        return self._event_type
+
+    async def handle(self, event: DomainEvent) -> None:
+        """
+        Aplica o evento ao snapshot.
+
+        Args:
+            event: Evento de verificação
+        """
+        if isinstance(event, VerificationCompleted):
+            if event.success:
+                self._snapshot.mark_verified(event.user_id)
+            else:
+                self._snapshot.mark_interacted(event.user_id)
+        elif isinstance(event, CPFRemapped):
+            self._snapshot.revoke(event.old_user_id)
+            self._snapshot.mark_verified(event.new_user_id)
+        elif isinstance(event, (VerificationStarted, VerificationExpired)):
+            # Expiração afeta só a verificação pendente; uma concluída anterior continua válida
+            self._snapshot.mark_interacted(event.user_id)
@@ -10,6 +10,7 @@ import logging
 from typing import Type
 
 from ..event_bus import EventHandler, DomainEvent
+from ..audit_log import get_audit_log_writer
 from ....domain.events.ticket_events import (
     TicketCreated,
     TicketAssigned,
@@ -30,6 +31,12 @@ class TicketCreatedHandler(EventHandler):
     - Preparação para sincronização com HubSoft
     """
 
+    # O mesmo ticket não pode ser preparado para sync com o HubSoft duas vezes
+    idempotent = True
+
+    # Sync em lote não deve inundar administradores/HubSoft com chamadas paralelas
+    max_concurrency = 5
+
     @property
     def event_type(self) -> Type[DomainEvent]:
         return TicketCreated
@@ -352,7 +359,7 @@ class TicketAuditHandler(EventHandler):
             f"em {event.occurred_at.strftime('%Y-%m-%d %H:%M:%S')}"
         )
 
-        # Em produção, salvaria em sistema de auditoria
+        # Grava na trilha de auditoria (em lote, fora do caminho crítico)
         await self._save_audit_log(event)
 
     async def _save_audit_log(self, event: DomainEvent) -> None:
@@ -362,9 +369,10 @@ class TicketAuditHandler(EventHandler):
         Args:
             event: Evento a ser auditado
         """
-        try:
-            # Em produção, salvaria em banco de dados de auditoria
-            logger.debug(f"💾 AUDIT LOG: {event.__class__.__name__} salvo para auditoria")
+        writer = get_audit_log_writer()
+        if writer is None:
+            logger.debug(f"Audit log não configurado, {event.__class__.__name__} não registrado")
+            return
 
-        except Exception as e:
-            logger.error(f"Erro ao salvar audit log: {e}")
\ No newline at end of file
+        # Só enfileira: o writer grava em lote em background
+        writer.record("ticket", event)
\ No newline at end of file
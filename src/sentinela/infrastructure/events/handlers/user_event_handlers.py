@@ -10,6 +10,7 @@ import logging
 from typing import Type
 
 from ..event_bus import EventHandler, DomainEvent
+from ..audit_log import get_audit_log_writer
 from ....domain.events.user_events import (
     UserRegistered,
     UserBanned,
@@ -422,7 +423,7 @@ class UserActivityAuditHandler(EventHandler):
             f"em {event.occurred_at.strftime('%Y-%m-%d %H:%M:%S')}"
         )
 
-        # Em produção, salvaria para análise de comportamento
+        # Grava na trilha de auditoria (em lote, fora do caminho crítico)
         await self._save_activity_log(event)
 
     async def _save_activity_log(self, event: DomainEvent) -> None:
@@ -432,9 +433,10 @@ class UserActivityAuditHandler(EventHandler):
         Args:
             event: Evento a ser registrado
         """
-        try:
-            # Em produção, salvaria em sistema de analytics
-            logger.debug(f"📊 ACTIVITY LOG: {event.__class__.__name__} registrado")
+        writer = get_audit_log_writer()
+        if writer is None:
+            logger.debug(f"Audit log não configurado, {event.__class__.__name__} não registrado")
+            return
 
-        except Exception as e:
-            logger.error(f"Erro ao salvar activity log: {e}")
\ No newline at end of file
+        # Só enfileira: o writer grava em lote em background
+        writer.record("user_activity", event)
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+Janela de idempotência para handlers de eventos.
+
+Guarda por um tempo limitado quais pares (handler, event_id) já foram
+processados, permitindo ignorar reentregas do mesmo evento (retries do
+outbox, publicações duplicadas) antes de repetir efeitos externos.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Any
+
+logger = logging.getLogger(__name__)
+
+
+class IdempotencyStore:
+    """
+    Registro em memória de chaves processadas, com janela de tempo limitada.
+
+    Chaves expiram após `window_seconds`; acima de `max_entries` as mais
+    antigas são descartadas primeiro. Consultas e registros são O(1).
+    """
+
+    def __init__(self, window_seconds: float = 3600, max_entries: int = 50000):
+        """
+        Inicializa o store.
+
+        Args:
+            window_seconds: Tempo em que uma chave é lembrada
+            max_entries: Máximo de chaves mantidas em memória
+        """
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+        self._stats = {
+            'claimed': 0,
+            'duplicates_skipped': 0,
+            'released': 0,
+            'evicted': 0
+        }
+
+    def claim(self, key: str) -> bool:
+        """
+        Registra a chave se ela ainda não foi vista na janela.
+
+        Args:
+            key: Chave de idempotência
+
+        Returns:
+            bool: True se é a primeira vez (deve processar), False se é duplicata
+        """
+        now = time.monotonic()
+        self._expire(now)
+
+        if key in self._entries:
+            self._stats['duplicates_skipped'] += 1
+            return False
+
+        self._entries[key] = now
+        self._stats['claimed'] += 1
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats['evicted'] += 1
+
+        return True
+
+    def release(self, key: str) -> None:
+        """
+        Esquece a chave para permitir nova tentativa (ex.: handler falhou).
+
+        Args:
+            key: Chave de idempotência
+        """
+        if self._entries.pop(key, None) is not None:
+            self._stats['released'] += 1
+
+    def seen(self, key: str) -> bool:
+        """
+        Verifica se a chave está na janela.
+
+        Args:
+            key: Chave de idempotência
+
+        Returns:
+            bool: True se já foi processada
+        """
+        self._expire(time.monotonic())
+        return key in self._entries
+
+    def _expire(self, now: float) -> None:
+        """Remove chaves fora da janela (mais antigas ficam no início)."""
+        cutoff = now - self.window_seconds
+        while self._entries:
+            key, claimed_at = next(iter(self._entries.items()))
+            if claimed_at > cutoff:
+                break
+            self._entries.popitem(last=False)
+            self._stats['evicted'] += 1
+
+    def clear(self) -> None:
+        """Remove todas as chaves."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do store.
+
+        Returns:
+            dict: Tamanho da janela e contadores
+        """
+        return {
+            'entries': len(self._entries),
+            'window_seconds': self.window_seconds,
+            'max_entries': self.max_entries,
+            'stats': self._stats.copy()
+        }
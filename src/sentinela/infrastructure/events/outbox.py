@@ -0,0 +1,524 @@
+"""
+Transactional Outbox para eventos de domínio.
+
+Eventos são gravados na tabela `event_outbox` na mesma transação
+da escrita do agregado. Se o processo morrer antes da publicação,
+o OutboxRelay reenvia os eventos pendentes (entrega at-least-once).
+Eventos que falham repetidamente vão para `event_dead_letters`,
+de onde podem ser reprocessados.
+
+Cobertura: hoje só o save de verificações de CPF
+(SQLiteCPFVerificationRepository) grava seus eventos no outbox. Os demais
+publicadores chamam o event bus direto e não têm reentrega se o processo
+morrer entre a escrita e a publicação.
+
+As escritas de entrega (marcar entregue, registrar falha, dead-letter)
+rodam em thread (asyncio.to_thread), cada uma com conexão própria, para
+não bloquear o event loop esperando o lock do banco.
+"""
+
+import asyncio
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Dict, Any
+
+from ...domain.entities.base import DomainEvent
+from .serialization import serialize_event, deserialize_event, EventSerializationError
+
+logger = logging.getLogger(__name__)
+
+# Espera pelo lock do banco; roda fora do event loop, então não trava o bot
+BUSY_TIMEOUT_SECONDS = 30.0
+
+
+class SQLiteEventOutbox:
+    """
+    Outbox de eventos em SQLite com dead-letter queue.
+
+    Estados de uma linha do outbox:
+    - pendente: dispatched_at IS NULL
+    - entregue: dispatched_at preenchido
+    Após `max_attempts` falhas o evento é movido para a dead-letter queue.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        max_attempts: int = 5,
+        retry_base_seconds: int = 30
+    ):
+        """
+        Inicializa o outbox.
+
+        Args:
+            db_path: Caminho para o arquivo do banco SQLite
+            max_attempts: Falhas permitidas antes de ir para a dead-letter queue
+            retry_base_seconds: Base do backoff exponencial entre tentativas
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self._ensure_tables()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Conexão própria por operação (usada dentro de asyncio.to_thread)."""
+        return sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_SECONDS)
+
+    def _ensure_tables(self) -> None:
+        """Garante que as tabelas do outbox existem."""
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS event_outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    event_id TEXT,
+                    event_type TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at TEXT NOT NULL,
+                    dispatched_at TEXT,
+                    last_error TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_event_outbox_pending
+                ON event_outbox(dispatched_at, next_attempt_at)
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS event_dead_letters (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    outbox_id INTEGER,
+                    event_id TEXT,
+                    event_type TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    attempts INTEGER NOT NULL,
+                    last_error TEXT,
+                    created_at TEXT NOT NULL,
+                    failed_at TEXT NOT NULL,
+                    replayed_at TEXT
+                )
+            """)
+            conn.commit()
+
+    # ==================== ESCRITA (mesma transação do agregado) ====================
+
+    def append(self, conn: sqlite3.Connection, events: Iterable[DomainEvent]) -> int:
+        """
+        Grava eventos no outbox usando a conexão/transação do chamador.
+
+        Não faz commit: o commit do agregado confirma também os eventos.
+        Eventos já gravados (com `_outbox_id`) são ignorados.
+
+        Args:
+            conn: Conexão com a transação do agregado em andamento
+            events: Eventos a gravar
+
+        Returns:
+            int: Número de eventos gravados
+        """
+        now = datetime.now().isoformat()
+        appended = 0
+
+        for event in events:
+            if getattr(event, '_outbox_id', None) is not None:
+                continue
+
+            try:
+                payload = serialize_event(event)
+            except EventSerializationError as e:
+                logger.error(f"Evento {type(event).__name__} não pode ir para o outbox: {e}")
+                continue
+
+            cursor = conn.execute("""
+                INSERT INTO event_outbox (event_id, event_type, payload, created_at, next_attempt_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, (
+                getattr(event, 'event_id', None),
+                type(event).__name__,
+                payload,
+                now,
+                now
+            ))
+            object.__setattr__(event, '_outbox_id', cursor.lastrowid)
+            appended += 1
+
+        return appended
+
+    # ==================== ENTREGA ====================
+
+    async def fetch_pending(
+        self,
+        limit: int = 100,
+        min_age_seconds: float = 0
+    ) -> List[Tuple[int, DomainEvent]]:
+        """
+        Busca lote de eventos pendentes prontos para entrega.
+
+        Args:
+            limit: Tamanho máximo do lote
+            min_age_seconds: Só retorna eventos gravados há pelo menos este tempo
+                (dá tempo para a publicação em processo acontecer primeiro)
+
+        Returns:
+            List[Tuple[int, DomainEvent]]: Pares (id no outbox, evento)
+        """
+        rows = await asyncio.to_thread(self._fetch_pending_rows, limit, min_age_seconds)
+
+        batch = []
+        for outbox_id, payload in rows:
+            try:
+                event = deserialize_event(payload)
+            except Exception as e:
+                logger.error(f"Evento {outbox_id} do outbox ilegível: {e}")
+                await self.record_failure(outbox_id, f"deserialization: {e}", force_dead_letter=True)
+                continue
+            object.__setattr__(event, '_outbox_id', outbox_id)
+            batch.append((outbox_id, event))
+
+        return batch
+
+    def _fetch_pending_rows(self, limit: int, min_age_seconds: float) -> List[Tuple[int, str]]:
+        """Lê as linhas pendentes (roda em thread)."""
+        now = datetime.now()
+        created_before = (now - timedelta(seconds=min_age_seconds)).isoformat()
+
+        with self._connect() as conn:
+            return conn.execute("""
+                SELECT id, payload FROM event_outbox
+                WHERE dispatched_at IS NULL
+                  AND next_attempt_at <= ?
+                  AND created_at <= ?
+                ORDER BY id
+                LIMIT ?
+            """, (now.isoformat(), created_before, limit)).fetchall()
+
+    async def mark_dispatched(self, outbox_ids: List[int]) -> None:
+        """
+        Marca eventos como entregues.
+
+        Args:
+            outbox_ids: IDs das linhas do outbox
+        """
+        if not outbox_ids:
+            return
+
+        await asyncio.to_thread(self._mark_dispatched, list(outbox_ids))
+
+    def _mark_dispatched(self, outbox_ids: List[int]) -> None:
+        """Grava a entrega (roda em thread)."""
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE event_outbox SET dispatched_at = ?, last_error = NULL WHERE id = ?",
+                [(now, outbox_id) for outbox_id in outbox_ids]
+            )
+            conn.commit()
+
+    async def record_failure(
+        self,
+        outbox_id: int,
+        error: str,
+        force_dead_letter: bool = False
+    ) -> bool:
+        """
+        Registra falha de entrega e agenda nova tentativa com backoff.
+
+        Args:
+            outbox_id: ID da linha do outbox
+            error: Descrição do erro
+            force_dead_letter: Move direto para a dead-letter queue
+
+        Returns:
+            bool: True se o evento foi movido para a dead-letter queue
+        """
+        return await asyncio.to_thread(self._record_failure, outbox_id, error, force_dead_letter)
+
+    def _record_failure(self, outbox_id: int, error: str, force_dead_letter: bool) -> bool:
+        """Grava a falha ou move para a dead-letter queue (roda em thread)."""
+        now = datetime.now()
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT event_id, event_type, payload, attempts, created_at FROM event_outbox WHERE id = ?",
+                (outbox_id,)
+            ).fetchone()
+            if not row:
+                return False
+
+            event_id, event_type, payload, attempts, created_at = row
+            attempts += 1
+
+            if force_dead_letter or attempts >= self.max_attempts:
+                conn.execute("""
+                    INSERT INTO event_dead_letters (
+                        outbox_id, event_id, event_type, payload, attempts,
+                        last_error, created_at, failed_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, (outbox_id, event_id, event_type, payload, attempts, error, created_at, now.isoformat()))
+                conn.execute("DELETE FROM event_outbox WHERE id = ?", (outbox_id,))
+                conn.commit()
+                logger.error(f"Evento {event_type} ({outbox_id}) movido para dead-letter após {attempts} tentativas: {error}")
+                return True
+
+            delay = self.retry_base_seconds * (2 ** (attempts - 1))
+            conn.execute("""
+                UPDATE event_outbox SET
+                    attempts = ?,
+                    last_error = ?,
+                    next_attempt_at = ?
+                WHERE id = ?
+            """, (attempts, error, (now + timedelta(seconds=delay)).isoformat(), outbox_id))
+            conn.commit()
+            logger.warning(f"Evento {event_type} ({outbox_id}) falhou, nova tentativa em {delay}s: {error}")
+            return False
+
+    async def purge_dispatched(self, older_than_days: int = 7) -> int:
+        """
+        Remove eventos já entregues.
+
+        Args:
+            older_than_days: Idade mínima dos eventos removidos
+
+        Returns:
+            int: Número de linhas removidas
+        """
+        cutoff = (datetime.now() - timedelta(days=older_than_days)).isoformat()
+        return await asyncio.to_thread(self._execute_write, (
+            "DELETE FROM event_outbox WHERE dispatched_at IS NOT NULL AND dispatched_at < ?"
+        ), (cutoff,))
+
+    def _execute_write(self, query: str, params: Tuple) -> int:
+        """Executa uma escrita e retorna as linhas afetadas (roda em thread)."""
+        with self._connect() as conn:
+            cursor = conn.execute(query, params)
+            conn.commit()
+            return cursor.rowcount
+
+    # ==================== DEAD-LETTER QUEUE ====================
+
+    async def list_dead_letters(
+        self,
+        limit: int = 50,
+        include_replayed: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Lista eventos na dead-letter queue.
+
+        Args:
+            limit: Máximo de registros
+            include_replayed: Inclui eventos já reprocessados
+
+        Returns:
+            List[dict]: Registros da dead-letter queue
+        """
+        query = """
+            SELECT id, outbox_id, event_id, event_type, attempts, last_error,
+                   created_at, failed_at, replayed_at
+            FROM event_dead_letters
+        """
+        if not include_replayed:
+            query += " WHERE replayed_at IS NULL"
+        query += " ORDER BY id DESC LIMIT ?"
+
+        def read() -> List[Dict[str, Any]]:
+            with self._connect() as conn:
+                conn.row_factory = sqlite3.Row
+                return [dict(row) for row in conn.execute(query, (limit,)).fetchall()]
+
+        return await asyncio.to_thread(read)
+
+    async def replay_dead_letters(
+        self,
+        dead_letter_ids: Optional[List[int]] = None,
+        event_type: Optional[str] = None
+    ) -> int:
+        """
+        Devolve eventos da dead-letter queue para o outbox.
+
+        Args:
+            dead_letter_ids: IDs específicos (None = todos não reprocessados)
+            event_type: Filtra por nome do tipo de evento
+
+        Returns:
+            int: Número de eventos devolvidos ao outbox
+        """
+        query = "SELECT id, event_id, event_type, payload FROM event_dead_letters WHERE replayed_at IS NULL"
+        params: List[Any] = []
+        if dead_letter_ids:
+            query += f" AND id IN ({','.join('?' for _ in dead_letter_ids)})"
+            params.extend(dead_letter_ids)
+        if event_type:
+            query += " AND event_type = ?"
+            params.append(event_type)
+
+        def replay() -> List[Tuple]:
+            now = datetime.now().isoformat()
+            with self._connect() as conn:
+                rows = conn.execute(query, params).fetchall()
+                for dead_letter_id, event_id, row_event_type, payload in rows:
+                    conn.execute("""
+                        INSERT INTO event_outbox (event_id, event_type, payload, created_at, next_attempt_at)
+                        VALUES (?, ?, ?, ?, ?)
+                    """, (event_id, row_event_type, payload, now, now))
+                    conn.execute(
+                        "UPDATE event_dead_letters SET replayed_at = ? WHERE id = ?",
+                        (now, dead_letter_id)
+                    )
+                conn.commit()
+            return rows
+
+        rows = await asyncio.to_thread(replay)
+        if rows:
+            logger.info(f"{len(rows)} eventos devolvidos da dead-letter queue para o outbox")
+        return len(rows)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do outbox.
+
+        Returns:
+            dict: Contagem de pendentes, entregues e dead letters
+        """
+        return await asyncio.to_thread(self._read_stats)
+
+    def _read_stats(self) -> Dict[str, Any]:
+        """Conta as linhas do outbox (roda em thread)."""
+        with self._connect() as conn:
+            pending, retrying = conn.execute("""
+                SELECT COUNT(*), COALESCE(SUM(CASE WHEN attempts > 0 THEN 1 ELSE 0 END), 0)
+                FROM event_outbox WHERE dispatched_at IS NULL
+            """).fetchone()
+            dispatched = conn.execute(
+                "SELECT COUNT(*) FROM event_outbox WHERE dispatched_at IS NOT NULL"
+            ).fetchone()[0]
+            dead_letters = conn.execute(
+                "SELECT COUNT(*) FROM event_dead_letters WHERE replayed_at IS NULL"
+            ).fetchone()[0]
+
+        return {
+            'pending': pending,
+            'retrying': retrying,
+            'dispatched': dispatched,
+            'dead_letters': dead_letters
+        }
+
+
+class OutboxRelay:
+    """
+    Reenvia eventos pendentes do outbox para o event bus.
+
+    A publicação normal acontece logo após o commit; o relay só pega
+    eventos que ficaram pendentes por mais de `claim_after_seconds`
+    (processo morreu antes de publicar) ou que falharam e aguardam retry.
+    """
+
+    def __init__(
+        self,
+        outbox: SQLiteEventOutbox,
+        event_bus,
+        batch_size: int = 50,
+        poll_interval: float = 10.0,
+        claim_after_seconds: float = 30.0
+    ):
+        """
+        Inicializa o relay.
+
+        Args:
+            outbox: Outbox de eventos
+            event_bus: InMemoryEventBus usado para entregar os eventos
+            batch_size: Eventos lidos por consulta
+            poll_interval: Intervalo entre verificações (segundos)
+            claim_after_seconds: Idade mínima de um evento pendente para o relay assumir
+        """
+        self.outbox = outbox
+        self.event_bus = event_bus
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.claim_after_seconds = claim_after_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._stats = {
+            'relayed': 0,
+            'failed': 0,
+            'batches': 0
+        }
+
+    async def start(self) -> None:
+        """Inicia o relay em background."""
+        if not self._running:
+            self._running = True
+            self._task = asyncio.create_task(self._run(), name="outbox-relay")
+            logger.info("Outbox relay iniciado")
+
+    async def stop(self) -> None:
+        """Para o relay."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("Outbox relay parado")
+
+    async def _run(self) -> None:
+        """Loop principal do relay."""
+        while self._running:
+            try:
+                relayed = await self.relay_once()
+                # Lote cheio: provavelmente há mais eventos, continua sem esperar
+                if relayed >= self.batch_size:
+                    continue
+            except Exception as e:
+                logger.error(f"Erro no outbox relay: {e}")
+
+            await asyncio.sleep(self.poll_interval)
+
+    async def relay_once(self, min_age_seconds: Optional[float] = None) -> int:
+        """
+        Entrega um lote de eventos pendentes.
+
+        Args:
+            min_age_seconds: Sobrescreve `claim_after_seconds` (0 = entrega tudo que está pendente)
+
+        Returns:
+            int: Número de eventos processados no lote
+        """
+        age = self.claim_after_seconds if min_age_seconds is None else min_age_seconds
+        batch = await self.outbox.fetch_pending(limit=self.batch_size, min_age_seconds=age)
+        if not batch:
+            return 0
+
+        self._stats['batches'] += 1
+        delivered: List[int] = []
+
+        for outbox_id, event in batch:
+            failures = await self.event_bus.deliver(event)
+            if failures:
+                self._stats['failed'] += 1
+                await self.outbox.record_failure(outbox_id, "; ".join(failures))
+            else:
+                delivered.append(outbox_id)
+
+        await self.outbox.mark_dispatched(delivered)
+        self._stats['relayed'] += len(delivered)
+
+        logger.debug(f"Outbox relay: {len(delivered)}/{len(batch)} eventos entregues")
+        return len(batch)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do relay.
+
+        Returns:
+            dict: Contadores do relay
+        """
+        return {
+            'running': self._running,
+            'batch_size': self.batch_size,
+            'stats': self._stats.copy()
+        }
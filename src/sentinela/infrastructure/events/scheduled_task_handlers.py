@@ -77,6 +77,11 @@ class MemberCPFCheckTaskHandler:
 
                 logger.info(f"Encontrados {len(users_without_cpf)} usuários sem CPF no banco")
 
+                # DMs em massa: saem pela fila de envios com a menor prioridade
+                from ..config.dependency_injection import get_container
+                from ..external_services.message_scheduler import OutboundMessageScheduler, SendPriority
+                outbound = get_container().get(OutboundMessageScheduler)
+
                 # Para cada usuário sem CPF, envia solicitação
                 for user in users_without_cpf:
                     # Pula admins
@@ -89,10 +94,11 @@ class MemberCPFCheckTaskHandler:
                         # Envia mensagem privada solicitando CPF
                         message = await self.member_verification_use_case.get_cpf_verification_message()
 
-                        await self.bot_instance.application.bot.send_message(
+                        await outbound.send_message(
                             chat_id=user.user_id.value,
                             text=message,
-                            parse_mode='Markdown'
+                            parse_mode='Markdown',
+                            priority=SendPriority.BULK
                         )
 
                         logger.info(f"Mensagem de verificação enviada para {user.user_id.value}")
@@ -0,0 +1,181 @@
+"""
+Serialização de eventos de domínio.
+
+Converte eventos (e os value objects que eles carregam) para JSON
+e de volta, permitindo persistir eventos fora da memória do processo.
+"""
+
+import json
+import importlib
+import dataclasses
+from datetime import datetime, date
+from enum import Enum
+from typing import Any, Dict
+
+from ...domain.entities.base import DomainEvent
+
+# Só classes do próprio projeto podem ser reconstruídas a partir do JSON
+_ALLOWED_PACKAGE = "sentinela"
+
+# Pacote raiz como importado neste processo ("sentinela" ou "src.sentinela").
+# Os caminhos gravados são sempre relativos a "sentinela", para que bot e
+# scripts (que importam o projeto de formas diferentes) resolvam as mesmas classes.
+_PACKAGE_ROOT = __name__.rsplit(".infrastructure.", 1)[0]
+
+# Atributos de infraestrutura anexados ao evento em tempo de execução
+_TRANSIENT_ATTRIBUTES = {"_outbox_id"}
+
+
+class EventSerializationError(Exception):
+    """Erro ao serializar ou desserializar um evento."""
+    pass
+
+
+def _class_path(cls: type) -> str:
+    module = cls.__module__
+    prefix = _PACKAGE_ROOT + "."
+    if module.startswith(prefix):
+        module = _ALLOWED_PACKAGE + "." + module[len(prefix):]
+    return f"{module}:{cls.__qualname__}"
+
+
+def _load_class(path: str) -> type:
+    module_name, _, qualname = path.partition(":")
+    if not module_name.startswith(_ALLOWED_PACKAGE + "."):
+        raise EventSerializationError(f"Classe fora do projeto não permitida: {path}")
+    module_name = _PACKAGE_ROOT + module_name[len(_ALLOWED_PACKAGE):]
+
+    try:
+        obj: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+    except (ImportError, AttributeError) as e:
+        raise EventSerializationError(f"Classe não encontrada: {path}") from e
+
+    return obj
+
+
+def _encode(value: Any) -> Any:
+    """Converte um valor para estrutura compatível com JSON."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, datetime):
+        return {"__type__": "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {"__type__": "date", "value": value.isoformat()}
+    if isinstance(value, Enum):
+        return {"__type__": "enum", "class": _class_path(type(value)), "value": _encode(value.value)}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__type__": "object",
+            "class": _class_path(type(value)),
+            "fields": {k: _encode(v) for k, v in vars(value).items()}
+        }
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return {"__type__": "set", "value": [_encode(v) for v in value]}
+    if isinstance(value, dict):
+        return {str(k): _encode(v) for k, v in value.items()}
+
+    raise EventSerializationError(f"Tipo não serializável: {type(value).__name__}")
+
+
+def _decode(value: Any) -> Any:
+    """Reconstrói um valor codificado por `_encode`."""
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if not isinstance(value, dict):
+        return value
+
+    kind = value.get("__type__")
+    if kind is None:
+        return {k: _decode(v) for k, v in value.items()}
+    if kind == "datetime":
+        return datetime.fromisoformat(value["value"])
+    if kind == "date":
+        return date.fromisoformat(value["value"])
+    if kind == "enum":
+        return _load_class(value["class"])(_decode(value["value"]))
+    if kind == "set":
+        return set(_decode(v) for v in value["value"])
+    if kind == "object":
+        return _restore_instance(_load_class(value["class"]), value["fields"])
+
+    raise EventSerializationError(f"Tipo codificado desconhecido: {kind}")
+
+
+def _restore_instance(cls: type, fields: Dict[str, Any]) -> Any:
+    """
+    Recria instância sem chamar __init__/__post_init__.
+
+    Eventos e value objects são frozen: os atributos são restaurados
+    exatamente como foram gravados (inclusive event_id).
+    """
+    instance = object.__new__(cls)
+    for name, raw in fields.items():
+        object.__setattr__(instance, name, _decode(raw))
+    return instance
+
+
+def event_to_dict(event: DomainEvent) -> Dict[str, Any]:
+    """
+    Converte evento em dicionário serializável.
+
+    Args:
+        event: Evento de domínio
+
+    Returns:
+        dict: Estrutura com classe e atributos do evento
+    """
+    attributes = {
+        name: _encode(value)
+        for name, value in vars(event).items()
+        if name not in _TRANSIENT_ATTRIBUTES
+    }
+    return {"class": _class_path(type(event)), "attributes": attributes}
+
+
+def event_from_dict(data: Dict[str, Any]) -> DomainEvent:
+    """
+    Reconstrói evento a partir de `event_to_dict`.
+
+    Args:
+        data: Estrutura serializada
+
+    Returns:
+        DomainEvent: Evento reconstruído
+
+    Raises:
+        EventSerializationError: Se a classe não puder ser carregada
+    """
+    cls = _load_class(data["class"])
+    if not (isinstance(cls, type) and issubclass(cls, DomainEvent)):
+        raise EventSerializationError(f"{data['class']} não é um DomainEvent")
+    return _restore_instance(cls, data["attributes"])
+
+
+def serialize_event(event: DomainEvent) -> str:
+    """
+    Serializa evento para JSON.
+
+    Args:
+        event: Evento de domínio
+
+    Returns:
+        str: JSON compacto
+    """
+    return json.dumps(event_to_dict(event), ensure_ascii=False, separators=(",", ":"))
+
+
+def deserialize_event(payload: str) -> DomainEvent:
+    """
+    Desserializa evento gravado por `serialize_event`.
+
+    Args:
+        payload: JSON do evento
+
+    Returns:
+        DomainEvent: Evento reconstruído
+    """
+    return event_from_dict(json.loads(payload))
@@ -0,0 +1,408 @@
+"""
+Transporte de eventos entre processos.
+
+Scripts de cron (checkup diário, expiração de regras) rodam em processos
+separados do bot. Eles publicam eventos de domínio e invalidações de
+cache numa fila SQLite compartilhada; o bot consome a fila e republica
+os eventos no seu event bus local.
+
+A fila é durável: mensagens enviadas com o bot parado são entregues
+quando ele volta. Cada canal (`channel`) tem seu consumidor, então o
+bot também pode delegar trabalho em lote para um processo worker.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+
+from ...domain.entities.base import DomainEvent
+from .event_bus import EventBus, EventHandler
+from .serialization import serialize_event, deserialize_event
+
+logger = logging.getLogger(__name__)
+
+# Canal consumido pelo bot
+BOT_CHANNEL = "bot"
+
+KIND_EVENT = "event"
+KIND_INVALIDATE = "invalidate"
+
+InvalidationCallback = Callable[[Optional[str]], Awaitable[None]]
+
+
+class SQLiteEventTransport:
+    """
+    Fila de mensagens entre processos em SQLite.
+
+    Cada operação abre a própria conexão, então um banco temporariamente
+    bloqueado ou indisponível não deixa conexões quebradas para trás:
+    a próxima operação simplesmente reconecta.
+    """
+
+    def __init__(self, db_path: str, timeout: float = 10.0):
+        """
+        Inicializa o transporte.
+
+        Args:
+            db_path: Caminho do banco SQLite compartilhado
+            timeout: Tempo de espera por lock do SQLite (segundos)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        self._ensure_table_exists()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=self.timeout)
+
+    def _ensure_table_exists(self) -> None:
+        """Cria a tabela da fila se não existir."""
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS event_transport (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    channel TEXT NOT NULL,
+                    origin TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    consumed_at TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_event_transport_pending
+                ON event_transport(channel, consumed_at, id)
+            """)
+            conn.commit()
+
+    def send(self, channel: str, origin: str, messages: List[Tuple[str, str]]) -> int:
+        """
+        Envia lote de mensagens numa única transação.
+
+        Args:
+            channel: Canal de destino
+            origin: Processo de origem (para diagnóstico)
+            messages: Pares (kind, payload)
+
+        Returns:
+            int: Número de mensagens enviadas
+        """
+        if not messages:
+            return 0
+
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.executemany("""
+                INSERT INTO event_transport (channel, origin, kind, payload, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, [(channel, origin, kind, payload, now) for kind, payload in messages])
+            conn.commit()
+
+        return len(messages)
+
+    def receive(self, channel: str, limit: int = 100) -> List[Tuple[int, str, str, str]]:
+        """
+        Lê o próximo lote pendente do canal.
+
+        Args:
+            channel: Canal a consumir
+            limit: Tamanho máximo do lote
+
+        Returns:
+            List[Tuple[int, str, str, str]]: (id, origin, kind, payload)
+        """
+        with self._connect() as conn:
+            return conn.execute("""
+                SELECT id, origin, kind, payload FROM event_transport
+                WHERE channel = ? AND consumed_at IS NULL
+                ORDER BY id
+                LIMIT ?
+            """, (channel, limit)).fetchall()
+
+    def acknowledge(self, message_ids: List[int]) -> None:
+        """
+        Marca mensagens como consumidas.
+
+        Args:
+            message_ids: IDs das mensagens
+        """
+        if not message_ids:
+            return
+
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE event_transport SET consumed_at = ? WHERE id = ?",
+                [(now, message_id) for message_id in message_ids]
+            )
+            conn.commit()
+
+    def purge_consumed(self, older_than_days: int = 7) -> int:
+        """
+        Remove mensagens já consumidas.
+
+        Args:
+            older_than_days: Idade mínima das mensagens removidas
+
+        Returns:
+            int: Número de mensagens removidas
+        """
+        cutoff = (datetime.now() - timedelta(days=older_than_days)).isoformat()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM event_transport WHERE consumed_at IS NOT NULL AND consumed_at < ?",
+                (cutoff,)
+            )
+            conn.commit()
+            return cursor.rowcount
+
+
+class RemoteEventBus(EventBus):
+    """
+    Adapter de EventBus para processos externos ao bot.
+
+    `publish` acumula eventos em memória e envia em lote ao atingir
+    `batch_size`; `flush`/`close` enviam o restante. Não há handlers
+    locais: os eventos são processados pelo bot.
+    """
+
+    def __init__(
+        self,
+        transport: SQLiteEventTransport,
+        origin: str,
+        channel: str = BOT_CHANNEL,
+        batch_size: int = 50
+    ):
+        """
+        Inicializa o adapter.
+
+        Args:
+            transport: Fila compartilhada
+            origin: Nome do processo que publica (ex.: 'daily_cpf_checkup')
+            channel: Canal de destino
+            batch_size: Mensagens acumuladas antes de enviar
+        """
+        self.transport = transport
+        self.origin = origin
+        self.channel = channel
+        self.batch_size = batch_size
+        self._pending: List[Tuple[str, str]] = []
+        self._stats = {
+            'events_sent': 0,
+            'invalidations_sent': 0,
+            'batches_sent': 0,
+            'send_errors': 0
+        }
+
+    async def publish(self, event: DomainEvent) -> None:
+        """
+        Enfileira evento para o bot.
+
+        Args:
+            event: Evento de domínio
+        """
+        self._pending.append((KIND_EVENT, serialize_event(event)))
+        self._stats['events_sent'] += 1
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+
+    async def invalidate_cache(self, cache: str, key: Optional[Any] = None) -> None:
+        """
+        Pede ao bot para descartar dados em cache.
+
+        Args:
+            cache: Nome do cache registrado no consumidor do bot
+            key: Chave específica (None = cache inteiro)
+        """
+        payload = json.dumps({"cache": cache, "key": None if key is None else str(key)}, separators=(",", ":"))
+        self._pending.append((KIND_INVALIDATE, payload))
+        self._stats['invalidations_sent'] += 1
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Envia mensagens acumuladas."""
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        try:
+            self.transport.send(self.channel, self.origin, batch)
+            self._stats['batches_sent'] += 1
+        except sqlite3.Error as e:
+            # Mantém as mensagens para a próxima tentativa
+            self._pending = batch + self._pending
+            self._stats['send_errors'] += 1
+            logger.error(f"Erro ao enviar {len(batch)} mensagens para '{self.channel}': {e}")
+            raise
+
+    async def close(self) -> None:
+        """Envia mensagens pendentes antes de encerrar."""
+        await self.flush()
+
+    def subscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
+        raise NotImplementedError("RemoteEventBus não executa handlers; eles rodam no processo do bot")
+
+    def unsubscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
+        raise NotImplementedError("RemoteEventBus não executa handlers; eles rodam no processo do bot")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do adapter.
+
+        Returns:
+            dict: Mensagens pendentes e contadores
+        """
+        return {
+            'channel': self.channel,
+            'pending': len(self._pending),
+            'stats': self._stats.copy()
+        }
+
+
+class EventTransportConsumer:
+    """
+    Consome um canal do transporte e entrega ao event bus local.
+
+    Erros de acesso ao banco aumentam o intervalo de polling
+    (backoff) até a fila voltar a responder.
+    """
+
+    def __init__(
+        self,
+        transport: SQLiteEventTransport,
+        event_bus: EventBus,
+        channel: str = BOT_CHANNEL,
+        batch_size: int = 100,
+        poll_interval: float = 2.0,
+        max_backoff: float = 60.0
+    ):
+        """
+        Inicializa o consumidor.
+
+        Args:
+            transport: Fila compartilhada
+            event_bus: Event bus local
+            channel: Canal consumido
+            batch_size: Mensagens lidas por consulta
+            poll_interval: Intervalo entre consultas com fila vazia
+            max_backoff: Intervalo máximo após erros consecutivos
+        """
+        self.transport = transport
+        self.event_bus = event_bus
+        self.channel = channel
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self._invalidation_callbacks: Dict[str, List[InvalidationCallback]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._stats = {
+            'events_received': 0,
+            'invalidations_received': 0,
+            'invalid_messages': 0,
+            'transport_errors': 0
+        }
+
+    def register_invalidation(self, cache: str, callback: InvalidationCallback) -> None:
+        """
+        Registra callback chamado quando outro processo invalida um cache.
+
+        Args:
+            cache: Nome do cache
+            callback: Coroutine recebendo a chave (ou None para tudo)
+        """
+        self._invalidation_callbacks.setdefault(cache, []).append(callback)
+
+    async def start(self) -> None:
+        """Inicia o consumo em background."""
+        if not self._running:
+            self._running = True
+            self._task = asyncio.create_task(self._run(), name=f"event-transport-{self.channel}")
+            logger.info(f"Consumidor do transporte de eventos iniciado (canal '{self.channel}')")
+
+    async def stop(self) -> None:
+        """Para o consumo."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """Loop de consumo com backoff em erros do transporte."""
+        delay = self.poll_interval
+        while self._running:
+            try:
+                consumed = await self.consume_once()
+                delay = self.poll_interval
+                if consumed >= self.batch_size:
+                    continue
+            except sqlite3.Error as e:
+                self._stats['transport_errors'] += 1
+                delay = min(delay * 2, self.max_backoff)
+                logger.warning(f"Transporte de eventos indisponível, nova tentativa em {delay:.0f}s: {e}")
+            except Exception as e:
+                logger.error(f"Erro no consumidor do transporte de eventos: {e}")
+
+            await asyncio.sleep(delay)
+
+    async def consume_once(self) -> int:
+        """
+        Processa um lote de mensagens do canal.
+
+        Returns:
+            int: Número de mensagens processadas
+        """
+        messages = self.transport.receive(self.channel, limit=self.batch_size)
+        if not messages:
+            return 0
+
+        for message_id, origin, kind, payload in messages:
+            try:
+                if kind == KIND_EVENT:
+                    event = deserialize_event(payload)
+                    self._stats['events_received'] += 1
+                    logger.debug(f"Evento {type(event).__name__} recebido de '{origin}'")
+                    await self.event_bus.publish(event)
+                elif kind == KIND_INVALIDATE:
+                    self._stats['invalidations_received'] += 1
+                    await self._invalidate(json.loads(payload))
+                else:
+                    raise ValueError(f"Tipo de mensagem desconhecido: {kind}")
+            except Exception as e:
+                # Mensagem inválida não pode travar a fila
+                self._stats['invalid_messages'] += 1
+                logger.error(f"Mensagem {message_id} de '{origin}' descartada: {e}")
+
+        self.transport.acknowledge([message[0] for message in messages])
+        return len(messages)
+
+    async def _invalidate(self, data: Dict[str, Any]) -> None:
+        """Executa callbacks de invalidação do cache indicado."""
+        callbacks = self._invalidation_callbacks.get(data.get("cache"), [])
+        if not callbacks:
+            logger.debug(f"Nenhum cache registrado como '{data.get('cache')}'")
+        for callback in callbacks:
+            await callback(data.get("key"))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do consumidor.
+
+        Returns:
+            dict: Caches registrados e contadores
+        """
+        return {
+            'channel': self.channel,
+            'running': self._running,
+            'caches': list(self._invalidation_callbacks.keys()),
+            'stats': self._stats.copy()
+        }
@@ -0,0 +1,420 @@
+"""
+Envio em segundo plano dos anexos de chamados para o HubSoft.
+
+O fluxo de /suporte só guarda o `file_id` das fotos. Depois que o
+atendimento é criado, cada foto é baixada do Telegram e repassada ao
+HubSoft bloco a bloco (download em streaming alimentando um upload
+multipart em partes), sem manter o arquivo inteiro em memória e sem
+fazer o usuário esperar pela confirmação do chamado.
+
+- Até `max_concurrent_uploads` transferências simultâneas no bot todo
+- Falhas (download ou upload) são repetidas com backoff
+- O mesmo arquivo não é enviado duas vezes ao mesmo atendimento
+- O usuário acompanha o progresso numa mensagem editada a cada anexo
+  concluído, e o canal técnico recebe o resumo final
+
+Os envios ficam só em memória: anexos em andamento num restart não são
+retomados (o resumo no canal técnico não chega, sinalizando a falta).
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+import aiohttp
+
+from .message_scheduler import OutboundMessageScheduler, SendPriority
+
+logger = logging.getLogger(__name__)
+
+
+class AttachmentDownloadError(Exception):
+    """
+    Falha ao baixar um anexo do Telegram.
+
+    A URL de download contém o token do bot (/file/bot<TOKEN>/...); a
+    mensagem leva só o status HTTP e o file_id, nunca a URL.
+    """
+
+    def __init__(self, file_id: str, status: Optional[int] = None, reason: str = ""):
+        self.file_id = file_id
+        self.status = status
+        detail = f"HTTP {status}" if status is not None else reason
+        super().__init__(f"Download do anexo {file_id} falhou: {detail}")
+
+
+@dataclass
+class _Attachment:
+    """Anexo de um chamado e o estado do envio."""
+    file_id: str
+    key: str  # file_unique_id (mesmo arquivo, file_ids diferentes) ou file_id
+    filename: str
+    file_size: Optional[int] = None
+    status: str = "pending"  # pending, uploading, uploaded, failed
+    bytes_sent: int = 0
+    attempts: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class _UploadJob:
+    """Anexos de um atendimento."""
+    atendimento_id: str
+    protocol: str
+    user_id: int
+    attachments: List[_Attachment] = field(default_factory=list)
+    progress_message_id: Optional[int] = None
+
+
+class AttachmentUploadPipeline:
+    """Transfere anexos do Telegram para atendimentos do HubSoft em background."""
+
+    # Chaves (atendimento, arquivo) lembradas para deduplicação
+    MAX_SEEN = 5000
+
+    def __init__(
+        self,
+        tech_channel_id: Optional[int] = None,
+        atendimento_client: Any = None,
+        max_concurrent_uploads: int = 3,
+        max_attempts: int = 3,
+        retry_base_delay: float = 2.0,
+        chunk_size: int = 64 * 1024
+    ):
+        """
+        Inicializa o pipeline.
+
+        Args:
+            tech_channel_id: Canal técnico que recebe o resumo (opcional)
+            atendimento_client: HubSoftAtendimentoClient (padrão: instância global)
+            max_concurrent_uploads: Transferências simultâneas no bot todo
+            max_attempts: Tentativas por anexo
+            retry_base_delay: Espera antes da 2ª tentativa (dobra a cada nova)
+            chunk_size: Tamanho dos blocos lidos do Telegram
+        """
+        self.tech_channel_id = tech_channel_id
+        self.max_concurrent_uploads = max_concurrent_uploads
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.chunk_size = chunk_size
+
+        self._bot: Any = None
+        self._client = atendimento_client
+        self._outbound: Optional[OutboundMessageScheduler] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        self._seen: "OrderedDict[tuple, str]" = OrderedDict()
+        self._tasks: Set[asyncio.Task] = set()
+        self._in_flight = 0
+
+        self._stats = {
+            'jobs': 0,
+            'enqueued': 0,
+            'deduplicated': 0,
+            'uploaded': 0,
+            'failed': 0,
+            'retried': 0,
+            'bytes_uploaded': 0
+        }
+
+    def bind(self, bot: Any) -> None:
+        """
+        Define o bot usado para baixar os arquivos.
+
+        Args:
+            bot: Instância de telegram.Bot
+        """
+        self._bot = bot
+
+    def _ensure_initialized(self) -> None:
+        if self._client is None:
+            from ...integrations.hubsoft.atendimento import hubsoft_atendimento_client
+            self._client = hubsoft_atendimento_client
+        if self._outbound is None:
+            from ..config.dependency_injection import get_container
+            self._outbound = get_container().get(OutboundMessageScheduler)
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrent_uploads)
+
+    # ==================== ENFILEIRAMENTO ====================
+
+    def enqueue(
+        self,
+        atendimento_id: Any,
+        protocol: str,
+        user_id: int,
+        attachments: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Agenda o envio dos anexos de um atendimento e retorna sem esperar.
+
+        Arquivos repetidos (na lista ou já enviados/em envio para o mesmo
+        atendimento) são ignorados.
+
+        Args:
+            atendimento_id: ID do atendimento no HubSoft
+            protocol: Protocolo exibido ao usuário
+            user_id: Usuário que abriu o chamado (recebe o progresso)
+            attachments: Anexos do fluxo de suporte (`file_id`, `file_unique_id`, `file_size`)
+
+        Returns:
+            int: Quantidade de anexos agendados
+        """
+        self._ensure_initialized()
+        atendimento_id = str(atendimento_id)
+        job = _UploadJob(atendimento_id=atendimento_id, protocol=protocol, user_id=user_id)
+
+        for info in attachments:
+            key = info.get('file_unique_id') or info['file_id']
+            if (atendimento_id, key) in self._seen:
+                self._stats['deduplicated'] += 1
+                continue
+            self._remember(atendimento_id, key, "pending")
+            job.attachments.append(_Attachment(
+                file_id=info['file_id'],
+                key=key,
+                filename=f"anexo_{protocol}_{len(job.attachments) + 1}.jpg",
+                file_size=info.get('file_size')
+            ))
+
+        if not job.attachments:
+            return 0
+
+        self._stats['jobs'] += 1
+        self._stats['enqueued'] += len(job.attachments)
+        task = asyncio.create_task(self._run(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+        logger.info(f"{len(job.attachments)} anexo(s) agendado(s) para o atendimento {atendimento_id}")
+        return len(job.attachments)
+
+    def _remember(self, atendimento_id: str, key: str, status: str) -> None:
+        self._seen[(atendimento_id, key)] = status
+        self._seen.move_to_end((atendimento_id, key))
+        while len(self._seen) > self.MAX_SEEN:
+            self._seen.popitem(last=False)
+
+    # ==================== ENVIO ====================
+
+    async def _run(self, job: _UploadJob) -> None:
+        """Envia os anexos do atendimento e reporta o resultado."""
+        try:
+            await self._start_progress(job)
+            await asyncio.gather(*(self._upload(job, attachment) for attachment in job.attachments))
+            await self._report_summary(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Erro no envio de anexos do atendimento {job.atendimento_id}: {e}", exc_info=True)
+
+    async def _upload(self, job: _UploadJob, attachment: _Attachment) -> None:
+        """Transfere um anexo, repetindo em caso de falha."""
+        while attachment.attempts < self.max_attempts:
+            attachment.attempts += 1
+            attachment.bytes_sent = 0
+            try:
+                async with self._slots:
+                    attachment.status = "uploading"
+                    self._in_flight += 1
+                    try:
+                        success = await self._client.add_attachment_to_atendimento(
+                            job.atendimento_id,
+                            self._download(attachment),
+                            attachment.filename,
+                            content_type="image/jpeg"
+                        )
+                    finally:
+                        self._in_flight -= 1
+
+                if not success:
+                    # O cliente já registrou o motivo no log
+                    raise RuntimeError("HubSoft não confirmou o anexo")
+
+                attachment.status = "uploaded"
+                self._stats['uploaded'] += 1
+                self._stats['bytes_uploaded'] += attachment.bytes_sent
+                self._remember(job.atendimento_id, attachment.key, "uploaded")
+                break
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                attachment.error = str(e)
+                if attachment.attempts >= self.max_attempts:
+                    attachment.status = "failed"
+                    self._stats['failed'] += 1
+                    # Um novo enqueue do mesmo arquivo pode tentar de novo
+                    self._seen.pop((job.atendimento_id, attachment.key), None)
+                    logger.error(
+                        f"Anexo {attachment.filename} não enviado ao atendimento {job.atendimento_id} "
+                        f"após {attachment.attempts} tentativa(s): {e}"
+                    )
+                    break
+
+                delay = self.retry_base_delay * (2 ** (attachment.attempts - 1))
+                self._stats['retried'] += 1
+                logger.warning(
+                    f"Falha ao enviar {attachment.filename} (tentativa {attachment.attempts}), "
+                    f"repetindo em {delay:g}s: {e}"
+                )
+                await asyncio.sleep(delay)
+
+        await self._update_progress(job)
+
+    async def _download(self, attachment: _Attachment) -> AsyncIterator[bytes]:
+        """Lê o arquivo do Telegram em blocos."""
+        if self._bot is None:
+            raise RuntimeError("AttachmentUploadPipeline sem bot configurado")
+
+        telegram_file = await self._bot.get_file(attachment.file_id)
+        file_path = telegram_file.file_path or ""
+
+        if file_path.startswith(("http://", "https://")):
+            session = await self._get_session()
+            try:
+                async with session.get(file_path) as response:
+                    if response.status >= 400:
+                        raise AttachmentDownloadError(attachment.file_id, status=response.status)
+                    async for chunk in response.content.iter_chunked(self.chunk_size):
+                        attachment.bytes_sent += len(chunk)
+                        yield chunk
+            except aiohttp.ClientError as e:
+                # O texto dos erros do aiohttp inclui a URL (com o token)
+                status = getattr(e, 'status', None)
+                raise AttachmentDownloadError(
+                    attachment.file_id, status=status, reason=type(e).__name__
+                ) from None
+        else:
+            # Bot API local devolve caminho no disco
+            data = await telegram_file.download_as_bytearray()
+            attachment.bytes_sent += len(data)
+            yield bytes(data)
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
+            )
+        return self._session
+
+    # ==================== PROGRESSO ====================
+
+    def _progress_text(self, job: _UploadJob) -> str:
+        lines = []
+        for index, attachment in enumerate(job.attachments, 1):
+            if attachment.status == "uploaded":
+                lines.append(f"✅ Anexo {index} enviado ({attachment.bytes_sent // 1024} KB)")
+            elif attachment.status == "failed":
+                lines.append(f"❌ Anexo {index} não pôde ser enviado")
+            else:
+                lines.append(f"⏳ Anexo {index} enviando...")
+
+        done = sum(1 for a in job.attachments if a.status in ("uploaded", "failed"))
+        header = (
+            f"📎 **Anexos do chamado** `{job.protocol}`\n\n"
+            if done < len(job.attachments) else
+            f"📎 **Anexos do chamado** `{job.protocol}` **concluídos**\n\n"
+        )
+        footer = ""
+        if any(a.status == "failed" for a in job.attachments) and done == len(job.attachments):
+            footer = "\n\nSe precisar, envie as fotos que faltaram quando o técnico responder."
+        return header + "\n".join(lines) + footer
+
+    async def _start_progress(self, job: _UploadJob) -> None:
+        try:
+            message = await self._outbound.send_message(
+                chat_id=job.user_id,
+                text=self._progress_text(job),
+                parse_mode='Markdown',
+                priority=SendPriority.NOTIFICATION
+            )
+            job.progress_message_id = message.message_id
+        except Exception as e:
+            logger.warning(f"Não foi possível enviar progresso dos anexos ao usuário {job.user_id}: {e}")
+
+    async def _update_progress(self, job: _UploadJob) -> None:
+        if job.progress_message_id is None:
+            return
+        try:
+            # Sem aguardar: a edição não segura a vaga de upload
+            self._outbound.submit(
+                'edit_message_text',
+                job.user_id,
+                SendPriority.NOTIFICATION,
+                message_id=job.progress_message_id,
+                text=self._progress_text(job),
+                parse_mode='Markdown'
+            )
+        except Exception as e:
+            logger.warning(f"Não foi possível atualizar progresso dos anexos do usuário {job.user_id}: {e}")
+
+    async def _report_summary(self, job: _UploadJob) -> None:
+        uploaded = [a for a in job.attachments if a.status == "uploaded"]
+        failed = [a for a in job.attachments if a.status == "failed"]
+        logger.info(
+            f"Anexos do atendimento {job.atendimento_id}: {len(uploaded)} enviado(s), {len(failed)} falha(s)"
+        )
+
+        if not self.tech_channel_id:
+            return
+
+        icon = "📎" if not failed else "⚠️"
+        text = (
+            f"{icon} **Anexos do chamado** `{job.protocol}`\n\n"
+            f"✅ Enviados ao HubSoft: {len(uploaded)}/{len(job.attachments)} "
+            f"({sum(a.bytes_sent for a in uploaded) // 1024} KB)"
+        )
+        if failed:
+            text += "\n❌ Falharam: " + ", ".join(
+                f"{a.filename} ({a.attempts}x)" for a in failed
+            )
+        try:
+            await self._outbound.send_message(
+                chat_id=self.tech_channel_id,
+                text=text,
+                parse_mode='Markdown',
+                priority=SendPriority.NOTIFICATION
+            )
+        except Exception as e:
+            logger.error(f"Erro ao notificar canal técnico sobre anexos: {e}")
+
+    # ==================== CICLO DE VIDA ====================
+
+    async def shutdown(self, timeout: float = 30) -> None:
+        """
+        Aguarda os envios em andamento e fecha a sessão HTTP.
+
+        Args:
+            timeout: Tempo máximo de espera pelos envios
+        """
+        if self._tasks:
+            done, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+            if pending:
+                logger.warning(f"Envio de anexos encerrado com {len(pending)} atendimento(s) incompleto(s)")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    # ==================== MÉTRICAS ====================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna métricas do pipeline de anexos.
+
+        Returns:
+            dict: Atendimentos em andamento, transferências ativas e contadores
+        """
+        return {
+            'active_jobs': len(self._tasks),
+            'in_flight': self._in_flight,
+            'max_concurrent_uploads': self.max_concurrent_uploads,
+            'stats': self._stats.copy()
+        }
@@ -1,14 +1,14 @@
 """
-Implementação do cliente de grupos usando serviços existentes.
+Implementação do cliente de grupos usando o índice de membros.
 """
 
 import logging
-from typing import TYPE_CHECKING
+from typing import Any
 
-from .group_client import GroupClient
+from telegram.error import BadRequest, TelegramError
 
-if TYPE_CHECKING:
-    pass
+from .group_client import GroupClient
+from ..repositories.membership_index import SOURCE_LOOKUP, MembershipIndex, is_member_status
 
 logger = logging.getLogger(__name__)
 
@@ -17,9 +17,33 @@ class GroupClientImpl(GroupClient):
     """
     Implementação concreta do cliente de grupos.
 
-    Utiliza os serviços existentes como base.
+    Consultas respondidas pelo MembershipIndex (mantido pelos updates
+    chat_member); só usuários que o índice nunca viu são consultados no
+    Telegram, e o resultado passa a fazer parte do índice.
     """
 
+    def __init__(self, index: MembershipIndex, group_id: int, bot: Any = None):
+        """
+        Inicializa o cliente.
+
+        Args:
+            index: Índice de membros do grupo
+            group_id: ID do grupo
+            bot: Instância de telegram.Bot (pode ser definida depois com `bind`)
+        """
+        self.index = index
+        self.group_id = group_id
+        self._bot = bot
+
+    def bind(self, bot: Any) -> None:
+        """
+        Define o bot usado nas consultas e remoções.
+
+        Args:
+            bot: Instância de telegram.Bot
+        """
+        self._bot = bot
+
     async def is_user_in_group(self, user_id: int) -> bool:
         """
         Verifica se usuário está no grupo.
@@ -30,23 +54,39 @@ class GroupClientImpl(GroupClient):
         Returns:
             True se usuário está no grupo, False caso contrário
         """
-        try:
-            # Importa aqui para evitar circular imports durante inicialização
-            from ...services.group_service import is_user_in_group
-
-            logger.info(f"Verificando se usuário {user_id} está no grupo...")
-            result = await is_user_in_group(user_id)
+        known = self.index.is_member(user_id)
+        if known is not None:
+            return known
 
-            logger.info(f"Usuário {user_id} {'está' if result else 'não está'} no grupo")
-            return result
+        if self._bot is None:
+            logger.warning(f"Usuário {user_id} fora do índice de membros e sem bot para consultar")
+            return False
 
-        except Exception as e:
+        try:
+            member = await self._bot.get_chat_member(chat_id=self.group_id, user_id=user_id)
+        except BadRequest:
+            # Usuário que nunca esteve no grupo
+            self.index.apply(user_id, 'left', source=SOURCE_LOOKUP)
+            return False
+        except TelegramError as e:
             logger.error(f"Erro ao verificar se usuário {user_id} está no grupo: {e}")
             return False
 
+        user = member.user
+        is_member = getattr(member, 'is_member', None)
+        self.index.apply(
+            user_id,
+            member.status,
+            username=user.username or user.first_name,
+            is_member=is_member,
+            source=SOURCE_LOOKUP
+        )
+        # Antes do load() o índice não responde: vale o status consultado
+        return is_member_status(member.status, is_member)
+
     async def remove_user_from_group(self, user_id: int) -> bool:
         """
-        Remove usuário do grupo.
+        Remove usuário do grupo (ban seguido de unban: pode voltar por convite).
 
         Args:
             user_id: ID do usuário no Telegram
@@ -54,11 +94,18 @@ class GroupClientImpl(GroupClient):
         Returns:
             True se removeu com sucesso, False caso contrário
         """
-        try:
-            # Implementação futura - usar serviços existentes ou implementar
-            logger.info(f"Remoção de usuário {user_id} do grupo não implementada ainda")
+        if self._bot is None:
+            logger.error(f"Remoção do usuário {user_id} sem bot configurado")
             return False
 
-        except Exception as e:
+        try:
+            await self._bot.ban_chat_member(chat_id=self.group_id, user_id=user_id)
+            await self._bot.unban_chat_member(chat_id=self.group_id, user_id=user_id, only_if_banned=True)
+        except TelegramError as e:
             logger.error(f"Erro ao remover usuário {user_id} do grupo: {e}")
-            return False
\ No newline at end of file
+            return False
+
+        # O update chat_member confirma depois; o índice já responde certo até lá
+        self.index.apply(user_id, 'left', source=SOURCE_LOOKUP)
+        logger.info(f"Usuário {user_id} removido do grupo")
+        return True
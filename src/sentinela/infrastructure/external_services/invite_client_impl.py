@@ -1,11 +1,12 @@
 """
-Implementação do cliente de convites usando serviços existentes.
+Implementação do cliente de convites usando o pool de links.
 """
 
 import logging
 from typing import Optional
 
 from .invite_client import InviteClient
+from .invite_link_pool import InviteLinkPool
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +15,19 @@ class InviteClientImpl(InviteClient):
     """
     Implementação concreta do cliente de convites.
 
-    Utiliza os serviços existentes como base.
+    Os links saem do InviteLinkPool (pré-criados, uso único); a API do
+    Telegram só é chamada na hora se o pool estiver vazio.
     """
 
+    def __init__(self, pool: InviteLinkPool):
+        """
+        Inicializa o cliente.
+
+        Args:
+            pool: Pool de links de convite
+        """
+        self.pool = pool
+
     async def create_temporary_invite_link(self, user_id: int, username: str) -> Optional[str]:
         """
         Cria link temporário de convite para o grupo.
@@ -28,20 +39,10 @@ class InviteClientImpl(InviteClient):
         Returns:
             Link de convite ou None se erro
         """
-        try:
-            # Importa aqui para evitar circular imports durante inicialização
-            from ...services.invite_service import create_temporary_invite_link
-
-            logger.info(f"Criando link temporário para usuário {username} (ID: {user_id})")
-            invite_link = await create_temporary_invite_link(user_id, username)
-
-            if invite_link:
-                logger.info(f"Link criado com sucesso para usuário {username} (ID: {user_id})")
-                return invite_link
-            else:
-                logger.warning(f"Falha ao criar link para usuário {username} (ID: {user_id})")
-                return None
-
-        except Exception as e:
-            logger.error(f"Erro ao criar link de convite para usuário {user_id}: {e}")
-            return None
\ No newline at end of file
+        invite_link = await self.pool.lease(user_id)
+
+        if invite_link:
+            logger.info(f"Link de convite entregue para usuário {username} (ID: {user_id})")
+        else:
+            logger.warning(f"Falha ao obter link para usuário {username} (ID: {user_id})")
+        return invite_link
@@ -0,0 +1,308 @@
+"""
+Pool de links de convite pré-criados.
+
+Depois de uma verificação de CPF bem-sucedida, o link de acesso ao grupo
+sai do pool na hora, sem chamar a API do Telegram enquanto o usuário
+espera. Um loop em background mantém `target_size` links disponíveis
+(uso único, expiração curta), criando-os em ritmo controlado, e revoga
+os que ficaram perto de expirar sem serem entregues. A entrada pelo link
+(update chat_member) marca o link como usado.
+
+O estado dos links fica em SQLite; toda chamada ao store roda em thread
+(asyncio.to_thread), fora do event loop.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from telegram.error import RetryAfter, TelegramError
+
+from .message_scheduler import TokenBucket
+from ..repositories.sqlite_invite_link_pool import LINK_EXPIRED, LINK_REVOKED, SQLiteInviteLinkStore
+
+logger = logging.getLogger(__name__)
+
+# Nome dos links no Telegram (aparece na lista de convites do grupo)
+POOL_LINK_NAME = "Acesso verificado"
+
+
+class InviteLinkPool:
+    """
+    Entrega links de convite de uso único a partir de um estoque.
+
+    Um link só é entregue se ainda tiver `min_remaining_seconds` de
+    validade; abaixo disso ele é revogado e substituído. Com o pool vazio,
+    o link é criado na hora (mesmo comportamento de antes, sem esperar o
+    ritmo da reposição) e a reposição é antecipada.
+    """
+
+    def __init__(
+        self,
+        store: SQLiteInviteLinkStore,
+        group_id: int,
+        bot: Any = None,
+        target_size: int = 20,
+        link_ttl_seconds: int = 3600,
+        min_remaining_seconds: int = 900,
+        refill_interval_seconds: float = 30.0,
+        calls_per_second: float = 1.0
+    ):
+        """
+        Inicializa o pool.
+
+        Args:
+            store: Estado dos links
+            group_id: ID do grupo
+            bot: Instância de telegram.Bot (pode ser definida depois com `bind`)
+            target_size: Links disponíveis mantidos
+            link_ttl_seconds: Validade de cada link criado
+            min_remaining_seconds: Validade mínima de um link entregue
+            refill_interval_seconds: Intervalo entre ciclos de reposição
+            calls_per_second: Chamadas à API por segundo na reposição
+        """
+        self.store = store
+        self.group_id = group_id
+        self._bot = bot
+        self.target_size = target_size
+        self.link_ttl = timedelta(seconds=link_ttl_seconds)
+        self.min_remaining = timedelta(seconds=min_remaining_seconds)
+        self.refill_interval_seconds = refill_interval_seconds
+        self._bucket = TokenBucket(calls_per_second, 1.0)
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._stats = {
+            'leased': 0,
+            'lease_misses': 0,
+            'created': 0,
+            'refills': 0,
+            'revoked': 0,
+            'expired': 0,
+            'used': 0,
+            'used_by_other': 0,
+            'errors': 0,
+            'retry_after': 0
+        }
+
+    def bind(self, bot: Any) -> None:
+        """
+        Define o bot usado para criar e revogar links.
+
+        Args:
+            bot: Instância de telegram.Bot
+        """
+        self._bot = bot
+
+    async def start(self) -> None:
+        """Inicia a reposição em background."""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run(), name="invite-link-pool")
+        logger.info(f"Pool de convites iniciado ({self.target_size} links)")
+
+    async def stop(self) -> None:
+        """Para a reposição (os links disponíveis continuam no banco)."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("Pool de convites parado")
+
+    async def lease(self, user_id: int) -> Optional[str]:
+        """
+        Entrega um link de convite ao usuário.
+
+        Args:
+            user_id: ID do usuário no Telegram
+
+        Returns:
+            Optional[str]: URL do link, ou None se nem a criação na hora funcionou
+        """
+        now = datetime.now()
+        invite_link = await asyncio.to_thread(self.store.lease, user_id, now, now + self.min_remaining)
+        self._wake.set()
+        if invite_link:
+            self._stats['leased'] += 1
+            return invite_link
+
+        # Pool vazio (início ou pico de verificações): cria na hora, fora do
+        # ritmo da reposição (o usuário está esperando)
+        self._stats['lease_misses'] += 1
+        logger.warning(f"Pool de convites vazio; criando link na hora para {user_id}")
+        try:
+            link = await self._create(throttled=False)
+        except TelegramError as e:
+            self._stats['errors'] += 1
+            logger.error(f"Erro ao criar link de convite para {user_id}: {e}")
+            return None
+        await asyncio.to_thread(self.store.add_leased, link, user_id, now, now + self.link_ttl)
+        return link
+
+    async def record_join(self, invite_link: str, user_id: int) -> None:
+        """
+        Registra a entrada de um usuário por um link (update chat_member).
+
+        Args:
+            invite_link: URL do link usado
+            user_id: Quem entrou
+        """
+        row = await asyncio.to_thread(self.store.mark_used, invite_link, user_id, datetime.now())
+        if row is None:
+            return
+        self._stats['used'] += 1
+        if row['leased_to'] != user_id:
+            self._stats['used_by_other'] += 1
+            logger.warning(
+                f"Link de convite entregue a {row['leased_to']} foi usado por {user_id}"
+            )
+
+    async def refill_once(self) -> Dict[str, int]:
+        """
+        Tira de circulação os links velhos e repõe o estoque.
+
+        Returns:
+            dict: revoked, expired e created neste ciclo
+        """
+        result = await self.revoke_stale()
+        result['created'] = 0
+
+        now = datetime.now()
+        available = await asyncio.to_thread(self.store.count_available, now + self.min_remaining)
+        for _ in range(max(0, self.target_size - available)):
+            created_at = datetime.now()
+            link = await self._create()
+            await asyncio.to_thread(self.store.add, link, created_at, created_at + self.link_ttl)
+            result['created'] += 1
+
+        if result['created']:
+            self._stats['refills'] += 1
+        return result
+
+    async def revoke_stale(self) -> Dict[str, int]:
+        """
+        Revoga os disponíveis quase expirados e encerra os entregues já expirados.
+
+        Returns:
+            dict: revoked e expired
+        """
+        if self._bot is None:
+            raise RuntimeError("InviteLinkPool sem bot configurado")
+
+        now = datetime.now()
+        result = {'revoked': 0, 'expired': 0}
+        stale = await asyncio.to_thread(self.store.find_stale, now, now + self.min_remaining)
+
+        result['expired'] = await asyncio.to_thread(self.store.close, stale['expired'], LINK_EXPIRED, now)
+        for invite_link in stale['revoke']:
+            try:
+                await self._throttle()
+                await self._bot.revoke_chat_invite_link(chat_id=self.group_id, invite_link=invite_link)
+            except RetryAfter:
+                raise
+            except TelegramError as e:
+                # Link já inválido no Telegram: sai do pool do mesmo jeito
+                logger.debug(f"Revogação de {invite_link} falhou: {e}")
+            result['revoked'] += await asyncio.to_thread(
+                self.store.close, [invite_link], LINK_REVOKED, datetime.now()
+            )
+            self._stats['revoked'] += 1
+
+        self._stats['expired'] += result['expired']
+        return result
+
+    async def purge_closed(self, before: datetime) -> int:
+        """
+        Apaga do histórico os links encerrados antes de `before`.
+
+        Args:
+            before: Encerrados antes disto são apagados
+
+        Returns:
+            int: Linhas apagadas
+        """
+        return await asyncio.to_thread(self.store.purge_closed, before)
+
+    # Private helper methods
+
+    async def _run(self) -> None:
+        """Repõe o pool periodicamente ou quando um link é entregue."""
+        while self._running:
+            try:
+                await self.refill_once()
+            except asyncio.CancelledError:
+                raise
+            except RetryAfter as e:
+                self._stats['retry_after'] += 1
+                retry_after = e.retry_after
+                seconds = retry_after.total_seconds() if hasattr(retry_after, 'total_seconds') else float(retry_after)
+                logger.warning(f"RetryAfter do Telegram: reposição de convites pausada por {seconds:g}s")
+                await asyncio.sleep(seconds)
+                continue
+            except Exception as e:
+                self._stats['errors'] += 1
+                logger.error(f"Erro na reposição do pool de convites: {e}")
+
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.refill_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _create(self, throttled: bool = True) -> str:
+        """
+        Cria um link de uso único no Telegram.
+
+        Args:
+            throttled: Respeita `calls_per_second` (reposição em background)
+        """
+        if self._bot is None:
+            raise RuntimeError("InviteLinkPool sem bot configurado (bind não foi chamado no startup)")
+        if throttled:
+            await self._throttle()
+        expire_date = datetime.now() + self.link_ttl
+        invite = await self._bot.create_chat_invite_link(
+            chat_id=self.group_id,
+            expire_date=int(expire_date.timestamp()),
+            member_limit=1,
+            name=POOL_LINK_NAME
+        )
+        self._stats['created'] += 1
+        return invite.invite_link
+
+    async def _throttle(self) -> None:
+        """Aguarda token do bucket antes de uma chamada à API."""
+        wait = self._bucket.time_until_token(time.monotonic())
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._bucket.time_until_token(time.monotonic())
+        self._bucket.consume(time.monotonic())
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do pool.
+
+        Returns:
+            dict: Ocupação, links por status e contadores
+        """
+        now = datetime.now()
+        available = await asyncio.to_thread(self.store.count_available, now + self.min_remaining)
+        links_by_status = await asyncio.to_thread(self.store.counts)
+        return {
+            **self._stats,
+            'running': self._running,
+            'available': available,
+            'target_size': self.target_size,
+            'occupancy': round(available / self.target_size, 3) if self.target_size else 0.0,
+            'hit_rate': round(
+                self._stats['leased'] / (self._stats['leased'] + self._stats['lease_misses']), 4
+            ) if self._stats['leased'] else 0.0,
+            'links_by_status': links_by_status
+        }
@@ -0,0 +1,360 @@
+"""
+Agrupamento de boas-vindas em rajadas de entrada no grupo.
+
+Com poucas entradas, cada novo membro recebe as próprias mensagens de
+boas-vindas e de regras. Quando o ritmo de entradas passa do limite
+(promoções, raids), as entradas de uma janela curta são reunidas numa
+única mensagem de boas-vindas e numa única mensagem de regras com um
+botão de aceite por usuário, e os membros são gravados de uma vez.
+"""
+
+import asyncio
+import html
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+from ...domain.value_objects.welcome_message import WelcomeMessage
+from .message_scheduler import OutboundMessageScheduler, SendPriority
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Joiner:
+    """Novo membro aguardando boas-vindas."""
+    user_id: int
+    username: str
+    first_name: str
+    last_name: Optional[str] = None
+
+    @property
+    def mention(self) -> str:
+        return f'<a href="tg://user?id={self.user_id}">{html.escape(self.first_name)}</a>'
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'user_id': self.user_id,
+            'username': self.username,
+            'first_name': self.first_name,
+            'last_name': self.last_name
+        }
+
+
+class JoinBurstAggregator:
+    """Boas-vindas individuais ou agrupadas conforme o ritmo de entradas."""
+
+    def __init__(
+        self,
+        welcome_topic_id: Optional[int] = None,
+        rules_topic_id: Optional[int] = None,
+        batch_threshold: int = 5,
+        window_seconds: float = 3.0,
+        max_batch_size: int = 20,
+        rules_acceptance_hours: float = 24.0
+    ):
+        """
+        Inicializa o agregador.
+
+        Args:
+            welcome_topic_id: Tópico das boas-vindas
+            rules_topic_id: Tópico das regras (sem ele não há mensagem de regras)
+            batch_threshold: Entradas na janela a partir das quais agrupa
+            window_seconds: Janela de agrupamento (e de medição do ritmo)
+            max_batch_size: Máximo de usuários (botões) por mensagem
+            rules_acceptance_hours: Prazo para aceitar as regras; depois dele
+                quem não aceitou é removido e o lote é esquecido
+        """
+        self.welcome_topic_id = welcome_topic_id
+        self.rules_topic_id = rules_topic_id
+        self.batch_threshold = batch_threshold
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self.rules_ttl_seconds = rules_acceptance_hours * 3600
+
+        self._welcome_use_case = None  # WelcomeManagementUseCase
+        self._outbound: Optional[OutboundMessageScheduler] = None
+
+        # Horários das entradas recentes por chat (ritmo medido por grupo)
+        self._recent_joins: Dict[int, Deque[float]] = {}
+        self._pending: Dict[int, Dict[int, _Joiner]] = {}
+        self._flush_tasks: Dict[int, asyncio.Task] = {}
+        # (chat_id, message_id) da mensagem de regras -> usuários com botão
+        self._open_rules: Dict[tuple, Dict[int, _Joiner]] = {}
+        self._rules_sent_at: Dict[tuple, float] = {}
+        self._rules_locks: Dict[tuple, asyncio.Lock] = {}
+
+        self._stats = {
+            'joins': 0,
+            'single_welcomes': 0,
+            'batches': 0,
+            'batched_members': 0,
+            'largest_batch': 0,
+            'messages_saved': 0,
+            'batch_errors': 0,
+            'rules_batches_expired': 0
+        }
+
+    def _ensure_initialized(self) -> None:
+        if self._outbound is None:
+            from ..config.dependency_injection import get_container
+            container = get_container()
+            self._welcome_use_case = container.get("welcome_management_use_case")
+            self._outbound = container.get(OutboundMessageScheduler)
+
+    def _in_burst(self, chat_id: int, now: float) -> bool:
+        """Registra a entrada e diz se o ritmo atual do chat pede agrupamento."""
+        recent = self._recent_joins.setdefault(chat_id, deque())
+        recent.append(now)
+        while recent and now - recent[0] > self.window_seconds:
+            recent.popleft()
+        # Descarta janelas de outros chats já sem entradas recentes
+        idle = [
+            other for other, joins in self._recent_joins.items()
+            if other != chat_id and now - joins[-1] > self.window_seconds
+        ]
+        for other in idle:
+            del self._recent_joins[other]
+        return len(recent) >= self.batch_threshold
+
+    async def add(
+        self,
+        chat_id: int,
+        user_id: int,
+        username: str,
+        first_name: str,
+        last_name: Optional[str] = None
+    ) -> None:
+        """
+        Recebe a entrada de um novo membro.
+
+        Fora de rajadas, envia as boas-vindas na hora; em rajadas, agenda
+        o envio agrupado ao fim da janela (ou antes, se o lote encher).
+
+        Args:
+            chat_id: Grupo onde o membro entrou
+            user_id: ID do usuário
+            username: Nome de usuário
+            first_name: Primeiro nome
+            last_name: Sobrenome (opcional)
+        """
+        self._ensure_initialized()
+        self._stats['joins'] += 1
+        joiner = _Joiner(user_id, username, first_name, last_name)
+
+        burst = self._in_burst(chat_id, time.monotonic())
+        pending = self._pending.get(chat_id)
+        if not burst and not pending:
+            await self._welcome_single(chat_id, joiner)
+            return
+
+        if pending is None:
+            pending = self._pending[chat_id] = {}
+        pending[user_id] = joiner
+
+        if len(pending) >= self.max_batch_size:
+            self._cancel_timer(chat_id)
+            await self._flush(chat_id)
+        elif chat_id not in self._flush_tasks:
+            self._flush_tasks[chat_id] = asyncio.create_task(self._flush_later(chat_id))
+
+    def _cancel_timer(self, chat_id: int) -> None:
+        task = self._flush_tasks.pop(chat_id, None)
+        if task and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _flush_later(self, chat_id: int) -> None:
+        await asyncio.sleep(self.window_seconds)
+        self._flush_tasks.pop(chat_id, None)
+        await self._flush(chat_id)
+
+    async def _flush(self, chat_id: int) -> None:
+        """Envia as boas-vindas agrupadas e grava os membros pendentes do chat."""
+        joiners = list(self._pending.pop(chat_id, {}).values())
+        if not joiners:
+            return
+        if len(joiners) == 1:
+            await self._welcome_single(chat_id, joiners[0])
+            return
+
+        try:
+            await self._welcome_batch(chat_id, joiners)
+        except Exception as e:
+            self._stats['batch_errors'] += 1
+            logger.error(f"Erro ao enviar boas-vindas agrupadas para {len(joiners)} membros: {e}")
+
+        result = await self._welcome_use_case.handle_new_members([j.as_dict() for j in joiners])
+        if not result.success:
+            self._stats['batch_errors'] += 1
+            logger.error(f"Erro ao registrar lote de novos membros: {result.message}")
+
+    async def _welcome_single(self, chat_id: int, joiner: _Joiner) -> None:
+        """Boas-vindas e lembrete de regras de um único membro."""
+        self._stats['single_welcomes'] += 1
+        user_mention = joiner.mention
+        display_name = html.escape(joiner.first_name)
+
+        welcome_msg = WelcomeMessage.create_initial_welcome(welcome_topic_id=self.welcome_topic_id)
+        await self._outbound.send_message(
+            chat_id=chat_id,
+            text=welcome_msg.format_for_user(user_mention=user_mention, username=display_name),
+            parse_mode='HTML',
+            message_thread_id=self.welcome_topic_id,
+            priority=SendPriority.NOTIFICATION
+        )
+
+        if self.rules_topic_id:
+            rules_msg = WelcomeMessage.create_rules_reminder(
+                rules_topic_id=self.rules_topic_id,
+                user_id=joiner.user_id
+            )
+            reply_markup = InlineKeyboardMarkup([[
+                InlineKeyboardButton(rules_msg.button_text, callback_data=rules_msg.button_callback)
+            ]])
+            await self._outbound.send_message(
+                chat_id=chat_id,
+                text=rules_msg.format_for_user(user_mention=user_mention, username=display_name),
+                parse_mode='HTML',
+                message_thread_id=self.rules_topic_id,
+                reply_markup=reply_markup,
+                priority=SendPriority.NOTIFICATION
+            )
+
+        result = await self._welcome_use_case.handle_new_member(
+            user_id=joiner.user_id,
+            username=joiner.username,
+            first_name=joiner.first_name,
+            last_name=joiner.last_name
+        )
+        if result.success:
+            logger.info(f"Novo membro {joiner.first_name} processado com sucesso")
+        else:
+            logger.error(f"Erro ao processar novo membro: {result.message}")
+
+    async def _welcome_batch(self, chat_id: int, joiners: List[_Joiner]) -> None:
+        """Uma mensagem de boas-vindas e uma de regras para todo o lote."""
+        mentions = ", ".join(joiner.mention for joiner in joiners)
+
+        welcome_msg = WelcomeMessage.create_batch_welcome(welcome_topic_id=self.welcome_topic_id)
+        await self._outbound.send_message(
+            chat_id=chat_id,
+            text=welcome_msg.format_for_user(user_mention=mentions, username="", user_mentions=mentions, count=len(joiners)),
+            parse_mode='HTML',
+            message_thread_id=self.welcome_topic_id,
+            priority=SendPriority.NOTIFICATION
+        )
+
+        messages_per_member = 1
+        if self.rules_topic_id:
+            messages_per_member = 2
+            remaining = {joiner.user_id: joiner for joiner in joiners}
+            rules_msg = WelcomeMessage.create_batch_rules_reminder(rules_topic_id=self.rules_topic_id)
+            sent = await self._outbound.send_message(
+                chat_id=chat_id,
+                text=rules_msg.format_for_user(user_mention=mentions, username="", user_mentions=mentions),
+                parse_mode='HTML',
+                message_thread_id=self.rules_topic_id,
+                reply_markup=self._rules_keyboard(rules_msg, remaining),
+                priority=SendPriority.NOTIFICATION
+            )
+            if sent is not None:
+                self._prune_open_rules(time.monotonic())
+                self._open_rules[(chat_id, sent.message_id)] = remaining
+                self._rules_sent_at[(chat_id, sent.message_id)] = time.monotonic()
+
+        self._stats['batches'] += 1
+        self._stats['batched_members'] += len(joiners)
+        self._stats['largest_batch'] = max(self._stats['largest_batch'], len(joiners))
+        self._stats['messages_saved'] += (len(joiners) - 1) * messages_per_member
+        logger.info(f"Boas-vindas agrupadas enviadas para {len(joiners)} novos membros")
+
+    @staticmethod
+    def _rules_keyboard(rules_msg: WelcomeMessage, joiners: Dict[int, _Joiner]) -> Optional[InlineKeyboardMarkup]:
+        if not joiners:
+            return None
+        return InlineKeyboardMarkup([
+            [InlineKeyboardButton(
+                rules_msg.button_text.replace("{username}", joiner.first_name[:24]),
+                callback_data=rules_msg.button_callback.replace("{user_id}", str(user_id))
+            )]
+            for user_id, joiner in joiners.items()
+        ])
+
+    async def accept_in_batch(self, chat_id: int, message_id: int, user_id: int) -> bool:
+        """
+        Remove o botão do usuário de uma mensagem de regras agrupada.
+
+        Args:
+            chat_id: Chat da mensagem de regras
+            message_id: ID da mensagem de regras
+            user_id: Usuário que aceitou
+
+        Returns:
+            bool: True se a mensagem é um lote conhecido (o chamador não
+            deve substituir o texto da mensagem)
+        """
+        self._prune_open_rules(time.monotonic())
+        key = (chat_id, message_id)
+        if key not in self._open_rules:
+            return False
+
+        self._ensure_initialized()
+        lock = self._rules_locks.setdefault(key, asyncio.Lock())
+        # Cliques simultâneos de usuários diferentes editam o mesmo teclado
+        async with lock:
+            remaining = self._open_rules.get(key)
+            if remaining is None or remaining.pop(user_id, None) is None:
+                return remaining is not None
+            if not remaining:
+                self._forget_rules_batch(key)
+
+            rules_msg = WelcomeMessage.create_batch_rules_reminder(rules_topic_id=self.rules_topic_id)
+            await self._outbound.submit(
+                'edit_message_reply_markup',
+                chat_id,
+                SendPriority.INTERACTIVE,
+                message_id=message_id,
+                reply_markup=self._rules_keyboard(rules_msg, remaining or {})
+            )
+        return True
+
+    def _prune_open_rules(self, now: float) -> None:
+        """Esquece lotes de regras além do prazo de aceite (os pendentes já foram removidos)."""
+        cutoff = now - self.rules_ttl_seconds
+        for key in [key for key, sent_at in self._rules_sent_at.items() if sent_at < cutoff]:
+            lock = self._rules_locks.get(key)
+            if lock is not None and lock.locked():
+                continue
+            self._forget_rules_batch(key)
+            self._stats['rules_batches_expired'] += 1
+
+    def _forget_rules_batch(self, key: tuple) -> None:
+        self._open_rules.pop(key, None)
+        self._rules_sent_at.pop(key, None)
+        self._rules_locks.pop(key, None)
+
+    async def shutdown(self) -> None:
+        """Envia os lotes pendentes antes de encerrar."""
+        for chat_id in list(self._flush_tasks):
+            self._cancel_timer(chat_id)
+        for chat_id in list(self._pending):
+            await self._flush(chat_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do agregador.
+
+        Returns:
+            dict: Configuração, pendências e contadores
+        """
+        return {
+            'batch_threshold': self.batch_threshold,
+            'window_seconds': self.window_seconds,
+            'pending': sum(len(joiners) for joiners in self._pending.values()),
+            'open_rules_messages': len(self._open_rules),
+            'stats': self._stats.copy()
+        }
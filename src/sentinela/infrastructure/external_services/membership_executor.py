@@ -0,0 +1,176 @@
+"""
+Execução em lote de ações de membros no Telegram.
+
+Aplica as remoções (ban + unban, o membro pode voltar por convite) e
+restaurações (unban) calculadas pelo MembershipReconciler, em lotes e com
+um token bucket próprio, sem disputar a fila de mensagens do bot.
+`RetryAfter` pausa o executor pelo tempo pedido e repete a ação.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from telegram.error import RetryAfter, TelegramError
+
+from .message_scheduler import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+ACTION_REMOVE = "remove"
+ACTION_RESTORE = "restore"
+
+
+@dataclass(frozen=True)
+class MembershipAction:
+    """Ação sobre um membro do grupo."""
+    action: str
+    user_id: int
+    username: str
+    reason: str
+
+
+@dataclass(frozen=True)
+class ActionOutcome:
+    """Resultado de uma ação executada."""
+    action: MembershipAction
+    success: bool
+    error: Optional[str] = None
+
+
+class MembershipActionExecutor:
+    """
+    Executa ações de membros respeitando um limite de chamadas à API.
+
+    Cada remoção usa duas chamadas (ban e unban); o bucket é consumido por
+    chamada. Ao fim de cada lote, `on_batch` recebe os resultados para
+    persistir os efeitos de uma vez.
+    """
+
+    def __init__(
+        self,
+        group_id: int,
+        bot: Any = None,
+        calls_per_second: float = 2.0,
+        batch_size: int = 20,
+        max_retries: int = 3
+    ):
+        """
+        Inicializa o executor.
+
+        Args:
+            group_id: ID do grupo
+            bot: Instância de telegram.Bot (pode ser definida depois com `bind`)
+            calls_per_second: Chamadas à API por segundo
+            batch_size: Ações por lote
+            max_retries: Repetições após RetryAfter
+        """
+        self.group_id = group_id
+        self._bot = bot
+        self.calls_per_second = calls_per_second
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self._bucket = TokenBucket(calls_per_second, max(1.0, calls_per_second))
+        self._stats = {
+            'removed': 0,
+            'restored': 0,
+            'failed': 0,
+            'retry_after': 0,
+            'batches': 0
+        }
+
+    def bind(self, bot: Any) -> None:
+        """
+        Define o bot usado nas ações.
+
+        Args:
+            bot: Instância de telegram.Bot
+        """
+        self._bot = bot
+
+    async def execute(
+        self,
+        actions: List[MembershipAction],
+        on_batch: Optional[Callable[[List[ActionOutcome]], Awaitable[None]]] = None
+    ) -> List[ActionOutcome]:
+        """
+        Executa as ações em lotes.
+
+        Args:
+            actions: Ações a executar
+            on_batch: Chamado com os resultados de cada lote
+
+        Returns:
+            list: Resultado de todas as ações
+        """
+        if self._bot is None:
+            raise RuntimeError("MembershipActionExecutor sem bot configurado")
+
+        outcomes: List[ActionOutcome] = []
+        for start in range(0, len(actions), self.batch_size):
+            batch = [await self._run(action) for action in actions[start:start + self.batch_size]]
+            self._stats['batches'] += 1
+            outcomes.extend(batch)
+            if on_batch:
+                await on_batch(batch)
+        return outcomes
+
+    # Private helper methods
+
+    async def _run(self, action: MembershipAction) -> ActionOutcome:
+        """Executa uma ação (remoção ou restauração)."""
+        try:
+            if action.action == ACTION_REMOVE:
+                await self._call(self._bot.ban_chat_member, chat_id=self.group_id, user_id=action.user_id)
+                await self._call(
+                    self._bot.unban_chat_member,
+                    chat_id=self.group_id, user_id=action.user_id, only_if_banned=True
+                )
+                self._stats['removed'] += 1
+            elif action.action == ACTION_RESTORE:
+                await self._call(
+                    self._bot.unban_chat_member,
+                    chat_id=self.group_id, user_id=action.user_id, only_if_banned=True
+                )
+                self._stats['restored'] += 1
+            else:
+                raise ValueError(f"Ação desconhecida: {action.action}")
+            return ActionOutcome(action, True)
+
+        except (TelegramError, ValueError) as e:
+            self._stats['failed'] += 1
+            logger.error(f"Falha em '{action.action}' do usuário {action.user_id}: {e}")
+            return ActionOutcome(action, False, str(e))
+
+    async def _call(self, method: Callable[..., Awaitable[Any]], **kwargs) -> Any:
+        """Chama a API após obter token, repetindo após RetryAfter."""
+        attempts = 0
+        while True:
+            wait = self._bucket.time_until_token(time.monotonic())
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self._bucket.time_until_token(time.monotonic())
+            self._bucket.consume(time.monotonic())
+
+            try:
+                return await method(**kwargs)
+            except RetryAfter as e:
+                attempts += 1
+                self._stats['retry_after'] += 1
+                if attempts > self.max_retries:
+                    raise
+                retry_after = e.retry_after
+                seconds = retry_after.total_seconds() if hasattr(retry_after, 'total_seconds') else float(retry_after)
+                logger.warning(f"RetryAfter do Telegram: ações de membros pausadas por {seconds:g}s")
+                await asyncio.sleep(seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do executor.
+
+        Returns:
+            dict: Contadores de ações
+        """
+        return dict(self._stats)
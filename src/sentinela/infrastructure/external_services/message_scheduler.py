@@ -0,0 +1,437 @@
+"""
+Agendador de envio de mensagens ao Telegram.
+
+Centraliza os envios do bot respeitando os limites da API:
+
+- limite global (~30 mensagens/s por bot)
+- limite por chat (~1 mensagem/s em privado, ~20 mensagens/min em grupos)
+
+Os envios são enfileirados por classe de prioridade (respostas
+interativas > notificações > DMs em massa) e despachados assim que há
+token disponível no bucket global e no do chat. `RetryAfter` pausa o
+despacho pelo tempo pedido pelo Telegram e reenfileira a mensagem.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Deque, Dict, Optional, Set, Tuple
+
+from telegram.error import RetryAfter
+
+logger = logging.getLogger(__name__)
+
+
+class SendPriority(IntEnum):
+    """Classes de prioridade de envio (menor valor = mais urgente)."""
+    INTERACTIVE = 0
+    NOTIFICATION = 1
+    BULK = 2
+
+
+class OutboundQueueFullError(Exception):
+    """Fila de envio cheia."""
+    pass
+
+
+class TokenBucket:
+    """Token bucket simples baseado em tempo monotônico."""
+
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated')
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Inicializa o bucket cheio.
+
+        Args:
+            rate: Tokens repostos por segundo
+            capacity: Máximo de tokens acumulados (rajada)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def time_until_token(self, now: float) -> float:
+        """Segundos até haver um token (0 se disponível agora)."""
+        self._refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def consume(self, now: float) -> None:
+        """Consome um token (chamar após `time_until_token` retornar 0)."""
+        self._refill(now)
+        self.tokens -= 1
+
+    def is_full(self, now: float) -> bool:
+        """Bucket sem uso recente (pode ser descartado)."""
+        self._refill(now)
+        return self.tokens >= self.capacity
+
+
+@dataclass
+class _OutboundJob:
+    """Envio enfileirado."""
+    method: str
+    chat_id: int
+    priority: SendPriority
+    kwargs: Dict[str, Any]
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+
+
+class OutboundMessageScheduler:
+    """
+    Fila central de envios ao Telegram com rate limit e prioridades.
+
+    - Um único despachante escolhe, em ordem de prioridade, o primeiro
+      envio cujo chat tem token disponível (um chat limitado não bloqueia
+      os demais)
+    - Mensagens para o mesmo chat saem em ordem: no máximo um envio em
+      andamento por chat
+    - Até `max_in_flight` requisições simultâneas à API
+    """
+
+    # Quantos envios por prioridade são examinados a cada decisão
+    SCAN_LIMIT = 200
+    # Acima deste número de buckets por chat, os ociosos são descartados
+    MAX_IDLE_BUCKETS = 5000
+
+    def __init__(
+        self,
+        bot: Any = None,
+        global_rate: float = 30.0,
+        private_chat_rate: float = 1.0,
+        group_chat_per_minute: float = 20.0,
+        max_in_flight: int = 8,
+        max_queue_size: int = 10000,
+        max_retries: int = 3
+    ):
+        """
+        Inicializa o agendador.
+
+        Args:
+            bot: Instância de telegram.Bot (pode ser definida depois com `bind`)
+            global_rate: Mensagens por segundo em todo o bot
+            private_chat_rate: Mensagens por segundo por chat privado
+            group_chat_per_minute: Mensagens por minuto por grupo
+            max_in_flight: Requisições simultâneas à API
+            max_queue_size: Envios aguardando na fila
+            max_retries: Reenvios após RetryAfter antes de desistir
+        """
+        self._bot = bot
+        self.global_rate = global_rate
+        self.private_chat_rate = private_chat_rate
+        self.group_chat_per_minute = group_chat_per_minute
+        self.max_in_flight = max_in_flight
+        self.max_queue_size = max_queue_size
+        self.max_retries = max_retries
+
+        self._global_bucket = TokenBucket(global_rate, global_rate)
+        self._chat_buckets: Dict[int, TokenBucket] = {}
+        self._queues: Dict[SendPriority, Deque[_OutboundJob]] = {p: deque() for p in SendPriority}
+        self._chats_in_flight: Set[int] = set()
+        self._in_flight = 0
+        self._paused_until = 0.0
+
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher_task: Optional[asyncio.Task] = None
+        self._dispatcher_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._send_tasks: Set[asyncio.Task] = set()
+
+        self._stats = {
+            'enqueued': 0,
+            'sent': 0,
+            'failed': 0,
+            'rejected': 0,
+            'retry_after': 0,
+            'retried': 0
+        }
+        self._wait_stats = {p.name.lower(): {'count': 0, 'total': 0.0, 'max': 0.0} for p in SendPriority}
+
+    def bind(self, bot: Any) -> None:
+        """
+        Define o bot usado nos envios.
+
+        Args:
+            bot: Instância de telegram.Bot
+        """
+        self._bot = bot
+
+    # ==================== ENFILEIRAMENTO ====================
+
+    async def send_message(
+        self,
+        chat_id: int,
+        text: str,
+        priority: SendPriority = SendPriority.INTERACTIVE,
+        **kwargs
+    ) -> Any:
+        """
+        Envia mensagem respeitando os limites e aguarda o resultado.
+
+        Args:
+            chat_id: Chat de destino
+            text: Texto da mensagem
+            priority: Classe de prioridade
+            **kwargs: Demais parâmetros de `Bot.send_message`
+
+        Returns:
+            Message: Mensagem enviada
+
+        Raises:
+            OutboundQueueFullError: Se a fila estiver cheia
+        """
+        return await self.submit('send_message', chat_id, priority, text=text, **kwargs)
+
+    def submit(
+        self,
+        method: str,
+        chat_id: int,
+        priority: SendPriority = SendPriority.INTERACTIVE,
+        **kwargs
+    ) -> asyncio.Future:
+        """
+        Enfileira uma chamada de envio do bot sem aguardar.
+
+        Args:
+            method: Método do telegram.Bot (ex.: 'send_message', 'send_photo')
+            chat_id: Chat de destino
+            priority: Classe de prioridade
+            **kwargs: Parâmetros do método
+
+        Returns:
+            asyncio.Future: Resolvida com o retorno do método
+
+        Raises:
+            OutboundQueueFullError: Se a fila estiver cheia
+        """
+        if self.queue_depth() >= self.max_queue_size:
+            self._stats['rejected'] += 1
+            raise OutboundQueueFullError(
+                f"Fila de envio cheia ({self.max_queue_size}); {method} para {chat_id} descartado"
+            )
+
+        loop = self._ensure_dispatcher()
+        future = loop.create_future()
+        future.add_done_callback(self._consume_unobserved_error)
+        self._queues[SendPriority(priority)].append(
+            _OutboundJob(method=method, chat_id=int(chat_id), priority=SendPriority(priority), kwargs=kwargs, future=future)
+        )
+        self._stats['enqueued'] += 1
+        self._wakeup.set()
+        return future
+
+    @staticmethod
+    def _consume_unobserved_error(future: asyncio.Future) -> None:
+        """Evita avisos de exceção não recuperada em envios fire-and-forget."""
+        if not future.cancelled():
+            future.exception()
+
+    def _ensure_dispatcher(self) -> asyncio.AbstractEventLoop:
+        """Inicia o despachante no loop atual, se necessário."""
+        loop = asyncio.get_running_loop()
+
+        if self._dispatcher_task is None or self._dispatcher_loop is not loop or self._dispatcher_task.done():
+            self._wakeup = asyncio.Event()
+            self._dispatcher_loop = loop
+            self._dispatcher_task = asyncio.create_task(self._run_dispatcher(), name="outbound-message-scheduler")
+
+        return loop
+
+    # ==================== DESPACHO ====================
+
+    async def _run_dispatcher(self) -> None:
+        """Escolhe e dispara envios conforme os buckets permitem."""
+        while True:
+            job, wait = self._next_ready_job()
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            task = asyncio.create_task(self._execute(job))
+            self._send_tasks.add(task)
+            task.add_done_callback(self._send_tasks.discard)
+
+    def _next_ready_job(self) -> Tuple[Optional[_OutboundJob], Optional[float]]:
+        """
+        Retira da fila o próximo envio liberado.
+
+        Returns:
+            Tuple: (envio, None) ou (None, segundos até reavaliar; None = aguardar novo envio)
+        """
+        now = time.monotonic()
+
+        if now < self._paused_until:
+            return None, self._paused_until - now
+        if self._in_flight >= self.max_in_flight:
+            return None, None
+
+        global_wait = self._global_bucket.time_until_token(now)
+        if global_wait > 0:
+            return None, global_wait
+
+        min_wait: Optional[float] = None
+        for priority in SendPriority:
+            queue = self._queues[priority]
+            for index, job in enumerate(queue):
+                if index >= self.SCAN_LIMIT:
+                    break
+                if job.future.cancelled():
+                    del queue[index]
+                    return None, 0
+                if job.chat_id in self._chats_in_flight:
+                    continue
+
+                bucket = self._chat_bucket(job.chat_id, now)
+                wait = bucket.time_until_token(now)
+                if wait > 0:
+                    min_wait = wait if min_wait is None else min(min_wait, wait)
+                    continue
+
+                del queue[index]
+                bucket.consume(now)
+                self._global_bucket.consume(now)
+                return job, None
+
+        return None, min_wait
+
+    def _chat_bucket(self, chat_id: int, now: float) -> TokenBucket:
+        """Obtém (ou cria) o bucket do chat."""
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            if len(self._chat_buckets) >= self.MAX_IDLE_BUCKETS:
+                self._chat_buckets = {
+                    cid: b for cid, b in self._chat_buckets.items() if not b.is_full(now)
+                }
+            if chat_id < 0:
+                rate = self.group_chat_per_minute / 60
+                bucket = TokenBucket(rate, max(1.0, self.group_chat_per_minute / 6))
+            else:
+                bucket = TokenBucket(self.private_chat_rate, max(1.0, self.private_chat_rate))
+            self._chat_buckets[chat_id] = bucket
+        return bucket
+
+    async def _execute(self, job: _OutboundJob) -> None:
+        """Executa o envio e trata RetryAfter."""
+        self._in_flight += 1
+        self._chats_in_flight.add(job.chat_id)
+        job.attempts += 1
+        try:
+            if self._bot is None:
+                raise RuntimeError("OutboundMessageScheduler sem bot configurado")
+
+            result = await getattr(self._bot, job.method)(chat_id=job.chat_id, **job.kwargs)
+            self._record_wait(job)
+            self._stats['sent'] += 1
+            if not job.future.done():
+                job.future.set_result(result)
+
+        except RetryAfter as e:
+            retry_after = e.retry_after
+            seconds = retry_after.total_seconds() if hasattr(retry_after, 'total_seconds') else float(retry_after)
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._stats['retry_after'] += 1
+            logger.warning(f"RetryAfter do Telegram: envios pausados por {seconds:g}s (chat {job.chat_id})")
+
+            if job.attempts <= self.max_retries and not job.future.done():
+                self._stats['retried'] += 1
+                self._queues[job.priority].appendleft(job)
+            else:
+                self._fail(job, e)
+
+        except Exception as e:
+            self._fail(job, e)
+
+        finally:
+            self._in_flight -= 1
+            self._chats_in_flight.discard(job.chat_id)
+            self._wakeup.set()
+
+    def _fail(self, job: _OutboundJob, error: Exception) -> None:
+        self._stats['failed'] += 1
+        if not job.future.done():
+            job.future.set_exception(error)
+        else:
+            logger.warning(f"Falha em {job.method} para {job.chat_id}: {error}")
+
+    def _record_wait(self, job: _OutboundJob) -> None:
+        waited = time.monotonic() - job.enqueued_at
+        stats = self._wait_stats[job.priority.name.lower()]
+        stats['count'] += 1
+        stats['total'] += waited
+        stats['max'] = max(stats['max'], waited)
+
+    # ==================== CICLO DE VIDA ====================
+
+    async def shutdown(self, timeout: float = 10) -> None:
+        """
+        Aguarda a fila esvaziar e para o despachante.
+
+        Args:
+            timeout: Tempo máximo para drenar a fila
+        """
+        deadline = time.monotonic() + timeout
+        while (self.queue_depth() or self._in_flight) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+
+        pending = self.queue_depth()
+        if pending:
+            logger.warning(f"Agendador de envios encerrado com {pending} mensagens não enviadas")
+        for queue in self._queues.values():
+            while queue:
+                queue.popleft().future.cancel()
+
+        if self._dispatcher_task:
+            self._dispatcher_task.cancel()
+            try:
+                await self._dispatcher_task
+            except asyncio.CancelledError:
+                pass
+        self._dispatcher_task = None
+        self._dispatcher_loop = None
+
+    # ==================== MÉTRICAS ====================
+
+    def queue_depth(self) -> int:
+        """Total de envios aguardando na fila."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna métricas da fila de envios.
+
+        Returns:
+            dict: Profundidade por prioridade, envios em andamento, espera e contadores
+        """
+        wait_time = {
+            name: {
+                'avg_seconds': round(s['total'] / s['count'], 3) if s['count'] else 0.0,
+                'max_seconds': round(s['max'], 3)
+            }
+            for name, s in self._wait_stats.items()
+        }
+        paused_for = max(0.0, self._paused_until - time.monotonic())
+
+        return {
+            'queue_depth': {p.name.lower(): len(q) for p, q in self._queues.items()},
+            'in_flight': self._in_flight,
+            'paused_seconds': round(paused_for, 1),
+            'tracked_chats': len(self._chat_buckets),
+            'wait_time': wait_time,
+            'stats': self._stats.copy()
+        }
@@ -5,9 +5,12 @@ Implementação mock para testes e desenvolvimento,
 sem dependências externas.
 """
 
+import asyncio
 import logging
+import random
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterable, Union
 
 from ...domain.repositories.hubsoft_repository import (
     HubSoftAPIRepository,
@@ -30,13 +33,83 @@ class MockHubSoftAPIService(HubSoftAPIRepository):
         token_manager=None,
         timeout_seconds: int = 30,
         simulate_errors: bool = False,
-        response_delay: float = 0.1
+        response_delay: float = 0.1,
+        latency_jitter: float = 0.0,
+        slow_rate: float = 0.0,
+        slow_delay: float = 2.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None
     ):
+        """
+        Inicializa o mock.
+
+        Args:
+            simulate_errors: Falha determinística a cada N requisições
+            response_delay: Latência base por requisição (segundos)
+            latency_jitter: Variação aleatória somada à latência base (0..jitter)
+            slow_rate: Fração de requisições lentas (cauda de latência)
+            slow_delay: Latência das requisições lentas
+            error_rate: Fração de requisições que falham com HubSoftAPIError
+            seed: Semente do gerador aleatório (perfis reproduzíveis)
+        """
         # Mock service ignores real parameters but accepts them for compatibility
         self.simulate_errors = simulate_errors
         self.response_delay = response_delay
+        self.latency_jitter = latency_jitter
+        self.slow_rate = slow_rate
+        self.slow_delay = slow_delay
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
         self._request_count = 0
 
+    def sample_latency(self) -> float:
+        """
+        Sorteia a latência de uma requisição conforme o perfil.
+
+        Returns:
+            float: Latência em segundos
+        """
+        if self.slow_rate and self._random.random() < self.slow_rate:
+            return self.slow_delay
+        return self.response_delay + self._random.uniform(0, self.latency_jitter)
+
+    async def _simulate_latency(self) -> None:
+        await asyncio.sleep(self.sample_latency())
+
+    def _maybe_fail(self, operation: str) -> None:
+        """Falha aleatória conforme `error_rate`."""
+        if self.error_rate and self._random.random() < self.error_rate:
+            raise HubSoftAPIError(f"Simulated {operation} error", status_code=503)
+
+    def legacy_client_info(self, cpf: str) -> Optional[Dict[str, Any]]:
+        """
+        Dados no formato de `integrations.hubsoft.cliente.get_client_info`.
+
+        Chamada síncrona, como a integração legada: bloqueia pelo tempo
+        sorteado no perfil de latência.
+
+        Args:
+            cpf: CPF do cliente
+
+        Returns:
+            Optional[dict]: Dados do cliente com serviço habilitado
+        """
+        self._request_count += 1
+        time.sleep(self.sample_latency())
+        self._maybe_fail("client lookup")
+
+        digits = "".join(filter(str.isdigit, cpf))
+        return {
+            "id_cliente": int(digits[:6]),
+            "id_cliente_servico": int(digits[-6:]),
+            "nome_razaosocial": f"Cliente {digits[:3]}***{digits[-2:]}",
+            "cpf_cnpj": digits,
+            "telefone": f"119{digits[-8:]}",
+            "email": f"cliente{digits[-4:]}@email.com",
+            "servico_nome": "OnCabo Gaming 500MB",
+            "servico_status": "Serviço Habilitado"
+        }
+
     async def verify_client_by_cpf(
         self,
         cpf: str,
@@ -48,9 +121,8 @@ class MockHubSoftAPIService(HubSoftAPIRepository):
         if self.simulate_errors and self._request_count % 5 == 0:
             raise HubSoftAPIError("Simulated API error", status_code=500)
 
-        # Simula delay
-        import asyncio
-        await asyncio.sleep(self.response_delay)
+        await self._simulate_latency()
+        self._maybe_fail("client verification")
 
         # Dados mock baseados no CPF
         client_data = {
@@ -91,11 +163,11 @@ class MockHubSoftAPIService(HubSoftAPIRepository):
         if self.simulate_errors and self._request_count % 8 == 0:
             raise HubSoftAPIError("Simulated ticket creation error", status_code=422)
 
-        import asyncio
-        await asyncio.sleep(self.response_delay)
+        await self._simulate_latency()
+        self._maybe_fail("ticket creation")
 
         # Gera ID mock
-        hubsoft_id = f"HST_{int(datetime.now().timestamp())}"
+        hubsoft_id = f"HST_{int(datetime.now().timestamp())}_{self._request_count}"
 
         response = {
             "id": hubsoft_id,
@@ -106,12 +178,45 @@ class MockHubSoftAPIService(HubSoftAPIRepository):
             "priority": ticket_data.get("priority", "normal"),
             "created_at": datetime.now().isoformat(),
             "estimated_resolution": "24h",
-            "assigned_technician": "TecnicoGaming01"
+            "assigned_technician": "TecnicoGaming01",
+            # Formato do endpoint de atendimento usado por create_support_ticket
+            "atendimento": {
+                "id_atendimento": self._request_count,
+                "protocolo": hubsoft_id
+            }
         }
 
         logger.info(f"Mock: Ticket criado - ID={hubsoft_id}")
         return response
 
+    async def add_attachment_to_atendimento(
+        self,
+        atendimento_id: str,
+        file_content: Union[bytes, AsyncIterable[bytes]],
+        filename: str,
+        content_type: str = "application/octet-stream"
+    ) -> bool:
+        """
+        Mock do envio de anexo (mesma assinatura do HubSoftAtendimentoClient).
+
+        Consome o conteúdo como o upload real faria, então o download do
+        Telegram também entra na medição.
+        """
+        self._request_count += 1
+
+        if isinstance(file_content, (bytes, bytearray)):
+            size = len(file_content)
+        else:
+            size = 0
+            async for chunk in file_content:
+                size += len(chunk)
+
+        await self._simulate_latency()
+        self._maybe_fail("attachment upload")
+
+        logger.info(f"Mock: Anexo {filename} ({size} bytes) adicionado ao atendimento {atendimento_id}")
+        return True
+
     async def update_ticket(
         self,
         hubsoft_ticket_id: str,
@@ -120,8 +225,7 @@ class MockHubSoftAPIService(HubSoftAPIRepository):
         """Mock de atualização de ticket."""
         self._request_count += 1
 
-        import asyncio
-        await asyncio.sleep(self.response_delay)
+        await self._simulate_latency()
 
         response = {
             "id": hubsoft_ticket_id,
@@ -139,8 +243,7 @@ class MockHubSoftAPIService(HubSoftAPIRepository):
         hubsoft_ticket_id: str
     ) -> Dict[str, Any]:
         """Mock de status de ticket."""
-        import asyncio
-        await asyncio.sleep(self.response_delay)
+        await self._simulate_latency()
 
         return {
             "id": hubsoft_ticket_id,
@@ -156,8 +259,7 @@ class MockHubSoftAPIService(HubSoftAPIRepository):
         limit: int = 50
     ) -> List[Dict[str, Any]]:
         """Mock de busca de tickets."""
-        import asyncio
-        await asyncio.sleep(self.response_delay)
+        await self._simulate_latency()
 
         # Simula alguns tickets
         tickets = []
@@ -173,13 +275,25 @@ class MockHubSoftAPIService(HubSoftAPIRepository):
         logger.info(f"Mock: Encontrados {len(tickets)} tickets para CPF={cpf[:3]}***{cpf[-2:]}")
         return tickets
 
+    async def get_user_tickets(
+        self,
+        cpf: Optional[str] = None,
+        include_closed: bool = True,
+        limit: Optional[int] = None,
+        **filters
+    ) -> List[Dict[str, Any]]:
+        """Mock de atendimentos do cliente (nenhum atendimento aberto)."""
+        self._request_count += 1
+        await self._simulate_latency()
+        self._maybe_fail("ticket lookup")
+        return []
+
     async def get_client_contracts(
         self,
         cpf: str
     ) -> List[Dict[str, Any]]:
         """Mock de contratos do cliente."""
-        import asyncio
-        await asyncio.sleep(self.response_delay)
+        await self._simulate_latency()
 
         contracts = [
             {
@@ -205,8 +319,7 @@ class MockHubSoftAPIService(HubSoftAPIRepository):
 
     async def check_api_health(self) -> Dict[str, Any]:
         """Mock de health check."""
-        import asyncio
-        await asyncio.sleep(self.response_delay)
+        await self._simulate_latency()
 
         return {
             "status": "healthy",
@@ -0,0 +1,164 @@
+"""
+Snapshot em memória das autorizações de usuários.
+
+Responde em O(1), sem acesso ao banco, as perguntas feitas a cada
+/start, /status e /suporte:
+
+- o usuário tem verificação de CPF concluída?
+- o usuário já passou pelo fluxo (tem qualquer verificação)?
+
+Carregado uma vez na inicialização e mantido atualizado pelos eventos
+de verificação (ver AuthorizationSnapshotHandler).
+"""
+
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Set, Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AuthorizationSnapshot:
+    """Conjuntos de IDs do Telegram verificados e que já interagiram."""
+
+    def __init__(self, db_path: str):
+        """
+        Inicializa o snapshot (vazio até `load`).
+
+        Args:
+            db_path: Caminho do banco com a tabela cpf_verifications
+        """
+        self.db_path = Path(db_path)
+        self._verified: Set[int] = set()
+        self._interacted: Set[int] = set()
+        self._loaded = False
+        self._stats = {
+            'loads': 0,
+            'user_refreshes': 0,
+            'hits': 0
+        }
+
+    @property
+    def is_loaded(self) -> bool:
+        """Snapshot pronto para responder consultas."""
+        return self._loaded
+
+    def load(self) -> int:
+        """
+        Carrega o snapshot do banco com uma consulta em streaming.
+
+        Returns:
+            int: Número de usuários carregados
+        """
+        verified: Set[int] = set()
+        interacted: Set[int] = set()
+
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute("""
+                SELECT user_id, MAX(status = 'completed')
+                FROM cpf_verifications
+                GROUP BY user_id
+            """)
+            # Itera o cursor sem materializar a tabela inteira
+            for user_id, has_completed in cursor:
+                interacted.add(user_id)
+                if has_completed:
+                    verified.add(user_id)
+
+        self._verified = verified
+        self._interacted = interacted
+        self._loaded = True
+        self._stats['loads'] += 1
+
+        logger.info(
+            f"Snapshot de autorização carregado: {len(verified)} verificados, "
+            f"{len(interacted)} usuários com histórico"
+        )
+        return len(interacted)
+
+    def refresh_user(self, user_id: int) -> None:
+        """
+        Relê o estado de um usuário do banco (ex.: alterado por outro processo).
+
+        Args:
+            user_id: ID do usuário no Telegram
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute("""
+                SELECT COUNT(*), COALESCE(MAX(status = 'completed'), 0)
+                FROM cpf_verifications WHERE user_id = ?
+            """, (user_id,)).fetchone()
+
+        count, has_completed = row
+        self._set(self._interacted, user_id, count > 0)
+        self._set(self._verified, user_id, bool(has_completed))
+        self._stats['user_refreshes'] += 1
+
+    @staticmethod
+    def _set(target: Set[int], user_id: int, present: bool) -> None:
+        if present:
+            target.add(user_id)
+        else:
+            target.discard(user_id)
+
+    # ==================== CONSULTAS ====================
+
+    def is_verified(self, user_id: int) -> Optional[bool]:
+        """
+        Verifica se o usuário tem verificação concluída.
+
+        Args:
+            user_id: ID do usuário no Telegram
+
+        Returns:
+            Optional[bool]: Resposta, ou None se o snapshot não foi carregado
+        """
+        if not self._loaded:
+            return None
+        self._stats['hits'] += 1
+        return user_id in self._verified
+
+    def has_interacted(self, user_id: int) -> Optional[bool]:
+        """
+        Verifica se o usuário já tem alguma verificação registrada.
+
+        Args:
+            user_id: ID do usuário no Telegram
+
+        Returns:
+            Optional[bool]: Resposta, ou None se o snapshot não foi carregado
+        """
+        if not self._loaded:
+            return None
+        self._stats['hits'] += 1
+        return user_id in self._interacted
+
+    # ==================== ATUALIZAÇÕES ====================
+
+    def mark_interacted(self, user_id: int) -> None:
+        """Registra que o usuário entrou no fluxo de verificação."""
+        self._interacted.add(user_id)
+
+    def mark_verified(self, user_id: int) -> None:
+        """Registra verificação concluída."""
+        self._interacted.add(user_id)
+        self._verified.add(user_id)
+
+    def revoke(self, user_id: int) -> None:
+        """Remove a autorização do usuário (ex.: CPF remapeado para outra conta)."""
+        self._verified.discard(user_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do snapshot.
+
+        Returns:
+            dict: Tamanho dos conjuntos e contadores
+        """
+        return {
+            'loaded': self._loaded,
+            'verified_users': len(self._verified),
+            'interacted_users': len(self._interacted),
+            'stats': self._stats.copy()
+        }
@@ -0,0 +1,386 @@
+"""
+Índice em memória dos membros do grupo, persistido em `group_members`.
+
+Responde em O(1), sem chamar a API do Telegram, se um usuário está no
+grupo. É atualizado por todo update chat_member (entradas, saídas,
+remoções, promoções) na hora, em memória; as linhas alteradas vão para o
+banco em lote (write-behind, uma transação por lote, em thread numa
+conexão dedicada), então uma rajada de entradas não faz um commit por
+update no event loop, e o índice sobrevive a restarts. A MembershipIndexSync confere o índice contra o Telegram em
+ritmo baixo e corrige o que divergiu (updates perdidos com o bot parado).
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Status do ChatMember que contam como "no grupo" (restricted depende de is_member)
+MEMBER_STATUSES = ('creator', 'administrator', 'member')
+STATUS_RESTRICTED = 'restricted'
+
+SOURCE_UPDATE = "update"
+SOURCE_LOOKUP = "lookup"
+SOURCE_SYNC = "sync"
+SOURCE_SEED = "seed"
+
+# Espera pelo lock do banco na gravação em lote (fora do event loop)
+FLUSH_BUSY_TIMEOUT_SECONDS = 30.0
+
+
+def is_member_status(status: str, is_member: Optional[bool] = None) -> bool:
+    """
+    Converte o status de um ChatMember em "está no grupo".
+
+    Args:
+        status: Status do ChatMember (member, left, kicked, ...)
+        is_member: Campo is_member de ChatMemberRestricted
+
+    Returns:
+        bool: True se o usuário está no grupo
+    """
+    if status == STATUS_RESTRICTED:
+        return bool(is_member)
+    return status in MEMBER_STATUSES
+
+
+class MembershipIndex:
+    """Estado de cada usuário no grupo: user_id -> está no grupo."""
+
+    def __init__(self, db_path: str, flush_interval: float = 1.0):
+        """
+        Inicializa o índice (vazio até `load`).
+
+        Args:
+            db_path: Caminho para o arquivo do banco SQLite
+            flush_interval: Intervalo entre gravações em lote (segundos)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self._members: Dict[int, bool] = {}
+        self._loaded = False
+
+        # Linhas ainda não gravadas (user_id -> linha de group_members)
+        self._pending: Dict[int, Tuple] = {}
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._flusher_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Conexão da gravação em lote, usada só fora do event loop
+        self._flush_conn: Optional[sqlite3.Connection] = None
+        self._flush_conn_lock = threading.Lock()
+
+        self._stats = {
+            'loads': 0,
+            'updates': 0,
+            'hits': 0,
+            'unknown': 0,
+            'lookups': 0,
+            'sync_checks': 0,
+            'sync_corrections': 0,
+            'written': 0,
+            'flushes': 0,
+            'write_errors': 0
+        }
+        self._ensure_tables()
+
+    def _ensure_tables(self) -> None:
+        """Garante que a tabela de membros existe."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS group_members (
+                    user_id INTEGER PRIMARY KEY,
+                    username TEXT,
+                    status TEXT NOT NULL,
+                    is_member INTEGER NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    verified_at TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_group_members_verified
+                ON group_members(verified_at)
+            """)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Índice pronto para responder consultas."""
+        return self._loaded
+
+    def load(self) -> int:
+        """
+        Carrega o índice do banco.
+
+        Na primeira carga (tabela vazia), usa os membros de user_rules como
+        ponto de partida; esses registros ficam sem `verified_at` e são os
+        primeiros conferidos pela sincronização.
+
+        Returns:
+            int: Número de membros no grupo
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            if conn.execute("SELECT COUNT(*) FROM group_members").fetchone()[0] == 0:
+                self._seed(conn)
+            members = {
+                user_id: bool(is_member)
+                for user_id, is_member in conn.execute("SELECT user_id, is_member FROM group_members")
+            }
+
+        self._members = members
+        self._loaded = True
+        self._stats['loads'] += 1
+        count = self.member_count()
+        logger.info(f"Índice de membros carregado: {count} no grupo, {len(members)} conhecidos")
+        return count
+
+    # ==================== CONSULTAS ====================
+
+    def is_member(self, user_id: int) -> Optional[bool]:
+        """
+        Verifica se o usuário está no grupo.
+
+        Args:
+            user_id: ID do usuário no Telegram
+
+        Returns:
+            Optional[bool]: Resposta, ou None se o índice não foi carregado
+            ou o usuário nunca foi visto
+        """
+        if not self._loaded or user_id not in self._members:
+            self._stats['unknown'] += 1
+            return None
+        self._stats['hits'] += 1
+        return self._members[user_id]
+
+    def member_count(self) -> int:
+        """Quantidade de usuários no grupo segundo o índice."""
+        return sum(1 for present in self._members.values() if present)
+
+    def due_for_sync(self, limit: int) -> List[int]:
+        """
+        Usuários a conferir no Telegram, os nunca conferidos primeiro.
+
+        Args:
+            limit: Máximo de usuários
+
+        Returns:
+            list: user_ids
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT user_id FROM group_members
+                ORDER BY verified_at IS NOT NULL, verified_at, user_id
+                LIMIT ?
+                """,
+                (limit,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    # ==================== ATUALIZAÇÕES ====================
+
+    def apply(
+        self,
+        user_id: int,
+        status: str,
+        username: Optional[str] = None,
+        is_member: Optional[bool] = None,
+        source: str = SOURCE_UPDATE
+    ) -> bool:
+        """
+        Registra o status atual de um usuário.
+
+        A memória muda na hora; a linha vai para o banco no próximo flush.
+
+        Args:
+            user_id: ID do usuário no Telegram
+            status: Status do ChatMember
+            username: Username ou primeiro nome (mantém o anterior se None)
+            is_member: Campo is_member de ChatMemberRestricted
+            source: Origem da informação (update, lookup, sync, seed)
+
+        Returns:
+            bool: True se o estado "está no grupo" mudou
+        """
+        present = is_member_status(status, is_member)
+        # Usuário desconhecido conta como fora do grupo
+        changed = bool(self._members.get(user_id)) != present
+        now = datetime.now().isoformat()
+        # Updates e consultas ao Telegram são a fonte da verdade: contam como conferência
+        verified_at = now if source != SOURCE_SEED else None
+
+        previous = self._pending.get(user_id)
+        if username is None and previous is not None:
+            # Mesma regra do COALESCE no banco: mantém o username já conhecido
+            username = previous[1]
+        self._pending[user_id] = (user_id, username, status, int(present), now, source, verified_at)
+        self._ensure_flusher()
+
+        self._members[user_id] = present
+        if source == SOURCE_UPDATE:
+            self._stats['updates'] += 1
+        elif source == SOURCE_LOOKUP:
+            self._stats['lookups'] += 1
+        elif source == SOURCE_SYNC:
+            self._stats['sync_checks'] += 1
+            if changed:
+                self._stats['sync_corrections'] += 1
+                logger.warning(f"Índice de membros divergente para {user_id}: agora '{status}'")
+        return changed
+
+    # ==================== WRITE-BEHIND ====================
+
+    async def flush_now(self) -> int:
+        """
+        Grava as linhas pendentes numa transação, em thread.
+
+        Returns:
+            int: Número de linhas gravadas
+        """
+        if not self._pending:
+            return 0
+        rows, self._pending = self._pending, {}
+        try:
+            await asyncio.to_thread(self._write_rows, list(rows.values()))
+        except BaseException as e:
+            # Devolve o que não foi substituído por uma atualização mais nova
+            for user_id, row in rows.items():
+                self._pending.setdefault(user_id, row)
+            if isinstance(e, Exception):
+                self._stats['write_errors'] += 1
+                logger.error(f"Erro ao gravar {len(rows)} linhas do índice de membros: {e}")
+                return 0
+            raise
+        return len(rows)
+
+    async def shutdown(self) -> None:
+        """Grava o que estiver pendente e para o flusher."""
+        written = await self.flush_now()
+        if self._flusher_task:
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+        self._flusher_task = None
+        self._flusher_loop = None
+
+        def close() -> None:
+            with self._flush_conn_lock:
+                self._close_flush_conn()
+
+        await asyncio.to_thread(close)
+        logger.info(f"Índice de membros encerrado ({written} linhas gravadas)")
+
+    def _ensure_flusher(self) -> None:
+        """Inicia o flusher no loop atual; sem loop rodando, grava na hora."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_pending_sync()
+            return
+
+        if self._flusher_task is None or self._flusher_loop is not loop or self._flusher_task.done():
+            self._flusher_loop = loop
+            self._flusher_task = asyncio.create_task(self._run_flusher(), name="membership-index-flusher")
+
+    async def _run_flusher(self) -> None:
+        """Grava as linhas pendentes periodicamente."""
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush_now()
+        except asyncio.CancelledError:
+            # Loop encerrando sem shutdown (ex.: fim de asyncio.run em scripts)
+            self._flush_pending_sync()
+            raise
+
+    def _flush_pending_sync(self) -> None:
+        """Grava as pendentes na thread atual (sem event loop ou no encerramento)."""
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, {}
+        try:
+            self._write_rows(list(rows.values()))
+        except Exception as e:
+            self._stats['write_errors'] += 1
+            logger.error(f"Erro ao gravar {len(rows)} linhas do índice de membros: {e}")
+
+    def _write_rows(self, rows: List[Tuple]) -> None:
+        """Grava um lote de linhas numa transação da conexão dedicada."""
+        with self._flush_conn_lock:
+            if self._flush_conn is None:
+                self._flush_conn = sqlite3.connect(
+                    self.db_path, timeout=FLUSH_BUSY_TIMEOUT_SECONDS, check_same_thread=False
+                )
+            conn = self._flush_conn
+            try:
+                with conn:
+                    conn.executemany(
+                        """
+                        INSERT INTO group_members (user_id, username, status, is_member, updated_at, source, verified_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(user_id) DO UPDATE SET
+                            username = COALESCE(excluded.username, group_members.username),
+                            status = excluded.status,
+                            is_member = excluded.is_member,
+                            updated_at = excluded.updated_at,
+                            source = excluded.source,
+                            verified_at = excluded.verified_at
+                        """,
+                        rows
+                    )
+            except sqlite3.Error:
+                # Conexão em estado incerto: a próxima gravação abre outra
+                self._close_flush_conn()
+                raise
+        self._stats['written'] += len(rows)
+        self._stats['flushes'] += 1
+
+    def _close_flush_conn(self) -> None:
+        """Fecha a conexão da gravação em lote (chamado com `_flush_conn_lock`)."""
+        if self._flush_conn is not None:
+            self._flush_conn.close()
+            self._flush_conn = None
+
+    # Private helper methods
+
+    def _seed(self, conn: sqlite3.Connection) -> None:
+        """Preenche a tabela vazia com os membros de user_rules."""
+        if not {row[1] for row in conn.execute("PRAGMA table_info(user_rules)")}:
+            return
+        now = datetime.now().isoformat()
+        cursor = conn.execute(
+            """
+            INSERT OR IGNORE INTO group_members (user_id, username, status, is_member, updated_at, source)
+            SELECT user_id, username, 'member', 1, ?, ? FROM user_rules
+            WHERE status IN ('pending', 'accepted')
+            """,
+            (now, SOURCE_SEED)
+        )
+        logger.info(f"Índice de membros iniciado com {cursor.rowcount} membros de user_rules")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do índice.
+
+        Returns:
+            dict: Tamanho do índice, taxa de acerto e divergências corrigidas
+        """
+        hits = self._stats['hits']
+        checks = self._stats['sync_checks']
+        return {
+            'loaded': self._loaded,
+            'members': self.member_count(),
+            'known_users': len(self._members),
+            'pending_writes': len(self._pending),
+            'hit_rate': round(hits / (hits + self._stats['unknown']), 4) if hits else 0.0,
+            # Fração das conferências em que o índice já estava certo
+            'accuracy': round(1 - self._stats['sync_corrections'] / checks, 4) if checks else None,
+            'stats': self._stats.copy()
+        }
@@ -5,8 +5,10 @@ Implementação concreta do repositório de administradores usando SQLite.
 """
 
 import sqlite3
+import hashlib
+import json
 import logging
-from typing import Optional, List
+from typing import Optional, List, Dict, Callable, FrozenSet
 from datetime import datetime
 
 from ...domain.repositories.admin_repository import AdminRepository
@@ -19,14 +21,21 @@ class SQLiteAdminRepository(AdminRepository):
     Implementação SQLite do repositório de administradores.
     """
 
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        on_admins_changed: Optional[Callable[[FrozenSet[int]], None]] = None
+    ):
         """
         Inicializa o repositório.
 
         Args:
             db_path: Caminho para o arquivo do banco SQLite
+            on_admins_changed: Chamado com os IDs ativos após cada sincronização
         """
         self.db_path = db_path
+        self.on_admins_changed = on_admins_changed
+        self._last_sync: Optional[dict] = None
         self._ensure_table_exists()
 
     def _ensure_table_exists(self) -> None:
@@ -49,6 +58,13 @@ class SQLiteAdminRepository(AdminRepository):
                     CREATE INDEX IF NOT EXISTS idx_administrators_active
                     ON administrators(is_active)
                 """)
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS admin_sync_state (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL,
+                        updated_at TEXT NOT NULL
+                    )
+                """)
                 conn.commit()
         except Exception as e:
             logger.error(f"Erro ao criar tabela administrators: {e}")
@@ -197,6 +213,7 @@ class SQLiteAdminRepository(AdminRepository):
                         1 if is_active else 0
                     ))
 
+                self._reset_sync_fingerprint(conn)
                 conn.commit()
                 return True
 
@@ -214,6 +231,7 @@ class SQLiteAdminRepository(AdminRepository):
                         last_updated = CURRENT_TIMESTAMP
                     WHERE user_id = ?
                 """, (user_id,))
+                self._reset_sync_fingerprint(conn)
                 conn.commit()
                 return True
 
@@ -225,36 +243,133 @@ class SQLiteAdminRepository(AdminRepository):
         """
         Sincroniza lista de administradores do Telegram.
 
+        Compara a lista com o estado salvo e aplica apenas inserções,
+        atualizações e desativações, numa única transação (não existe
+        momento em que ninguém é administrador). Se a lista for idêntica
+        à da última sincronização (mesmo fingerprint), nada é gravado.
+
         Args:
             admin_list: Lista de dicts com keys: user_id, username, first_name, last_name, status
 
         Returns:
             int: Número de administradores sincronizados
         """
-        synced_count = 0
+        incoming = {}
+        for admin in admin_list:
+            user_id = admin.get('user_id')
+            if user_id is None:
+                continue
+            incoming[int(user_id)] = (
+                admin.get('username'),
+                admin.get('first_name'),
+                admin.get('last_name'),
+                admin.get('status', 'administrator')
+            )
+
+        fingerprint = self._fingerprint(incoming)
 
         try:
-            # Marca todos como inativos primeiro
             with sqlite3.connect(self.db_path) as conn:
-                conn.execute("UPDATE administrators SET is_active = 0")
-                conn.commit()
+                # Trava escrita durante leitura + diff + aplicação
+                conn.execute("BEGIN IMMEDIATE")
 
-            # Adiciona/atualiza os da lista atual
-            for admin in admin_list:
-                success = await self.save_administrator(
-                    user_id=admin.get('user_id'),
-                    username=admin.get('username'),
-                    first_name=admin.get('first_name'),
-                    last_name=admin.get('last_name'),
-                    status=admin.get('status', 'administrator'),
-                    is_active=True
-                )
-                if success:
-                    synced_count += 1
+                row = conn.execute(
+                    "SELECT value FROM admin_sync_state WHERE key = 'fingerprint'"
+                ).fetchone()
+                if row and row[0] == fingerprint:
+                    conn.rollback()
+                    self._last_sync = {'skipped': True, 'inserted': 0, 'updated': 0, 'deactivated': 0}
+                    logger.info(f"Administradores inalterados ({len(incoming)}), sincronização ignorada")
+                    self._notify_admins_changed(incoming.keys())
+                    return len(incoming)
 
-            logger.info(f"Sincronizados {synced_count} administradores")
-            return synced_count
+                stored = {
+                    user_id: ((username, first_name, last_name, status), bool(is_active))
+                    for user_id, username, first_name, last_name, status, is_active in conn.execute(
+                        "SELECT user_id, username, first_name, last_name, status, is_active FROM administrators"
+                    )
+                }
+
+                inserts = [
+                    (user_id, *fields) for user_id, fields in incoming.items()
+                    if user_id not in stored
+                ]
+                updates = [
+                    (*fields, user_id) for user_id, fields in incoming.items()
+                    if user_id in stored and stored[user_id] != (fields, True)
+                ]
+                deactivations = [
+                    (user_id,) for user_id, (_, is_active) in stored.items()
+                    if is_active and user_id not in incoming
+                ]
+
+                conn.executemany("""
+                    INSERT INTO administrators (user_id, username, first_name, last_name, status, is_active)
+                    VALUES (?, ?, ?, ?, ?, 1)
+                """, inserts)
+                conn.executemany("""
+                    UPDATE administrators SET
+                        username = ?,
+                        first_name = ?,
+                        last_name = ?,
+                        status = ?,
+                        is_active = 1,
+                        last_updated = CURRENT_TIMESTAMP
+                    WHERE user_id = ?
+                """, updates)
+                conn.executemany("""
+                    UPDATE administrators SET
+                        is_active = 0,
+                        last_updated = CURRENT_TIMESTAMP
+                    WHERE user_id = ?
+                """, deactivations)
+                conn.execute("""
+                    INSERT OR REPLACE INTO admin_sync_state (key, value, updated_at)
+                    VALUES ('fingerprint', ?, ?)
+                """, (fingerprint, datetime.now().isoformat()))
+                conn.commit()
+
+            self._last_sync = {
+                'skipped': False,
+                'inserted': len(inserts),
+                'updated': len(updates),
+                'deactivated': len(deactivations)
+            }
+            logger.info(
+                f"Sincronizados {len(incoming)} administradores "
+                f"(+{len(inserts)} ~{len(updates)} -{len(deactivations)})"
+            )
+            self._notify_admins_changed(incoming.keys())
+            return len(incoming)
 
         except Exception as e:
             logger.error(f"Erro ao sincronizar administradores: {e}")
-            return synced_count
+            return 0
+
+    @staticmethod
+    def _reset_sync_fingerprint(conn: sqlite3.Connection) -> None:
+        """Alteração manual: a próxima sincronização não pode ser ignorada."""
+        conn.execute("DELETE FROM admin_sync_state WHERE key = 'fingerprint'")
+
+    @staticmethod
+    def _fingerprint(admins: Dict[int, tuple]) -> str:
+        """Hash estável da lista de administradores (independe da ordem)."""
+        canonical = json.dumps(sorted([user_id, *fields] for user_id, fields in admins.items()))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _notify_admins_changed(self, admin_ids) -> None:
+        """Entrega o novo conjunto de administradores ativos ao cache em memória."""
+        if self.on_admins_changed:
+            try:
+                self.on_admins_changed(frozenset(admin_ids))
+            except Exception as e:
+                logger.error(f"Erro ao atualizar cache de administradores: {e}")
+
+    def get_last_sync(self) -> Optional[dict]:
+        """
+        Retorna o resultado da última sincronização neste processo.
+
+        Returns:
+            Optional[dict]: Contagem de inserções, atualizações e desativações
+        """
+        return self._last_sync
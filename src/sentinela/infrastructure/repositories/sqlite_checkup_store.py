@@ -0,0 +1,368 @@
+"""
+Checkpoints do checkup diário de CPF em SQLite.
+
+Cada execução do DailyCPFCheckup é uma linha em `checkup_runs`. Cada fase
+grava seu progresso em `checkup_checkpoints` (último user_id processado,
+contadores e se terminou). A fase de contratos também grava a decisão de
+cada usuário em `checkup_decisions`. Uma execução interrompida é retomada
+pela próxima: fases concluídas são puladas, o keyset continua do último
+user_id, e usuários já decididos não voltam a ser consultados no HubSoft.
+"""
+
+import json
+import logging
+import sqlite3
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+RUN_RUNNING = "running"
+RUN_COMPLETED = "completed"
+RUN_FAILED = "failed"
+
+
+class SQLiteCheckupStore:
+    """Estado persistido das execuções do checkup diário."""
+
+    def __init__(self, db_path: str):
+        """
+        Inicializa o store.
+
+        Args:
+            db_path: Caminho para o arquivo do banco SQLite
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_tables()
+
+    def _ensure_tables(self) -> None:
+        """Garante que as tabelas de checkpoint existem."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS checkup_runs (
+                    run_id TEXT PRIMARY KEY,
+                    mode TEXT NOT NULL,
+                    since TEXT,
+                    status TEXT NOT NULL,
+                    started_at TEXT NOT NULL,
+                    finished_at TEXT,
+                    resumed_count INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS checkup_checkpoints (
+                    run_id TEXT NOT NULL,
+                    phase TEXT NOT NULL,
+                    last_key INTEGER,
+                    counters TEXT NOT NULL DEFAULT '{}',
+                    completed INTEGER NOT NULL DEFAULT 0,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (run_id, phase)
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS checkup_decisions (
+                    run_id TEXT NOT NULL,
+                    phase TEXT NOT NULL,
+                    user_id INTEGER NOT NULL,
+                    decision TEXT NOT NULL,
+                    applied INTEGER NOT NULL DEFAULT 0,
+                    detail TEXT,
+                    decided_at TEXT NOT NULL,
+                    PRIMARY KEY (run_id, phase, user_id)
+                )
+            """)
+
+    # Execuções
+
+    def start_or_resume(
+        self,
+        mode: str,
+        since: Optional[datetime] = None,
+        max_resumes: int = 3,
+        max_age_hours: float = 20.0
+    ) -> Tuple[str, bool]:
+        """
+        Retoma a execução interrompida ou cria uma nova.
+
+        Uma execução retomada `max_resumes` vezes (falha recorrente) ou
+        iniciada há mais de `max_age_hours` (dados velhos demais para
+        reaproveitar) é encerrada como RUN_FAILED e uma nova é criada.
+
+        Args:
+            mode: 'full' ou 'incremental'
+            since: Início da janela incremental (só para execuções novas)
+            max_resumes: Retomadas permitidas por execução
+            max_age_hours: Idade máxima de uma execução retomável
+
+        Returns:
+            tuple: (run_id, True se retomada)
+        """
+        now = datetime.now()
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                """
+                SELECT run_id, started_at, resumed_count FROM checkup_runs
+                WHERE status = ? ORDER BY started_at DESC LIMIT 1
+                """,
+                (RUN_RUNNING,)
+            ).fetchone()
+            if row:
+                run_id, started_at, resumed_count = row
+                age = now - datetime.fromisoformat(started_at)
+                if resumed_count < max_resumes and age < timedelta(hours=max_age_hours):
+                    conn.execute(
+                        "UPDATE checkup_runs SET resumed_count = resumed_count + 1 WHERE run_id = ?",
+                        (run_id,)
+                    )
+                    return run_id, True
+
+                logger.warning(
+                    f"Checkup {run_id} abandonado ({resumed_count} retomadas, iniciado em {started_at}); "
+                    f"iniciando nova execução"
+                )
+                conn.execute(
+                    "UPDATE checkup_runs SET status = ?, finished_at = ? WHERE status = ?",
+                    (RUN_FAILED, now.isoformat(), RUN_RUNNING)
+                )
+
+            run_id = uuid.uuid4().hex
+            conn.execute(
+                "INSERT INTO checkup_runs (run_id, mode, since, status, started_at) VALUES (?, ?, ?, ?, ?)",
+                (run_id, mode, since.isoformat() if since else None, RUN_RUNNING, now.isoformat())
+            )
+            return run_id, False
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retorna os dados de uma execução.
+
+        Args:
+            run_id: ID da execução
+
+        Returns:
+            Optional[dict]: Execução ou None
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM checkup_runs WHERE run_id = ?", (run_id,)).fetchone()
+        return dict(row) if row else None
+
+    def finish_run(self, run_id: str, status: str = RUN_COMPLETED) -> None:
+        """
+        Marca a execução como encerrada.
+
+        Args:
+            run_id: ID da execução
+            status: RUN_COMPLETED ou RUN_FAILED
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "UPDATE checkup_runs SET status = ?, finished_at = ? WHERE run_id = ?",
+                (status, datetime.now().isoformat(), run_id)
+            )
+
+    def last_completed_run(self) -> Optional[Dict[str, Any]]:
+        """
+        Última execução concluída (base do modo incremental).
+
+        Returns:
+            Optional[dict]: Execução ou None
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute(
+                "SELECT * FROM checkup_runs WHERE status = ? ORDER BY started_at DESC LIMIT 1",
+                (RUN_COMPLETED,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    # Checkpoints
+
+    def get_checkpoint(self, run_id: str, phase: str) -> Dict[str, Any]:
+        """
+        Progresso de uma fase.
+
+        Args:
+            run_id: ID da execução
+            phase: Nome da fase
+
+        Returns:
+            dict: last_key (None = início), counters e completed
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT last_key, counters, completed FROM checkup_checkpoints WHERE run_id = ? AND phase = ?",
+                (run_id, phase)
+            ).fetchone()
+        if not row:
+            return {'last_key': None, 'counters': {}, 'completed': False}
+        return {'last_key': row[0], 'counters': json.loads(row[1]), 'completed': bool(row[2])}
+
+    def save_checkpoint(
+        self,
+        run_id: str,
+        phase: str,
+        last_key: Optional[int],
+        counters: Dict[str, int],
+        completed: bool = False
+    ) -> None:
+        """
+        Grava o progresso de uma fase.
+
+        Args:
+            run_id: ID da execução
+            phase: Nome da fase
+            last_key: Último user_id processado do keyset
+            counters: Contadores acumulados da fase
+            completed: Se a fase terminou
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO checkup_checkpoints (run_id, phase, last_key, counters, completed, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (run_id, phase, last_key, json.dumps(counters), int(completed), datetime.now().isoformat())
+            )
+
+    # Decisões por usuário
+
+    def record_decision(self, run_id: str, phase: str, user_id: int, decision: str, detail: Optional[str] = None) -> None:
+        """
+        Grava a decisão tomada para um usuário (antes de aplicá-la).
+
+        Args:
+            run_id: ID da execução
+            phase: Nome da fase
+            user_id: ID do usuário
+            decision: Ex.: 'keep', 'remove', 'skip_admin'
+            detail: Motivo ou erro
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO checkup_decisions (run_id, phase, user_id, decision, applied, detail, decided_at)
+                VALUES (?, ?, ?, ?, 0, ?, ?)
+                """,
+                (run_id, phase, user_id, decision, detail, datetime.now().isoformat())
+            )
+
+    def mark_applied(self, run_id: str, phase: str, user_id: int) -> None:
+        """
+        Marca a decisão do usuário como aplicada (remoção feita).
+
+        Args:
+            run_id: ID da execução
+            phase: Nome da fase
+            user_id: ID do usuário
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "UPDATE checkup_decisions SET applied = 1 WHERE run_id = ? AND phase = ? AND user_id = ?",
+                (run_id, phase, user_id)
+            )
+
+    def get_decisions(self, run_id: str, phase: str, user_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Decisões já tomadas para os usuários informados.
+
+        Args:
+            run_id: ID da execução
+            phase: Nome da fase
+            user_ids: Usuários do lote
+
+        Returns:
+            dict: user_id -> {'decision', 'applied', 'detail'}
+        """
+        if not user_ids:
+            return {}
+        placeholders = ",".join("?" * len(user_ids))
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT user_id, decision, applied, detail FROM checkup_decisions
+                WHERE run_id = ? AND phase = ? AND user_id IN ({placeholders})
+                """,
+                (run_id, phase, *user_ids)
+            ).fetchall()
+        return {row[0]: {'decision': row[1], 'applied': bool(row[2]), 'detail': row[3]} for row in rows}
+
+    def count_decisions(self, run_id: str) -> Dict[str, int]:
+        """
+        Contagem de decisões da execução.
+
+        Args:
+            run_id: ID da execução
+
+        Returns:
+            dict: decision -> quantidade
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT decision, COUNT(*) FROM checkup_decisions WHERE run_id = ? GROUP BY decision",
+                (run_id,)
+            ).fetchall()
+        return dict(rows)
+
+    # Membros (tabela users)
+
+    def fetch_members_with_cpf(
+        self,
+        after_user_id: Optional[int],
+        limit: int,
+        changed_since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Próximo lote de membros ativos com CPF, em ordem de user_id (keyset).
+
+        Args:
+            after_user_id: Último user_id do lote anterior (None = início)
+            limit: Tamanho do lote
+            changed_since: Só usuários criados ou verificados depois desta data
+
+        Returns:
+            list: Dicts com user_id, username e cpf
+        """
+        query = """
+            SELECT user_id, username, cpf FROM users
+            WHERE user_id > ? AND cpf IS NOT NULL AND cpf != '' AND is_active = 1
+        """
+        params: list = [after_user_id if after_user_id is not None else -1]
+        if changed_since:
+            query += " AND (julianday(created_at) > julianday(?) OR julianday(last_verification) > julianday(?))"
+            params += [changed_since.isoformat(), changed_since.isoformat()]
+        query += " ORDER BY user_id LIMIT ?"
+        params.append(limit)
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def purge_old_runs(self, keep_runs: int = 30) -> int:
+        """
+        Remove execuções encerradas além das `keep_runs` mais recentes.
+
+        Args:
+            keep_runs: Execuções mantidas
+
+        Returns:
+            int: Execuções removidas
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            old = [row[0] for row in conn.execute(
+                """
+                SELECT run_id FROM checkup_runs WHERE status != ?
+                ORDER BY started_at DESC LIMIT -1 OFFSET ?
+                """,
+                (RUN_RUNNING, keep_runs)
+            ).fetchall()]
+            for run_id in old:
+                conn.execute("DELETE FROM checkup_decisions WHERE run_id = ?", (run_id,))
+                conn.execute("DELETE FROM checkup_checkpoints WHERE run_id = ?", (run_id,))
+                conn.execute("DELETE FROM checkup_runs WHERE run_id = ?", (run_id,))
+        return len(old)
@@ -0,0 +1,218 @@
+"""
+Última verificação de contrato de cada membro em SQLite.
+
+Cada linha de `contract_checks` guarda quando o contrato do usuário foi
+consultado no HubSoft pela última vez e um fingerprint dos serviços
+habilitados. O ContractReverifier escolhe por aqui quem consultar (os
+mais antigos primeiro, com prioridade para quem mudou) e o checkup diário
+lê o resultado em vez de consultar todos os membros de uma vez.
+"""
+
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Prioridades de `pick_due` (menor = consultado antes)
+PRIORITY_NEVER_CHECKED = 0
+PRIORITY_CHANGED = 1
+PRIORITY_STALE = 2
+
+_MEMBERS_FILTER = "u.cpf IS NOT NULL AND u.cpf != '' AND u.is_active = 1"
+
+
+class SQLiteContractCheckStore:
+    """Estado de verificação de contrato por usuário."""
+
+    def __init__(self, db_path: str):
+        """
+        Inicializa o store.
+
+        Args:
+            db_path: Caminho para o arquivo do banco SQLite
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_tables()
+
+    def _ensure_tables(self) -> None:
+        """Garante que a tabela de verificações existe."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS contract_checks (
+                    user_id INTEGER PRIMARY KEY,
+                    last_contract_check_at TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    active INTEGER NOT NULL,
+                    inactive_streak INTEGER NOT NULL DEFAULT 0,
+                    status_changed_at TEXT,
+                    checks INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_contract_checks_last_check
+                ON contract_checks(last_contract_check_at)
+            """)
+
+    def pick_due(
+        self,
+        limit: int,
+        stale_before: datetime,
+        changed_since: datetime,
+        recheck_changed_before: datetime
+    ) -> List[Dict[str, Any]]:
+        """
+        Membros que precisam de nova consulta, em ordem de prioridade.
+
+        Ordem: nunca verificados; com mudança ainda não confirmada (a última
+        consulta, feita depois de `changed_since`, detectou a mudança, ou o
+        CPF foi reverificado depois dela) e consultados antes de
+        `recheck_changed_before`; demais consultados antes de `stale_before`.
+        Dentro de cada grupo, o mais antigo primeiro.
+
+        Args:
+            limit: Máximo de membros
+            stale_before: Consultas anteriores a isto estão vencidas
+            changed_since: Início da janela de "mudou recentemente"
+            recheck_changed_before: Intervalo mínimo entre consultas de quem mudou
+
+        Returns:
+            list: Dicts com user_id, username, cpf, fingerprint, active,
+            inactive_streak e priority
+        """
+        query = f"""
+            SELECT * FROM (
+                SELECT u.user_id, u.username, u.cpf, c.fingerprint, c.active, c.inactive_streak,
+                       c.last_contract_check_at,
+                       CASE
+                           WHEN c.user_id IS NULL THEN {PRIORITY_NEVER_CHECKED}
+                           WHEN c.last_contract_check_at < :recheck_before AND (
+                               (c.status_changed_at = c.last_contract_check_at AND c.status_changed_at >= :changed_since)
+                               OR julianday(u.last_verification) > julianday(c.last_contract_check_at)
+                           ) THEN {PRIORITY_CHANGED}
+                           WHEN c.last_contract_check_at < :stale_before THEN {PRIORITY_STALE}
+                       END AS priority
+                FROM users u
+                LEFT JOIN contract_checks c ON c.user_id = u.user_id
+                WHERE {_MEMBERS_FILTER}
+            )
+            WHERE priority IS NOT NULL
+            ORDER BY priority, last_contract_check_at, user_id
+            LIMIT :limit
+        """
+        params = {
+            'recheck_before': recheck_changed_before.isoformat(),
+            'changed_since': changed_since.isoformat(),
+            'stale_before': stale_before.isoformat(),
+            'limit': limit
+        }
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def record_check(self, user_id: int, fingerprint: str, active: bool, checked_at: datetime) -> bool:
+        """
+        Grava o resultado de uma consulta.
+
+        Args:
+            user_id: ID do usuário
+            fingerprint: Fingerprint dos serviços habilitados
+            active: Se há serviço habilitado
+            checked_at: Momento da consulta
+
+        Returns:
+            bool: True se o fingerprint mudou desde a consulta anterior
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT fingerprint, inactive_streak, status_changed_at FROM contract_checks WHERE user_id = ?",
+                (user_id,)
+            ).fetchone()
+            changed = row is not None and row[0] != fingerprint
+            streak = 0 if active else (row[1] + 1 if row else 1)
+            if changed or (row is None and not active):
+                # Primeira consulta sem serviço também é confirmada logo
+                status_changed_at = checked_at.isoformat()
+            else:
+                status_changed_at = row[2] if row else None
+            conn.execute(
+                """
+                INSERT INTO contract_checks
+                    (user_id, last_contract_check_at, fingerprint, active, inactive_streak, status_changed_at, checks)
+                VALUES (?, ?, ?, ?, ?, ?, 1)
+                ON CONFLICT(user_id) DO UPDATE SET
+                    last_contract_check_at = excluded.last_contract_check_at,
+                    fingerprint = excluded.fingerprint,
+                    active = excluded.active,
+                    inactive_streak = excluded.inactive_streak,
+                    status_changed_at = excluded.status_changed_at,
+                    checks = checks + 1
+                """,
+                (user_id, checked_at.isoformat(), fingerprint, int(active), streak, status_changed_at)
+            )
+        return changed
+
+    def get_checks(self, user_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Última verificação dos usuários informados.
+
+        Args:
+            user_ids: IDs dos usuários
+
+        Returns:
+            dict: user_id -> linha de contract_checks
+        """
+        if not user_ids:
+            return {}
+        placeholders = ",".join("?" * len(user_ids))
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                f"SELECT * FROM contract_checks WHERE user_id IN ({placeholders})",
+                user_ids
+            ).fetchall()
+        return {row['user_id']: dict(row) for row in rows}
+
+    def coverage(self, sla_before: datetime) -> Dict[str, Any]:
+        """
+        Situação da cobertura em relação à janela de SLA.
+
+        Args:
+            sla_before: Consultas anteriores a isto violam o SLA
+
+        Returns:
+            dict: members, never_checked, overdue e oldest_check_at
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                f"""
+                SELECT COUNT(*),
+                       SUM(CASE WHEN c.user_id IS NULL THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN c.last_contract_check_at < ? THEN 1 ELSE 0 END),
+                       MIN(c.last_contract_check_at)
+                FROM users u
+                LEFT JOIN contract_checks c ON c.user_id = u.user_id
+                WHERE {_MEMBERS_FILTER}
+                """,
+                (sla_before.isoformat(),)
+            ).fetchone()
+        return {
+            'members': row[0],
+            'never_checked': row[1] or 0,
+            'overdue': row[2] or 0,
+            'oldest_check_at': row[3]
+        }
+
+    def count_members(self) -> int:
+        """
+        Membros ativos com CPF (universo da reverificação).
+
+        Returns:
+            int: Quantidade de membros
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM users u WHERE {_MEMBERS_FILTER}").fetchone()[0]
@@ -0,0 +1,458 @@
+"""
+Store SQLite para o estado do fluxo conversacional de suporte.
+
+Mantém um working set em memória com os estados em uso e persiste as
+alterações em lote (write-behind) num SQLite, de forma que:
+
+- um restart no meio do /suporte não perde o formulário em andamento
+- conversas ociosas saem da memória após `idle_ttl_seconds` e só são
+  relidas do banco se o usuário voltar
+- estados abandonados são removidos do banco após `retention_seconds`
+
+Todo acesso ao banco depois da criação da tabela (restauração, leitura
+sob demanda, gravação em lote e expurgo) roda em thread
+(asyncio.to_thread) numa conexão dedicada: esperar o lock do banco não
+trava o event loop.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Espera pelo lock do banco na gravação em lote (fora do event loop)
+FLUSH_BUSY_TIMEOUT_SECONDS = 30.0
+
+
+class _Entry:
+    """Estado residente em memória."""
+
+    __slots__ = ('state', 'last_access', 'persisted_json')
+
+    def __init__(self, state: Dict[str, Any], last_access: float, persisted_json: Optional[str] = None):
+        self.state = state
+        self.last_access = last_access
+        self.persisted_json = persisted_json
+
+
+class SQLiteConversationStateStore:
+    """
+    Estados de conversa por usuário com persistência write-behind.
+
+    Os estados são dicionários JSON alterados in-place pelos handlers.
+    Toda leitura via `get` marca o estado como "quente"; a cada
+    `flush_interval` segundos os estados quentes (acessados nos últimos
+    `write_window_seconds`) são serializados e apenas os que mudaram
+    desde a última gravação são escritos, numa única transação, em thread
+    e numa conexão reservada ao flush.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        idle_ttl_seconds: float = 1800,
+        retention_seconds: float = 86400,
+        flush_interval: float = 2.0,
+        write_window_seconds: float = 300
+    ):
+        """
+        Inicializa o store.
+
+        Args:
+            db_path: Caminho do banco SQLite
+            idle_ttl_seconds: Inatividade após a qual o estado sai da memória
+            retention_seconds: Inatividade após a qual o estado é apagado do banco
+            flush_interval: Intervalo entre gravações em lote (segundos)
+            write_window_seconds: Por quanto tempo após o acesso o estado é
+                verificado por alterações a gravar
+        """
+        self.db_path = Path(db_path)
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.retention_seconds = retention_seconds
+        self.flush_interval = flush_interval
+        self.write_window_seconds = write_window_seconds
+
+        # Ordenado por último acesso (mais antigos no início)
+        self._resident: "OrderedDict[int, _Entry]" = OrderedDict()
+        # Usuários com estado gravado no banco, mas fora da memória
+        self._on_disk: Set[int] = set()
+        self._deleted: Set[int] = set()
+
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._flusher_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Conexão do flush, usada só dentro de asyncio.to_thread
+        self._flush_conn: Optional[sqlite3.Connection] = None
+        self._flush_conn_lock = threading.Lock()
+        # Um flush por vez (flusher e shutdown)
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._stats = {
+            'restored': 0,
+            'loaded_from_disk': 0,
+            'written': 0,
+            'unchanged_skipped': 0,
+            'deleted': 0,
+            'evicted': 0,
+            'purged': 0,
+            'flushes': 0,
+            'write_errors': 0
+        }
+        self._ensure_table_exists()
+
+    def _ensure_table_exists(self) -> None:
+        """Cria a tabela de estados se não existir."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS conversation_states (
+                    user_id INTEGER PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_conversation_states_updated ON conversation_states(updated_at)"
+            )
+            conn.commit()
+
+    async def load(self) -> int:
+        """
+        Restaura, na inicialização, quais usuários têm conversa em andamento.
+
+        Estados além da retenção são apagados; os demais ficam no banco e
+        são carregados sob demanda no primeiro acesso.
+
+        Returns:
+            int: Número de conversas restauradas
+        """
+        cutoff = (datetime.now() - timedelta(seconds=self.retention_seconds)).isoformat()
+
+        def restore(conn: sqlite3.Connection):
+            with conn:
+                purged = conn.execute(
+                    "DELETE FROM conversation_states WHERE updated_at < ?", (cutoff,)
+                ).rowcount
+                user_ids = {row[0] for row in conn.execute("SELECT user_id FROM conversation_states")}
+            return purged, user_ids
+
+        purged, user_ids = await asyncio.to_thread(self._on_flush_conn, restore)
+
+        self._on_disk = user_ids - set(self._resident)
+        self._stats['restored'] += len(user_ids)
+        self._stats['purged'] += purged
+
+        logger.info(f"Conversas de suporte restauradas: {len(user_ids)} ({purged} expiradas removidas)")
+        return len(user_ids)
+
+    # ==================== ACESSO ====================
+
+    def contains(self, user_id: int) -> bool:
+        """
+        Verifica se o usuário tem conversa em andamento, sem acessar o banco.
+
+        Args:
+            user_id: ID do usuário no Telegram
+
+        Returns:
+            bool: True se existe estado para o usuário
+        """
+        return user_id in self._resident or user_id in self._on_disk
+
+    async def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Obtém o estado do usuário (carrega do banco se necessário).
+
+        O dicionário retornado pode ser alterado in-place; as alterações
+        são gravadas no próximo flush.
+
+        Args:
+            user_id: ID do usuário no Telegram
+
+        Returns:
+            Optional[dict]: Estado da conversa ou None
+        """
+        entry = self._resident.get(user_id)
+        if entry is None:
+            if user_id not in self._on_disk:
+                return None
+            entry = await self._load_from_disk(user_id)
+            if entry is None:
+                return None
+
+        entry.last_access = time.monotonic()
+        self._resident.move_to_end(user_id)
+        self._ensure_flusher()
+        return entry.state
+
+    def put(self, user_id: int, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Define (ou substitui) o estado do usuário.
+
+        Args:
+            user_id: ID do usuário no Telegram
+            state: Estado da conversa
+
+        Returns:
+            dict: O próprio estado, já residente
+        """
+        self._deleted.discard(user_id)
+        self._on_disk.discard(user_id)
+
+        previous = self._resident.pop(user_id, None)
+        self._resident[user_id] = _Entry(
+            state,
+            time.monotonic(),
+            previous.persisted_json if previous else None
+        )
+        self._ensure_flusher()
+        return state
+
+    def delete(self, user_id: int) -> None:
+        """
+        Remove o estado do usuário (conversa concluída ou cancelada).
+
+        Args:
+            user_id: ID do usuário no Telegram
+        """
+        self._resident.pop(user_id, None)
+        self._on_disk.discard(user_id)
+        self._deleted.add(user_id)
+        self._ensure_flusher()
+
+    async def _load_from_disk(self, user_id: int) -> Optional[_Entry]:
+        """Carrega um estado do banco para o working set."""
+        row = await asyncio.to_thread(
+            self._on_flush_conn,
+            lambda conn: conn.execute(
+                "SELECT state FROM conversation_states WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        )
+
+        # put/delete durante a leitura têm precedência sobre o que veio do banco
+        if user_id in self._resident:
+            return self._resident[user_id]
+        if user_id not in self._on_disk:
+            return None
+        self._on_disk.discard(user_id)
+        if row is None:
+            return None
+
+        entry = _Entry(json.loads(row[0]), time.monotonic(), row[0])
+        self._resident[user_id] = entry
+        self._stats['loaded_from_disk'] += 1
+        return entry
+
+    # ==================== WRITE-BEHIND ====================
+
+    def _ensure_flusher(self) -> None:
+        """Inicia o flusher no loop atual, se houver loop rodando."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        if self._flusher_task is None or self._flusher_loop is not loop or self._flusher_task.done():
+            self._flusher_loop = loop
+            self._flusher_task = asyncio.create_task(self._run_flusher(), name="conversation-state-flusher")
+
+    async def _run_flusher(self) -> None:
+        """Grava alterações periodicamente e expurga estados antigos a cada hora."""
+        last_purge = time.monotonic()
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush_now()
+
+            if time.monotonic() - last_purge >= 3600:
+                last_purge = time.monotonic()
+                try:
+                    await self.purge_expired()
+                except Exception as e:
+                    logger.error(f"Erro ao expurgar estados de conversa: {e}")
+
+    async def flush_now(self) -> int:
+        """
+        Grava estados alterados e remoções pendentes, e aplica o TTL.
+
+        A serialização roda no loop (os estados são alterados pelos
+        handlers); a transação roda em thread na conexão do flush.
+
+        Returns:
+            int: Número de estados gravados
+        """
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            return await self._flush()
+
+    async def _flush(self) -> int:
+        """Executa um flush (chamado com `_flush_lock`)."""
+        now = time.monotonic()
+        timestamp = datetime.now().isoformat()
+
+        # Estados quentes ficam no final do OrderedDict
+        upserts = []
+        for user_id in reversed(self._resident):
+            entry = self._resident[user_id]
+            if now - entry.last_access > self.write_window_seconds:
+                break
+            payload = json.dumps(entry.state, ensure_ascii=False, sort_keys=True, default=str)
+            if payload == entry.persisted_json:
+                self._stats['unchanged_skipped'] += 1
+                continue
+            upserts.append((user_id, payload, timestamp, entry))
+
+        deletes = list(self._deleted)
+
+        if upserts or deletes:
+            try:
+                await asyncio.to_thread(
+                    self._write_batch,
+                    [(user_id, payload, ts) for user_id, payload, ts, _ in upserts],
+                    deletes
+                )
+            except Exception as e:
+                self._stats['write_errors'] += 1
+                logger.error(f"Erro ao gravar {len(upserts)} estados de conversa: {e}")
+                return 0
+
+            for _, payload, _, entry in upserts:
+                entry.persisted_json = payload
+            self._deleted.difference_update(deletes)
+            self._stats['written'] += len(upserts)
+            self._stats['deleted'] += len(deletes)
+            self._stats['flushes'] += 1
+
+        self._evict_idle(now)
+        return len(upserts)
+
+    def _write_batch(self, rows: List[tuple], deletes: List[int]) -> None:
+        """Grava o lote numa transação da conexão do flush (roda em thread)."""
+        def write(conn: sqlite3.Connection) -> None:
+            with conn:
+                if rows:
+                    conn.executemany("""
+                        INSERT INTO conversation_states (user_id, state, updated_at)
+                        VALUES (?, ?, ?)
+                        ON CONFLICT(user_id) DO UPDATE SET
+                            state = excluded.state,
+                            updated_at = excluded.updated_at
+                    """, rows)
+                if deletes:
+                    conn.executemany(
+                        "DELETE FROM conversation_states WHERE user_id = ?",
+                        [(user_id,) for user_id in deletes]
+                    )
+
+        self._on_flush_conn(write)
+
+    def _on_flush_conn(self, operation: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Executa `operation` na conexão do flush (roda em thread)."""
+        with self._flush_conn_lock:
+            if self._flush_conn is None:
+                self._flush_conn = sqlite3.connect(
+                    self.db_path, timeout=FLUSH_BUSY_TIMEOUT_SECONDS, check_same_thread=False
+                )
+            try:
+                return operation(self._flush_conn)
+            except sqlite3.Error:
+                # Conexão em estado incerto: a próxima operação abre outra
+                self._close_flush_conn()
+                raise
+
+    def _close_flush_conn(self) -> None:
+        """Fecha a conexão do flush (chamado com `_flush_conn_lock`)."""
+        if self._flush_conn is not None:
+            self._flush_conn.close()
+            self._flush_conn = None
+
+    def _evict_idle(self, now: float) -> None:
+        """Remove da memória estados ociosos (já gravados) além do TTL."""
+        cutoff = now - self.idle_ttl_seconds
+        while self._resident:
+            user_id, entry = next(iter(self._resident.items()))
+            if entry.last_access > cutoff:
+                break
+            self._resident.popitem(last=False)
+            if entry.persisted_json is not None:
+                self._on_disk.add(user_id)
+            self._stats['evicted'] += 1
+
+    async def shutdown(self) -> None:
+        """Para o flusher e grava o que estiver pendente."""
+        if self._flusher_task:
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+        self._flusher_task = None
+        self._flusher_loop = None
+
+        # No encerramento todo estado residente é conferido, não só os quentes
+        window = self.write_window_seconds
+        self.write_window_seconds = float('inf')
+        try:
+            written = await self.flush_now()
+        finally:
+            self.write_window_seconds = window
+
+        def close() -> None:
+            with self._flush_conn_lock:
+                self._close_flush_conn()
+
+        await asyncio.to_thread(close)
+        logger.info(f"Store de conversas encerrado ({written} estados gravados)")
+
+    # ==================== MANUTENÇÃO ====================
+
+    async def purge_expired(self) -> int:
+        """
+        Apaga do banco estados sem atividade além da retenção.
+
+        Returns:
+            int: Número de estados apagados
+        """
+        cutoff = (datetime.now() - timedelta(seconds=self.retention_seconds)).isoformat()
+
+        def purge(conn: sqlite3.Connection) -> List[int]:
+            with conn:
+                purged = [
+                    row[0] for row in conn.execute(
+                        "SELECT user_id FROM conversation_states WHERE updated_at < ?", (cutoff,)
+                    )
+                ]
+                conn.execute("DELETE FROM conversation_states WHERE updated_at < ?", (cutoff,))
+            return purged
+
+        purged_ids: List[int] = await asyncio.to_thread(self._on_flush_conn, purge)
+
+        # Residentes seguem em uso: serão regravados no próximo flush
+        self._on_disk.difference_update(purged_ids)
+        for user_id in purged_ids:
+            entry = self._resident.get(user_id)
+            if entry is not None:
+                entry.persisted_json = None
+        self._stats['purged'] += len(purged_ids)
+        return len(purged_ids)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do store.
+
+        Returns:
+            dict: Tamanho do working set e contadores
+        """
+        return {
+            'resident': len(self._resident),
+            'on_disk': len(self._on_disk),
+            'pending_deletes': len(self._deleted),
+            'idle_ttl_seconds': self.idle_ttl_seconds,
+            'stats': self._stats.copy()
+        }
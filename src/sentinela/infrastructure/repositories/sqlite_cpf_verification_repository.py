@@ -4,25 +4,31 @@ SQLite CPF Verification Repository Implementation.
 Implementa persistência de verificações CPF usando SQLite.
 """
 
+import asyncio
 import logging
 import sqlite3
 import aiosqlite
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
 from ...domain.entities.cpf_verification import CPFVerificationRequest, VerificationId, VerificationStatus, VerificationAttempt, VerificationType
 from ...domain.repositories.cpf_verification_repository import CPFVerificationRepository
 from ...domain.value_objects.identifiers import UserId
+from ..events.outbox import SQLiteEventOutbox
 
 logger = logging.getLogger(__name__)
 
+# Espera pelo lock no save; roda fora do event loop
+SAVE_BUSY_TIMEOUT_SECONDS = 30.0
+
 
 class SQLiteCPFVerificationRepository(CPFVerificationRepository):
     """Implementação SQLite do repositório de verificações CPF."""
 
-    def __init__(self, db_path: str = "data/oncabo.db"):
+    def __init__(self, db_path: str = "data/oncabo.db", outbox: Optional[SQLiteEventOutbox] = None):
         self.db_path = Path(db_path)
+        self.outbox = outbox
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._init_tables()
 
@@ -90,86 +96,99 @@ class SQLiteCPFVerificationRepository(CPFVerificationRepository):
             conn.commit()
 
     async def save(self, verification: CPFVerificationRequest) -> None:
-        """Salva uma verificação CPF."""
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-
-                # Verifica se já existe
-                cursor.execute(
-                    "SELECT id FROM cpf_verifications WHERE id = ?",
-                    (verification.id.value,)
-                )
-                exists = cursor.fetchone()
-
-                if exists:
-                    # Update
-                    cursor.execute("""
-                        UPDATE cpf_verifications SET
-                            user_id = ?,
-                            username = ?,
-                            user_mention = ?,
-                            cpf_hash = ?,
-                            verification_type = ?,
-                            status = ?,
-                            max_attempts = ?,
-                            expires_at = ?,
-                            completed_at = ?,
-                            verification_data = ?,
-                            metadata = ?,
-                            client_data = ?
-                        WHERE id = ?
-                    """, (
-                        verification.user_id.value,
-                        verification.username,
-                        verification.user_mention,
-                        verification.cpf_hash,
-                        verification.verification_type.value,
-                        verification.status.value,
-                        verification.max_attempts,
-                        verification.expires_at.isoformat(),
-                        verification.completed_at.isoformat() if verification.completed_at else None,
-                        self._serialize_data(verification.verification_data),
-                        self._serialize_data(verification.metadata),
-                        self._serialize_data(verification.client_data) if verification.client_data else None,
-                        verification.id.value
-                    ))
-                else:
-                    # Insert
-                    cursor.execute("""
-                        INSERT INTO cpf_verifications (
-                            id, user_id, username, user_mention, cpf_hash, verification_type,
-                            status, max_attempts, created_at, expires_at,
-                            completed_at, verification_data, metadata, client_data
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        verification.id.value,
-                        verification.user_id.value,
-                        verification.username,
-                        verification.user_mention,
-                        verification.cpf_hash,
-                        verification.verification_type.value,
-                        verification.status.value,
-                        verification.max_attempts,
-                        verification.created_at.isoformat(),
-                        verification.expires_at.isoformat(),
-                        verification.completed_at.isoformat() if verification.completed_at else None,
-                        self._serialize_data(verification.verification_data),
-                        self._serialize_data(verification.metadata),
-                        self._serialize_data(verification.client_data) if verification.client_data else None
-                    ))
-
-                # Salva tentativas
-                await self._save_attempts(conn, verification)
-
-                conn.commit()
-                logger.debug(f"Verificação {verification.id.value} salva com sucesso")
+        """
+        Salva uma verificação CPF.
 
+        A transação (verificação, tentativas e eventos no outbox) roda em
+        thread com conexão própria: a espera pelo lock do banco não trava
+        o event loop.
+        """
+        try:
+            await asyncio.to_thread(self._save_sync, verification)
         except Exception as e:
             logger.error(f"Erro ao salvar verificação {verification.id.value}: {e}")
             raise
 
-    async def _save_attempts(self, conn: sqlite3.Connection, verification: CPFVerificationRequest) -> None:
+    def _save_sync(self, verification: CPFVerificationRequest) -> None:
+        """Grava a verificação em uma transação (roda em thread)."""
+        with sqlite3.connect(self.db_path, timeout=SAVE_BUSY_TIMEOUT_SECONDS) as conn:
+            cursor = conn.cursor()
+
+            # Verifica se já existe
+            cursor.execute(
+                "SELECT id FROM cpf_verifications WHERE id = ?",
+                (verification.id.value,)
+            )
+            exists = cursor.fetchone()
+
+            if exists:
+                # Update
+                cursor.execute("""
+                    UPDATE cpf_verifications SET
+                        user_id = ?,
+                        username = ?,
+                        user_mention = ?,
+                        cpf_hash = ?,
+                        verification_type = ?,
+                        status = ?,
+                        max_attempts = ?,
+                        expires_at = ?,
+                        completed_at = ?,
+                        verification_data = ?,
+                        metadata = ?,
+                        client_data = ?
+                    WHERE id = ?
+                """, (
+                    verification.user_id.value,
+                    verification.username,
+                    verification.user_mention,
+                    verification.cpf_hash,
+                    verification.verification_type.value,
+                    verification.status.value,
+                    verification.max_attempts,
+                    verification.expires_at.isoformat(),
+                    verification.completed_at.isoformat() if verification.completed_at else None,
+                    self._serialize_data(verification.verification_data),
+                    self._serialize_data(verification.metadata),
+                    self._serialize_data(verification.client_data) if verification.client_data else None,
+                    verification.id.value
+                ))
+            else:
+                # Insert
+                cursor.execute("""
+                    INSERT INTO cpf_verifications (
+                        id, user_id, username, user_mention, cpf_hash, verification_type,
+                        status, max_attempts, created_at, expires_at,
+                        completed_at, verification_data, metadata, client_data
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    verification.id.value,
+                    verification.user_id.value,
+                    verification.username,
+                    verification.user_mention,
+                    verification.cpf_hash,
+                    verification.verification_type.value,
+                    verification.status.value,
+                    verification.max_attempts,
+                    verification.created_at.isoformat(),
+                    verification.expires_at.isoformat(),
+                    verification.completed_at.isoformat() if verification.completed_at else None,
+                    self._serialize_data(verification.verification_data),
+                    self._serialize_data(verification.metadata),
+                    self._serialize_data(verification.client_data) if verification.client_data else None
+                ))
+
+            # Salva tentativas
+            self._save_attempts(conn, verification)
+
+            # Eventos gravados na mesma transação da verificação
+            if self.outbox:
+                self.outbox.append(conn, verification.get_domain_events())
+
+            conn.commit()
+            logger.debug(f"Verificação {verification.id.value} salva com sucesso")
+
+    def _save_attempts(self, conn: sqlite3.Connection, verification: CPFVerificationRequest) -> None:
         """Salva tentativas de verificação."""
         cursor = conn.cursor()
 
@@ -366,7 +385,7 @@ class SQLiteCPFVerificationRepository(CPFVerificationRepository):
         """Remove verificações expiradas antigas."""
         try:
             cutoff_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            cutoff_date = cutoff_date.replace(day=cutoff_date.day - older_than_days)
+            cutoff_date -= timedelta(days=older_than_days)
 
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
@@ -33,11 +33,31 @@ class SQLiteGroupMemberRepository(GroupMemberRepository):
             db_path: Caminho do arquivo SQLite
         """
         self.db_path = db_path
+        self._table_ready = False
+
+    async def _ensure_table_exists(self, db: aiosqlite.Connection) -> None:
+        """Cria a tabela user_rules se não existir."""
+        if self._table_ready:
+            return
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS user_rules (
+                user_id INTEGER PRIMARY KEY,
+                username TEXT,
+                joined_at TEXT,
+                rules_accepted INTEGER DEFAULT 0,
+                rules_accepted_at TEXT,
+                expires_at TEXT,
+                status TEXT DEFAULT 'pending'
+            )
+        """)
+        self._table_ready = True
 
     async def save(self, member: GroupMember) -> GroupMember:
         """Salva ou atualiza membro."""
         try:
             async with aiosqlite.connect(self.db_path) as db:
+                await self._ensure_table_exists(db)
+
                 # Verifica se já existe
                 cursor = await db.execute(
                     "SELECT user_id FROM user_rules WHERE user_id = ?",
@@ -91,6 +111,79 @@ class SQLiteGroupMemberRepository(GroupMemberRepository):
             logger.error(f"Erro ao salvar membro {member.telegram_id}: {e}")
             raise
 
+    async def save_many(self, members: List[GroupMember]) -> int:
+        """
+        Salva ou atualiza vários membros numa única transação.
+
+        Args:
+            members: Entidades dos membros
+
+        Returns:
+            int: Quantidade de membros salvos
+        """
+        if not members:
+            return 0
+
+        # Último registro de cada usuário prevalece
+        by_id = {member.telegram_id: member for member in members}
+
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                await self._ensure_table_exists(db)
+
+                placeholders = ",".join("?" * len(by_id))
+                cursor = await db.execute(
+                    f"SELECT user_id FROM user_rules WHERE user_id IN ({placeholders})",
+                    tuple(by_id)
+                )
+                existing = {row[0] for row in await cursor.fetchall()}
+
+                updates = [
+                    (
+                        member.username,
+                        1 if member.is_verified else 0,
+                        member.joined_at.isoformat() if member.is_verified else None,
+                        'accepted' if member.is_verified else 'pending',
+                        telegram_id
+                    )
+                    for telegram_id, member in by_id.items() if telegram_id in existing
+                ]
+                expires_at = (datetime.now() + timedelta(hours=24)).isoformat()
+                inserts = [
+                    (telegram_id, member.username, member.joined_at.isoformat(), 0, expires_at, 'pending')
+                    for telegram_id, member in by_id.items() if telegram_id not in existing
+                ]
+
+                if updates:
+                    await db.executemany(
+                        """
+                        UPDATE user_rules
+                        SET username = ?,
+                            rules_accepted = ?,
+                            rules_accepted_at = ?,
+                            status = ?
+                        WHERE user_id = ?
+                        """,
+                        updates
+                    )
+                if inserts:
+                    await db.executemany(
+                        """
+                        INSERT INTO user_rules
+                        (user_id, username, joined_at, rules_accepted, expires_at, status)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        inserts
+                    )
+
+                await db.commit()
+                logger.info(f"{len(by_id)} membros salvos ({len(inserts)} novos, {len(updates)} atualizados)")
+                return len(by_id)
+
+        except Exception as e:
+            logger.error(f"Erro ao salvar {len(by_id)} membros: {e}")
+            raise
+
     async def find_by_telegram_id(self, telegram_id: int) -> Optional[GroupMember]:
         """Busca membro por ID do Telegram."""
         try:
@@ -114,7 +207,6 @@ class SQLiteGroupMemberRepository(GroupMemberRepository):
                 is_verified = bool(row[3])
 
                 return GroupMember(
-                    id=None,  # Não usado neste contexto
                     user_id=UserId(row[0]),
                     telegram_id=row[0],
                     username=row[1],
@@ -152,7 +244,6 @@ class SQLiteGroupMemberRepository(GroupMemberRepository):
                     is_verified = bool(row[3])
 
                     member = GroupMember(
-                        id=None,
                         user_id=UserId(row[0]),
                         telegram_id=row[0],
                         username=row[1],
@@ -199,7 +290,6 @@ class SQLiteGroupMemberRepository(GroupMemberRepository):
                     joined_at = datetime.fromisoformat(row[2]) if row[2] else datetime.now()
 
                     member = GroupMember(
-                        id=None,
                         user_id=UserId(row[0]),
                         telegram_id=row[0],
                         username=row[1],
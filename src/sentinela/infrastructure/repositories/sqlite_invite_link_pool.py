@@ -0,0 +1,270 @@
+"""
+Links de convite pré-criados em SQLite.
+
+Cada linha de `invite_link_pool` é um link de uso único com expiração
+curta, criado antes de alguém precisar dele. O ciclo de vida é:
+available -> leased (entregue a um usuário verificado) -> used (o usuário
+entrou pelo link), ou revoked/expired quando o link envelhece sem uso.
+
+Os métodos são síncronos; o InviteLinkPool os chama via asyncio.to_thread,
+então a espera pelo lock (até BUSY_TIMEOUT_SECONDS) não trava o event loop.
+"""
+
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+LINK_AVAILABLE = "available"
+LINK_LEASED = "leased"
+LINK_USED = "used"
+LINK_REVOKED = "revoked"
+LINK_EXPIRED = "expired"
+
+# Espera pelo lock do banco (as chamadas rodam fora do event loop)
+BUSY_TIMEOUT_SECONDS = 30.0
+
+
+class SQLiteInviteLinkStore:
+    """Estado dos links do pool de convites."""
+
+    def __init__(self, db_path: str):
+        """
+        Inicializa o store.
+
+        Args:
+            db_path: Caminho para o arquivo do banco SQLite
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_tables()
+
+    def _connect(self, **kwargs) -> sqlite3.Connection:
+        """Conexão com o timeout de lock do store."""
+        return sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_SECONDS, **kwargs)
+
+    def _ensure_tables(self) -> None:
+        """Garante que a tabela do pool existe."""
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS invite_link_pool (
+                    invite_link TEXT PRIMARY KEY,
+                    created_at TEXT NOT NULL,
+                    expires_at TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    leased_to INTEGER,
+                    leased_at TEXT,
+                    used_by INTEGER,
+                    used_at TEXT,
+                    closed_at TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_invite_link_pool_status
+                ON invite_link_pool(status, expires_at)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_invite_link_pool_leased_to
+                ON invite_link_pool(leased_to)
+            """)
+
+    def add(self, invite_link: str, created_at: datetime, expires_at: datetime) -> None:
+        """
+        Registra um link recém-criado como disponível.
+
+        Args:
+            invite_link: URL do link
+            created_at: Momento da criação
+            expires_at: Expiração do link no Telegram
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO invite_link_pool (invite_link, created_at, expires_at, status) VALUES (?, ?, ?, ?)",
+                (invite_link, created_at.isoformat(), expires_at.isoformat(), LINK_AVAILABLE)
+            )
+
+    def lease(self, user_id: int, now: datetime, valid_until: datetime) -> Optional[str]:
+        """
+        Entrega um link ao usuário.
+
+        Um link já entregue a ele, ainda sem uso e válido até `valid_until`,
+        é devolvido de novo (pedido repetido); senão, o disponível que
+        expira primeiro entre os válidos até `valid_until`.
+
+        Args:
+            user_id: ID do usuário no Telegram
+            now: Momento do pedido
+            valid_until: Validade mínima do link entregue
+
+        Returns:
+            Optional[str]: URL do link, ou None se o pool está vazio
+        """
+        conn = self._connect(isolation_level=None)
+        try:
+            # Reserva exclusiva: dois pedidos simultâneos nunca recebem o mesmo link
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                """
+                SELECT invite_link FROM invite_link_pool
+                WHERE status = ? AND leased_to = ? AND expires_at >= ?
+                ORDER BY leased_at DESC LIMIT 1
+                """,
+                (LINK_LEASED, user_id, valid_until.isoformat())
+            ).fetchone()
+            if row is None:
+                row = conn.execute(
+                    """
+                    SELECT invite_link FROM invite_link_pool
+                    WHERE status = ? AND expires_at >= ?
+                    ORDER BY expires_at LIMIT 1
+                    """,
+                    (LINK_AVAILABLE, valid_until.isoformat())
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        "UPDATE invite_link_pool SET status = ?, leased_to = ?, leased_at = ? WHERE invite_link = ?",
+                        (LINK_LEASED, user_id, now.isoformat(), row[0])
+                    )
+            conn.execute("COMMIT")
+            return row[0] if row else None
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def add_leased(self, invite_link: str, user_id: int, created_at: datetime, expires_at: datetime) -> None:
+        """
+        Registra um link criado na hora (pool vazio) já entregue ao usuário.
+
+        Args:
+            invite_link: URL do link
+            user_id: ID do usuário no Telegram
+            created_at: Momento da criação
+            expires_at: Expiração do link no Telegram
+        """
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR IGNORE INTO invite_link_pool
+                    (invite_link, created_at, expires_at, status, leased_to, leased_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (invite_link, created_at.isoformat(), expires_at.isoformat(), LINK_LEASED, user_id, created_at.isoformat())
+            )
+
+    def mark_used(self, invite_link: str, user_id: int, used_at: datetime) -> Optional[Dict[str, Any]]:
+        """
+        Registra a entrada de um usuário pelo link.
+
+        Args:
+            invite_link: URL do link
+            user_id: Quem entrou
+            used_at: Momento da entrada
+
+        Returns:
+            Optional[dict]: Linha do link (com leased_to), ou None se não é do pool
+        """
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM invite_link_pool WHERE invite_link = ?", (invite_link,)).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE invite_link_pool SET status = ?, used_by = ?, used_at = ?, closed_at = ? WHERE invite_link = ?",
+                (LINK_USED, user_id, used_at.isoformat(), used_at.isoformat(), invite_link)
+            )
+        return dict(row)
+
+    def find_stale(self, now: datetime, valid_until: datetime) -> Dict[str, List[str]]:
+        """
+        Links a tirar de circulação.
+
+        Args:
+            now: Momento de referência
+            valid_until: Disponíveis que expiram antes disto não são mais entregues
+
+        Returns:
+            dict: 'revoke' (disponíveis quase expirados) e 'expired'
+            (entregues e não usados, já expirados no Telegram)
+        """
+        with self._connect() as conn:
+            revoke = conn.execute(
+                "SELECT invite_link FROM invite_link_pool WHERE status = ? AND expires_at < ?",
+                (LINK_AVAILABLE, valid_until.isoformat())
+            ).fetchall()
+            expired = conn.execute(
+                "SELECT invite_link FROM invite_link_pool WHERE status = ? AND expires_at < ?",
+                (LINK_LEASED, now.isoformat())
+            ).fetchall()
+        return {'revoke': [row[0] for row in revoke], 'expired': [row[0] for row in expired]}
+
+    def close(self, invite_links: List[str], status: str, closed_at: datetime) -> int:
+        """
+        Marca links como revogados ou expirados.
+
+        Args:
+            invite_links: URLs dos links
+            status: LINK_REVOKED ou LINK_EXPIRED
+            closed_at: Momento da baixa
+
+        Returns:
+            int: Linhas atualizadas
+        """
+        if not invite_links:
+            return 0
+        placeholders = ",".join("?" * len(invite_links))
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"UPDATE invite_link_pool SET status = ?, closed_at = ? WHERE invite_link IN ({placeholders})",
+                (status, closed_at.isoformat(), *invite_links)
+            )
+            return cursor.rowcount
+
+    def count_available(self, valid_until: datetime) -> int:
+        """
+        Links disponíveis para entrega.
+
+        Args:
+            valid_until: Validade mínima
+
+        Returns:
+            int: Quantidade
+        """
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM invite_link_pool WHERE status = ? AND expires_at >= ?",
+                (LINK_AVAILABLE, valid_until.isoformat())
+            ).fetchone()[0]
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Quantidade de links por status.
+
+        Returns:
+            dict: status -> quantidade
+        """
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM invite_link_pool GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def purge_closed(self, before: datetime) -> int:
+        """
+        Apaga links encerrados (usados, revogados, expirados) antigos.
+
+        Args:
+            before: Encerrados antes disto são apagados
+
+        Returns:
+            int: Linhas apagadas
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM invite_link_pool WHERE status IN (?, ?, ?) AND closed_at < ?",
+                (LINK_USED, LINK_REVOKED, LINK_EXPIRED, before.isoformat())
+            )
+            return cursor.rowcount
@@ -0,0 +1,188 @@
+"""
+Conjuntos de membros do grupo lidos do SQLite.
+
+Base do MembershipReconciler: cada consulta devolve um conjunto inteiro de
+user_ids (membros observados, administradores, e os que violam cada
+critério de permanência) em vez de buscar usuário por usuário. Tabelas ou
+colunas ausentes (banco novo, esquema antigo) resultam em conjunto vazio.
+"""
+
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Set
+
+logger = logging.getLogger(__name__)
+
+# Status em user_rules de membros que estão no grupo
+OBSERVED_STATUSES = ('pending', 'accepted')
+STATUS_REMOVED = "removed"
+STATUS_LEFT = "left"
+
+# Critérios de permanência (também usados como motivo da remoção)
+REASON_BANNED = "banned"
+REASON_RULES_EXPIRED = "rules_expired"
+REASON_CONTRACT_INACTIVE = "contract_inactive"
+REASON_NOT_VERIFIED = "not_verified"
+
+
+class SQLiteMembershipSets:
+    """Consultas por conjunto sobre users, user_rules, administrators e afins."""
+
+    def __init__(self, db_path: str):
+        """
+        Inicializa o leitor.
+
+        Args:
+            db_path: Caminho para o arquivo do banco SQLite
+        """
+        self.db_path = Path(db_path)
+
+    def observed_members(self) -> Dict[int, str]:
+        """
+        Membros que estão no grupo segundo o índice de membros (group_members).
+
+        Sem o índice (banco anterior a ele), usa user_rules.
+
+        Returns:
+            dict: user_id -> username
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            if self._columns(conn, "group_members"):
+                rows = conn.execute("SELECT user_id, username FROM group_members WHERE is_member = 1").fetchall()
+            elif self._columns(conn, "user_rules"):
+                rows = conn.execute(
+                    f"SELECT user_id, username FROM user_rules WHERE status IN {OBSERVED_STATUSES}"
+                ).fetchall()
+            else:
+                return {}
+        return {row[0]: row[1] or str(row[0]) for row in rows}
+
+    def removed_members(self) -> Dict[int, str]:
+        """
+        Membros removidos pelo sistema (candidatos a ter o acesso restaurado).
+
+        Returns:
+            dict: user_id -> username
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            if not self._columns(conn, "user_rules"):
+                return {}
+            rows = conn.execute(
+                "SELECT user_id, username FROM user_rules WHERE status = ?",
+                (STATUS_REMOVED,)
+            ).fetchall()
+        return {row[0]: row[1] or str(row[0]) for row in rows}
+
+    def admin_ids(self) -> Set[int]:
+        """
+        Administradores ativos.
+
+        Returns:
+            set: user_ids
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            if not self._columns(conn, "administrators"):
+                return set()
+            return self._ids(conn, "SELECT user_id FROM administrators WHERE is_active = 1")
+
+    def violations(self, now: datetime, rules_acceptance_hours: float, contract_confirmations: int) -> Dict[str, Set[int]]:
+        """
+        Usuários que violam cada critério de permanência no grupo.
+
+        - banned: desativados em users (is_active = 0)
+        - rules_expired: não aceitaram as regras no prazo (inclusive os já
+          removidos, para que não sejam restaurados)
+        - contract_inactive: sem serviço habilitado em `contract_confirmations`
+          consultas seguidas (contract_checks)
+        - not_verified: sem CPF e com a última verificação expirada,
+          falha ou cancelada (verificação pendente ainda está no prazo)
+
+        Args:
+            now: Momento de referência
+            rules_acceptance_hours: Prazo para aceitar as regras
+            contract_confirmations: Consultas inativas que confirmam o contrato inativo
+
+        Returns:
+            dict: motivo -> user_ids
+        """
+        result: Dict[str, Set[int]] = {
+            REASON_BANNED: set(),
+            REASON_RULES_EXPIRED: set(),
+            REASON_CONTRACT_INACTIVE: set(),
+            REASON_NOT_VERIFIED: set()
+        }
+        with sqlite3.connect(self.db_path) as conn:
+            users_columns = self._columns(conn, "users")
+            legacy_users = {'user_id', 'cpf', 'is_active'} <= users_columns
+
+            if legacy_users:
+                result[REASON_BANNED] = self._ids(conn, "SELECT user_id FROM users WHERE is_active = 0")
+
+            if self._columns(conn, "user_rules"):
+                result[REASON_RULES_EXPIRED] = self._ids(
+                    conn,
+                    """
+                    SELECT user_id FROM user_rules
+                    WHERE rules_accepted = 0 AND status IN ('pending', ?)
+                    AND julianday(joined_at) < julianday(?) - ? / 24.0
+                    """,
+                    (STATUS_REMOVED, now.isoformat(), rules_acceptance_hours)
+                )
+
+            if self._columns(conn, "contract_checks"):
+                result[REASON_CONTRACT_INACTIVE] = self._ids(
+                    conn,
+                    "SELECT user_id FROM contract_checks WHERE active = 0 AND inactive_streak >= ?",
+                    (contract_confirmations,)
+                )
+
+            if self._columns(conn, "cpf_verifications"):
+                with_cpf = "SELECT user_id FROM users WHERE cpf IS NOT NULL AND cpf != ''" if legacy_users else "SELECT NULL"
+                result[REASON_NOT_VERIFIED] = self._ids(
+                    conn,
+                    f"""
+                    SELECT v.user_id FROM cpf_verifications v
+                    WHERE v.created_at = (
+                        SELECT MAX(created_at) FROM cpf_verifications WHERE user_id = v.user_id
+                    )
+                    AND v.status IN ('expired', 'failed', 'cancelled')
+                    AND v.user_id NOT IN ({with_cpf})
+                    """
+                )
+        return result
+
+    def mark_status(self, user_ids: Iterable[int], status: str) -> int:
+        """
+        Atualiza o status em user_rules de vários membros de uma vez.
+
+        Args:
+            user_ids: IDs dos usuários
+            status: STATUS_REMOVED ou STATUS_LEFT
+
+        Returns:
+            int: Linhas atualizadas
+        """
+        ids = list(user_ids)
+        if not ids:
+            return 0
+        placeholders = ",".join("?" * len(ids))
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                f"UPDATE user_rules SET status = ? WHERE user_id IN ({placeholders})",
+                (status, *ids)
+            )
+            return cursor.rowcount
+
+    # Private helper methods
+
+    @staticmethod
+    def _columns(conn: sqlite3.Connection, table: str) -> Set[str]:
+        """Colunas da tabela (vazio se não existir)."""
+        return {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+
+    @staticmethod
+    def _ids(conn: sqlite3.Connection, query: str, params: tuple = ()) -> Set[int]:
+        """Primeira coluna da consulta como conjunto."""
+        return {row[0] for row in conn.execute(query, params) if row[0] is not None}
@@ -0,0 +1,152 @@
+"""
+Histórico de execuções de tarefas agendadas em SQLite.
+
+Cada execução do agendador grava uma linha em `scheduled_task_runs`.
+O último horário agendado de cada tarefa é o que permite recuperar,
+após um restart, as execuções perdidas enquanto o processo estava parado.
+"""
+
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteTaskRunHistory:
+    """Execuções de tarefas agendadas (sucesso, falha, timeout, pulada)."""
+
+    def __init__(self, db_path: str, retention_days: int = 30):
+        """
+        Inicializa o histórico.
+
+        Args:
+            db_path: Caminho para o arquivo do banco SQLite
+            retention_days: Dias mantidos por `purge_old_runs`
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.retention_days = retention_days
+        self._ensure_tables()
+
+    def _ensure_tables(self) -> None:
+        """Garante que a tabela de execuções existe."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS scheduled_task_runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    task_id TEXT NOT NULL,
+                    scheduled_for TEXT NOT NULL,
+                    started_at TEXT NOT NULL,
+                    finished_at TEXT NOT NULL,
+                    duration_seconds REAL NOT NULL,
+                    status TEXT NOT NULL,
+                    trigger TEXT NOT NULL DEFAULT 'schedule',
+                    error TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_scheduled_task_runs_task
+                ON scheduled_task_runs(task_id, scheduled_for)
+            """)
+
+    def record(
+        self,
+        task_id: str,
+        scheduled_for: datetime,
+        started_at: datetime,
+        finished_at: datetime,
+        status: str,
+        trigger: str = "schedule",
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Registra uma execução.
+
+        Args:
+            task_id: ID da tarefa
+            scheduled_for: Horário para o qual a execução estava agendada
+            started_at: Início real
+            finished_at: Fim
+            status: Valor de TaskStatus
+            trigger: Origem ('schedule', 'catch_up' ou 'manual')
+            error: Mensagem de erro (se houver)
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO scheduled_task_runs
+                    (task_id, scheduled_for, started_at, finished_at, duration_seconds, status, trigger, error)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    task_id,
+                    scheduled_for.isoformat(),
+                    started_at.isoformat(),
+                    finished_at.isoformat(),
+                    (finished_at - started_at).total_seconds(),
+                    status,
+                    trigger,
+                    error[:1000] if error else None
+                )
+            )
+
+    def last_scheduled_runs(self) -> Dict[str, datetime]:
+        """
+        Último horário agendado já executado (ou pulado) de cada tarefa.
+
+        Returns:
+            dict: task_id -> scheduled_for
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT task_id, MAX(scheduled_for) FROM scheduled_task_runs
+                WHERE trigger != 'manual'
+                GROUP BY task_id
+                """
+            ).fetchall()
+        return {task_id: datetime.fromisoformat(value) for task_id, value in rows}
+
+    def recent_runs(self, task_id: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Execuções mais recentes.
+
+        Args:
+            task_id: Filtra por tarefa (None = todas)
+            limit: Máximo de linhas
+
+        Returns:
+            list: Execuções da mais recente para a mais antiga
+        """
+        query = """
+            SELECT task_id, scheduled_for, started_at, finished_at, duration_seconds, status, trigger, error
+            FROM scheduled_task_runs
+        """
+        params: tuple = ()
+        if task_id:
+            query += " WHERE task_id = ?"
+            params = (task_id,)
+        query += " ORDER BY id DESC LIMIT ?"
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(query, params + (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def purge_old_runs(self) -> int:
+        """
+        Remove execuções mais antigas que `retention_days`.
+
+        Returns:
+            int: Linhas removidas
+        """
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute("DELETE FROM scheduled_task_runs WHERE started_at < ?", (cutoff,))
+            removed = cursor.rowcount
+        if removed:
+            logger.info(f"{removed} execuções antigas de tarefas removidas do histórico")
+        return removed
@@ -0,0 +1,6 @@
+"""
+Scheduling Infrastructure Layer.
+
+Agendador em processo das tarefas periódicas (antes executadas por
+cron externo) e as rotinas executadas por ele.
+"""
@@ -0,0 +1,275 @@
+"""
+Reverificação contínua de contratos no HubSoft.
+
+Em vez de consultar todos os membros de uma vez no checkup das 6:00, o
+ContractReverifier consulta alguns por minuto ao longo do dia. A taxa é
+recalculada a cada ciclo a partir do que sobra do orçamento da API
+(HubSoftRateLimiter) depois do uso interativo, nunca abaixo do mínimo que
+garante a janela de SLA. O resultado fica em `contract_checks` e o checkup
+diário remove quem teve contrato inativo confirmado.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional
+
+from ...integrations.hubsoft.rate_limiter import HubSoftRateLimiter
+from ..repositories.sqlite_contract_check_store import SQLiteContractCheckStore
+
+logger = logging.getLogger(__name__)
+
+# Consultas seguidas sem serviço habilitado antes de o checkup remover o membro
+CONFIRMATIONS_TO_REMOVE = 2
+
+
+def contract_fingerprint(client_data: Optional[Dict[str, Any]]) -> str:
+    """
+    Fingerprint dos serviços habilitados do cliente.
+
+    Args:
+        client_data: Retorno de cliente.lookup_client (None = sem serviço)
+
+    Returns:
+        str: Hash curto de (id, nome, status) dos serviços, em ordem
+    """
+    services = sorted(
+        (str(service.get('id')), service.get('nome') or '', service.get('status') or '')
+        for service in (client_data or {}).get('servicos') or []
+    )
+    payload = json.dumps({'active': bool(client_data), 'services': services})
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def fetch_contract(cpf: str) -> Optional[Dict[str, Any]]:
+    """
+    Consulta o cliente no HubSoft ignorando o cache (bloqueante).
+
+    O resultado volta para o cache, então o fluxo interativo também passa a
+    ver os dados atualizados. Falha de consulta (sem token, timeout, erro
+    HTTP) levanta exceção em vez de virar "sem serviço": uma queda do
+    HubSoft não pode contar como contrato inativo.
+
+    Args:
+        cpf: CPF do membro
+
+    Returns:
+        Optional[dict]: Dados do cliente com serviço habilitado, ou None se não há
+
+    Raises:
+        HubSoftLookupError: Se a consulta falhou
+    """
+    from ...integrations.hubsoft import cliente
+    from ...integrations.hubsoft.cache_manager import invalidate_client_cache
+
+    formatted_cpf = "".join(filter(str.isdigit, cpf))
+    invalidate_client_cache(formatted_cpf)
+    return cliente.lookup_client(formatted_cpf)
+
+
+def hubsoft_available() -> bool:
+    """Se há token de acesso ao HubSoft (bloqueante)."""
+    from ...integrations.hubsoft.token_manager import get_hubsoft_token
+    return get_hubsoft_token() is not None
+
+
+class ContractReverifier:
+    """
+    Consulta contratos em ritmo constante, os mais antigos primeiro.
+
+    Um membro fica vencido na metade da janela de SLA; a taxa mínima
+    (membros / meia janela) garante que todos os vencidos sejam consultados
+    antes de completar a janela inteira. Membros nunca consultados vêm
+    primeiro, depois os que mudaram recentemente (fingerprint diferente ou
+    CPF reverificado), que são consultados de novo após
+    `recheck_changed_minutes` para confirmar a mudança.
+    """
+
+    def __init__(
+        self,
+        store: SQLiteContractCheckStore,
+        limiter: HubSoftRateLimiter,
+        sla_hours: float = 24.0,
+        max_per_minute: float = 15.0,
+        interactive_reserve_per_minute: float = 10.0,
+        recheck_changed_minutes: float = 15.0,
+        changed_window_hours: float = 24.0,
+        tick_seconds: float = 60.0,
+        fetch: Callable[[str], Optional[Dict[str, Any]]] = fetch_contract,
+        is_api_available: Callable[[], bool] = hubsoft_available
+    ):
+        """
+        Inicializa o reverificador.
+
+        Args:
+            store: Última verificação por usuário
+            limiter: Rate limiter com o consumo atual da API
+            sla_hours: Janela em que todo membro é consultado
+            max_per_minute: Teto de consultas por minuto quando há orçamento sobrando
+            interactive_reserve_per_minute: Folga mantida para o uso interativo
+            recheck_changed_minutes: Espera até reconsultar quem mudou
+            changed_window_hours: Por quanto tempo uma mudança dá prioridade
+            tick_seconds: Duração de cada ciclo (taxa recalculada por ciclo)
+            fetch: Consulta bloqueante do cliente por CPF (levanta exceção se falhar)
+            is_api_available: Checagem bloqueante de acesso à API
+        """
+        self.store = store
+        self.limiter = limiter
+        self.sla = timedelta(hours=sla_hours)
+        self.max_per_minute = max_per_minute
+        self.interactive_reserve_per_minute = interactive_reserve_per_minute
+        self.recheck_changed = timedelta(minutes=recheck_changed_minutes)
+        self.changed_window = timedelta(hours=changed_window_hours)
+        self.tick_seconds = tick_seconds
+        self.fetch = fetch
+        self.is_api_available = is_api_available
+        self._own_requests: deque = deque()
+        self._credit = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._last_rate = 0.0
+        self._last_interactive = 0
+        self._stats = {
+            'ticks': 0,
+            'checks': 0,
+            'changed': 0,
+            'became_inactive': 0,
+            'errors': 0,
+            'api_unavailable': 0,
+            'sla_at_risk': 0
+        }
+
+    async def start(self) -> None:
+        """Inicia o loop em background."""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run(), name="contract-reverifier")
+        logger.info(f"Reverificação de contratos iniciada (SLA de {self.sla.total_seconds() / 3600:g}h)")
+
+    async def stop(self) -> None:
+        """Para o loop (uma consulta em andamento é abandonada)."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        logger.info("Reverificação de contratos parada")
+
+    # Private helper methods
+
+    async def _run(self) -> None:
+        """Executa ciclos até ser parado."""
+        while self._running:
+            try:
+                await self._tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Erro na reverificação de contratos: {e}")
+                await asyncio.sleep(self.tick_seconds)
+
+    async def _tick(self) -> None:
+        """Consulta a cota do ciclo, espaçada igualmente dentro dele."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        self._stats['ticks'] += 1
+
+        if not await asyncio.to_thread(self.is_api_available):
+            self._stats['api_unavailable'] += 1
+            logger.warning("HubSoft sem token de acesso; reverificação adiada")
+            await asyncio.sleep(self.tick_seconds)
+            return
+
+        rate = self._plan_rate(self.store.count_members())
+        self._credit += rate * self.tick_seconds / 60
+        quota = int(self._credit)
+        self._credit -= quota
+
+        now = datetime.now()
+        due = self.store.pick_due(
+            quota,
+            stale_before=now - self.sla / 2,
+            changed_since=now - self.changed_window,
+            recheck_changed_before=now - self.recheck_changed
+        ) if quota else []
+
+        spacing = self.tick_seconds / max(quota, 1)
+        for member in due:
+            await self._check(member)
+            await asyncio.sleep(spacing)
+
+        remaining = self.tick_seconds - (loop.time() - started)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+    def _plan_rate(self, members: int) -> float:
+        """Consultas por minuto para este ciclo."""
+        now = time.time()
+        while self._own_requests and now - self._own_requests[0] > 60:
+            self._own_requests.popleft()
+
+        recent = self.limiter.get_stats()['current_requests_per_minute']
+        interactive = max(0, recent - len(self._own_requests))
+        hard_cap = max(0.0, self.limiter.max_requests_per_minute - interactive)
+        spare = max(0.0, hard_cap - self.interactive_reserve_per_minute)
+        # Vencido na metade do SLA + esta taxa = consultado antes do fim do SLA
+        required = members / (self.sla.total_seconds() / 120)
+
+        rate = min(max(required, min(spare, self.max_per_minute)), hard_cap)
+        if rate < required:
+            self._stats['sla_at_risk'] += 1
+            logger.warning(
+                f"Orçamento do HubSoft insuficiente para o SLA: {rate:.1f}/min disponíveis, "
+                f"{required:.1f}/min necessários ({interactive} req/min interativas)"
+            )
+
+        self._last_rate = rate
+        self._last_interactive = interactive
+        return rate
+
+    async def _check(self, member: Dict[str, Any]) -> None:
+        """Consulta um membro e grava o resultado."""
+        user_id = member['user_id']
+        self._own_requests.append(time.time())
+        try:
+            client_data = await asyncio.to_thread(self.fetch, member['cpf'])
+        except Exception as e:
+            # Sem resposta do HubSoft não há resultado: nada é gravado e o
+            # membro continua vencido para a próxima rodada
+            self._stats['errors'] += 1
+            logger.error(f"Erro ao reverificar contrato do usuário {user_id}: {e}")
+            return
+
+        active = bool(client_data)
+        changed = self.store.record_check(user_id, contract_fingerprint(client_data), active, datetime.now())
+        self._stats['checks'] += 1
+
+        if changed:
+            self._stats['changed'] += 1
+            logger.info(f"Contrato do usuário {user_id} mudou; nova consulta em {self.recheck_changed}")
+        if member['active'] and not active:
+            self._stats['became_inactive'] += 1
+            logger.warning(f"Usuário {user_id} sem serviço habilitado no HubSoft")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas da reverificação.
+
+        Returns:
+            dict: Contadores, taxa atual e cobertura do SLA
+        """
+        return {
+            **self._stats,
+            'running': self._running,
+            'rate_per_minute': round(self._last_rate, 2),
+            'interactive_per_minute': self._last_interactive,
+            **self.store.coverage(datetime.now() - self.sla)
+        }
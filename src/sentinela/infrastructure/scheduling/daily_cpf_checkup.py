@@ -0,0 +1,596 @@
+"""
+Verificação diária de CPF.
+
+Verifica:
+1. Usuários do grupo sem CPF cadastrado
+2. Verificações de CPF expiradas (24h)
+3. Remove usuários que não confirmaram CPF
+4. Detecta e resolve CPFs duplicados
+
+Executada pelo DeadlineScheduler dentro do processo do bot (tarefa
+`check_member_cpf_daily`) ou manualmente por `scripts/daily_cpf_checkup.py`.
+O progresso de cada fase fica em SQLiteCheckupStore, então uma execução
+interrompida é retomada de onde parou.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from ...domain.value_objects.identifiers import UserId
+from ...domain.entities.cpf_verification import VerificationStatus
+from ...domain.events.user_events import UserBanned
+from ...domain.events.group_events import MemberLeftGroupEvent
+from ..events.transport import RemoteEventBus
+from ..external_services.group_client import GroupClient
+from ..external_services.message_scheduler import OutboundMessageScheduler, SendPriority
+from ...core.config import CONTRACT_REVERIFY_ENABLED, HUBSOFT_ENABLED
+from ..repositories.sqlite_checkup_store import SQLiteCheckupStore, RUN_COMPLETED
+from ..repositories.sqlite_contract_check_store import SQLiteContractCheckStore
+from ..repositories.sqlite_membership_sets import SQLiteMembershipSets, STATUS_REMOVED
+from .contract_reverifier import CONFIRMATIONS_TO_REMOVE
+
+logger = logging.getLogger(__name__)
+
+# Fases com checkpoint (checkup_checkpoints.phase)
+PHASE_SYNC_ADMINS = "sync_admins"
+PHASE_EXPIRED = "expired_verifications"
+PHASE_CONTRACTS = "active_contracts"
+PHASE_WITHOUT_CPF = "members_without_cpf"
+PHASE_DUPLICATES = "duplicates"
+
+# Decisões da fase de contratos (checkup_decisions.decision)
+DECISION_KEEP = "keep"
+DECISION_REMOVE = "remove"
+DECISION_SKIP_ADMIN = "skip_admin"
+
+# Verificações expiradas conferidas na fase de expiradas
+EXPIRED_LOOKBACK = timedelta(days=7)
+EXPIRED_SCAN_LIMIT = 500
+
+
+class DailyCPFCheckup:
+    """Gerencia a verificação diária de CPF usando nova arquitetura."""
+
+    def __init__(
+        self,
+        container: Any,
+        bot: Any,
+        outbound: OutboundMessageScheduler,
+        group_id: int,
+        bot_events: RemoteEventBus,
+        batch_size: int = 100,
+        contract_check_concurrency: int = 4
+    ):
+        """
+        Inicializa o checkup.
+
+        Args:
+            container: Container DI já configurado
+            bot: Bot do Telegram (remoções e consulta de administradores)
+            outbound: Fila de envios (DMs em massa com prioridade BULK)
+            group_id: ID do grupo verificado
+            bot_events: Eventos e invalidações de cache para o bot
+            batch_size: Membros por lote na fase de contratos
+            contract_check_concurrency: Consultas simultâneas ao HubSoft
+        """
+        self.container = container
+        self.bot = bot
+        self.outbound = outbound
+        self.group_id = group_id
+        self.bot_events = bot_events
+        self.user_repo = container.get("user_repository")
+        self.cpf_verification_repo = container.get("cpf_verification_repository")
+        self.cpf_use_case = container.get("cpf_verification_use_case")
+        self.hubsoft_use_case = container.get("hubsoft_integration_use_case")
+        self.admin_repo = container.get("admin_repository")
+        self.store = container.get(SQLiteCheckupStore)
+        # Com a reverificação contínua ligada, a fase de contratos só aplica o resultado dela
+        self.contract_checks: Optional[SQLiteContractCheckStore] = (
+            container.get(SQLiteContractCheckStore) if CONTRACT_REVERIFY_ENABLED and HUBSOFT_ENABLED else None
+        )
+        # Removidos aqui saem do conjunto observado pela reconciliação de membros
+        self.membership_sets = container.get(SQLiteMembershipSets)
+        self.batch_size = batch_size
+        self.contract_check_concurrency = contract_check_concurrency
+        self.run_id: Optional[str] = None
+        self.since: Optional[datetime] = None
+
+    async def run_checkup(self, incremental: bool = False) -> bool:
+        """
+        Executa verificação diária completa.
+
+        Se a execução anterior foi interrompida (processo morto, timeout,
+        erro), ela é retomada: fases concluídas são puladas e a fase de
+        contratos continua do último lote gravado.
+
+        Args:
+            incremental: Verifica contratos só de usuários criados ou
+                verificados desde o último checkup concluído
+
+        Returns:
+            bool: True se a execução foi concluída
+        """
+        since = None
+        if incremental:
+            last = self.store.last_completed_run()
+            if last:
+                since = datetime.fromisoformat(last['started_at'])
+            else:
+                logger.info("Nenhum checkup concluído anteriormente; executando verificação completa")
+
+        self.run_id, resumed = self.store.start_or_resume("incremental" if since else "full", since)
+        run = self.store.get_run(self.run_id)
+        # Uma retomada mantém o modo da execução original
+        self.since = datetime.fromisoformat(run['since']) if run['since'] else None
+
+        logger.info("=" * 60)
+        logger.info("🔍 INICIANDO VERIFICAÇÃO DIÁRIA DE CPF")
+        logger.info(f"📅 Data: {datetime.now().strftime('%d/%m/%Y %H:%M')}")
+        if resumed:
+            logger.info(f"↩️ Retomando execução {self.run_id} iniciada em {run['started_at']}")
+        logger.info("=" * 60)
+
+        try:
+            for phase, method in (
+                # Fase 1: Sincronizar lista de administradores
+                (PHASE_SYNC_ADMINS, self._phase_sync_admins),
+                # Fase 2: Processar verificações expiradas
+                (PHASE_EXPIRED, self._phase1_process_expired_verifications),
+                # Fase 3: Verificar contratos ativos de membros existentes
+                (PHASE_CONTRACTS, self._phase_check_active_contracts),
+                # Fase 4: Verificar membros do grupo sem CPF
+                (PHASE_WITHOUT_CPF, self._phase2_check_members_without_cpf),
+                # Fase 5: Detectar e resolver duplicatas
+                (PHASE_DUPLICATES, self._phase3_handle_duplicates),
+            ):
+                checkpoint = self.store.get_checkpoint(self.run_id, phase)
+                if checkpoint['completed']:
+                    logger.info(f"⏭️ Fase '{phase}' já concluída nesta execução")
+                    continue
+
+                await method()
+
+                checkpoint = self.store.get_checkpoint(self.run_id, phase)
+                self.store.save_checkpoint(
+                    self.run_id, phase, checkpoint['last_key'], checkpoint['counters'], completed=True
+                )
+
+            # Fase 6: Estatísticas finais
+            await self._phase4_final_stats()
+
+            self.store.finish_run(self.run_id, RUN_COMPLETED)
+            self.store.purge_old_runs()
+
+            logger.info("=" * 60)
+            logger.info("✅ VERIFICAÇÃO DIÁRIA CONCLUÍDA COM SUCESSO")
+            logger.info("=" * 60)
+            return True
+
+        except Exception as e:
+            logger.error(
+                f"❌ ERRO CRÍTICO durante checkup (execução {self.run_id} será retomada): {e}",
+                exc_info=True
+            )
+            return False
+        finally:
+            # Remoções e invalidações chegam ao bot pelo transporte de eventos
+            await self.bot_events.flush()
+
+    async def _phase_sync_admins(self):
+        """Busca os admins atuais do grupo no Telegram e sincroniza com o banco de dados."""
+        logger.info("\n" + "=" * 60)
+        logger.info("👤 FASE 1: Sincronizando Administradores")
+        logger.info("=" * 60)
+        
+        try:
+            logger.info("Buscando administradores do grupo no Telegram...")
+            tg_admins = await self.bot.get_chat_administrators(self.group_id)
+            
+            formatted_admins = []
+            for admin in tg_admins:
+                if not admin.user.is_bot:
+                    formatted_admins.append({
+                        "user_id": admin.user.id,
+                        "username": admin.user.username,
+                        "first_name": admin.user.first_name,
+                        "last_name": admin.user.last_name,
+                        "status": admin.status,
+                    })
+            
+            logger.info(f"Encontrados {len(formatted_admins)} administradores. Sincronizando com o banco de dados...")
+            
+            synced_count = await self.admin_repo.sync_from_telegram(formatted_admins)
+            await self.bot_events.invalidate_cache("admins")
+            
+            logger.info(f"✅ Sincronização concluída. {synced_count} administradores ativos no banco.")
+
+        except Exception as e:
+            logger.error(f"Erro na fase de sincronização de administradores: {e}", exc_info=True)
+
+    async def _phase1_process_expired_verifications(self):
+        """Fase 1: Processa verificações expiradas e remove usuários."""
+        logger.info("\n" + "=" * 60)
+        logger.info("📋 FASE 1: Processando Verificações Expiradas")
+        logger.info("=" * 60)
+
+        # Expira as pendentes vencidas (a tarefa expire_old_verifications também faz isso)
+        result = await self.cpf_use_case.process_expired_verifications()
+        logger.info(f"⏰ Verificações expiradas agora: {result.get('processed_count', 0)}")
+
+        # Remove quem tem verificação expirada e continua no grupo, não importa
+        # quem a expirou: só "expiradas agora" deixaria de fora as da tarefa horária
+        expired_verifications = await self.cpf_verification_repo.find_by_status(
+            VerificationStatus.EXPIRED,
+            limit=EXPIRED_SCAN_LIMIT
+        )
+        cutoff = datetime.now() - EXPIRED_LOOKBACK
+        pending_removal = {}
+        for verification in expired_verifications:
+            if verification.completed_at and verification.completed_at >= cutoff:
+                pending_removal.setdefault(verification.user_id.value, verification)
+
+        group_client = self.container.get(GroupClient)
+        removed_count = 0
+        for user_id, verification in pending_removal.items():
+            # Uma verificação mais nova (concluída ou pendente) substitui a expirada
+            latest = await self.cpf_verification_repo.find_by_user_id(UserId(user_id), limit=1)
+            if latest and latest[0].status != VerificationStatus.EXPIRED:
+                continue
+
+            # Não remove administradores
+            if await self.admin_repo.is_administrator(user_id):
+                logger.info(f"⏭️ Pulando administrador: {user_id}")
+                continue
+
+            # Já removido (por este checkup ou outra rotina) ou saiu sozinho
+            if not await group_client.is_user_in_group(user_id):
+                continue
+
+            if not await group_client.remove_user_from_group(user_id):
+                continue
+
+            removed_count += 1
+            self.membership_sets.mark_status([user_id], STATUS_REMOVED)
+            logger.warning(f"🚫 Usuário {user_id} removido por não confirmar CPF em 24h")
+
+            await self.bot_events.publish(MemberLeftGroupEvent(
+                user_id=user_id,
+                username=verification.username,
+                left_at=datetime.now()
+            ))
+
+            # Tenta enviar mensagem privada explicando
+            try:
+                await self.outbound.send_message(
+                    chat_id=user_id,
+                    text=(
+                        "⚠️ **Remoção por Segurança**\n\n"
+                        "Você foi removido do grupo OnCabo Gaming por não completar "
+                        "a verificação de CPF dentro do prazo de 24 horas.\n\n"
+                        "🔒 **Motivo:** Medida de segurança do grupo\n"
+                        "⏰ **Prazo:** 24 horas (expirado)\n\n"
+                        "📱 **Para retornar ao grupo:**\n"
+                        "1. Complete sua verificação de CPF\n"
+                        "2. Entre em contato com um administrador\n\n"
+                        "💡 Use /verificar_cpf para iniciar nova verificação"
+                    ),
+                    parse_mode='Markdown',
+                    priority=SendPriority.BULK
+                )
+            except Exception:
+                pass  # Ignora se não conseguir enviar DM
+
+        logger.info(f"🚫 Total de usuários removidos: {removed_count}")
+        logger.info(f"🧹 Verificações antigas limpas: {result.get('cleanup_count', 0)}")
+
+    async def _phase2_check_members_without_cpf(self):
+        """Fase 2: Verifica membros do grupo sem CPF cadastrado."""
+        logger.info("\n" + "=" * 60)
+        logger.info("👥 FASE 2: Verificando Membros sem CPF")
+        logger.info("=" * 60)
+
+        try:
+            # Busca membros do grupo (limitado a admins via API, mas podemos verificar quem já tem CPF)
+            # Para grupos grandes, requer bot admin com permissões especiais
+
+            admins = await self.bot.get_chat_administrators(self.group_id)
+            members_checked = 0
+            members_without_cpf = 0
+            requests_sent = 0
+
+            for admin in admins:
+                user_id = admin.user.id
+
+                if admin.user.is_bot:
+                    continue
+
+                members_checked += 1
+                user_id_vo = UserId(user_id)
+
+                # Verifica se tem CPF no banco
+                user = await self.user_repo.find_by_id(user_id_vo)
+
+                if not user or not user.cpf:
+                    # Verifica se já tem verificação pendente
+                    pending = await self.cpf_verification_repo.find_by_user_id(user_id_vo)
+
+                    if not pending or pending.status != VerificationStatus.PENDING:
+                        # Cria nova solicitação de verificação
+                        result = await self.cpf_use_case.start_verification(
+                            user_id=user_id,
+                            username=admin.user.username or admin.user.first_name,
+                            user_mention=f"@{admin.user.username}" if admin.user.username else admin.user.first_name,
+                            verification_type="auto_checkup",
+                            source_action="daily_checkup"
+                        )
+
+                        if result.success:
+                            # Envia mensagem privada
+                            try:
+                                await self.outbound.send_message(
+                                    chat_id=user_id,
+                                    text=(
+                                        "🔐 **Verificação de Segurança - OnCabo Gaming**\n\n"
+                                        "Olá! Detectamos que você ainda não completou sua "
+                                        "verificação de CPF no sistema.\n\n"
+                                        "⏰ **Você tem 24 horas** para completar a verificação\n"
+                                        "🔒 **Sem verificação:** Remoção automática do grupo\n\n"
+                                        "📱 **Para verificar:**\n"
+                                        "Use o comando /verificar_cpf aqui no privado\n\n"
+                                        "⚠️ **Importante:** Esta é uma medida de segurança para "
+                                        "proteger todos os membros do grupo."
+                                    ),
+                                    parse_mode='Markdown',
+                                    priority=SendPriority.BULK
+                                )
+                                requests_sent += 1
+                                logger.info(f"📤 Solicitação enviada para {user_id}")
+                            except Exception as dm_error:
+                                logger.warning(f"Não foi possível enviar DM para {user_id}: {dm_error}")
+
+                        members_without_cpf += 1
+
+            logger.info(f"👥 Membros verificados: {members_checked}")
+            logger.info(f"❌ Sem CPF: {members_without_cpf}")
+            logger.info(f"📤 Solicitações enviadas: {requests_sent}")
+
+        except Exception as e:
+            logger.error(f"Erro na Fase 2: {e}", exc_info=True)
+
+    async def _phase3_handle_duplicates(self):
+        """Fase 3: Detecta e reporta CPFs duplicados."""
+        logger.info("\n" + "=" * 60)
+        logger.info("🔍 FASE 3: Verificando CPFs Duplicados")
+        logger.info("=" * 60)
+
+        try:
+            duplicate_service = self.container.get("duplicate_cpf_service")
+
+            # Obtém estatísticas de duplicatas
+            stats = await duplicate_service.get_duplicate_statistics(days=30)
+
+            duplicate_count = stats.get('duplicate_cpfs', 0)
+            logger.info(f"🔍 CPFs únicos: {stats.get('unique_cpfs', 0)}")
+            logger.info(f"⚠️ CPFs duplicados: {duplicate_count}")
+            logger.info(f"📊 Taxa de duplicação: {stats.get('duplicate_rate', 0):.2f}%")
+
+            if duplicate_count > 0:
+                most_duplicated = stats.get('most_duplicated')
+                if most_duplicated:
+                    logger.warning(
+                        f"🚨 CPF mais duplicado: "
+                        f"{most_duplicated['duplicate_count']} contas - "
+                        f"IDs: {most_duplicated['user_ids']}"
+                    )
+
+        except Exception as e:
+            logger.error(f"Erro na Fase 3: {e}", exc_info=True)
+
+    async def _phase4_final_stats(self):
+        """Fase 4: Estatísticas finais."""
+        logger.info("\n" + "=" * 60)
+        logger.info("📊 FASE 4: Estatísticas Finais")
+        logger.info("=" * 60)
+
+        try:
+            # Conta verificações por status
+            pending_verifications = await self.cpf_verification_repo.find_by_status(
+                VerificationStatus.PENDING,
+                limit=1000
+            )
+
+            completed_verifications = await self.cpf_verification_repo.find_by_status(
+                VerificationStatus.COMPLETED,
+                limit=1000
+            )
+
+            expired_verifications = await self.cpf_verification_repo.find_by_status(
+                VerificationStatus.EXPIRED,
+                limit=1000
+            )
+
+            logger.info(f"✅ Verificações completas: {len(completed_verifications)}")
+            logger.info(f"⏳ Verificações pendentes: {len(pending_verifications)}")
+            logger.info(f"⏰ Verificações expiradas: {len(expired_verifications)}")
+
+        except Exception as e:
+            logger.error(f"Erro ao obter estatísticas: {e}")
+
+    async def _phase_check_active_contracts(self):
+        """
+        Verifica contratos ativos de usuários com CPF e remove os inativos.
+
+        Percorre os membros em lotes ordenados por user_id (keyset). A decisão
+        de cada usuário é gravada antes de ser aplicada e o checkpoint da fase
+        a cada lote; numa retomada, usuários já decididos não são consultados
+        de novo no HubSoft (remoções decididas e não aplicadas são concluídas).
+        Erros inesperados sobem para `run_checkup`, que deixa a execução
+        pendente de retomada.
+
+        Com a reverificação contínua (ContractReverifier), nenhum membro é
+        consultado aqui: são removidos os que tiveram contrato inativo
+        confirmado em `contract_checks`.
+        """
+        logger.info("\n" + "=" * 60)
+        logger.info("💼 FASE NOVA: Verificando Contratos Ativos de Membros")
+        logger.info("=" * 60)
+
+        checkpoint = self.store.get_checkpoint(self.run_id, PHASE_CONTRACTS)
+        last_key = checkpoint['last_key']
+        counters = {
+            'checked': 0, 'kept': 0, 'removed': 0, 'skipped_admin': 0, 'reused': 0, 'errors': 0, 'unchecked': 0
+        }
+        counters.update(checkpoint['counters'])
+
+        if last_key is not None:
+            logger.info(f"↩️ Retomando após user_id {last_key} ({counters['checked']} já verificados)")
+        if self.since:
+            logger.info(f"🕒 Modo incremental: usuários criados ou verificados desde {self.since:%d/%m/%Y %H:%M}")
+
+        semaphore = asyncio.Semaphore(self.contract_check_concurrency)
+
+        while True:
+            batch = self.store.fetch_members_with_cpf(last_key, self.batch_size, changed_since=self.since)
+            if not batch:
+                break
+
+            user_ids = [m['user_id'] for m in batch]
+            decided = self.store.get_decisions(self.run_id, PHASE_CONTRACTS, user_ids)
+            checks = self.contract_checks.get_checks(user_ids) if self.contract_checks else {}
+            await asyncio.gather(*(
+                self._check_member_contract(
+                    member, decided.get(member['user_id']), checks.get(member['user_id']), counters, semaphore
+                )
+                for member in batch
+            ))
+
+            last_key = batch[-1]['user_id']
+            self.store.save_checkpoint(self.run_id, PHASE_CONTRACTS, last_key, counters)
+            logger.info(f"📦 Lote até user_id {last_key}: {counters}")
+
+            if len(batch) < self.batch_size:
+                break
+
+        logger.info(f"✅ Verificação de contratos concluída. Total de usuários removidos: {counters['removed']}")
+
+    async def _check_member_contract(
+        self,
+        member: Dict[str, Any],
+        prior: Optional[Dict[str, Any]],
+        check: Optional[Dict[str, Any]],
+        counters: Dict[str, int],
+        semaphore: asyncio.Semaphore
+    ) -> None:
+        """Decide e aplica a situação de um membro (reaproveitando decisão anterior)."""
+        user_id = member['user_id']
+        username = member['username'] or str(user_id)
+
+        if prior:
+            counters['reused'] += 1
+            if prior['decision'] == DECISION_REMOVE and not prior['applied']:
+                await self._remove_inactive_member(user_id, username, member['cpf'], counters)
+            return
+
+        if await self.admin_repo.is_administrator(user_id):
+            logger.info(f"⏭️  Pulando verificação de contrato para o administrador {username} (ID: {user_id})")
+            self.store.record_decision(self.run_id, PHASE_CONTRACTS, user_id, DECISION_SKIP_ADMIN)
+            counters['skipped_admin'] += 1
+            return
+
+        if self.contract_checks is not None:
+            self._apply_contract_check(member, check, counters)
+            if check and not check['active'] and check['inactive_streak'] >= CONFIRMATIONS_TO_REMOVE:
+                await self._remove_inactive_member(user_id, username, member['cpf'], counters)
+            return
+
+        logger.info(f"📋 Verificando contrato para {username} (ID: {user_id})...")
+        try:
+            async with semaphore:
+                result = await self.hubsoft_use_case.verify_user_in_hubsoft(
+                    user_id=user_id,
+                    cpf=member['cpf'],
+                    force_refresh=True
+                )
+        except Exception as e:
+            # Sem decisão gravada: o usuário é consultado de novo numa retomada
+            counters['errors'] += 1
+            logger.error(f"Erro ao verificar contrato de {username} (ID: {user_id}): {e}")
+            return
+
+        counters['checked'] += 1
+        if not result.success or not result.data:
+            logger.warning(f"Contrato inativo ou não encontrado para {username} (ID: {user_id}). Removendo do grupo.")
+            self.store.record_decision(self.run_id, PHASE_CONTRACTS, user_id, DECISION_REMOVE, result.message)
+            await self._remove_inactive_member(user_id, username, member['cpf'], counters)
+        else:
+            self.store.record_decision(self.run_id, PHASE_CONTRACTS, user_id, DECISION_KEEP)
+            counters['kept'] += 1
+            logger.info(f"✅ Contrato ativo para {username} (ID: {user_id}). Acesso mantido.")
+
+    def _apply_contract_check(
+        self,
+        member: Dict[str, Any],
+        check: Optional[Dict[str, Any]],
+        counters: Dict[str, int]
+    ) -> None:
+        """Grava a decisão a partir da última reverificação do membro."""
+        user_id = member['user_id']
+        if check is None:
+            # Entrou há pouco; a reverificação contínua consulta dentro do SLA
+            counters['unchecked'] += 1
+            self.store.record_decision(self.run_id, PHASE_CONTRACTS, user_id, DECISION_KEEP, "Ainda não reverificado")
+            return
+
+        if not check['active'] and check['inactive_streak'] >= CONFIRMATIONS_TO_REMOVE:
+            logger.warning(
+                f"Contrato inativo confirmado para {member['username'] or user_id} (ID: {user_id}) "
+                f"em {check['last_contract_check_at']}. Removendo do grupo."
+            )
+            self.store.record_decision(
+                self.run_id, PHASE_CONTRACTS, user_id, DECISION_REMOVE,
+                f"Sem serviço habilitado em {check['inactive_streak']} consultas"
+            )
+            return
+
+        self.store.record_decision(self.run_id, PHASE_CONTRACTS, user_id, DECISION_KEEP)
+        counters['kept'] += 1
+
+    async def _remove_inactive_member(self, user_id: int, username: str, cpf: str, counters: Dict[str, int]) -> None:
+        """Remove do grupo um membro com contrato inativo e o notifica."""
+        try:
+            await self.bot.ban_chat_member(chat_id=self.group_id, user_id=user_id)
+            await self.bot.unban_chat_member(chat_id=self.group_id, user_id=user_id, only_if_banned=True)
+            # Removido do grupo: uma retomada não repete a remoção
+            self.store.mark_applied(self.run_id, PHASE_CONTRACTS, user_id)
+            self.membership_sets.mark_status([user_id], STATUS_REMOVED)
+            counters['removed'] += 1
+
+            await self.user_repo.ban_user(user_id=UserId(user_id), reason="Contrato inativo ou cancelado (checkup diário)")
+
+            # Bot descarta o status de contrato em cache e processa o banimento
+            await self.bot_events.invalidate_cache("hubsoft_client", cpf)
+            await self.bot_events.publish(UserBanned(
+                user_id=user_id,
+                username=username,
+                reason="Contrato inativo ou cancelado (checkup diário)",
+                banned_by="daily_cpf_checkup",
+                ban_date=datetime.now()
+            ))
+
+            await self.outbound.send_message(
+                chat_id=user_id,
+                text=(
+                    "🚫 Acesso ao grupo OnCabo Gaming removido 🚫\n\n"
+                    "Olá! Em nossa verificação diária, identificamos que seu plano OnCabo Gaming não se encontra mais ativo.\n\n"
+                    "Por esse motivo, seu acesso ao grupo exclusivo foi revogado para manter a comunidade apenas para membros ativos.\n\n"
+                    "Se você acredita que isso é um erro ou gostaria de reativar seu plano para voltar a participar, "
+                    "por favor, entre em contato com nosso suporte comercial."
+                ),
+                priority=SendPriority.BULK
+            )
+            logger.info(f"Usuário {user_id} removido do grupo e notificado por DM.")
+
+        except Exception as e:
+            logger.error(f"Falha ao remover/notificar usuário {user_id}: {e}")
@@ -0,0 +1,367 @@
+"""
+Agendador de tarefas por deadline.
+
+Mantém um min-heap com o próximo horário de cada tarefa registrada no
+ScheduledTasksUseCase e dorme até o mais próximo, em vez de varrer todas
+as tarefas periodicamente. Execuções perdidas enquanto o processo estava
+parado são recuperadas a partir do histórico em SQLite, conforme a
+CatchUpPolicy de cada tarefa.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from ...application.use_cases.scheduled_tasks_use_case import (
+    ScheduledTasksUseCase,
+    TaskExecutionResult
+)
+from ...domain.value_objects.scheduled_task import CatchUpPolicy, ScheduledTask, TaskStatus
+from ..repositories.sqlite_task_run_history import SQLiteTaskRunHistory
+from .job_lease import LeaseLostError, SQLiteJobLeaseStore, default_owner_id
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineScheduler:
+    """
+    Dispara as tarefas do ScheduledTasksUseCase nos seus horários.
+
+    Cada entrada do heap é (disparo com jitter, sequência, task_id,
+    horário agendado). Execuções rodam em tasks separadas, limitadas por
+    `max_concurrency`; se a execução anterior da mesma tarefa ainda não
+    terminou, a nova é registrada como SKIPPED. Com `lease_store`, cada
+    execução adquire o lease do job (task_id) e também é pulada se um
+    script manual estiver executando o mesmo job.
+    """
+
+    def __init__(
+        self,
+        use_case: ScheduledTasksUseCase,
+        history: SQLiteTaskRunHistory,
+        max_concurrency: int = 2,
+        max_catch_up_runs: int = 10,
+        lease_store: Optional[SQLiteJobLeaseStore] = None,
+        lease_ttl_seconds: float = 120.0
+    ):
+        """
+        Inicializa o agendador.
+
+        Args:
+            use_case: Use case com as tarefas registradas
+            history: Histórico de execuções (também usado no catch-up)
+            max_concurrency: Tarefas executando ao mesmo tempo
+            max_catch_up_runs: Limite de execuções recuperadas por tarefa (RUN_ALL)
+            lease_store: Leases compartilhados com os scripts (opcional)
+            lease_ttl_seconds: Validade do lease sem heartbeat
+        """
+        self.use_case = use_case
+        self.history = history
+        self.max_concurrency = max_concurrency
+        self.max_catch_up_runs = max_catch_up_runs
+        self.lease_store = lease_store
+        self.lease_ttl_seconds = lease_ttl_seconds
+        self.owner_id = default_owner_id("bot")
+        self._heap: List[Tuple[datetime, int, str, datetime]] = []
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._running_jobs: Dict[str, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+        self._stats = {
+            'dispatched': 0,
+            'completed': 0,
+            'failed': 0,
+            'timed_out': 0,
+            'skipped_overlap': 0,
+            'skipped_lease': 0,
+            'caught_up': 0,
+            'missed_skipped': 0,
+            'manual_runs': 0
+        }
+
+    async def start(self) -> None:
+        """Agenda as tarefas registradas e inicia o loop em background."""
+        if self._running:
+            return
+
+        self._running = True
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        try:
+            self.history.purge_old_runs()
+            last_runs = self.history.last_scheduled_runs()
+        except Exception as e:
+            logger.error(f"Histórico de tarefas indisponível, catch-up desativado: {e}")
+            last_runs = {}
+
+        now = datetime.now()
+        for task in self.use_case.get_tasks():
+            self._schedule_initial(task, last_runs.get(task.task_id), now)
+
+        self._task = asyncio.create_task(self._run(), name="deadline-scheduler")
+        logger.info(f"Agendador de tarefas iniciado ({len(self._heap)} tarefas agendadas)")
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """
+        Para o loop e aguarda as execuções em andamento.
+
+        Args:
+            timeout: Tempo máximo de espera pelas execuções (segundos)
+        """
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        jobs = list(self._running_jobs.values())
+        if jobs:
+            done, pending = await asyncio.wait(jobs, timeout=timeout)
+            for job in pending:
+                job.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                logger.warning(f"{len(pending)} tarefas agendadas canceladas no encerramento")
+
+        self._heap.clear()
+        logger.info("Agendador de tarefas parado")
+
+    async def run_now(self, task_id: str) -> Optional[TaskExecutionResult]:
+        """
+        Executa uma tarefa imediatamente, sem alterar o próximo horário.
+
+        Args:
+            task_id: ID da tarefa
+
+        Returns:
+            Optional[TaskExecutionResult]: Resultado, ou None se a tarefa
+            já estiver em execução (neste processo ou em um script)
+
+        Raises:
+            KeyError: Se a tarefa não estiver registrada
+        """
+        task = self.use_case.get_task(task_id)
+        if task is None:
+            raise KeyError(task_id)
+        if task_id in self._running_jobs:
+            return None
+
+        self._stats['manual_runs'] += 1
+        job = asyncio.create_task(
+            self._execute(task_id, [datetime.now()], task.next_run, "manual"),
+            name=f"scheduled-task-{task_id}"
+        )
+        self._running_jobs[task_id] = job
+        return await job
+
+    # Private helper methods
+
+    def _schedule_initial(self, task: ScheduledTask, last_run: Optional[datetime], now: datetime) -> None:
+        """Calcula o primeiro disparo da tarefa, tratando execuções perdidas."""
+        if last_run is None:
+            # Primeira vez: cron/intervalo a partir de agora, senão o next_run da fábrica
+            if task.cron or task.interval_seconds:
+                self._push(task, task.next_run_after(now))
+            else:
+                self._push(task, max(task.next_run, now))
+            return
+
+        missed: List[datetime] = []
+        moment = task.next_run_after(last_run)
+        while moment <= now:
+            missed.append(moment)
+            moment = task.next_run_after(moment)
+        # `moment` agora é o primeiro horário futuro
+
+        if missed and task.is_enabled:
+            if task.catch_up == CatchUpPolicy.SKIP:
+                self._stats['missed_skipped'] += len(missed)
+                logger.info(f"Tarefa '{task.name}': {len(missed)} execuções perdidas ignoradas")
+            else:
+                runs = missed[-1:] if task.catch_up == CatchUpPolicy.RUN_ONCE else missed[-self.max_catch_up_runs:]
+                self._stats['caught_up'] += len(runs)
+                logger.info(
+                    f"Tarefa '{task.name}': {len(missed)} execuções perdidas, "
+                    f"recuperando {len(runs)}"
+                )
+                self._dispatch(task, runs, moment, "catch_up")
+
+        self._push(task, moment)
+
+    def _push(self, task: ScheduledTask, scheduled_for: datetime) -> None:
+        """Insere o próximo horário da tarefa no heap."""
+        if scheduled_for == datetime.max:
+            return  # TaskFrequency.ONCE já executada
+
+        fire_at = scheduled_for
+        if task.jitter_seconds:
+            fire_at += timedelta(seconds=random.uniform(0, task.jitter_seconds))
+
+        heapq.heappush(self._heap, (fire_at, next(self._sequence), task.task_id, scheduled_for))
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Loop principal: dorme até o deadline mais próximo."""
+        while self._running:
+            try:
+                if not self._heap:
+                    await self._wakeup.wait()
+                    self._wakeup.clear()
+                    continue
+
+                delay = (self._heap[0][0] - datetime.now()).total_seconds()
+                if delay > 0:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                _, _, task_id, scheduled_for = heapq.heappop(self._heap)
+                task = self.use_case.get_task(task_id)
+                if task is None:
+                    continue
+
+                now = datetime.now()
+                next_run = task.next_run_after(scheduled_for)
+                if next_run <= now:
+                    # Loop ficou para trás (ex.: event loop bloqueado); não acumula disparos
+                    next_run = task.next_run_after(now)
+
+                if task.is_enabled:
+                    self._dispatch(task, [scheduled_for], next_run, "schedule")
+                self._push(task, next_run)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Erro no agendador de tarefas: {e}")
+                await asyncio.sleep(1)
+
+    def _dispatch(self, task: ScheduledTask, runs: List[datetime], next_run: datetime, trigger: str) -> None:
+        """Inicia a execução, ou registra SKIPPED se a anterior ainda roda."""
+        if task.task_id in self._running_jobs:
+            self._stats['skipped_overlap'] += 1
+            logger.warning(f"Tarefa '{task.name}' ainda em execução; disparo de {runs[-1]} pulado")
+            now = datetime.now()
+            self._record(task.task_id, runs[-1], now, now, TaskStatus.SKIPPED, trigger, "Execução anterior em andamento")
+            return
+
+        self._stats['dispatched'] += len(runs)
+        self._running_jobs[task.task_id] = asyncio.create_task(
+            self._execute(task.task_id, runs, next_run, trigger),
+            name=f"scheduled-task-{task.task_id}"
+        )
+
+    async def _execute(
+        self,
+        task_id: str,
+        runs: List[datetime],
+        next_run: datetime,
+        trigger: str
+    ) -> Optional[TaskExecutionResult]:
+        """Executa os horários informados em sequência, dentro do semáforo."""
+        result = None
+        try:
+            for scheduled_for in runs:
+                async with self._semaphore:
+                    result = await self._run_with_lease(task_id, scheduled_for, next_run)
+
+                if result is None:
+                    self._stats['skipped_lease'] += 1
+                    now = datetime.now()
+                    holder = await asyncio.to_thread(self.lease_store.get_lease, task_id) if self.lease_store else None
+                    self._record(
+                        task_id, scheduled_for, now, now, TaskStatus.SKIPPED, trigger,
+                        f"Job em execução por {holder['owner_id'] if holder else 'outro processo'}"
+                    )
+                    continue
+
+                if result.status == TaskStatus.COMPLETED:
+                    self._stats['completed'] += 1
+                elif result.status == TaskStatus.TIMED_OUT:
+                    self._stats['timed_out'] += 1
+                else:
+                    self._stats['failed'] += 1
+
+                self._record(
+                    task_id, scheduled_for, result.started_at, result.finished_at,
+                    result.status, trigger, result.error
+                )
+        finally:
+            self._running_jobs.pop(task_id, None)
+        return result
+
+    async def _run_with_lease(
+        self,
+        task_id: str,
+        scheduled_for: datetime,
+        next_run: datetime
+    ) -> Optional[TaskExecutionResult]:
+        """Executa a tarefa segurando o lease do job; None se o lease está em uso."""
+        if self.lease_store is None:
+            return await self.use_case.run_task(task_id, scheduled_for=scheduled_for, next_run=next_run)
+
+        started_at = datetime.now()
+        try:
+            async with self.lease_store.lease(task_id, self.owner_id, self.lease_ttl_seconds) as lease:
+                if not lease.acquired:
+                    return None
+                return await self.use_case.run_task(task_id, scheduled_for=scheduled_for, next_run=next_run)
+        except LeaseLostError as e:
+            # Execução interrompida: outro processo assumiu o job
+            finished_at = datetime.now()
+            return TaskExecutionResult(
+                success=False,
+                task_id=task_id,
+                message="Lease perdido durante a execução",
+                started_at=started_at,
+                finished_at=finished_at,
+                duration_seconds=(finished_at - started_at).total_seconds(),
+                status=TaskStatus.FAILED,
+                error=str(e)
+            )
+
+    def _record(
+        self,
+        task_id: str,
+        scheduled_for: datetime,
+        started_at: datetime,
+        finished_at: datetime,
+        status: TaskStatus,
+        trigger: str,
+        error: Optional[str]
+    ) -> None:
+        """Grava a execução no histórico sem interromper o agendador."""
+        try:
+            self.history.record(task_id, scheduled_for, started_at, finished_at, status.value, trigger, error)
+        except Exception as e:
+            logger.error(f"Erro ao gravar histórico da tarefa {task_id}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do agendador.
+
+        Returns:
+            dict: Contadores, tarefas em execução e próximos disparos
+        """
+        upcoming = sorted(self._heap)[:5]
+        return {
+            **self._stats,
+            'running': sorted(self._running_jobs),
+            'scheduled': len(self._heap),
+            'next_deadlines': [
+                {'task_id': task_id, 'fire_at': fire_at.isoformat()}
+                for fire_at, _, task_id, _ in upcoming
+            ]
+        }
@@ -0,0 +1,377 @@
+"""
+Leases de jobs em SQLite.
+
+Impede que o mesmo job em lote (checkup diário, prazo das regras,
+expiração de verificações) rode em dois processos ao mesmo tempo: o bot
+(agendador interno) e os scripts manuais adquirem o lease antes de
+executar e o renovam enquanto executam. Um lease sem heartbeat dentro do
+TTL (processo que morreu) é retomado automaticamente pelo próximo.
+
+O store é síncrono; JobLease chama as operações com asyncio.to_thread para
+não travar o event loop enquanto o SQLite espera por lock.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseLostError(Exception):
+    """O lease foi retomado por outro processo enquanto o job executava."""
+
+
+def default_owner_id(origin: str) -> str:
+    """
+    Identificador do dono do lease para este processo.
+
+    Args:
+        origin: Nome do processo (ex.: 'bot', 'daily_cpf_checkup')
+
+    Returns:
+        str: origin@host:pid
+    """
+    return f"{origin}@{socket.gethostname()}:{os.getpid()}"
+
+
+class SQLiteJobLeaseStore:
+    """
+    Tabela de leases compartilhada entre processos.
+
+    Cada operação abre a própria conexão e usa `BEGIN IMMEDIATE`, então a
+    verificação do dono atual e a gravação do novo dono são atômicas
+    mesmo com vários processos disputando o mesmo job.
+    """
+
+    def __init__(self, db_path: str, default_ttl_seconds: float = 120.0, timeout: float = 10.0):
+        """
+        Inicializa o store.
+
+        Args:
+            db_path: Caminho do banco SQLite compartilhado
+            default_ttl_seconds: TTL usado quando o lease não informa outro
+            timeout: Tempo de espera por lock do SQLite (segundos)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.default_ttl_seconds = default_ttl_seconds
+        self.timeout = timeout
+        self._stats = {
+            'acquired': 0,
+            'contended': 0,
+            'reclaimed': 0,
+            'renew_failures': 0,
+            'released': 0
+        }
+        self._ensure_table_exists()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=self.timeout, isolation_level=None)
+
+    def _ensure_table_exists(self) -> None:
+        """Cria a tabela de leases se não existir."""
+        conn = self._connect()
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS job_leases (
+                    job_name TEXT PRIMARY KEY,
+                    owner_id TEXT NOT NULL,
+                    acquired_at TEXT NOT NULL,
+                    heartbeat_at TEXT NOT NULL,
+                    expires_at TEXT NOT NULL
+                )
+            """)
+        finally:
+            conn.close()
+
+    def try_acquire(self, job_name: str, owner_id: str, ttl_seconds: Optional[float] = None) -> bool:
+        """
+        Tenta adquirir o lease do job.
+
+        Sucede se não houver lease, se o lease atual estiver expirado
+        (retomado de um processo que morreu) ou se já pertencer a `owner_id`.
+
+        Args:
+            job_name: Nome do job
+            owner_id: Dono que está adquirindo
+            ttl_seconds: Validade sem heartbeat (padrão: default_ttl_seconds)
+
+        Returns:
+            bool: True se o lease é de `owner_id` agora
+        """
+        now = datetime.now()
+        expires_at = now + timedelta(seconds=ttl_seconds or self.default_ttl_seconds)
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT owner_id, expires_at FROM job_leases WHERE job_name = ?",
+                (job_name,)
+            ).fetchone()
+
+            if row and row[0] != owner_id and row[1] > now.isoformat():
+                conn.execute("ROLLBACK")
+                self._stats['contended'] += 1
+                return False
+
+            if row and row[0] != owner_id:
+                self._stats['reclaimed'] += 1
+                logger.warning(f"Lease expirado de '{job_name}' retomado de {row[0]} (expirou em {row[1]})")
+
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO job_leases (job_name, owner_id, acquired_at, heartbeat_at, expires_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (job_name, owner_id, now.isoformat(), now.isoformat(), expires_at.isoformat())
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+        self._stats['acquired'] += 1
+        return True
+
+    def renew(self, job_name: str, owner_id: str, ttl_seconds: Optional[float] = None) -> bool:
+        """
+        Registra heartbeat e estende a validade do lease.
+
+        Args:
+            job_name: Nome do job
+            owner_id: Dono do lease
+            ttl_seconds: Nova validade a partir de agora
+
+        Returns:
+            bool: False se o lease não pertence mais a `owner_id`
+        """
+        now = datetime.now()
+        expires_at = now + timedelta(seconds=ttl_seconds or self.default_ttl_seconds)
+
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                """
+                UPDATE job_leases SET heartbeat_at = ?, expires_at = ?
+                WHERE job_name = ? AND owner_id = ?
+                """,
+                (now.isoformat(), expires_at.isoformat(), job_name, owner_id)
+            )
+            renewed = cursor.rowcount == 1
+        finally:
+            conn.close()
+
+        if not renewed:
+            self._stats['renew_failures'] += 1
+        return renewed
+
+    def release(self, job_name: str, owner_id: str) -> bool:
+        """
+        Libera o lease (apenas se ainda pertencer a `owner_id`).
+
+        Args:
+            job_name: Nome do job
+            owner_id: Dono do lease
+
+        Returns:
+            bool: True se o lease foi removido
+        """
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                "DELETE FROM job_leases WHERE job_name = ? AND owner_id = ?",
+                (job_name, owner_id)
+            )
+            released = cursor.rowcount == 1
+        finally:
+            conn.close()
+
+        if released:
+            self._stats['released'] += 1
+        return released
+
+    def get_lease(self, job_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Retorna o lease atual do job.
+
+        Args:
+            job_name: Nome do job
+
+        Returns:
+            Optional[dict]: Dados do lease ou None
+        """
+        conn = self._connect()
+        try:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM job_leases WHERE job_name = ?", (job_name,)).fetchone()
+        finally:
+            conn.close()
+        return dict(row) if row else None
+
+    def list_leases(self) -> List[Dict[str, Any]]:
+        """
+        Lista os leases registrados (inclusive expirados ainda não retomados).
+
+        Returns:
+            list: Leases ordenados por job
+        """
+        conn = self._connect()
+        try:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute("SELECT * FROM job_leases ORDER BY job_name").fetchall()
+        finally:
+            conn.close()
+        return [dict(row) for row in rows]
+
+    def lease(
+        self,
+        job_name: str,
+        owner_id: str,
+        ttl_seconds: Optional[float] = None,
+        wait_timeout: float = 0.0,
+        poll_interval: float = 5.0
+    ) -> 'JobLease':
+        """
+        Cria o context manager assíncrono do lease.
+
+        Exemplo:
+            async with store.lease("check_member_cpf_daily", owner) as lease:
+                if lease.acquired:
+                    await run()
+
+        Args:
+            job_name: Nome do job
+            owner_id: Dono do lease
+            ttl_seconds: Validade sem heartbeat
+            wait_timeout: Tempo esperando o lease ficar livre (0 = não espera)
+            poll_interval: Intervalo entre tentativas durante a espera
+
+        Returns:
+            JobLease: Context manager
+        """
+        return JobLease(
+            self, job_name, owner_id,
+            ttl_seconds or self.default_ttl_seconds,
+            wait_timeout, poll_interval
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do store.
+
+        Returns:
+            dict: Contadores de aquisição, disputa e retomada
+        """
+        return dict(self._stats)
+
+
+class JobLease:
+    """
+    Lease adquirido na entrada e liberado na saída do `async with`.
+
+    Enquanto o bloco executa, uma task renova o lease a cada terço do TTL.
+    Se a renovação falhar (lease retomado por outro processo após um
+    travamento longo), `lost` passa a True e a task que entrou no bloco é
+    cancelada: o `async with` termina com LeaseLostError em vez de seguir
+    executando em paralelo com o novo dono.
+    """
+
+    def __init__(
+        self,
+        store: SQLiteJobLeaseStore,
+        job_name: str,
+        owner_id: str,
+        ttl_seconds: float,
+        wait_timeout: float,
+        poll_interval: float
+    ):
+        self.store = store
+        self.job_name = job_name
+        self.owner_id = owner_id
+        self.ttl_seconds = ttl_seconds
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.acquired = False
+        self.lost = False
+        self.holder: Optional[str] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._guarded_task: Optional[asyncio.Task] = None
+        self._exiting = False
+
+    async def __aenter__(self) -> 'JobLease':
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.wait_timeout
+
+        while True:
+            self.acquired = await asyncio.to_thread(
+                self.store.try_acquire, self.job_name, self.owner_id, self.ttl_seconds
+            )
+            if self.acquired or loop.time() >= deadline:
+                break
+            await asyncio.sleep(min(self.poll_interval, max(deadline - loop.time(), 0)))
+
+        if self.acquired:
+            self._guarded_task = asyncio.current_task()
+            self._heartbeat_task = asyncio.create_task(
+                self._heartbeat(), name=f"job-lease-{self.job_name}"
+            )
+        else:
+            current = await asyncio.to_thread(self.store.get_lease, self.job_name)
+            self.holder = current['owner_id'] if current else None
+            logger.info(f"Job '{self.job_name}' em execução por {self.holder}; {self.owner_id} não executará")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # A partir daqui o heartbeat não cancela mais o bloco
+        self._exiting = True
+
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+
+        if self.acquired and not self.lost:
+            await asyncio.to_thread(self.store.release, self.job_name, self.owner_id)
+
+        # Cancelamento pedido pelo heartbeat (e nenhum outro pendente): vira LeaseLostError
+        if self.lost and exc_type is asyncio.CancelledError and self._guarded_task.uncancel() == 0:
+            raise LeaseLostError(
+                f"Lease de '{self.job_name}' perdido por {self.owner_id} durante a execução"
+            ) from exc
+
+    async def _heartbeat(self) -> None:
+        """Renova o lease até o bloco terminar ou o lease ser perdido."""
+        interval = self.ttl_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                renewed = await asyncio.to_thread(
+                    self.store.renew, self.job_name, self.owner_id, self.ttl_seconds
+                )
+            except sqlite3.Error as e:
+                # Banco ocupado: tenta de novo no próximo intervalo (ainda dentro do TTL)
+                logger.warning(f"Falha ao renovar lease de '{self.job_name}': {e}")
+                continue
+
+            if not renewed:
+                self.lost = True
+                logger.error(
+                    f"Lease de '{self.job_name}' perdido por {self.owner_id}; "
+                    f"interrompendo a execução para não rodar junto com o novo dono"
+                )
+                if not self._exiting:
+                    self._guarded_task.cancel()
+                return
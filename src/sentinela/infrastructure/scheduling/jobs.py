@@ -0,0 +1,90 @@
+"""
+Rotinas executadas pelo agendador dentro do processo do bot.
+
+Associa o task_id das tarefas padrão (ScheduledTask.create_*) à rotina
+que as executa, reaproveitando o container, o bot e a fila de envios já
+inicializados. Tarefas sem rotina aqui apenas publicam
+ScheduledTaskTriggeredEvent.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from ...application.use_cases.scheduled_tasks_use_case import TaskHandler
+from ...core.config import TELEGRAM_GROUP_ID
+from ..backup.sqlite_backup import BackupManager
+from ..events.transport import RemoteEventBus, SQLiteEventTransport
+from ..external_services.invite_link_pool import InviteLinkPool
+from ..external_services.message_scheduler import OutboundMessageScheduler
+from .daily_cpf_checkup import DailyCPFCheckup
+from .membership_index_sync import MembershipIndexSync
+from .membership_reconciler import MembershipReconciler
+
+logger = logging.getLogger(__name__)
+
+
+def build_task_handlers(container: Any, bot: Any) -> Dict[str, TaskHandler]:
+    """
+    Cria as rotinas das tarefas padrão.
+
+    Args:
+        container: Container DI configurado
+        bot: Bot do Telegram da aplicação
+
+    Returns:
+        dict: task_id -> coroutine function
+    """
+    async def check_expired_rules():
+        result = await container.get("welcome_management_use_case").check_expired_rules_acceptance()
+        if not result.success:
+            raise RuntimeError(result.message)
+
+    async def expire_old_verifications():
+        result = await container.get("cpf_verification_use_case").process_expired_verifications()
+        if not result.get('success', True):
+            raise RuntimeError(result.get('error', 'Falha ao expirar verificações'))
+
+    async def check_member_cpf_daily():
+        # Remoções e invalidações seguem pelo mesmo transporte usado pelo script
+        checkup = DailyCPFCheckup(
+            container=container,
+            bot=bot,
+            outbound=container.get(OutboundMessageScheduler),
+            group_id=int(TELEGRAM_GROUP_ID),
+            bot_events=RemoteEventBus(container.get(SQLiteEventTransport), origin="scheduler")
+        )
+        if not await checkup.run_checkup():
+            raise RuntimeError("Checkup interrompido; será retomado na próxima execução")
+
+    async def cleanup_inactive_members():
+        await container.get(MembershipReconciler).reconcile()
+
+    async def cleanup_expired_invites():
+        pool = container.get(InviteLinkPool)
+        await pool.revoke_stale()
+        # Histórico de links encerrados (usados, revogados, expirados) por 30 dias
+        await pool.purge_closed(datetime.now() - timedelta(days=30))
+
+    async def sync_membership_index():
+        await container.get(MembershipIndexSync).run_once()
+
+    async def backup_databases():
+        # Cópia e exports bloqueiam: rodam fora do event loop, em lotes de páginas
+        backups = container.get(BackupManager)
+        set_dir = await asyncio.to_thread(backups.create_set, "auto")
+        problems = await asyncio.to_thread(backups.verify_set, set_dir)
+        if problems:
+            raise RuntimeError(f"Backup {set_dir.name} não confere: {'; '.join(problems)}")
+        backups.rotate(label="auto")
+
+    return {
+        "backup_databases": backup_databases,
+        "cleanup_inactive_members": cleanup_inactive_members,
+        "sync_membership_index": sync_membership_index,
+        "cleanup_expired_invites": cleanup_expired_invites,
+        "check_expired_rules": check_expired_rules,
+        "expire_old_verifications": expire_old_verifications,
+        "check_member_cpf_daily": check_member_cpf_daily,
+    }
@@ -0,0 +1,159 @@
+"""
+Conferência periódica do índice de membros contra o Telegram.
+
+O índice (MembershipIndex) é mantido pelos updates chat_member, mas perde
+mudanças feitas com o bot parado ou fora do webhook. A cada execução, esta
+rotina compara a contagem de membros do grupo com a do índice, atualiza os
+administradores e confere alguns usuários com getChatMember (os nunca
+conferidos primeiro, depois os conferidos há mais tempo), em ritmo baixo.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from telegram.error import BadRequest, RetryAfter, TelegramError
+
+from ..external_services.message_scheduler import TokenBucket
+from ..repositories.membership_index import SOURCE_SYNC, MembershipIndex
+
+logger = logging.getLogger(__name__)
+
+
+class MembershipIndexSync:
+    """Corrige divergências do índice de membros em lotes pequenos."""
+
+    def __init__(
+        self,
+        index: MembershipIndex,
+        group_id: int,
+        bot: Any = None,
+        checks_per_run: int = 60,
+        calls_per_second: float = 1.0
+    ):
+        """
+        Inicializa a conferência.
+
+        Args:
+            index: Índice de membros
+            group_id: ID do grupo
+            bot: Instância de telegram.Bot (pode ser definida depois com `bind`)
+            checks_per_run: Usuários conferidos por execução
+            calls_per_second: Chamadas à API por segundo
+        """
+        self.index = index
+        self.group_id = group_id
+        self._bot = bot
+        self.checks_per_run = checks_per_run
+        self._bucket = TokenBucket(calls_per_second, 1.0)
+        self._last_count_drift: Optional[int] = None
+        self._stats = {
+            'runs': 0,
+            'checked': 0,
+            'corrected': 0,
+            'errors': 0,
+            'interrupted': 0
+        }
+
+    def bind(self, bot: Any) -> None:
+        """
+        Define o bot usado nas consultas.
+
+        Args:
+            bot: Instância de telegram.Bot
+        """
+        self._bot = bot
+
+    async def run_once(self) -> Dict[str, int]:
+        """
+        Executa uma rodada de conferência.
+
+        Returns:
+            dict: checked, corrected e count_drift desta rodada
+        """
+        if self._bot is None:
+            raise RuntimeError("MembershipIndexSync sem bot configurado")
+        if not self.index.is_loaded:
+            self.index.load()
+
+        self._stats['runs'] += 1
+        result = {'checked': 0, 'corrected': 0, 'count_drift': 0}
+
+        try:
+            for admin in await self._call(self._bot.get_chat_administrators, chat_id=self.group_id):
+                self._record(admin, result)
+
+            for user_id in self.index.due_for_sync(self.checks_per_run):
+                try:
+                    member = await self._call(self._bot.get_chat_member, chat_id=self.group_id, user_id=user_id)
+                except BadRequest as e:
+                    # Conta apagada ou usuário que nunca esteve no grupo
+                    logger.debug(f"getChatMember falhou para {user_id}: {e}")
+                    result['checked'] += 1
+                    if self.index.apply(user_id, 'left', source=SOURCE_SYNC):
+                        result['corrected'] += 1
+                    continue
+                self._record(member, result)
+
+            # Depois das correções: o que sobra são membros que o índice nunca viu
+            count = await self._call(self._bot.get_chat_member_count, chat_id=self.group_id)
+            result['count_drift'] = count - self.index.member_count()
+            self._last_count_drift = result['count_drift']
+
+        except RetryAfter as e:
+            # A próxima rodada continua de onde esta parou (verified_at)
+            self._stats['interrupted'] += 1
+            logger.warning(f"RetryAfter na conferência do índice de membros ({e.retry_after}); rodada encerrada")
+        except TelegramError as e:
+            self._stats['errors'] += 1
+            logger.error(f"Erro na conferência do índice de membros: {e}")
+            raise
+
+        self._stats['checked'] += result['checked']
+        self._stats['corrected'] += result['corrected']
+        if result['corrected'] or result['count_drift']:
+            logger.info(
+                f"Índice de membros conferido: {result['checked']} consultas, "
+                f"{result['corrected']} correções, diferença de contagem {result['count_drift']:+d}"
+            )
+        return result
+
+    # Private helper methods
+
+    def _record(self, member: Any, result: Dict[str, int]) -> None:
+        """Grava o ChatMember retornado pela API."""
+        user = member.user
+        result['checked'] += 1
+        changed = self.index.apply(
+            user.id,
+            member.status,
+            username=user.username or user.first_name,
+            is_member=getattr(member, 'is_member', None),
+            source=SOURCE_SYNC
+        )
+        if changed:
+            result['corrected'] += 1
+
+    async def _call(self, method, **kwargs) -> Any:
+        """Chama a API após obter token do bucket."""
+        wait = self._bucket.time_until_token(time.monotonic())
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._bucket.time_until_token(time.monotonic())
+        self._bucket.consume(time.monotonic())
+        return await method(**kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas da conferência.
+
+        Returns:
+            dict: Contadores, diferença de contagem e estatísticas do índice
+        """
+        return {
+            **self._stats,
+            # Membros do grupo - membros no índice, na última rodada
+            'count_drift': self._last_count_drift,
+            'index': self.index.get_stats()
+        }
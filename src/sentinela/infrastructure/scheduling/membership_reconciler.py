@@ -0,0 +1,302 @@
+"""
+Reconciliação dos membros do grupo.
+
+Compara três conjuntos lidos de uma vez do banco: os membros desejados
+(verificados, com contrato ativo, regras aceitas e não banidos), os
+observados no grupo (group_members, mantida pelos updates chat_member) e os
+administradores. A diferença vira uma lista de ações executada em lotes
+pelo MembershipActionExecutor; em modo simulação, só o relatório é gerado.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ...domain.events.user_events import UserBanned
+from ..events.event_bus import EventBus
+from ..external_services.membership_executor import (
+    ACTION_REMOVE,
+    ACTION_RESTORE,
+    ActionOutcome,
+    MembershipAction,
+    MembershipActionExecutor
+)
+from ..external_services.message_scheduler import OutboundMessageScheduler, SendPriority
+from ..repositories.membership_index import SOURCE_LOOKUP, MembershipIndex
+from ..repositories.sqlite_membership_sets import (
+    REASON_BANNED,
+    REASON_CONTRACT_INACTIVE,
+    REASON_NOT_VERIFIED,
+    REASON_RULES_EXPIRED,
+    STATUS_LEFT,
+    STATUS_REMOVED,
+    SQLiteMembershipSets
+)
+from .contract_reverifier import CONFIRMATIONS_TO_REMOVE
+
+logger = logging.getLogger(__name__)
+
+# Ordem de precedência do motivo quando o membro viola mais de um critério
+REASON_ORDER = (REASON_BANNED, REASON_RULES_EXPIRED, REASON_NOT_VERIFIED, REASON_CONTRACT_INACTIVE)
+
+REASON_LABELS = {
+    REASON_BANNED: "Usuário desativado",
+    REASON_RULES_EXPIRED: "Não aceitou regras em 24 horas",
+    REASON_NOT_VERIFIED: "Verificação de CPF não concluída",
+    REASON_CONTRACT_INACTIVE: "Contrato inativo ou cancelado",
+    ACTION_RESTORE: "Critérios atendidos novamente"
+}
+
+REMOVAL_MESSAGES = {
+    REASON_RULES_EXPIRED: (
+        "🚫 Você foi removido do grupo OnCabo Gaming por não aceitar as regras em 24 horas.\n\n"
+        "Para voltar, solicite um novo convite e aceite as regras ao entrar."
+    ),
+    REASON_NOT_VERIFIED: (
+        "🚫 Você foi removido do grupo OnCabo Gaming porque a verificação de CPF não foi concluída.\n\n"
+        "Use /verificar_cpf aqui no privado para verificar e voltar ao grupo."
+    ),
+    REASON_CONTRACT_INACTIVE: (
+        "🚫 Acesso ao grupo OnCabo Gaming removido: seu plano não se encontra mais ativo.\n\n"
+        "Se acredita que isso é um erro, entre em contato com nosso suporte comercial."
+    )
+}
+
+
+@dataclass
+class ReconciliationPlan:
+    """Diferença entre os membros desejados e os observados."""
+
+    generated_at: datetime
+    observed_count: int
+    admin_count: int
+    violations: Dict[str, int]
+    actions: List[MembershipAction] = field(default_factory=list)
+
+    @property
+    def removals(self) -> List[MembershipAction]:
+        return [a for a in self.actions if a.action == ACTION_REMOVE]
+
+    @property
+    def restores(self) -> List[MembershipAction]:
+        return [a for a in self.actions if a.action == ACTION_RESTORE]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Contagens do plano.
+
+        Returns:
+            dict: Observados, administradores, remoções por motivo e restaurações
+        """
+        by_reason: Dict[str, int] = {}
+        for action in self.removals:
+            by_reason[action.reason] = by_reason.get(action.reason, 0) + 1
+        return {
+            'observed': self.observed_count,
+            'admins': self.admin_count,
+            'remove': len(self.removals),
+            'remove_by_reason': by_reason,
+            'restore': len(self.restores),
+            'violations': self.violations
+        }
+
+    def format_report(self, limit: int = 50) -> str:
+        """
+        Relatório legível do plano (modo simulação).
+
+        Args:
+            limit: Máximo de ações listadas
+
+        Returns:
+            str: Relatório
+        """
+        summary = self.summary()
+        lines = [
+            f"Reconciliação de membros ({self.generated_at:%d/%m/%Y %H:%M})",
+            f"  Observados no grupo: {summary['observed']}",
+            f"  Administradores (ignorados): {summary['admins']}",
+            f"  Remoções: {summary['remove']}",
+        ]
+        for reason in REASON_ORDER:
+            if reason in summary['remove_by_reason']:
+                lines.append(f"    - {REASON_LABELS[reason]}: {summary['remove_by_reason'][reason]}")
+        lines.append(f"  Restaurações: {summary['restore']}")
+
+        if self.actions:
+            lines.append("")
+            for action in self.actions[:limit]:
+                lines.append(
+                    f"  {action.action:<8} {action.user_id:>12}  {action.username:<24} "
+                    f"{REASON_LABELS.get(action.reason, action.reason)}"
+                )
+            if len(self.actions) > limit:
+                lines.append(f"  ... e mais {len(self.actions) - limit} ações")
+        return "\n".join(lines)
+
+
+class MembershipReconciler:
+    """
+    Calcula e aplica a diferença entre membros desejados e observados.
+
+    Remove = observados ∩ (violam algum critério) − administradores.
+    Restaura = removidos pelo sistema que não violam mais nenhum critério
+    (ex.: contrato reativado), liberando o usuário para entrar de novo.
+    """
+
+    def __init__(
+        self,
+        sets: SQLiteMembershipSets,
+        executor: MembershipActionExecutor,
+        event_bus: EventBus,
+        outbound: OutboundMessageScheduler,
+        index: Optional[MembershipIndex] = None,
+        rules_acceptance_hours: float = 24.0,
+        max_removals: int = 50
+    ):
+        """
+        Inicializa o reconciliador.
+
+        Args:
+            sets: Conjuntos de membros do banco
+            executor: Executor das ações no Telegram
+            event_bus: Barramento para UserBanned (auditoria)
+            outbound: Fila de envios (aviso por DM aos removidos)
+            index: Índice de membros, atualizado sem esperar o update chat_member
+            rules_acceptance_hours: Prazo para aceitar as regras
+            max_removals: Acima disto o plano não é aplicado (proteção contra dados inconsistentes)
+        """
+        self.sets = sets
+        self.executor = executor
+        self.event_bus = event_bus
+        self.outbound = outbound
+        self.index = index
+        self.rules_acceptance_hours = rules_acceptance_hours
+        self.max_removals = max_removals
+        self._last_summary: Optional[Dict[str, Any]] = None
+        self._stats = {
+            'runs': 0,
+            'applied': 0,
+            'blocked': 0,
+            'removed': 0,
+            'restored': 0,
+            'failed': 0
+        }
+
+    def plan(self, now: Optional[datetime] = None) -> ReconciliationPlan:
+        """
+        Calcula o plano em uma passada sobre os conjuntos.
+
+        Args:
+            now: Momento de referência (padrão: agora)
+
+        Returns:
+            ReconciliationPlan: Ações necessárias
+        """
+        now = now or datetime.now()
+        observed = self.sets.observed_members()
+        removed = self.sets.removed_members()
+        admins = self.sets.admin_ids()
+        violations = self.sets.violations(now, self.rules_acceptance_hours, CONFIRMATIONS_TO_REMOVE)
+
+        reason_of: Dict[int, str] = {}
+        for reason in reversed(REASON_ORDER):
+            for user_id in violations[reason]:
+                reason_of[user_id] = reason
+
+        actions = [
+            MembershipAction(ACTION_REMOVE, user_id, observed[user_id], reason_of[user_id])
+            for user_id in sorted((observed.keys() & reason_of.keys()) - admins)
+        ]
+        actions += [
+            MembershipAction(ACTION_RESTORE, user_id, removed[user_id], ACTION_RESTORE)
+            for user_id in sorted(removed.keys() - reason_of.keys())
+        ]
+
+        return ReconciliationPlan(
+            generated_at=now,
+            observed_count=len(observed),
+            admin_count=len(admins),
+            violations={reason: len(ids) for reason, ids in violations.items()},
+            actions=actions
+        )
+
+    async def reconcile(self, dry_run: bool = False, max_removals: Optional[int] = None) -> ReconciliationPlan:
+        """
+        Calcula o plano e, fora do modo simulação, aplica as ações.
+
+        Args:
+            dry_run: Apenas calcula e registra o relatório
+            max_removals: Sobrescreve o limite de remoções desta execução
+
+        Returns:
+            ReconciliationPlan: Plano calculado
+
+        Raises:
+            RuntimeError: Se o plano excede o limite de remoções
+        """
+        self._stats['runs'] += 1
+        plan = self.plan()
+        self._last_summary = plan.summary()
+        logger.info(plan.format_report(limit=20 if not dry_run else 50))
+
+        if dry_run or not plan.actions:
+            return plan
+
+        limit = self.max_removals if max_removals is None else max_removals
+        if len(plan.removals) > limit:
+            self._stats['blocked'] += 1
+            raise RuntimeError(
+                f"Reconciliação bloqueada: {len(plan.removals)} remoções excedem o limite de {limit}; "
+                f"confira o relatório (scripts/reconcile_membership.py) antes de aplicar"
+            )
+
+        await self.executor.execute(plan.actions, on_batch=self._persist_batch)
+        self._stats['applied'] += 1
+        return plan
+
+    # Private helper methods
+
+    async def _persist_batch(self, outcomes: List[ActionOutcome]) -> None:
+        """Grava os efeitos de um lote e notifica os removidos."""
+        removed = [o.action for o in outcomes if o.success and o.action.action == ACTION_REMOVE]
+        restored = [o.action for o in outcomes if o.success and o.action.action == ACTION_RESTORE]
+        self._stats['failed'] += sum(1 for o in outcomes if not o.success)
+
+        self.sets.mark_status((a.user_id for a in removed), STATUS_REMOVED)
+        self.sets.mark_status((a.user_id for a in restored), STATUS_LEFT)
+        if self.index:
+            for action in removed:
+                self.index.apply(action.user_id, 'left', source=SOURCE_LOOKUP)
+        self._stats['removed'] += len(removed)
+        self._stats['restored'] += len(restored)
+
+        for action in removed:
+            await self.event_bus.publish(UserBanned(
+                user_id=action.user_id,
+                username=action.username,
+                reason=REASON_LABELS[action.reason],
+                banned_by="membership_reconciler",
+                ban_date=datetime.now()
+            ))
+            message = REMOVAL_MESSAGES.get(action.reason)
+            if message:
+                try:
+                    await self.outbound.send_message(
+                        chat_id=action.user_id, text=message, priority=SendPriority.BULK
+                    )
+                except Exception as e:
+                    logger.debug(f"Aviso de remoção não enviado para {action.user_id}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas da reconciliação.
+
+        Returns:
+            dict: Contadores, resumo do último plano e do executor
+        """
+        return {
+            **self._stats,
+            'last_plan': self._last_summary,
+            'executor': self.executor.get_stats()
+        }
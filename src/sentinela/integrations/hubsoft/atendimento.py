@@ -1,7 +1,8 @@
+import asyncio
 import logging
 import json
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterable, Union
 from urllib.parse import urljoin
 import aiohttp
 
@@ -27,11 +28,11 @@ class HubSoftAtendimentoClient:
         self.base_url = HUBSOFT_HOST
 
     async def _make_async_request(self, method: str, endpoint: str, data: Dict = None,
-                                files: Dict = None) -> Dict[str, Any]:
+                                files: Dict = None, timeout: aiohttp.ClientTimeout = None) -> Dict[str, Any]:
         """Faz requisição assíncrona autenticada para API"""
         try:
-            # Usa função síncrona existente para obter token
-            token = get_hubsoft_token()
+            # Função síncrona (requests): roda fora do event loop
+            token = await asyncio.to_thread(get_hubsoft_token)
             if not token:
                 raise Exception("Não foi possível obter token de acesso")
 
@@ -72,7 +73,7 @@ class HubSoftAtendimentoClient:
                 elif data:
                     request_kwargs['data'] = json.dumps(data)
 
-                timeout = aiohttp.ClientTimeout(total=15)
+                timeout = timeout or aiohttp.ClientTimeout(total=15)
                 async with getattr(session, method.lower())(url, timeout=timeout, **request_kwargs) as response:
                     response_text = await response.text()
 
@@ -103,8 +104,8 @@ class HubSoftAtendimentoClient:
             Dados do atendimento criado com ID oficial
         """
         try:
-            # Busca dados do cliente
-            client_data = get_client_info(client_cpf, full_data=True)
+            # Busca dados do cliente (consulta síncrona, fora do event loop)
+            client_data = await asyncio.to_thread(get_client_info, client_cpf, full_data=True)
             if not client_data:
                 raise Exception("Cliente não encontrado ou sem serviço ativo")
 
@@ -258,14 +259,18 @@ class HubSoftAtendimentoClient:
             return False
 
     async def add_attachment_to_atendimento(self, atendimento_id: str,
-                                          file_content: bytes, filename: str) -> bool:
+                                          file_content: Union[bytes, AsyncIterable[bytes]],
+                                          filename: str,
+                                          content_type: str = "application/octet-stream") -> bool:
         """
         Adiciona anexo ao atendimento
 
         Args:
             atendimento_id: ID do atendimento
-            file_content: Conteúdo do arquivo em bytes
+            file_content: Conteúdo do arquivo em bytes, ou blocos assíncronos
+                (enviados conforme chegam, sem carregar o arquivo em memória)
             filename: Nome do arquivo
+            content_type: Tipo MIME do arquivo
 
         Returns:
             True se sucesso, False caso contrário
@@ -277,11 +282,13 @@ class HubSoftAtendimentoClient:
                 "files[0]": {
                     "content": file_content,
                     "filename": filename,
-                    "content_type": "application/octet-stream"
+                    "content_type": content_type
                 }
             }
 
-            response = await self._make_async_request("POST", endpoint, files=files)
+            # Upload em partes: o limite de 15s vale só para leitura da resposta
+            timeout = aiohttp.ClientTimeout(total=None, sock_read=15)
+            response = await self._make_async_request("POST", endpoint, files=files, timeout=timeout)
             success = response.get('success', False)
 
             if success:
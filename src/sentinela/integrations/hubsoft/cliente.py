@@ -14,6 +14,7 @@ from .cache_manager import (
     cache_contract_status,
     get_cached_contract_status
 )
+from .rate_limiter import rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,95 @@ def _get_access_token() -> Optional[str]:
     """
     return get_hubsoft_token()
 
+class HubSoftLookupError(Exception):
+    """A consulta ao HubSoft falhou (sem token, erro de rede/HTTP ou resposta inválida)."""
+
+
+def _request_clients(formatted_cpf: str) -> list:
+    """
+    Consulta os clientes com serviço habilitado de um CPF na API.
+
+    Args:
+        formatted_cpf: CPF só com dígitos
+
+    Returns:
+        list: Clientes encontrados (vazia se o HubSoft respondeu sem cliente)
+
+    Raises:
+        HubSoftLookupError: Se não foi possível obter uma resposta válida
+    """
+    token = _get_access_token()
+    if not token:
+        raise HubSoftLookupError("Não foi possível buscar dados do cliente pois não há token de acesso.")
+
+    api_endpoint = urljoin(HUBSOFT_HOST, HUBSOFT_ENDPOINT_CLIENTE.lstrip('/'))
+
+    headers = {"Authorization": f"Bearer {token}"}
+    params = {
+        "busca": "cpf_cnpj",
+        "termo_busca": formatted_cpf,
+        "servico_status": "servico_habilitado",
+        "limit": 1
+    }
+
+    try:
+        rate_limiter.record_request()
+        response = requests.get(api_endpoint, headers=headers, params=params, timeout=15)
+        response.raise_for_status()
+        data = response.json()
+    except requests.exceptions.RequestException as e:
+        raise HubSoftLookupError(f"Erro ao consultar a API de integração do Hubsoft: {e}") from e
+    except ValueError as e:
+        raise HubSoftLookupError(f"Resposta inválida da API Hubsoft: {e}") from e
+
+    # Extrai os clientes da resposta
+    if isinstance(data, dict) and "clientes" in data:
+        return data.get("clientes") or []
+    if isinstance(data, list):
+        return data
+    raise HubSoftLookupError(f"Formato inesperado na resposta da API Hubsoft: {type(data).__name__}")
+
+
+def _enrich_client_data(client_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Enriquece os dados com informações úteis para atendimento."""
+    if 'servicos' in client_data and client_data['servicos']:
+        servico = client_data['servicos'][0]
+        client_data['id_cliente_servico'] = servico.get('id')
+        client_data['servico_nome'] = servico.get('nome', '')
+        client_data['servico_status'] = servico.get('status', '')
+    return client_data
+
+
+def lookup_client(cpf: str) -> Optional[Dict[str, Any]]:
+    """
+    Consulta o cliente na API, sem cache, distinguindo falha de ausência.
+
+    Diferente de get_client_info, que devolve None tanto para "cliente sem
+    serviço habilitado" quanto para erro na consulta, aqui só a primeira
+    situação devolve None; falhas levantam HubSoftLookupError. Use onde
+    uma falha não pode ser tratada como contrato inativo.
+
+    Args:
+        cpf: CPF do cliente (formatado ou não)
+
+    Returns:
+        Optional[dict]: Dados do cliente com serviço habilitado, ou None se não há
+
+    Raises:
+        HubSoftLookupError: Se a consulta falhou
+    """
+    formatted_cpf = "".join(filter(str.isdigit, cpf))
+    clientes = _request_clients(formatted_cpf)
+    if not clientes:
+        return None
+
+    client_data = _enrich_client_data(clientes[0])
+    # Atualiza o cache usado pelo fluxo interativo
+    cache_client_data(formatted_cpf, client_data)
+    cache_contract_status(formatted_cpf, True)
+    return client_data
+
+
 def get_client_info(cpf: str, full_data: bool = True) -> Optional[Dict[str, Any]]:
     """
     Busca dados do cliente com serviço habilitado de forma otimizada.
@@ -55,37 +145,12 @@ def get_client_info(cpf: str, full_data: bool = True) -> Optional[Dict[str, Any]
             logger.debug(f"Status do contrato {formatted_cpf[:3]}*** encontrado no cache: {cached_status}")
             return cached_status
 
-    # Cache miss - busca na API
-    token = _get_access_token()
-    if not token:
-        error_msg = "Não foi possível buscar dados do cliente pois não há token de acesso."
-        logger.error(error_msg)
-        return False if not full_data else None
-
-    api_endpoint = urljoin(HUBSOFT_HOST, HUBSOFT_ENDPOINT_CLIENTE.lstrip('/'))
-
-    headers = {"Authorization": f"Bearer {token}"}
-    params = {
-        "busca": "cpf_cnpj",
-        "termo_busca": formatted_cpf,
-        "servico_status": "servico_habilitado",
-        "limit": 1
-    }
-
     log_msg = "Verificando cliente na API Hubsoft" if not full_data else "Buscando dados completos do cliente na API Hubsoft"
     logger.info(f"{log_msg} (cache miss)...")
 
+    # Cache miss - busca na API
     try:
-        response = requests.get(api_endpoint, headers=headers, params=params, timeout=15)
-        response.raise_for_status()
-        data = response.json()
-
-        # Extrai os clientes da resposta
-        clientes = []
-        if isinstance(data, dict) and "clientes" in data:
-            clientes = data.get("clientes", [])
-        elif isinstance(data, list):
-            clientes = data
+        clientes = _request_clients(formatted_cpf)
 
         if clientes and len(clientes) > 0:
             # Se só queremos verificar existência, cache o status e retorna True
@@ -96,16 +161,9 @@ def get_client_info(cpf: str, full_data: bool = True) -> Optional[Dict[str, Any]
                 return True
 
             # Retorna dados completos
-            client_data = clientes[0]
+            client_data = _enrich_client_data(clientes[0])
             logger.info("Dados do cliente encontrados com sucesso.")
 
-            # Enriquece os dados com informações úteis para atendimento
-            if 'servicos' in client_data and client_data['servicos']:
-                servico = client_data['servicos'][0]
-                client_data['id_cliente_servico'] = servico.get('id')
-                client_data['servico_nome'] = servico.get('nome', '')
-                client_data['servico_status'] = servico.get('status', '')
-
             # Cache os dados completos
             cache_client_data(formatted_cpf, client_data)
             # Cache também o status positivo
@@ -123,8 +181,8 @@ def get_client_info(cpf: str, full_data: bool = True) -> Optional[Dict[str, Any]
 
         return False if not full_data else None
 
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Erro ao consultar a API de integração do Hubsoft: {e}")
+    except HubSoftLookupError as e:
+        logger.error(str(e))
         return False if not full_data else None
     except Exception as e:
         error_msg = f"Erro inesperado ao processar resposta da API Hubsoft: {e}" if not full_data else f"Erro inesperado ao processar dados do cliente: {e}"
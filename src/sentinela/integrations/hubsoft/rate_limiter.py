@@ -138,6 +138,15 @@ class HubSoftRateLimiter:
         with self._rate_lock:
             self._request_times.append(time.time())
 
+    def record_request(self):
+        """
+        Registra uma requisição feita fora da queue (ex.: cliente.get_client_info).
+
+        Mantém `current_requests_per_minute` fiel ao consumo real da API,
+        usado para dimensionar tarefas de background ao orçamento que sobra.
+        """
+        self._record_request()
+
     async def wait_for_rate_limit(self):
         """Aguarda até poder fazer uma nova requisição."""
         while not self.can_make_request():
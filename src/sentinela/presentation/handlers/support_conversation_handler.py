@@ -394,10 +394,14 @@ class SupportConversationHandler:
                 f"🔗 **Responder no tópico de Suporte Gamer**"
             )
 
-            await context.bot.send_message(
+            from ...infrastructure.config.dependency_injection import get_container
+            from ...infrastructure.external_services.message_scheduler import OutboundMessageScheduler, SendPriority
+
+            await get_container().get(OutboundMessageScheduler).send_message(
                 chat_id=self.tech_channel_id,
                 text=notification,
-                parse_mode='Markdown'
+                parse_mode='Markdown',
+                priority=SendPriority.NOTIFICATION
             )
 
             logger.info(f"Notificação técnica enviada para ticket {protocol}")
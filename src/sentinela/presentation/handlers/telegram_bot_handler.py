@@ -16,7 +16,14 @@ from ...application.use_cases.hubsoft_integration_use_case import HubSoftIntegra
 from ...application.use_cases.cpf_verification_use_case import CPFVerificationUseCase
 from ...application.use_cases.admin_operations_use_case import AdminOperationsUseCase
 from ...domain.value_objects.identifiers import UserId
+from ...infrastructure.repositories.authorization_snapshot import AuthorizationSnapshot
+from ...infrastructure.repositories.membership_index import MembershipIndex, is_member_status
+from ...infrastructure.repositories.sqlite_conversation_state_store import SQLiteConversationStateStore
+from ...infrastructure.external_services.message_scheduler import OutboundMessageScheduler, SendPriority
 from ...core.config import SUPPORT_TOPIC_ID, TELEGRAM_GROUP_ID
+from ...infrastructure.external_services.join_aggregator import JoinBurstAggregator
+from ...infrastructure.external_services.attachment_pipeline import AttachmentUploadPipeline
+from ...infrastructure.external_services.invite_link_pool import InviteLinkPool
 
 logger = logging.getLogger(__name__)
 
@@ -53,9 +60,14 @@ def get_step_status(step: int, current: int) -> str:
         return "⏳"
 
 
-def init_support_state(context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Inicializa estado do suporte no context.user_data."""
-    context.user_data['support'] = {
+def _support_states() -> SQLiteConversationStateStore:
+    """Store persistente dos estados do fluxo de suporte."""
+    return get_container().get(SQLiteConversationStateStore)
+
+
+def init_support_state(user_id: int) -> Dict[str, Any]:
+    """Inicializa estado do suporte do usuário."""
+    return _support_states().put(user_id, {
         'state': SupportState.IDLE,
         'category': None,
         'category_name': None,
@@ -66,20 +78,25 @@ def init_support_state(context: ContextTypes.DEFAULT_TYPE) -> None:
         'description': None,
         'attachments': [],
         'current_step': 0
-    }
+    })
+
+
+def has_support_state(user_id: int) -> bool:
+    """Verifica se o usuário está no fluxo de suporte."""
+    return _support_states().contains(user_id)
 
 
-def get_support_state(context: ContextTypes.DEFAULT_TYPE) -> Dict[str, Any]:
-    """Obtém estado do suporte."""
-    if 'support' not in context.user_data:
-        init_support_state(context)
-    return context.user_data['support']
+async def get_support_state(user_id: int) -> Dict[str, Any]:
+    """Obtém estado do suporte (carrega do banco, fora do event loop, se preciso)."""
+    state = await _support_states().get(user_id)
+    if state is None:
+        state = init_support_state(user_id)
+    return state
 
 
-def clear_support_state(context: ContextTypes.DEFAULT_TYPE) -> None:
+def clear_support_state(user_id: int) -> None:
     """Limpa estado do suporte."""
-    if 'support' in context.user_data:
-        del context.user_data['support']
+    _support_states().delete(user_id)
 
 
 class TelegramBotHandler:
@@ -92,6 +109,13 @@ class TelegramBotHandler:
         self._admin_use_case: Optional[AdminOperationsUseCase] = None
         self._welcome_use_case = None  # WelcomeManagementUseCase
         self._admin_repo = None  # AdminRepository
+        self._authorization = None  # AuthorizationSnapshot
+        self._outbound = None  # OutboundMessageScheduler
+        self._joins = None  # JoinBurstAggregator
+        self._attachments = None  # AttachmentUploadPipeline
+        self._membership = None  # MembershipIndex
+        self._invites = None  # InviteLinkPool
+        self._group_id = None
 
     async def _ensure_initialized(self) -> None:
         """Garante que o handler está inicializado."""
@@ -102,6 +126,13 @@ class TelegramBotHandler:
             self._admin_use_case = self._container.get("admin_operations_use_case")
             self._welcome_use_case = self._container.get("welcome_management_use_case")
             self._admin_repo = self._container.get("admin_repository")
+            self._authorization = self._container.get(AuthorizationSnapshot)
+            self._outbound = self._container.get(OutboundMessageScheduler)
+            self._joins = self._container.get(JoinBurstAggregator)
+            self._attachments = self._container.get(AttachmentUploadPipeline)
+            self._membership = self._container.get(MembershipIndex)
+            self._invites = self._container.get(InviteLinkPool)
+            self._group_id = int(TELEGRAM_GROUP_ID)
 
     async def _user_already_interacted(self, user_id: int) -> bool:
         """
@@ -119,6 +150,11 @@ class TelegramBotHandler:
         try:
             await self._ensure_initialized()
 
+            # Snapshot em memória: sem acesso ao banco
+            has_interacted = self._authorization.has_interacted(user_id)
+            if has_interacted is not None:
+                return has_interacted
+
             cpf_repo = self._container.get("cpf_verification_repository")
             if not cpf_repo:
                 return False
@@ -153,7 +189,12 @@ class TelegramBotHandler:
         try:
             await self._ensure_initialized()
 
-            # Busca verificação de CPF no repositório
+            # Snapshot em memória: sem acesso ao banco
+            is_verified = self._authorization.is_verified(user_id)
+            if is_verified is not None:
+                return is_verified
+
+            # Snapshot ainda não carregado: consulta o repositório
             cpf_repo = self._container.get("cpf_verification_repository")
             if not cpf_repo:
                 logger.warning("CPF verification repository não disponível")
@@ -427,7 +468,7 @@ class TelegramBotHandler:
                     if SUPPORT_TOPIC_ID:
                         send_params['message_thread_id'] = int(SUPPORT_TOPIC_ID)
 
-                await context.bot.send_message(**send_params)
+                await self._outbound.send_message(**send_params)
 
                 logger.info(f"Usuário {user.id} tentou abrir ticket mas já tem ativo: {protocol} (enviado no {'grupo/tópico' if is_group else 'privado'})")
                 return
@@ -439,7 +480,7 @@ class TelegramBotHandler:
                     await update.message.delete()
 
                     # Envia notificação ao tópico de suporte
-                    await context.bot.send_message(
+                    await self._outbound.send_message(
                         chat_id=int(TELEGRAM_GROUP_ID),
                         message_thread_id=int(SUPPORT_TOPIC_ID),
                         text=(
@@ -449,14 +490,14 @@ class TelegramBotHandler:
                             f"📱 Por favor, confira suas **mensagens diretas** comigo!\n\n"
                             f"💬 Te vejo lá! Já estou te aguardando..."
                         ),
-                        parse_mode='Markdown'
+                        parse_mode='Markdown',
+                        priority=SendPriority.NOTIFICATION
                     )
                 except Exception as e:
                     logger.warning(f"Erro ao enviar notificação no tópico: {e}")
 
             # Inicializa estado do suporte
-            init_support_state(context)
-            state = get_support_state(context)
+            state = init_support_state(user.id)
             state['state'] = SupportState.CATEGORY
             state['current_step'] = 1
 
@@ -489,11 +530,12 @@ class TelegramBotHandler:
             )
 
             # SEMPRE responde no privado do usuário
-            await context.bot.send_message(
+            await self._outbound.send_message(
                 chat_id=user.id,
                 text=message,
                 reply_markup=reply_markup,
-                parse_mode='Markdown'
+                parse_mode='Markdown',
+                priority=SendPriority.INTERACTIVE
             )
 
             logger.info(f"Usuário {user.id} iniciou fluxo de suporte - Step 1 (Categoria)")
@@ -501,9 +543,10 @@ class TelegramBotHandler:
         except Exception as e:
             logger.error(f"Erro no comando /suporte: {e}")
             try:
-                await context.bot.send_message(
+                await self._outbound.send_message(
                     chat_id=user.id,
-                    text="❌ Erro ao iniciar suporte. Tente novamente."
+                    text="❌ Erro ao iniciar suporte. Tente novamente.",
+                    priority=SendPriority.INTERACTIVE
                 )
             except Exception as e:
                 # Ignora falhas ao enviar mensagem de erro (último recurso)
@@ -793,18 +836,14 @@ class TelegramBotHandler:
             if result.success and result.data.get('verified'):
                 # A resolução foi um sucesso e a verificação foi completada.
                 try:
-                    from ...core.config import TELEGRAM_GROUP_ID
-                    client_name = query.from_user.first_name
-                    invite_link = await query.get_bot().create_chat_invite_link(
-                        chat_id=int(TELEGRAM_GROUP_ID),
-                        member_limit=1,
-                        name=f"Link para {client_name}"
-                    )
+                    invite_link = await self._invites.lease(query.from_user.id)
+                    if not invite_link:
+                        raise RuntimeError("nenhum link de convite disponível")
                     message = (
                         f"✅ **Conflito Resolvido!**\n\n"
                         f"O CPF foi associado à sua conta e removido da(s) conta(s) antiga(s).\n\n"
                         f"Seja bem-vindo(a) ao grupo!\n\n"
-                        f"🔗 **Seu novo link de acesso:**\n{invite_link.invite_link}"
+                        f"🔗 **Seu novo link de acesso:**\n{invite_link}"
                     )
                     await query.edit_message_text(message, parse_mode='Markdown', disable_web_page_preview=True)
                 except Exception as e:
@@ -934,8 +973,8 @@ class TelegramBotHandler:
             text = update.message.text
 
             # Verifica se está em fluxo de suporte (usuário verificado)
-            if 'support' in context.user_data:
-                state = get_support_state(context)
+            if has_support_state(user.id):
+                state = await get_support_state(user.id)
 
                 # Se está aguardando descrição
                 if state['state'] == SupportState.DESCRIPTION:
@@ -1016,7 +1055,7 @@ class TelegramBotHandler:
                 return
 
             # Verifica se está em fluxo de suporte e aguardando anexos
-            if 'support' not in context.user_data:
+            if not has_support_state(user.id):
                 await update.message.reply_text(
                     "📷 Foto recebida!\n\n"
                     "Para criar um atendimento com anexos, use /suporte",
@@ -1024,7 +1063,7 @@ class TelegramBotHandler:
                 )
                 return
 
-            state = get_support_state(context)
+            state = await get_support_state(user.id)
 
             # Só aceita fotos na etapa de anexos
             if state['state'] != SupportState.ATTACHMENTS:
@@ -1048,9 +1087,19 @@ class TelegramBotHandler:
             # Pega a maior resolução da foto
             photo = update.message.photo[-1]
 
-            # Salva informações do anexo
+            # Mesma foto reenviada (file_id muda, file_unique_id não)
+            if any(a.get('file_unique_id') == photo.file_unique_id for a in attachments):
+                await update.message.reply_text(
+                    "📷 Esta foto já foi anexada.\n\n"
+                    "Envie outra ou clique em **Continuar**.",
+                    parse_mode='Markdown'
+                )
+                return
+
+            # Salva informações do anexo (o arquivo vai ao HubSoft após criar o chamado)
             attachment_info = {
                 'file_id': photo.file_id,
+                'file_unique_id': photo.file_unique_id,
                 'file_size': photo.file_size,
                 'width': photo.width,
                 'height': photo.height
@@ -1087,7 +1136,6 @@ class TelegramBotHandler:
             from ...core.config import (
                 ONCABO_SITE_URL,
                 ONCABO_WHATSAPP_URL,
-                TELEGRAM_GROUP_ID,
                 INVITE_LINK_EXPIRE_TIME
             )
 
@@ -1152,16 +1200,15 @@ class TelegramBotHandler:
                     client_data = result.data.get('client_data', {})
                     client_name = client_data.get('name', user.first_name)
                     try:
-                        invite_link = await update.get_bot().create_chat_invite_link(
-                            chat_id=int(TELEGRAM_GROUP_ID),
-                            member_limit=1,
-                            name=f"Link para {client_name}"
-                        )
+                        # Link pré-criado: entregue sem chamar a API do Telegram
+                        invite_link = await self._invites.lease(user.id)
+                        if not invite_link:
+                            raise RuntimeError("nenhum link de convite disponível")
                         message = (
                             f"✅ <b>PARABÉNS, {client_name}!</b> 🎉\n\n"
                             "Seu plano OnCabo Gaming está ativo e verificado com sucesso!\n\n"
                             "🔗 **LINK DE ACESSO AO GRUPO:**\n"
-                            f"{invite_link.invite_link}\n\n"
+                            f"{invite_link}\n\n"
                             "⏰ <b>Atenção:</b> Este link é pessoal e pode ser usado <b>apenas 1 vez</b>!\n\n"
                             "Clique no link para entrar no grupo. Nos vemos lá! 🔥"
                         )
@@ -1233,7 +1280,7 @@ class TelegramBotHandler:
 
     async def _handle_support_cancel(self, query, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Cancela o fluxo de suporte."""
-        clear_support_state(context)
+        clear_support_state(query.from_user.id)
         await query.edit_message_text(
             "❌ **Formulário Cancelado**\n\n"
             "Você pode iniciar um novo chamado a qualquer momento usando /suporte",
@@ -1243,7 +1290,7 @@ class TelegramBotHandler:
 
     async def _handle_support_back(self, query, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Volta para etapa anterior."""
-        state = get_support_state(context)
+        state = await get_support_state(query.from_user.id)
         current_state = state['state']
 
         # Define para onde voltar
@@ -1287,7 +1334,7 @@ class TelegramBotHandler:
             "others": "📞 Outros"
         }
 
-        state = get_support_state(context)
+        state = await get_support_state(query.from_user.id)
         state['category'] = category_key
         state['category_name'] = category_names.get(category_key, "Outros")
         state['state'] = SupportState.GAME
@@ -1298,7 +1345,7 @@ class TelegramBotHandler:
 
     async def _show_game_step(self, query, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Mostra etapa de seleção de jogo."""
-        state = get_support_state(context)
+        state = await get_support_state(query.from_user.id)
 
         keyboard = [
             [
@@ -1391,7 +1438,7 @@ class TelegramBotHandler:
             "other": "🎪 Outro jogo"
         }
 
-        state = get_support_state(context)
+        state = await get_support_state(query.from_user.id)
         state['game'] = game_key
         state['game_name'] = game_names.get(game_key, "Outro")
         state['state'] = SupportState.TIMING
@@ -1402,7 +1449,7 @@ class TelegramBotHandler:
 
     async def _show_timing_step(self, query, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Mostra etapa de seleção de timing."""
-        state = get_support_state(context)
+        state = await get_support_state(query.from_user.id)
 
         keyboard = [
             [
@@ -1459,7 +1506,7 @@ class TelegramBotHandler:
             "always": "♾️ Sempre Foi Assim"
         }
 
-        state = get_support_state(context)
+        state = await get_support_state(query.from_user.id)
         state['timing'] = timing_key
         state['timing_name'] = timing_names.get(timing_key, "Não informado")
         state['state'] = SupportState.DESCRIPTION
@@ -1493,7 +1540,7 @@ class TelegramBotHandler:
 
     async def _show_attachments_step(self, query_or_message, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Mostra etapa de anexos opcionais."""
-        state = get_support_state(context)
+        state = await get_support_state(query_or_message.from_user.id)
         attachments_count = len(state.get('attachments', []))
 
         keyboard = [
@@ -1546,14 +1593,14 @@ class TelegramBotHandler:
     ) -> None:
         """Processa ações de anexos."""
         if callback_data == "sup_att_skip" or callback_data == "sup_att_continue":
-            state = get_support_state(context)
+            state = await get_support_state(query.from_user.id)
             state['state'] = SupportState.CONFIRMATION
             state['current_step'] = 6
             await self._show_confirmation_step(query, context)
 
     async def _show_confirmation_step(self, query, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Mostra etapa de confirmação."""
-        state = get_support_state(context)
+        state = await get_support_state(query.from_user.id)
         attachments_count = len(state.get('attachments', []))
 
         keyboard = [
@@ -1625,22 +1672,22 @@ class TelegramBotHandler:
                 parse_mode='Markdown'
             )
         elif callback_data == "sup_edit_category":
-            state = get_support_state(context)
+            state = await get_support_state(query.from_user.id)
             state['state'] = SupportState.CATEGORY
             state['current_step'] = 1
             await self._show_category_step(query, context)
         elif callback_data == "sup_edit_game":
-            state = get_support_state(context)
+            state = await get_support_state(query.from_user.id)
             state['state'] = SupportState.GAME
             state['current_step'] = 2
             await self._show_game_step(query, context)
         elif callback_data == "sup_edit_timing":
-            state = get_support_state(context)
+            state = await get_support_state(query.from_user.id)
             state['state'] = SupportState.TIMING
             state['current_step'] = 3
             await self._show_timing_step(query, context)
         elif callback_data == "sup_edit_description":
-            state = get_support_state(context)
+            state = await get_support_state(query.from_user.id)
             state['state'] = SupportState.DESCRIPTION
             state['current_step'] = 4
 
@@ -1649,7 +1696,7 @@ class TelegramBotHandler:
                 parse_mode='Markdown'
             )
         elif callback_data == "sup_edit_attachments":
-            state = get_support_state(context)
+            state = await get_support_state(query.from_user.id)
             state['state'] = SupportState.ATTACHMENTS
             state['current_step'] = 5
             await self._show_attachments_step(query, context)
@@ -1663,8 +1710,8 @@ class TelegramBotHandler:
         Cria ticket a partir do fluxo de suporte, usando a nova arquitetura
         e o endpoint correto do HubSoft.
         """
-        state = get_support_state(context)
         user = query.from_user
+        state = await get_support_state(user.id)
 
         try:
             await query.edit_message_text(
@@ -1715,13 +1762,33 @@ class TelegramBotHandler:
             # 4. Montar mensagem de sucesso com o protocolo real
             hubsoft_protocol = hubsoft_result.data.get("protocolo") or f"ID {hubsoft_result.data.get('id_atendimento')}"
             now = datetime.now()
-            
+
+            # Anexos seguem em background; a confirmação não espera pelo upload
+            attachments_queued = 0
+            id_atendimento = hubsoft_result.data.get('id_atendimento')
+            if ticket_data['attachments'] and id_atendimento:
+                try:
+                    attachments_queued = self._attachments.enqueue(
+                        atendimento_id=id_atendimento,
+                        protocol=hubsoft_protocol,
+                        user_id=user.id,
+                        attachments=ticket_data['attachments']
+                    )
+                except Exception as e:
+                    logger.error(f"Erro ao agendar anexos do chamado {hubsoft_protocol}: {e}")
+            attachments_note = (
+                f"📎 Seus {attachments_queued} anexo(s) estão sendo enviados ao chamado; "
+                f"avisaremos aqui quando terminar.\n\n"
+                if attachments_queued else ""
+            )
+
             success_message = (
                 f"🎉 **PRONTO! SEU CHAMADO FOI CRIADO COM SUCESSO!**\n\n"
                 f"📋 **Protocolo:** `{hubsoft_protocol}`\n"
                 f"📅 **Criado em:** {now.strftime('%d/%m/%Y às %H:%M')}\n"
                 f"📊 **Status:** Aguardando Atendimento\n\n"
                 f"✅ Nossa equipe técnica já recebeu seu chamado e vai começar a análise.\n\n"
+                f"{attachments_note}"
                 f"Você receberá todas as atualizações aqui pelo Telegram. "
                 f"O tempo médio de primeira resposta é de **até 24h úteis**.\n\n"
                 f"Obrigado pela paciência! 🙏"
@@ -1739,16 +1806,17 @@ class TelegramBotHandler:
                     f"🎮 **Jogo:** {state['game_name']}\n"
                     f"📝 **Descrição:**\n{notification_desc}"
                 )
-                await context.bot.send_message(
+                await self._outbound.send_message(
                     chat_id=int(TELEGRAM_GROUP_ID),
                     message_thread_id=int(SUPPORT_TOPIC_ID),
                     text=notification,
-                    parse_mode='Markdown'
+                    parse_mode='Markdown',
+                    priority=SendPriority.NOTIFICATION
                 )
             except Exception as e:
                 logger.error(f"Erro ao enviar notificação de novo ticket ao grupo: {e}")
 
-            clear_support_state(context)
+            clear_support_state(user.id)
             logger.info(f"Ticket {hubsoft_protocol} criado com sucesso para usuário {user.id}")
 
         except Exception as e:
@@ -1809,77 +1877,32 @@ class TelegramBotHandler:
             user = update.chat_member.from_user
             chat = update.effective_chat
 
+            # Toda mudança de status (entrada, saída, remoção, promoção) atualiza o índice
+            if chat.id == self._group_id:
+                member_user = new_member.user
+                self._membership.apply(
+                    member_user.id,
+                    new_member.status,
+                    username=member_user.username or member_user.first_name,
+                    is_member=getattr(new_member, 'is_member', None)
+                )
+                # Entrada por link do pool: marca o link como usado
+                joined_via = update.chat_member.invite_link
+                if joined_via and is_member_status(new_member.status, getattr(new_member, 'is_member', None)):
+                    await self._invites.record_join(joined_via.invite_link, member_user.id)
+
             # Verifica se é um novo membro (não estava no grupo antes)
             if old_member.status in ['left', 'kicked'] and new_member.status == 'member':
                 logger.info(f"Novo membro detectado: {user.first_name} ({user.id})")
 
-                # Usa WelcomeManagementUseCase se disponível
-                if hasattr(self, '_welcome_use_case') and self._welcome_use_case:
-                    from ...domain.value_objects.welcome_message import WelcomeMessage
-                    from ...core.config import WELCOME_TOPIC_ID, RULES_TOPIC_ID
-                    from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-
-                    # Cria mensagem de boas-vindas
-                    welcome_msg = WelcomeMessage.create_initial_welcome(
-                        welcome_topic_id=int(WELCOME_TOPIC_ID) if WELCOME_TOPIC_ID else None
-                    )
-
-                    # Formata menção HTML
-                    user_mention = f'<a href="tg://user?id={user.id}">{user.first_name}</a>'
-                    welcome_text = welcome_msg.format_for_user(
-                        user_mention=user_mention,
-                        username=user.first_name
-                    )
-
-                    # Envia mensagem de boas-vindas no tópico correto
-                    await context.bot.send_message(
-                        chat_id=chat.id,
-                        text=welcome_text,
-                        parse_mode='HTML',
-                        message_thread_id=int(WELCOME_TOPIC_ID) if WELCOME_TOPIC_ID else None
-                    )
-
-                    # Envia mensagem de regras com botão
-                    if RULES_TOPIC_ID:
-                        rules_msg = WelcomeMessage.create_rules_reminder(
-                            rules_topic_id=int(RULES_TOPIC_ID),
-                            user_id=user.id
-                        )
-
-                        rules_text = rules_msg.format_for_user(
-                            user_mention=user_mention,
-                            username=user.first_name
-                        )
-
-                        # Cria botão inline
-                        keyboard = [[
-                            InlineKeyboardButton(
-                                rules_msg.button_text,
-                                callback_data=rules_msg.button_callback
-                            )
-                        ]]
-                        reply_markup = InlineKeyboardMarkup(keyboard)
-
-                        await context.bot.send_message(
-                            chat_id=chat.id,
-                            text=rules_text,
-                            parse_mode='HTML',
-                            message_thread_id=int(RULES_TOPIC_ID),
-                            reply_markup=reply_markup
-                        )
-
-                    # Registra no use case
-                    result = await self._welcome_use_case.handle_new_member(
-                        user_id=user.id,
-                        username=user.username or user.first_name,
-                        first_name=user.first_name,
-                        last_name=user.last_name
-                    )
-
-                    if result.success:
-                        logger.info(f"Novo membro {user.first_name} processado com sucesso")
-                    else:
-                        logger.error(f"Erro ao processar novo membro: {result.message}")
+                # Boas-vindas individuais ou agrupadas (rajadas de entrada)
+                await self._joins.add(
+                    chat_id=chat.id,
+                    user_id=user.id,
+                    username=user.username or user.first_name,
+                    first_name=user.first_name,
+                    last_name=user.last_name
+                )
 
         except Exception as e:
             logger.error(f"Erro ao processar novo membro: {e}")
@@ -1914,21 +1937,35 @@ class TelegramBotHandler:
                 )
 
                 if result.success:
-                    # Atualiza mensagem
-                    user_mention = f'<a href="tg://user?id={user.id}">{user.first_name}</a>'
-
-                    from ...domain.value_objects.welcome_message import WelcomeMessage
-                    confirmation_msg = WelcomeMessage.create_rules_accepted()
-                    confirmation_text = confirmation_msg.format_for_user(
-                        user_mention=user_mention,
-                        username=user.first_name
+                    # Mensagem de regras agrupada: remove só o botão deste usuário
+                    message = query.message
+                    in_batch = bool(message) and await self._joins.accept_in_batch(
+                        message.chat.id, message.message_id, user.id
                     )
+                    if not in_batch and message and message.reply_markup:
+                        buttons = [row for row in message.reply_markup.inline_keyboard]
+                        if len(buttons) > 1:
+                            # Lote enviado antes de um restart: usa o teclado da própria mensagem
+                            remaining = [row for row in buttons if row[0].callback_data != callback_data]
+                            await query.edit_message_reply_markup(reply_markup=InlineKeyboardMarkup(remaining))
+                            in_batch = True
+
+                    if not in_batch:
+                        # Atualiza mensagem
+                        user_mention = f'<a href="tg://user?id={user.id}">{user.first_name}</a>'
+
+                        from ...domain.value_objects.welcome_message import WelcomeMessage
+                        confirmation_msg = WelcomeMessage.create_rules_accepted()
+                        confirmation_text = confirmation_msg.format_for_user(
+                            user_mention=user_mention,
+                            username=user.first_name
+                        )
 
-                    # Edita mensagem removendo botão
-                    await query.edit_message_text(
-                        text=confirmation_text,
-                        parse_mode='HTML'
-                    )
+                        # Edita mensagem removendo botão
+                        await query.edit_message_text(
+                            text=confirmation_text,
+                            parse_mode='HTML'
+                        )
 
                     # Notifica usuário
                     await query.answer(
@@ -5,10 +5,17 @@ Registra os handlers do Telegram Bot para a nova arquitetura.
 
 import logging
 from telegram.ext import Application
-from ..core.config import TELEGRAM_TOKEN
+from ..core.config import TELEGRAM_TOKEN, UPDATE_CONCURRENCY
+from .update_processor import PerUserUpdateProcessor
 
 # Cria a instância principal da aplicação do bot
-application = Application.builder().token(TELEGRAM_TOKEN).build()
+# Usuários distintos em paralelo; mensagens do mesmo usuário em ordem
+application = (
+    Application.builder()
+    .token(TELEGRAM_TOKEN)
+    .concurrent_updates(PerUserUpdateProcessor(UPDATE_CONCURRENCY))
+    .build()
+)
 
 from telegram.ext import Application, CommandHandler, CallbackQueryHandler, MessageHandler, ChatMemberHandler, filters
 
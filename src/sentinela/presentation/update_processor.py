@@ -0,0 +1,127 @@
+"""
+Processamento concorrente de updates com ordem garantida por usuário.
+
+Updates de usuários diferentes são processados em paralelo (até o limite
+global); updates do mesmo usuário são processados um de cada vez, na
+ordem de chegada, para que o wizard de suporte e a entrada de CPF nunca
+vejam duas mensagens do mesmo usuário ao mesmo tempo.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Dict, Hashable, Optional
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+logger = logging.getLogger(__name__)
+
+
+class PerUserUpdateProcessor(BaseUpdateProcessor):
+    """
+    Update processor do PTB com fila sequencial por usuário.
+
+    A espera pela vez do usuário acontece antes de ocupar uma vaga do
+    limite global: um usuário com muitas mensagens enfileiradas não
+    consome vagas que outros usuários poderiam usar.
+    """
+
+    def __init__(self, max_concurrent_updates: int = 64):
+        """
+        Inicializa o processor.
+
+        Args:
+            max_concurrent_updates: Máximo de updates em processamento simultâneo
+        """
+        super().__init__(max_concurrent_updates)
+        self._key_locks: Dict[Hashable, asyncio.Lock] = {}
+        self._key_pending: Dict[Hashable, int] = {}
+        self._in_flight = 0
+        self._stats = {
+            'processed': 0,
+            'waited_for_same_user': 0,
+            'max_user_backlog': 0,
+            'max_in_flight': 0
+        }
+
+    @staticmethod
+    def _ordering_key(update: Any) -> Optional[Hashable]:
+        """Usuário (ou, na falta dele, o chat) que define a ordem do update."""
+        if not isinstance(update, Update):
+            return None
+        if update.effective_user:
+            return ('user', update.effective_user.id)
+        if update.effective_chat:
+            return ('chat', update.effective_chat.id)
+        return None
+
+    async def process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+        """
+        Processa o update após os anteriores do mesmo usuário.
+
+        Args:
+            update: Update recebido
+            coroutine: Processamento do update pela Application
+        """
+        key = self._ordering_key(update)
+        if key is None:
+            await super().process_update(update, coroutine)
+            return
+
+        lock = self._key_locks.get(key)
+        if lock is None:
+            lock = self._key_locks[key] = asyncio.Lock()
+        pending = self._key_pending.get(key, 0) + 1
+        self._key_pending[key] = pending
+
+        if pending > 1:
+            self._stats['waited_for_same_user'] += 1
+            self._stats['max_user_backlog'] = max(self._stats['max_user_backlog'], pending - 1)
+
+        try:
+            # asyncio.Lock atende em ordem FIFO: mantém a ordem de chegada
+            async with lock:
+                await super().process_update(update, coroutine)
+        finally:
+            pending = self._key_pending[key] - 1
+            if pending:
+                self._key_pending[key] = pending
+            else:
+                del self._key_pending[key]
+                del self._key_locks[key]
+
+    async def do_process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+        """
+        Executa o processamento (já dentro do limite global).
+
+        Args:
+            update: Update recebido
+            coroutine: Processamento do update pela Application
+        """
+        self._in_flight += 1
+        self._stats['max_in_flight'] = max(self._stats['max_in_flight'], self._in_flight)
+        try:
+            await coroutine
+        finally:
+            self._in_flight -= 1
+            self._stats['processed'] += 1
+
+    async def initialize(self) -> None:
+        """Sem recursos a inicializar."""
+
+    async def shutdown(self) -> None:
+        """Sem recursos a liberar."""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do processor.
+
+        Returns:
+            dict: Limite, updates em andamento, usuários com fila e contadores
+        """
+        return {
+            'max_concurrent_updates': self.max_concurrent_updates,
+            'in_flight': self._in_flight,
+            'users_with_backlog': sum(1 for pending in self._key_pending.values() if pending > 1),
+            'stats': self._stats.copy()
+        }
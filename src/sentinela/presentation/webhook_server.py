@@ -0,0 +1,203 @@
+"""
+Recebimento de updates via webhook com servidor aiohttp embutido.
+
+O receptor só valida o segredo, decodifica o update e o coloca na
+`update_queue` da Application; o processamento segue pelo mesmo
+pipeline do polling. A resposta ao Telegram sai imediatamente, sem
+esperar os handlers.
+
+Rode uma única instância do bot por token. O receptor não guarda
+estado, mas o processamento sim: ordem por usuário, estado das conversas,
+limites de envio e índices em memória ficam no processo. Vários processos
+na mesma porta dividiriam os updates de um mesmo usuário entre estados
+que não se enxergam. Por isso a porta não usa SO_REUSEPORT: uma segunda
+instância falha no bind em vez de dividir o tráfego.
+"""
+
+import asyncio
+import hmac
+import logging
+import signal
+import time
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+from telegram import Update
+from telegram.ext import Application
+
+logger = logging.getLogger(__name__)
+
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+class WebhookServer:
+    """Servidor HTTP que enfileira updates do Telegram na Application."""
+
+    def __init__(
+        self,
+        application: Application,
+        secret_token: str,
+        path: str = "/telegram/webhook",
+        listen: str = "0.0.0.0",
+        port: int = 8080,
+        max_body_bytes: int = 1024 * 1024
+    ):
+        """
+        Inicializa o servidor.
+
+        Args:
+            application: Application do PTB (já inicializada e iniciada)
+            secret_token: Segredo esperado no header do Telegram
+            path: Caminho HTTP do webhook
+            listen: Endereço de escuta
+            port: Porta de escuta
+            max_body_bytes: Tamanho máximo aceito por requisição
+        """
+        self.application = application
+        self.secret_token = secret_token
+        self.path = path
+        self.listen = listen
+        self.port = port
+        self.max_body_bytes = max_body_bytes
+
+        self._runner: Optional[web.AppRunner] = None
+        self._stats = {
+            'received': 0,
+            'enqueued': 0,
+            'rejected_secret': 0,
+            'invalid_payload': 0
+        }
+        self._enqueue_seconds_total = 0.0
+
+    def _build_app(self) -> web.Application:
+        app = web.Application(client_max_size=self.max_body_bytes)
+        app.router.add_post(self.path, self._handle_update)
+        app.router.add_get("/healthz", self._handle_health)
+        return app
+
+    async def start(self) -> None:
+        """Inicia o servidor HTTP."""
+        self._runner = web.AppRunner(self._build_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.listen, self.port)
+        await site.start()
+        logger.info(f"Webhook escutando em {self.listen}:{self.port}{self.path}")
+
+    async def stop(self) -> None:
+        """Para o servidor HTTP."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _handle_update(self, request: web.Request) -> web.Response:
+        """Valida, decodifica e enfileira um update."""
+        started = time.perf_counter()
+        self._stats['received'] += 1
+
+        received_secret = request.headers.get(SECRET_HEADER, "")
+        if not hmac.compare_digest(received_secret, self.secret_token):
+            self._stats['rejected_secret'] += 1
+            return web.Response(status=403)
+
+        try:
+            data = await request.json()
+            update = Update.de_json(data, self.application.bot)
+        except Exception as e:
+            self._stats['invalid_payload'] += 1
+            logger.warning(f"Update inválido recebido no webhook: {e}")
+            return web.Response(status=400)
+
+        if update is None:
+            self._stats['invalid_payload'] += 1
+            return web.Response(status=400)
+
+        # Fila sem limite da Application: put_nowait nunca bloqueia o ack
+        self.application.update_queue.put_nowait(update)
+        self._stats['enqueued'] += 1
+        self._enqueue_seconds_total += time.perf_counter() - started
+        return web.Response(status=200)
+
+    async def _handle_health(self, request: web.Request) -> web.Response:
+        """Health check para o proxy reverso."""
+        return web.json_response(self.get_stats())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retorna estatísticas do receptor.
+
+        Returns:
+            dict: Contadores e tempo médio de enfileiramento
+        """
+        enqueued = self._stats['enqueued']
+        return {
+            'update_queue_size': self.application.update_queue.qsize(),
+            'avg_ack_ms': round(self._enqueue_seconds_total / enqueued * 1000, 3) if enqueued else 0.0,
+            'stats': self._stats.copy()
+        }
+
+
+async def serve_webhook(
+    application: Application,
+    secret_token: str,
+    webhook_url: Optional[str] = None,
+    path: str = "/telegram/webhook",
+    listen: str = "0.0.0.0",
+    port: int = 8080,
+    register: bool = True,
+    max_connections: int = 40,
+    allowed_updates: Optional[List[str]] = None
+) -> None:
+    """
+    Executa a Application em modo webhook até receber SIGINT/SIGTERM.
+
+    Segue o mesmo ciclo de vida de `run_polling` (post_init,
+    post_stop e post_shutdown são chamados).
+
+    Args:
+        application: Application do PTB com handlers registrados
+        secret_token: Segredo conferido em cada requisição
+        webhook_url: URL pública registrada no Telegram
+        path: Caminho HTTP do webhook
+        listen: Endereço de escuta
+        port: Porta de escuta
+        register: Se deve chamar setWebhook na inicialização
+        max_connections: Conexões simultâneas que o Telegram pode abrir
+        allowed_updates: Tipos de update a receber
+    """
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            pass
+
+    await application.initialize()
+    if application.post_init:
+        await application.post_init(application)
+    await application.start()
+
+    server = WebhookServer(application, secret_token, path=path, listen=listen, port=port)
+    try:
+        await server.start()
+
+        if register:
+            if not webhook_url:
+                raise ValueError("WEBHOOK_URL é obrigatório para registrar o webhook")
+            await application.bot.set_webhook(
+                url=webhook_url,
+                secret_token=secret_token,
+                allowed_updates=allowed_updates,
+                max_connections=max_connections
+            )
+            logger.info(f"Webhook registrado em {webhook_url}")
+
+        await stop_event.wait()
+    finally:
+        await server.stop()
+        await application.stop()
+        if application.post_stop:
+            await application.post_stop(application)
+        await application.shutdown()
+        if application.post_shutdown:
+            await application.post_shutdown(application)